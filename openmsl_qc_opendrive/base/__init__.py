@@ -4,5 +4,24 @@
 # Public License, v. 2.0. If a copy of the MPL was not distributed
 # with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
+from . import arc_length as arc_length
+from . import byte_index as byte_index
+from . import clothoid as clothoid
+from . import input_stream as input_stream
+from . import lane_borders as lane_borders
+from . import lane_widths as lane_widths
 from . import models as models
+from . import network as network
+from . import outline as outline
+from . import parallel as parallel
+from . import plan_view as plan_view
+from . import positions as positions
+from . import profiles as profiles
+from . import projection as projection
+from . import reference_line as reference_line
+from . import road_geometry as road_geometry
+from . import snapshot as snapshot
+from . import spatial as spatial
+from . import tables as tables
 from . import utils as utils
+from . import visitor as visitor
@@ -0,0 +1,192 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import functools
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Number of Gauss-Legendre nodes per subinterval
+DEFAULT_ORDER = 8
+# Relative error at which a curve is no longer refined
+DEFAULT_TOLERANCE = 1.0e-9
+# Refinement doubles the number of subintervals up to 2**DEFAULT_MAX_DEPTH
+DEFAULT_MAX_DEPTH = 10
+# Number of knot intervals of a reparametrization table
+DEFAULT_TABLE_SIZE = 16
+NEWTON_ITERATIONS = 2
+
+
+def _speed(u: np.ndarray, v: np.ndarray, p: np.ndarray) -> np.ndarray:
+    """
+    Returns sqrt(u'(p)^2 + v'(p)^2) for coefficients (N, 4) and parameters
+    (N, K).
+    """
+    du = u[:, 1:2] + p * (2.0 * u[:, 2:3] + p * (3.0 * u[:, 3:4]))
+    dv = v[:, 1:2] + p * (2.0 * v[:, 2:3] + p * (3.0 * v[:, 3:4]))
+    return np.sqrt(du**2 + dv**2)
+
+
+def _integrate(
+    u: np.ndarray,
+    v: np.ndarray,
+    p_start: np.ndarray,
+    p_end: np.ndarray,
+    segments: int,
+    order: int,
+) -> np.ndarray:
+    """
+    Composite Gauss-Legendre quadrature of the speed over [p_start, p_end],
+    split into segments subintervals of equal size.
+    """
+    nodes, weights = np.polynomial.legendre.leggauss(order)
+
+    # Nodes of all subintervals on [0, 1]
+    offsets = np.arange(segments)[:, np.newaxis]
+    unit_nodes = ((offsets + (nodes + 1.0) / 2.0) / segments).ravel()
+    unit_weights = np.tile(weights / (2.0 * segments), segments)
+
+    width = (p_end - p_start)[:, np.newaxis]
+    p = p_start[:, np.newaxis] + width * unit_nodes
+    return (_speed(u, v, p) * unit_weights).sum(axis=1) * width[:, 0]
+
+
+def param_poly3_arc_lengths(
+    u: np.ndarray,
+    v: np.ndarray,
+    p_end: np.ndarray,
+    p_start: Optional[np.ndarray] = None,
+    order: int = DEFAULT_ORDER,
+    tolerance: float = DEFAULT_TOLERANCE,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the arc lengths of many paramPoly3 curves between p_start
+    (default 0) and p_end, and the estimated absolute error of each.
+
+    All curves are integrated at once with a fixed order Gauss-Legendre rule
+    on one and on two subintervals. Only the curves where the two results
+    differ by more than tolerance relative to their length are refined further
+    by doubling the number of subintervals.
+    """
+    u = np.asarray(u, dtype=np.float64).reshape(-1, 4)
+    v = np.asarray(v, dtype=np.float64).reshape(-1, 4)
+    p_end = np.broadcast_to(np.asarray(p_end, dtype=np.float64), (len(u),))
+    if p_start is None:
+        p_start = np.zeros(len(u))
+    p_start = np.broadcast_to(np.asarray(p_start, dtype=np.float64), (len(u),))
+
+    coarse = _integrate(u, v, p_start, p_end, 1, order)
+    lengths = _integrate(u, v, p_start, p_end, 2, order)
+    errors = np.abs(lengths - coarse)
+
+    segments = 2
+    pending = np.flatnonzero(errors > tolerance * np.maximum(np.abs(lengths), 1.0))
+    for _ in range(max_depth - 1):
+        if len(pending) == 0:
+            break
+
+        segments *= 2
+        refined = _integrate(
+            u[pending], v[pending], p_start[pending], p_end[pending], segments, order
+        )
+        errors[pending] = np.abs(refined - lengths[pending])
+        lengths[pending] = refined
+
+        converged = errors[pending] <= tolerance * np.maximum(
+            np.abs(lengths[pending]), 1.0
+        )
+        pending = pending[~converged]
+
+    return lengths, errors
+
+
+class ReparametrizationTable:
+    """
+    Cumulative arc length of paramPoly3 curves at equidistant parameter knots,
+    used to find the parameter p at which the curve has a given arc length.
+
+    Row i holds curve i. The lookup of an arc length is a search in the table
+    of its curve, a linear guess between the enclosing knots and Newton steps
+    on s(p) - s = 0, where s(p) is integrated from the lower knot.
+    """
+
+    def __init__(
+        self,
+        u: np.ndarray,
+        v: np.ndarray,
+        p_end: np.ndarray,
+        size: int = DEFAULT_TABLE_SIZE,
+    ):
+        self.u = np.asarray(u, dtype=np.float64).reshape(-1, 4)
+        self.v = np.asarray(v, dtype=np.float64).reshape(-1, 4)
+        count = len(self.u)
+        p_end = np.broadcast_to(np.asarray(p_end, dtype=np.float64), (count,))
+
+        self.p_knots = p_end[:, np.newaxis] * np.linspace(0.0, 1.0, size + 1)
+        pieces, _ = param_poly3_arc_lengths(
+            np.repeat(self.u, size, axis=0),
+            np.repeat(self.v, size, axis=0),
+            self.p_knots[:, 1:].ravel(),
+            self.p_knots[:, :-1].ravel(),
+        )
+        self.s_knots = np.hstack(
+            [np.zeros((count, 1)), np.cumsum(pieces.reshape(count, size), axis=1)]
+        )
+
+    @property
+    def size(self) -> int:
+        return self.p_knots.shape[1] - 1
+
+    def __len__(self) -> int:
+        return len(self.u)
+
+    def invert(
+        self, rows: np.ndarray, s: np.ndarray, iterations: int = NEWTON_ITERATIONS
+    ) -> np.ndarray:
+        """
+        Returns for each sample the parameter p of curve rows[i] at arc length
+        s[i] from the start of the curve. Arc lengths beyond the end of the
+        curve are extrapolated from the last knot interval.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        s = np.asarray(s, dtype=np.float64)
+
+        s_knots = self.s_knots[rows]
+        k = (s_knots <= s[:, np.newaxis]).sum(axis=1) - 1
+        k = np.clip(k, 0, self.size - 1)
+
+        samples = np.arange(len(rows))
+        p_knots = self.p_knots[rows]
+        p_start = p_knots[samples, k]
+        s_start = s_knots[samples, k]
+        p_step = p_knots[samples, k + 1] - p_start
+        s_step = s_knots[samples, k + 1] - s_start
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            p = p_start + np.where(s_step > 0.0, (s - s_start) / s_step, 0.0) * p_step
+
+        u = self.u[rows]
+        v = self.v[rows]
+        for _ in range(iterations):
+            residual = s_start + _integrate(u, v, p_start, p, 1, DEFAULT_ORDER) - s
+            speed = _speed(u, v, p[:, np.newaxis])[:, 0]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                p = np.where(speed > 0.0, p - residual / speed, p)
+
+        return p
+
+
+@functools.lru_cache(maxsize=4096)
+def get_reparametrization_table(
+    u: Tuple[float, float, float, float],
+    v: Tuple[float, float, float, float],
+    p_end: float,
+) -> ReparametrizationTable:
+    """
+    Returns the table of a single curve, cached by its coefficients.
+    """
+    return ReparametrizationTable(np.array([u]), np.array([v]), p_end)
@@ -0,0 +1,541 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import json
+import math
+import mmap
+import os
+import re
+import tempfile
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+# Increase when the layout of the index file changes
+INDEX_VERSION = 3
+
+INDEX_FILE_SUFFIX = ".index.json"
+
+ROAD = "road"
+JUNCTION = "junction"
+CONTROLLER = "controller"
+
+TOP_LEVEL_TAGS = (ROAD, JUNCTION, CONTROLLER)
+
+# Lateral distance added to the extent of the reference line, covering the
+# lanes of the road
+DEFAULT_BOUNDING_BOX_MARGIN = 50.0
+
+# Markup that is not parsed as elements. Tags inside comments, CDATA
+# sections and processing instructions are skipped.
+_UNPARSED_PATTERN = rb"<!--.*?-->|<!\[CDATA\[.*?\]\]>|<\?.*?\?>"
+_UNPARSED_MARKUP_PATTERN = re.compile(_UNPARSED_PATTERN, re.DOTALL)
+_START_TAG_PATTERN = re.compile(
+    _UNPARSED_PATTERN + rb"|<(road|junction|controller)[\s/>]", re.DOTALL
+)
+_END_TAG_PATTERNS = {
+    tag.encode(): re.compile(
+        _UNPARSED_PATTERN + rb"|(</" + tag.encode() + rb"\s*>)", re.DOTALL
+    )
+    for tag in TOP_LEVEL_TAGS
+}
+_ID_PATTERN = re.compile(rb'\sid="([^"]*)"')
+_ROAD_JUNCTION_PATTERN = re.compile(rb'\sjunction="([^"]*)"')
+_ROAD_LINK_PATTERN = re.compile(rb"<(?:predecessor|successor)\s[^>]*>")
+_ELEMENT_TYPE_PATTERN = re.compile(rb'\selementType="([^"]*)"')
+_ELEMENT_ID_PATTERN = re.compile(rb'\selementId="([^"]*)"')
+_GEOMETRY_PATTERN = re.compile(
+    rb"(<geometry\s[^>]*?)(?:/>|>(.*?)</geometry>)", re.DOTALL
+)
+_PARAM_POLY3_PATTERN = re.compile(rb"<paramPoly3\s[^>]*>")
+_S_PATTERN = re.compile(rb'\ss="([^"]*)"')
+_X_PATTERN = re.compile(rb'\sx="([^"]*)"')
+_Y_PATTERN = re.compile(rb'\sy="([^"]*)"')
+_LENGTH_PATTERN = re.compile(rb'\slength="([^"]*)"')
+_P_RANGE_PATTERN = re.compile(rb'\spRange="([^"]*)"')
+_PARAM_POLY3_COEFFICIENTS = tuple(
+    (
+        re.compile(rb"\s" + name.encode() + rb'U="([^"]*)"'),
+        re.compile(rb"\s" + name.encode() + rb'V="([^"]*)"'),
+    )
+    for name in "abcd"
+)
+_JUNCTION_ROAD_PATTERN = re.compile(
+    rb'\s(?:incomingRoad|connectingRoad|linkedRoad)="([^"]*)"'
+)
+_XPATH_PATTERN = re.compile(r"^(/[^/]+/)(road|junction|controller)(?:\[(\d+)\])?")
+
+
+@dataclass
+class IndexedElement:
+    tag: str
+    id: str
+    start: int
+    end: int
+    # 1-based position among the top-level elements with the same tag
+    position: int
+    # (tag, id) of the roads and junctions the element is linked to
+    links: List[Tuple[str, str]] = field(default_factory=list)
+    # Id of the junction a road belongs to
+    junction: Optional[str] = None
+    # Inertial (x_min, y_min, x_max, y_max) containing the reference line of a
+    # road, None if unknown
+    extent: Optional[Tuple[float, float, float, float]] = None
+
+
+@dataclass
+class RegionOfInterest:
+    """
+    Roads and junctions to check, selected by id or by an inertial bounding
+    box (x_min, y_min, x_max, y_max). A junction and its connecting roads are
+    always selected together.
+    """
+
+    road_ids: Set[str] = field(default_factory=set)
+    junction_ids: Set[str] = field(default_factory=set)
+    bounding_box: Optional[Tuple[float, float, float, float]] = None
+    margin: float = DEFAULT_BOUNDING_BOX_MARGIN
+
+    def is_empty(self) -> bool:
+        return (
+            len(self.road_ids) == 0
+            and len(self.junction_ids) == 0
+            and self.bounding_box is None
+        )
+
+    def contains_road(self, element: IndexedElement) -> bool:
+        if element.id in self.road_ids:
+            return True
+        if self.bounding_box is None:
+            return False
+        # Roads without a known extent are kept, the prefilter must never
+        # drop a road inside the box
+        if element.extent is None:
+            return True
+
+        x_min, y_min, x_max, y_max = element.extent
+        box_x_min, box_y_min, box_x_max, box_y_max = self.bounding_box
+        return (
+            x_min - self.margin <= box_x_max
+            and x_max + self.margin >= box_x_min
+            and y_min - self.margin <= box_y_max
+            and y_max + self.margin >= box_y_min
+        )
+
+
+@dataclass
+class ByteIndex:
+    """
+    Byte offsets of the top-level <road>, <junction> and <controller> elements
+    of an OpenDRIVE file. header_end is the offset of the first and footer_start
+    the end of the last indexed element.
+    """
+
+    size: int
+    mtime_ns: int
+    header_end: int
+    footer_start: int
+    elements: List[IndexedElement]
+
+    def counts(self) -> Dict[str, int]:
+        counts = {tag: 0 for tag in TOP_LEVEL_TAGS}
+        for element in self.elements:
+            counts[element.tag] += 1
+        return counts
+
+    def select(
+        self, region: RegionOfInterest
+    ) -> Tuple[List[IndexedElement], List[IndexedElement]]:
+        """
+        Returns the roads and junctions of the region and the elements needed
+        as their context, both in file order. The context are the roads and
+        junctions linked to a selected element, the roads of every included
+        junction with their links and all controllers.
+        """
+        by_key = {(e.tag, e.id): e for e in self.elements}
+        roads = [e for e in self.elements if e.tag == ROAD]
+
+        region_roads = {e.id for e in roads if region.contains_road(e)}
+        member_roads: Dict[str, Set[str]] = dict()
+        for road in roads:
+            if road.junction is not None:
+                member_roads.setdefault(road.junction, set()).add(road.id)
+
+        # A junction is selected with any of its connecting roads. A direct
+        # junction has no connecting roads and is selected with its linked
+        # roads.
+        junction_ids = set(region.junction_ids)
+        for junction in self.elements:
+            if junction.tag != JUNCTION:
+                continue
+            if junction.id in member_roads:
+                junction_roads = member_roads[junction.id]
+            else:
+                junction_roads = {road_id for _, road_id in junction.links}
+            if len(junction_roads & region_roads) > 0:
+                junction_ids.add(junction.id)
+
+        selected_keys = {(JUNCTION, i) for i in junction_ids} | {
+            (ROAD, e.id)
+            for e in roads
+            if e.id in region_roads or e.junction in junction_ids
+        }
+        selected_keys &= by_key.keys()
+
+        context_keys: Set[Tuple[str, str]] = set()
+        for key in selected_keys:
+            context_keys.update(by_key[key].links)
+        # Junction checkers follow the links of the junction roads
+        for key in list(selected_keys | context_keys):
+            if key[0] == JUNCTION and key in by_key:
+                for road_key in by_key[key].links:
+                    context_keys.add(road_key)
+                    if road_key in by_key:
+                        context_keys.update(by_key[road_key].links)
+        context_keys = (context_keys & by_key.keys()) - selected_keys
+
+        selected = []
+        context = []
+        for element in self.elements:
+            key = (element.tag, element.id)
+            if key in selected_keys:
+                selected.append(element)
+            elif key in context_keys or element.tag == CONTROLLER:
+                context.append(element)
+
+        return selected, context
+
+
+def _find_element_end(data: mmap.mmap, tag: bytes, start: int) -> Tuple[int, int]:
+    """
+    Returns the end offsets of the start tag and of the element starting at
+    start.
+    """
+    start_tag_end = data.find(b">", start) + 1
+    if start_tag_end == 0:
+        raise ValueError(f"Unterminated <{tag.decode()}> at byte {start}.")
+    if data[start_tag_end - 2 : start_tag_end - 1] == b"/":
+        return start_tag_end, start_tag_end
+
+    end_tag_pattern = _END_TAG_PATTERNS[tag]
+    offset = start_tag_end
+    while True:
+        match = end_tag_pattern.search(data, offset)
+        if match is None:
+            raise ValueError(f"Unterminated <{tag.decode()}> at byte {start}.")
+        if match.group(1) is not None:
+            return start_tag_end, match.end()
+        offset = match.end()
+
+
+def _get_attribute(pattern: re.Pattern, data: bytes) -> Optional[str]:
+    match = pattern.search(data)
+    return None if match is None else match.group(1).decode()
+
+
+def _to_float(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _get_param_poly3_radius(
+    param_poly3: bytes, length: float, evaluated_length: float
+) -> Optional[float]:
+    """
+    Returns a bound of the distance of the paramPoly3 curve from its start,
+    evaluated up to evaluated_length: the sum of the absolute coefficients
+    times the powers of the largest p.
+    """
+    if _get_attribute(_P_RANGE_PATTERN, param_poly3) == "arcLength":
+        p = evaluated_length
+    elif length != 0.0:
+        p = evaluated_length / abs(length)
+    else:
+        return None
+
+    u_bound = 0.0
+    v_bound = 0.0
+    for power, (u_pattern, v_pattern) in enumerate(_PARAM_POLY3_COEFFICIENTS):
+        u = _to_float(_get_attribute(u_pattern, param_poly3))
+        v = _to_float(_get_attribute(v_pattern, param_poly3))
+        if u is None or v is None:
+            return None
+        u_bound += abs(u) * p**power
+        v_bound += abs(v) * p**power
+
+    return math.hypot(u_bound, v_bound)
+
+
+def _get_road_extent(
+    plan_view: bytes, road_length: Optional[float]
+) -> Optional[Tuple[float, float, float, float]]:
+    """
+    Returns a box containing the reference line, using only the geometry
+    records: a line, arc or spiral is never farther from its start than its
+    length. Returns None if the extent cannot be bounded, e.g. for a poly3
+    geometry.
+    """
+    geometries = _GEOMETRY_PATTERN.findall(plan_view)
+
+    x_values = []
+    y_values = []
+    for i, (header, body) in enumerate(geometries):
+        s = _to_float(_get_attribute(_S_PATTERN, header))
+        x = _to_float(_get_attribute(_X_PATTERN, header))
+        y = _to_float(_get_attribute(_Y_PATTERN, header))
+        length = _to_float(_get_attribute(_LENGTH_PATTERN, header))
+        if s is None or x is None or y is None or length is None:
+            return None
+        if b"<poly3" in body:
+            return None
+
+        # The last geometry is extrapolated up to the road length
+        radius = abs(length)
+        if i == len(geometries) - 1 and road_length is not None:
+            radius = max(radius, road_length - s)
+
+        param_poly3 = _PARAM_POLY3_PATTERN.search(body)
+        if param_poly3 is not None:
+            param_poly3_radius = _get_param_poly3_radius(
+                param_poly3.group(0), length, radius
+            )
+            if param_poly3_radius is None:
+                return None
+            radius = max(radius, param_poly3_radius)
+
+        x_values.extend((x - radius, x + radius))
+        y_values.extend((y - radius, y + radius))
+
+    if len(x_values) == 0:
+        return None
+
+    return (min(x_values), min(y_values), max(x_values), max(y_values))
+
+
+def build_byte_index(path: str) -> ByteIndex:
+    """
+    Scans the file once for the top-level road, junction and controller
+    elements. Roads and junctions never nest, controllers inside a junction
+    are skipped. Elements inside comments, CDATA sections and processing
+    instructions are not indexed.
+    """
+    stat = os.stat(path)
+    elements: List[IndexedElement] = []
+    positions = {tag: 0 for tag in TOP_LEVEL_TAGS}
+
+    with open(path, "rb") as raw_file:
+        if stat.st_size == 0:
+            return ByteIndex(stat.st_size, stat.st_mtime_ns, 0, 0, [])
+
+        with mmap.mmap(raw_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            offset = 0
+            while True:
+                match = _START_TAG_PATTERN.search(data, offset)
+                if match is None:
+                    break
+
+                tag = match.group(1)
+                if tag is None:
+                    offset = match.end()
+                    continue
+
+                start = match.start()
+                start_tag_end, end = _find_element_end(data, tag, start)
+                start_tag = data[start:start_tag_end]
+
+                name = tag.decode()
+                positions[name] += 1
+                element = IndexedElement(
+                    tag=name,
+                    id=_get_attribute(_ID_PATTERN, start_tag) or "",
+                    start=start,
+                    end=end,
+                    position=positions[name],
+                )
+
+                body = data[start_tag_end:end]
+                if b"<!" in body or b"<?" in body:
+                    body = _UNPARSED_MARKUP_PATTERN.sub(b"", body)
+                if name == ROAD:
+                    junction_id = _get_attribute(_ROAD_JUNCTION_PATTERN, start_tag)
+                    if junction_id is not None and junction_id != "-1":
+                        element.junction = junction_id
+                        element.links.append((JUNCTION, junction_id))
+                    # The road link precedes the planView, later <link>
+                    # elements belong to lanes
+                    plan_view = body.find(b"<planView")
+                    road_link = body if plan_view < 0 else body[:plan_view]
+                    if plan_view >= 0:
+                        plan_view_end = body.find(b"</planView>", plan_view)
+                        element.extent = _get_road_extent(
+                            (
+                                body[plan_view:plan_view_end]
+                                if plan_view_end >= 0
+                                else body[plan_view:]
+                            ),
+                            _to_float(_get_attribute(_LENGTH_PATTERN, start_tag)),
+                        )
+                    for link in _ROAD_LINK_PATTERN.findall(road_link):
+                        element_type = _get_attribute(_ELEMENT_TYPE_PATTERN, link)
+                        element_id = _get_attribute(_ELEMENT_ID_PATTERN, link)
+                        if element_type in (ROAD, JUNCTION) and element_id:
+                            element.links.append((element_type, element_id))
+                elif name == JUNCTION:
+                    element.links = [
+                        (ROAD, road_id.decode())
+                        for road_id in _JUNCTION_ROAD_PATTERN.findall(body)
+                    ]
+
+                elements.append(element)
+                offset = end
+
+            footer_start = elements[-1].end if elements else len(data)
+            header_end = elements[0].start if elements else len(data)
+
+    return ByteIndex(
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        header_end=header_end,
+        footer_start=footer_start,
+        elements=elements,
+    )
+
+
+def get_index_path(path: str) -> str:
+    return path + INDEX_FILE_SUFFIX
+
+
+def save_byte_index(index: ByteIndex, index_path: str) -> None:
+    """
+    Writes the index atomically. Failing to write it, e.g. in a read-only map
+    store, is not an error: the index is rebuilt by the next run.
+    """
+    content = dict(asdict(index), version=INDEX_VERSION)
+    directory = os.path.dirname(os.path.abspath(index_path))
+    try:
+        handle, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(handle, "w") as index_file:
+            json.dump(content, index_file)
+        os.replace(temporary, index_path)
+    except OSError:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+def load_byte_index(path: str) -> Optional[ByteIndex]:
+    """
+    Returns the index stored next to the file, or None if there is none or it
+    is outdated.
+    """
+    try:
+        with open(get_index_path(path)) as index_file:
+            content = json.load(index_file)
+    except (OSError, ValueError):
+        return None
+
+    stat = os.stat(path)
+    if (
+        content.get("version") != INDEX_VERSION
+        or content["size"] != stat.st_size
+        or content["mtime_ns"] != stat.st_mtime_ns
+    ):
+        return None
+
+    return ByteIndex(
+        size=content["size"],
+        mtime_ns=content["mtime_ns"],
+        header_end=content["header_end"],
+        footer_start=content["footer_start"],
+        elements=[
+            IndexedElement(
+                **dict(
+                    e,
+                    links=[tuple(link) for link in e["links"]],
+                    extent=None if e["extent"] is None else tuple(e["extent"]),
+                )
+            )
+            for e in content["elements"]
+        ],
+    )
+
+
+def get_byte_index(path: str) -> ByteIndex:
+    index = load_byte_index(path)
+    if index is None:
+        index = build_byte_index(path)
+        save_byte_index(index, get_index_path(path))
+    return index
+
+
+class PartialDocument:
+    """
+    A document made of the header and footer of an OpenDRIVE file and a
+    selection of its top-level elements. Maps the xpaths of the partial
+    document back to the positions of the elements in the original file.
+    """
+
+    def __init__(
+        self,
+        index: ByteIndex,
+        selected: List[IndexedElement],
+        context: List[IndexedElement],
+    ):
+        self.index = index
+        self.selected = selected
+        self.context = context
+        self.elements = sorted(selected + context, key=lambda e: e.start)
+        self._selected_starts = {e.start for e in selected}
+
+        self._partial: Dict[str, List[IndexedElement]] = {t: [] for t in TOP_LEVEL_TAGS}
+        for element in self.elements:
+            self._partial[element.tag].append(element)
+        self._original_counts = index.counts()
+
+    def read(self, path: str) -> bytes:
+        with open(path, "rb") as raw_file:
+            with mmap.mmap(raw_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                parts = [data[: self.index.header_end]]
+                parts.extend(data[e.start : e.end] for e in self.elements)
+                parts.append(data[self.index.footer_start :])
+        return b"\n".join(parts)
+
+    def _find_element(self, xpath: str) -> Optional[Tuple[re.Match, IndexedElement]]:
+        match = _XPATH_PATTERN.match(xpath)
+        if match is None:
+            return None
+        elements = self._partial[match.group(2)]
+        position = int(match.group(3) or 1)
+        if position > len(elements):
+            return None
+        return match, elements[position - 1]
+
+    def map_xpath(self, xpath: str) -> str:
+        """
+        Returns the xpath of the same node in the original file.
+        """
+        found = self._find_element(xpath)
+        if found is None:
+            return xpath
+
+        match, element = found
+        if self._original_counts[element.tag] > 1:
+            top_level = f"{match.group(1)}{element.tag}[{element.position}]"
+        else:
+            top_level = f"{match.group(1)}{element.tag}"
+        return top_level + xpath[match.end() :]
+
+    def is_context(self, xpath: str) -> bool:
+        """
+        Returns True if the xpath points into an element that was only parsed
+        as context of the selection.
+        """
+        found = self._find_element(xpath)
+        return found is not None and found[1].start not in self._selected_starts
@@ -0,0 +1,136 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+from typing import Tuple
+
+import numpy as np
+from scipy import special
+
+PYCLOTHOIDS = "pyclothoids"
+FRESNEL = "fresnel"
+BACKENDS = (PYCLOTHOIDS, FRESNEL)
+DEFAULT_BACKEND = PYCLOTHOIDS
+
+# The Fresnel form evaluates the clothoid relative to the point of zero
+# curvature. Its phase k0^2 / (2 kd) grows without bound when the curvature
+# rate goes to zero, and with it the rounding error. Above this phase the
+# clothoid is integrated with quadrature instead.
+MAX_FRESNEL_PHASE = 1.0e4
+# Gauss-Legendre nodes per quadrature subinterval and heading change covered
+# by one subinterval
+QUADRATURE_ORDER = 8
+QUADRATURE_MAX_ANGLE = np.pi / 4
+QUADRATURE_MAX_SEGMENTS = 256
+
+_backend = DEFAULT_BACKEND
+
+
+def get_backend() -> str:
+    return _backend
+
+
+def set_backend(backend: str) -> None:
+    """
+    Selects how spirals are evaluated: with pyclothoids, one point per call,
+    or with Fresnel integrals on arrays of samples.
+    """
+    global _backend
+    if backend not in BACKENDS:
+        raise ValueError(
+            f"Unknown spiral backend '{backend}', expected one of {', '.join(BACKENDS)}."
+        )
+    _backend = backend
+
+
+def _fresnel_offsets(
+    curv_start: np.ndarray, curv_rate: np.ndarray, ds: np.ndarray
+) -> np.ndarray:
+    """
+    Returns the offsets of clothoids with start heading 0 as complex numbers.
+
+    With t0 = k0 / kd the heading k0 t + kd t^2 / 2 is kd / 2 (t + t0)^2 - kd
+    t0^2 / 2, so the offset is a difference of Fresnel integrals at
+    a (t + t0), a = sqrt(|kd| / pi), rotated by the constant phase.
+    """
+    sign = np.sign(curv_rate)
+    scale = np.sqrt(np.abs(curv_rate) / np.pi)
+    shift = curv_start / curv_rate
+
+    s_start, c_start = special.fresnel(scale * shift)
+    s_end, c_end = special.fresnel(scale * (ds + shift))
+    phase = -0.5 * curv_start * shift
+
+    return (
+        np.exp(1j * phase) * ((c_end - c_start) + 1j * sign * (s_end - s_start)) / scale
+    )
+
+
+def _quadrature_offsets(
+    curv_start: np.ndarray, curv_rate: np.ndarray, ds: np.ndarray
+) -> np.ndarray:
+    """
+    Returns the offsets of clothoids with start heading 0 as complex numbers,
+    integrated with composite Gauss-Legendre quadrature. All samples use the
+    number of subintervals needed for the largest heading change.
+    """
+    if len(ds) == 0:
+        return np.zeros(0, dtype=np.complex128)
+
+    angle = np.abs(curv_start * ds) + np.abs(0.5 * curv_rate * ds**2)
+    segments = int(
+        np.clip(
+            np.ceil(np.max(angle) / QUADRATURE_MAX_ANGLE), 1, QUADRATURE_MAX_SEGMENTS
+        )
+    )
+
+    nodes, weights = np.polynomial.legendre.leggauss(QUADRATURE_ORDER)
+    offsets = np.arange(segments)[:, np.newaxis]
+    unit_nodes = ((offsets + (nodes + 1.0) / 2.0) / segments).ravel()
+    unit_weights = np.tile(weights / (2.0 * segments), segments)
+
+    t = ds[:, np.newaxis] * unit_nodes
+    theta = t * (curv_start[:, np.newaxis] + 0.5 * curv_rate[:, np.newaxis] * t)
+    return (np.exp(1j * theta) * unit_weights).sum(axis=1) * ds
+
+
+def evaluate_clothoids(
+    x0: np.ndarray,
+    y0: np.ndarray,
+    heading: np.ndarray,
+    curv_start: np.ndarray,
+    curv_rate: np.ndarray,
+    ds: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns x, y and heading of clothoids at distance ds from their start.
+    All arguments are broadcast against each other, so e.g. many ds of one
+    spiral or one ds of many spirals are evaluated at once.
+    """
+    arrays = np.broadcast_arrays(x0, y0, heading, curv_start, curv_rate, ds)
+    shape = arrays[0].shape
+    arrays = [np.asarray(a, dtype=np.float64).ravel() for a in arrays]
+    x0, y0, heading, curv_start, curv_rate, ds = arrays
+
+    offsets = np.full(len(ds), np.nan, dtype=np.complex128)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fresnel = np.abs(curv_rate) * MAX_FRESNEL_PHASE > 0.5 * curv_start**2
+    quadrature = ~fresnel & np.isfinite(curv_rate)
+
+    offsets[fresnel] = _fresnel_offsets(
+        curv_start[fresnel], curv_rate[fresnel], ds[fresnel]
+    )
+    offsets[quadrature] = _quadrature_offsets(
+        curv_start[quadrature], curv_rate[quadrature], ds[quadrature]
+    )
+
+    offsets *= np.exp(1j * heading)
+    theta = heading + ds * (curv_start + 0.5 * curv_rate * ds)
+
+    return (
+        (x0 + offsets.real).reshape(shape),
+        (y0 + offsets.imag).reshape(shape),
+        theta.reshape(shape),
+    )
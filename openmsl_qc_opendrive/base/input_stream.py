@@ -0,0 +1,123 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import contextlib
+import gzip
+import io
+import lzma
+import re
+from typing import BinaryIO, Iterator, Optional
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+GZIP = "gzip"
+XZ = "xz"
+ZSTD = "zstd"
+
+MAGIC_BYTES = {
+    GZIP: b"\x1f\x8b",
+    XZ: b"\xfd7zXZ\x00",
+    ZSTD: b"\x28\xb5\x2f\xfd",
+}
+
+READ_CHUNK_SIZE = 1 << 20
+DEFAULT_ZSTD_CHUNK_SIZE = 1 << 20
+
+DEFAULT_NAMESPACE_PATTERN = re.compile(rb' xmlns="[^"]+"')
+
+
+def detect_compression(raw_file: io.BufferedReader) -> Optional[str]:
+    """
+    Returns the compression of the file from its magic bytes, or None for an
+    uncompressed file. The read position is not changed.
+    """
+    header = raw_file.peek(max(len(magic) for magic in MAGIC_BYTES.values()))
+    for compression, magic in MAGIC_BYTES.items():
+        if header.startswith(magic):
+            return compression
+    return None
+
+
+def is_compressed(path: str) -> bool:
+    with open(path, "rb") as raw_file:
+        return detect_compression(raw_file) is not None
+
+
+@contextlib.contextmanager
+def open_input_stream(
+    path: str, zstd_chunk_size: int = DEFAULT_ZSTD_CHUNK_SIZE
+) -> Iterator[BinaryIO]:
+    """
+    Opens the file for reading its uncompressed content. gzip, xz and zstd
+    compressed files are decompressed while reading, without an intermediate
+    file. zstd requires the optional zstandard package.
+    """
+    with open(path, "rb") as raw_file:
+        compression = detect_compression(raw_file)
+
+        if compression == GZIP:
+            with gzip.GzipFile(fileobj=raw_file, mode="rb") as stream:
+                yield stream
+        elif compression == XZ:
+            with lzma.LZMAFile(raw_file, mode="rb") as stream:
+                yield stream
+        elif compression == ZSTD:
+            if zstandard is None:
+                raise RuntimeError(
+                    f"{path} is zstd compressed, but the zstandard package is not installed."
+                )
+            decompressor = zstandard.ZstdDecompressor()
+            with decompressor.stream_reader(
+                raw_file,
+                read_size=zstd_chunk_size,
+                read_across_frames=True,
+                closefd=False,
+            ) as stream:
+                yield stream
+        else:
+            yield raw_file
+
+
+class DefaultNamespaceFilter(io.RawIOBase):
+    """
+    Removes the default namespace declarations from an XML byte stream.
+
+    The stream is read in chunks. Only the part up to the last '>' of the data
+    read so far is filtered and passed on, so that a declaration is never
+    split between two chunks.
+    """
+
+    def __init__(self, stream: BinaryIO, chunk_size: int = READ_CHUNK_SIZE):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._pending = b""
+        self._output = memoryview(b"")
+        self._eof = False
+
+    def readable(self) -> bool:
+        return True
+
+    def _fill(self) -> None:
+        while len(self._output) == 0 and not self._eof:
+            chunk = self._stream.read(self._chunk_size)
+            if not chunk:
+                self._eof = True
+                data, self._pending = self._pending, b""
+            else:
+                data = self._pending + chunk
+                end = data.rfind(b">") + 1
+                data, self._pending = data[:end], data[end:]
+            self._output = memoryview(DEFAULT_NAMESPACE_PATTERN.sub(b"", data))
+
+    def readinto(self, buffer) -> int:
+        self._fill()
+        count = min(len(buffer), len(self._output))
+        buffer[:count] = self._output[:count]
+        self._output = self._output[count:]
+        return count
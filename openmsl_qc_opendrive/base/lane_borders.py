@@ -0,0 +1,283 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from openmsl_qc_opendrive.base import models
+
+
+class _LanePolynomials:
+    """
+    Width or border polynomials of one lane, evaluated relative to the start of
+    the lane section. Before the first s_offset the polynomial is undefined.
+
+    The record lookup follows the linear scan of the scalar implementation
+    (the first record with s_offset > ds ends the search), which is the same as
+    a binary search on the running maximum of the s offsets.
+    """
+
+    def __init__(self, records: List[models.OffsetPoly3]):
+        s_offsets = np.array([r.s_offset for r in records], dtype=np.float64)
+        self.s_offsets = s_offsets
+        self.search_offsets = np.maximum.accumulate(s_offsets)
+        self.coefficients = np.array(
+            [[r.poly3.a, r.poly3.b, r.poly3.c, r.poly3.d] for r in records],
+            dtype=np.float64,
+        ).reshape(-1, 4)
+
+    @classmethod
+    def from_arrays(
+        cls, s_offsets: np.ndarray, coefficients: np.ndarray
+    ) -> "_LanePolynomials":
+        polynomials = cls.__new__(cls)
+        polynomials.s_offsets = s_offsets
+        polynomials.search_offsets = np.maximum.accumulate(s_offsets)
+        polynomials.coefficients = coefficients.reshape(-1, 4)
+        return polynomials
+
+    def __len__(self) -> int:
+        return len(self.s_offsets)
+
+    def evaluate(self, ds: np.ndarray) -> np.ndarray:
+        indices = np.searchsorted(self.search_offsets, ds, side="right") - 1
+        undefined = indices < 0
+        indices = np.where(undefined, 0, indices)
+
+        a, b, c, d = self.coefficients[indices].T
+        p = ds - self.s_offsets[indices]
+        value = a + p * (b + p * (c + p * d))
+        return np.where(undefined, np.nan, value)
+
+
+class LaneWidthTable:
+    """
+    Width polynomials of many lanes, e.g. all lanes of a network, in
+    contiguous arrays. Row i holds the records of lane i, so that widths of
+    arbitrary (lane, ds) pairs are evaluated in one batch. The record lookup
+    is the same as in _LanePolynomials.
+    """
+
+    def __init__(self, widths: List[List[models.OffsetPoly3]]):
+        self.counts = np.array([len(w) for w in widths], dtype=np.int64)
+        self.starts = np.concatenate([[0], np.cumsum(self.counts)[:-1]]).astype(
+            np.int64
+        )
+
+        records = [r for lane_widths in widths for r in lane_widths]
+        self.s_offsets = np.array([r.s_offset for r in records], dtype=np.float64)
+        self.coefficients = np.array(
+            [[r.poly3.a, r.poly3.b, r.poly3.c, r.poly3.d] for r in records],
+            dtype=np.float64,
+        ).reshape(-1, 4)
+
+        # Running maximum of the s offsets within each lane. Only lanes with
+        # unsorted records need it.
+        self.search_offsets = self.s_offsets.copy()
+        is_lane_start = np.zeros(len(records), dtype=bool)
+        is_lane_start[self.starts[self.counts > 0]] = True
+        unsorted = np.flatnonzero((np.diff(self.s_offsets) < 0.0) & ~is_lane_start[1:])
+        lanes = np.unique(np.searchsorted(self.starts, unsorted, side="right") - 1)
+        for start, count in zip(self.starts[lanes], self.counts[lanes]):
+            self.search_offsets[start : start + count] = np.maximum.accumulate(
+                self.s_offsets[start : start + count]
+            )
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def evaluate(self, rows: np.ndarray, ds: np.ndarray) -> np.ndarray:
+        """
+        Returns the width of lane rows[i] at ds[i] relative to the start of its
+        lane section, NaN where the lane has no width.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        ds = np.asarray(ds, dtype=np.float64)
+        widths = np.full(ds.shape, np.nan)
+
+        counts = self.counts[rows]
+        starts = self.starts[rows]
+        has_width = counts > 0
+        if not has_width.any():
+            return widths
+
+        # All records of the lane of each query, one block per query
+        block_starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        records = np.repeat(starts - block_starts, counts) + np.arange(counts.sum())
+        is_below = (self.search_offsets[records] <= np.repeat(ds, counts)).astype(
+            np.int64
+        )
+
+        below = np.zeros(len(rows), dtype=np.int64)
+        below[has_width] = np.add.reduceat(is_below, block_starts[has_width])
+
+        defined = below > 0
+        index = starts[defined] + below[defined] - 1
+        a, b, c, d = self.coefficients[index].T
+        p = ds[defined] - self.s_offsets[index]
+        widths[defined] = a + p * (b + p * (c + p * d))
+        return widths
+
+
+class LaneGroupBorders:
+    """
+    Compiled lane widths and borders of the left or right lanes of a lane
+    section. Evaluates the outer border t of all lanes for many s at once.
+
+    If any lane has a width at a given s, only lanes with a width have a border
+    there: lane_offset plus the cumulated widths from the center outward. Else
+    the <border> records of the lanes are used directly.
+
+    Lanes are identified by their id. If an id appears twice the last lane wins.
+    """
+
+    def __init__(
+        self,
+        lane_ids: List[int],
+        widths: List[List[models.OffsetPoly3]],
+        borders: List[List[models.OffsetPoly3]],
+    ):
+        rows: Dict[int, int] = dict()
+        for i, lane_id in enumerate(lane_ids):
+            rows[lane_id] = i
+        kept = sorted(rows.values(), key=lambda i: abs(lane_ids[i]))
+
+        self._set_lanes(
+            np.array([lane_ids[i] for i in kept], dtype=np.int64),
+            [_LanePolynomials(widths[i]) for i in kept],
+            [_LanePolynomials(borders[i]) for i in kept],
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        lane_ids: np.ndarray,
+        widths: List[Tuple[np.ndarray, np.ndarray]],
+        borders: List[Tuple[np.ndarray, np.ndarray]],
+    ) -> "LaneGroupBorders":
+        """
+        Creates the borders from compiled arrays, e.g. views of a network
+        snapshot. lane_ids must already be unique and sorted by |id|, widths
+        and borders hold the (s_offsets, coefficients) of each lane.
+        """
+        group = cls.__new__(cls)
+        group._set_lanes(
+            lane_ids,
+            [_LanePolynomials.from_arrays(*arrays) for arrays in widths],
+            [_LanePolynomials.from_arrays(*arrays) for arrays in borders],
+        )
+        return group
+
+    def _set_lanes(
+        self,
+        lane_ids: np.ndarray,
+        widths: List[_LanePolynomials],
+        borders: List[_LanePolynomials],
+    ) -> None:
+        self.lane_ids = lane_ids
+        self.widths = widths
+        self.borders = borders
+        self.rows = {int(lane_id): row for row, lane_id in enumerate(self.lane_ids)}
+
+    def __len__(self) -> int:
+        return len(self.lane_ids)
+
+    def _evaluate(
+        self, polynomials: List[_LanePolynomials], ds: np.ndarray
+    ) -> np.ndarray:
+        values = np.full((len(self.lane_ids), len(ds)), np.nan)
+        for row, lane_id in enumerate(self.lane_ids):
+            if lane_id == 0:
+                values[row] = 0.0
+            elif len(polynomials[row]) > 0:
+                values[row] = polynomials[row].evaluate(ds)
+        return values
+
+    def evaluate_outer_borders(
+        self, ds: np.ndarray, lane_offset: np.ndarray
+    ) -> np.ndarray:
+        """
+        Returns an array (lanes, samples) with the outer border t of each lane
+        in lane_ids order, NaN where the border is undefined. ds is the s
+        coordinate relative to the lane section start.
+        """
+        ds = np.atleast_1d(np.asarray(ds, dtype=np.float64))
+        lane_offset = np.broadcast_to(
+            np.asarray(lane_offset, dtype=np.float64), ds.shape
+        )
+
+        widths = self._evaluate(self.widths, ds)
+        has_width = ~np.isnan(widths)
+        steps = np.where(has_width, widths, 0.0)
+
+        # Rows are sorted by |id|, so each side is accumulated with a single
+        # cumsum starting at the lane offset.
+        cumulated = np.empty(widths.shape)
+        for side, sign in ((self.lane_ids > 0, 1.0), (self.lane_ids < 0, -1.0)):
+            if np.any(side):
+                stacked = np.vstack([lane_offset, sign * steps[side]])
+                cumulated[side] = np.cumsum(stacked, axis=0)[1:]
+        cumulated[self.lane_ids == 0] = lane_offset
+
+        width_borders = np.where(has_width, cumulated, np.nan)
+        if not np.all(has_width.any(axis=0)):
+            raw_borders = self._evaluate(self.borders, ds)
+            return np.where(has_width.any(axis=0), width_borders, raw_borders)
+
+        return width_borders
+
+    def evaluate_middle(
+        self, lane_id: int, ds: np.ndarray, lane_offset: np.ndarray
+    ) -> np.ndarray:
+        """
+        Returns the t coordinate of the middle of the lane for each ds, NaN
+        where it is undefined.
+        """
+        ds = np.atleast_1d(np.asarray(ds, dtype=np.float64))
+        lane_offset = np.broadcast_to(
+            np.asarray(lane_offset, dtype=np.float64), ds.shape
+        )
+
+        outer_row = self.rows.get(lane_id)
+        if outer_row is None:
+            return np.full(ds.shape, np.nan)
+
+        borders = self.evaluate_outer_borders(ds, lane_offset)
+        t_outer = borders[outer_row]
+
+        if abs(lane_id) == 1:
+            t_inner = lane_offset
+        else:
+            inner_id = lane_id - 1 if lane_id > 0 else lane_id + 1
+            inner_row = self.rows.get(inner_id)
+            if inner_row is None:
+                return np.full(ds.shape, np.nan)
+            t_inner = borders[inner_row]
+
+        return (t_outer + t_inner) / 2.0
+
+
+@dataclass
+class LaneSectionBorders:
+    s: Optional[float]
+    left: LaneGroupBorders
+    right: LaneGroupBorders
+
+    def get_group(self, lane_id: int) -> LaneGroupBorders:
+        return self.left if lane_id > 0 else self.right
+
+    def evaluate_middle(
+        self, lane_id: int, s: np.ndarray, lane_offset: np.ndarray
+    ) -> np.ndarray:
+        s = np.atleast_1d(np.asarray(s, dtype=np.float64))
+        if self.s is None:
+            return np.full(s.shape, np.nan)
+        if lane_id == 0:
+            return np.zeros(s.shape)
+
+        return self.get_group(lane_id).evaluate_middle(lane_id, s - self.s, lane_offset)
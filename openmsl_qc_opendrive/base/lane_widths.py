@@ -0,0 +1,181 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+from lxml import etree
+
+from openmsl_qc_opendrive.base import lane_borders, models, network, utils
+
+
+def compile_lane_width_transitions(
+    roads: List[etree._ElementTree],
+) -> Dict[etree._ElementTree, List[models.LaneWidthTransition]]:
+    """
+    Returns for each road the widths of its lanes and their linked lanes
+    where they meet: between consecutive lane sections and, over road links,
+    between the first or last lane section and the contact lane section of
+    the linked road. Lanes linked one to one are listed once, at the road
+    that is visited first; a split or merge is listed at the single lane.
+    The widths of all lane ends are evaluated in one batch.
+    """
+    road_id_map = {utils.to_int(road.get("id")): road for road in roads}
+    road_sections = {
+        road: utils.get_sorted_lane_sections_with_length_from_road(road)
+        for road in roads
+    }
+
+    # Lane link index: (lane section, lane id) -> row of the width table
+    rows: Dict[Tuple[etree._ElementTree, int], int] = dict()
+    lanes = []
+    widths = []
+    for sections in road_sections.values():
+        for section in sections:
+            for lane in utils.get_left_and_right_lanes_from_lane_section(
+                section.lane_section
+            ):
+                lane_id = utils.get_lane_id(lane)
+                if lane_id is None or lane_id == 0:
+                    continue
+                rows[(section.lane_section, lane_id)] = len(lanes)
+                lanes.append(lane)
+                widths.append(utils.get_lane_width_poly3_list(lane))
+
+    def get_contact_section(road, contact_point):
+        sections = road_sections.get(road, [])
+        if len(sections) == 0:
+            return None
+        if contact_point == models.ContactPoint.START:
+            return road, sections[0], models.ContactPoint.START
+        return road, sections[-1], models.ContactPoint.END
+
+    def get_linked_section(road, sections, i, linkage_tag):
+        if linkage_tag == models.LinkageTag.SUCCESSOR and i + 1 < len(sections):
+            return road, sections[i + 1], models.ContactPoint.START
+        if linkage_tag == models.LinkageTag.PREDECESSOR and i > 0:
+            return road, sections[i - 1], models.ContactPoint.END
+
+        linkage = utils.get_road_linkage(road, linkage_tag)
+        if linkage is None or linkage.id not in road_id_map:
+            return None
+        return get_contact_section(road_id_map[linkage.id], linkage.contact_point)
+
+    def get_end(road, section, contact_point):
+        s_section = utils.get_s_from_lane_section(section.lane_section)
+        if contact_point == models.ContactPoint.START:
+            return 0.0, s_section
+        return section.length, s_section + section.length
+
+    # Lane end (row, contact point) -> (road, ds, s) and the linked lane ends
+    end_positions: Dict[Tuple[int, models.ContactPoint], Tuple] = dict()
+    end_links: Dict[Tuple[int, models.ContactPoint], List[Tuple]] = dict()
+    for road, sections in road_sections.items():
+        for i, section in enumerate(sections):
+            for lane in utils.get_left_and_right_lanes_from_lane_section(
+                section.lane_section
+            ):
+                row = rows.get((section.lane_section, utils.get_lane_id(lane)))
+                if row is None:
+                    continue
+
+                for linkage_tag, contact_point, linked_lane_ids in (
+                    (
+                        models.LinkageTag.PREDECESSOR,
+                        models.ContactPoint.START,
+                        utils.get_predecessor_lane_ids(lane),
+                    ),
+                    (
+                        models.LinkageTag.SUCCESSOR,
+                        models.ContactPoint.END,
+                        utils.get_successor_lane_ids(lane),
+                    ),
+                ):
+                    if len(linked_lane_ids) == 0:
+                        continue
+                    linked = get_linked_section(road, sections, i, linkage_tag)
+                    if linked is None:
+                        continue
+                    linked_road, linked_section, linked_contact_point = linked
+
+                    end = (row, contact_point)
+                    end_positions[end] = (road, *get_end(road, section, contact_point))
+                    for linked_lane_id in set(linked_lane_ids):
+                        linked_row = rows.get(
+                            (linked_section.lane_section, linked_lane_id)
+                        )
+                        if linked_row is None:
+                            continue
+                        linked_end = (linked_row, linked_contact_point)
+                        end_positions[linked_end] = (
+                            linked_road,
+                            *get_end(linked_road, linked_section, linked_contact_point),
+                        )
+                        end_links.setdefault(end, []).append(linked_end)
+
+    # A lane that splits into or merges from several lanes is compared with
+    # their summed width. Each of the several lanes links back to it alone
+    # and is not compared separately. Lanes linked one to one are compared
+    # once, even if both declare the link.
+    groups = []
+    seen = set()
+    for end, linked_ends in end_links.items():
+        if len(linked_ends) == 1:
+            if len(end_links.get(linked_ends[0], [])) > 1:
+                continue
+            key = frozenset([end, linked_ends[0]])
+            if key in seen:
+                continue
+            seen.add(key)
+        groups.append((end, linked_ends))
+
+    transitions = {road: [] for road in roads}
+    if len(groups) == 0:
+        return transitions
+
+    # Evaluate the widths of all lane ends in one batch
+    all_ends = list(end_positions.keys())
+    end_rows = {end: i for i, end in enumerate(all_ends)}
+    table = lane_borders.LaneWidthTable(widths)
+    end_widths = table.evaluate(
+        np.array([row for row, _ in all_ends], dtype=np.int64),
+        np.array([end_positions[end][1] for end in all_ends]),
+    )
+
+    for end, linked_ends in groups:
+        road, _, s = end_positions[end]
+        linked_road, _, linked_s = end_positions[linked_ends[0]]
+        transitions[road].append(
+            models.LaneWidthTransition(
+                road=road,
+                lane=lanes[end[0]],
+                s=s,
+                width=float(end_widths[end_rows[end]]),
+                linked_road=linked_road,
+                linked_lanes=[lanes[row] for row, _ in linked_ends],
+                linked_s=linked_s,
+                linked_width=float(
+                    sum(end_widths[end_rows[linked_end]] for linked_end in linked_ends)
+                ),
+            )
+        )
+    return transitions
+
+
+def get_lane_width_transitions(
+    road: etree._ElementTree,
+) -> List[models.LaneWidthTransition]:
+    """
+    Returns the width transitions between the lanes of the road and their
+    linked lanes. On first use the transitions of all roads of the document
+    are computed at once.
+    """
+    network_index = network.get_network_index(road)
+    transitions = network_index.get_or_create(
+        "lane_width_transitions",
+        lambda: compile_lane_width_transitions(utils.get_roads(network_index.root)),
+    )
+    return transitions.get(road, [])
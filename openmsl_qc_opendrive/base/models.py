@@ -5,9 +5,10 @@
 # with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntEnum
 from lxml import etree
-from typing import Optional
+import numpy as np
+from typing import List, Optional
 
 from qc_baselib import Configuration, Result
 
@@ -50,6 +51,15 @@ class ParamPoly3Range(str, Enum):
     NORMALIZED = "normalized"
 
 
+class GeometryType(IntEnum):
+    INVALID = 0
+    LINE = 1
+    ARC = 2
+    SPIRAL = 3
+    PARAM_POLY3_ARC_LENGTH = 4
+    PARAM_POLY3_NORMALIZED = 5
+
+
 @dataclass
 class ParamPoly3:
     u: Poly3
@@ -80,6 +90,24 @@ class LaneSectionWithLength:
     length: float
 
 
+@dataclass
+class LaneWidthTransition:
+    """
+    Width of a lane where it meets its linked lanes, at s on road, and the
+    summed width of the linked lanes at linked_s on linked_road. Several
+    linked lanes are the result of a split or a merge.
+    """
+
+    road: etree._ElementTree
+    lane: etree._ElementTree
+    s: float
+    width: float
+    linked_road: etree._ElementTree
+    linked_lanes: List[etree._ElementTree]
+    linked_s: float
+    linked_width: float
+
+
 @dataclass
 class OffsetPoly3:
     poly3: Poly3
@@ -87,6 +115,19 @@ class OffsetPoly3:
     xml_element: Optional[etree._ElementTree] = None
 
 
+@dataclass
+class ShapePoly3:
+    """
+    Lateral <shape> record: height above the reference line at lateral
+    position t_offset + dt of the cross section at s_offset.
+    """
+
+    poly3: Poly3
+    s_offset: float
+    t_offset: float
+    xml_element: Optional[etree._ElementTree] = None
+
+
 class LaneDirection(str, Enum):
     STANDARD = "standard"
     REVERSED = "reversed"
@@ -104,3 +145,213 @@ class Point3D:
 class Point2D:
     x: float
     y: float
+
+
+@dataclass
+class RoadOverlap:
+    """
+    Crossing of the outer lane borders of road and other_road at point. If
+    other_road is road, the borders of the road intersect themselves.
+    """
+
+    road: etree._ElementTree
+    other_road: etree._ElementTree
+    point: Point3D
+
+
+@dataclass
+class RoadElementPlacements:
+    """
+    Inertial placements of the objects or signals of a network, one row per
+    element. Footprints are rectangles of half_length along heading and
+    half_width across it, height is NaN where it is not given.
+    """
+
+    elements: List[etree._ElementTree]
+    roads: List[etree._ElementTree]
+    s: np.ndarray
+    t: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    z: np.ndarray
+    heading: np.ndarray
+    half_length: np.ndarray
+    half_width: np.ndarray
+    height: np.ndarray
+
+
+@dataclass
+class GeometryTable:
+    """
+    Attributes of the planView geometries of a set of roads, one row per
+    geometry in document order. road is the index of the road of each row in
+    roads, road_length holds the @length of each road. Missing attributes are
+    NaN, geometry_type is INVALID if the geometry can not be evaluated.
+
+    p_range is PARAM_POLY3_ARC_LENGTH or PARAM_POLY3_NORMALIZED where the
+    geometry has a complete <paramPoly3> of that @pRange, independent of the
+    other attributes, and INVALID otherwise. u and v hold its coefficients.
+    """
+
+    elements: List[etree._ElementTree]
+    roads: List[etree._ElementTree]
+    road_length: np.ndarray
+    road: np.ndarray
+    s: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    heading: np.ndarray
+    length: np.ndarray
+    geometry_type: np.ndarray
+    curvature_start: np.ndarray
+    curvature_end: np.ndarray
+    p_range: np.ndarray
+    u: np.ndarray
+    v: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+
+@dataclass
+class LaneSectionTable:
+    """
+    laneSections of a set of roads, one row per laneSection in document
+    order. road is the index of the road of each row in roads. length is the
+    distance to the start of the next laneSection in s order, or to the end
+    of the road for the last one. It is NaN for all laneSections of a road
+    with a missing @s or road length.
+    """
+
+    elements: List[etree._ElementTree]
+    roads: List[etree._ElementTree]
+    road_length: np.ndarray
+    road: np.ndarray
+    s: np.ndarray
+    length: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+
+@dataclass
+class LaneTable:
+    """
+    Left and right lanes of a set of roads, one row per lane in document
+    order, so the lanes of each laneSection and side are consecutive.
+    lane_section is the row of the laneSection in the LaneSectionTable, side
+    is 1 for left and -1 for right lanes. id is NaN where @id is missing.
+    lane_type is the index of @type in lane_types.
+    """
+
+    elements: List[etree._ElementTree]
+    road: np.ndarray
+    lane_section: np.ndarray
+    side: np.ndarray
+    id: np.ndarray
+    lane_type: np.ndarray
+    lane_types: List[Optional[str]]
+    level: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+
+@dataclass
+class RoadElementTable:
+    """
+    Attributes of the objects or signals of a set of roads, one row per
+    element. The elements of each road are grouped by tag in the order of
+    tags and keep their document order within a tag. road is the index of
+    the road of each row in roads, tag the index of the element tag in tags.
+    Missing attributes are NaN, has_outline is set for objects with an
+    <outline>.
+    """
+
+    elements: List[etree._ElementTree]
+    roads: List[etree._ElementTree]
+    road_length: np.ndarray
+    road: np.ndarray
+    tags: List[str]
+    tag: np.ndarray
+    s: np.ndarray
+    t: np.ndarray
+    z_offset: np.ndarray
+    length: np.ndarray
+    width: np.ndarray
+    height: np.ndarray
+    radius: np.ndarray
+    has_outline: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    def is_tag(self, tag: str) -> np.ndarray:
+        """
+        Returns a mask of the rows with the given element tag.
+        """
+        if tag not in self.tags:
+            return np.zeros(len(self), dtype=bool)
+        return self.tag == self.tags.index(tag)
+
+
+@dataclass
+class JunctionConnectionTable:
+    """
+    Connections of the junctions of a document, one row per connection in
+    document order. junction is the index of the junction of each row in
+    junctions. incoming_road and connecting_road are indices in roads, -1
+    where the id is missing or no road has it. contact_point is the index of
+    the contact point in CONTACT_POINTS.
+    """
+
+    elements: List[etree._ElementTree]
+    junctions: List[etree._ElementTree]
+    roads: List[etree._ElementTree]
+    junction: np.ndarray
+    incoming_road: np.ndarray
+    connecting_road: np.ndarray
+    contact_point: np.ndarray
+
+    # Contact point codes, 0 is a missing or unknown contact point
+    CONTACT_POINTS = (None, ContactPoint.START, ContactPoint.END)
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+
+@dataclass
+class LaneLinkTable:
+    """
+    laneLinks of junction connections, one row per laneLink in document
+    order. connection is the row of the connection in the
+    JunctionConnectionTable, junction, incoming_road, connecting_road and
+    contact_point are repeated from it. from_lane and to_lane are NaN where
+    the attribute is missing.
+    """
+
+    elements: List[etree._ElementTree]
+    connection: np.ndarray
+    junction: np.ndarray
+    incoming_road: np.ndarray
+    connecting_road: np.ndarray
+    contact_point: np.ndarray
+    from_lane: np.ndarray
+    to_lane: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+
+@dataclass
+class RoadCoordinates:
+    """
+    Road coordinates of inertial points, one row per point. road and lane are
+    None and the arrays NaN where no road is close enough.
+    """
+
+    roads: List[Optional[etree._ElementTree]]
+    lanes: List[Optional[etree._ElementTree]]
+    s: np.ndarray
+    t: np.ndarray
+    distance: np.ndarray
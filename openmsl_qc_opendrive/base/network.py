@@ -0,0 +1,104 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from lxml import etree
+
+
+class NetworkIndex:
+    """
+    Per-document cache of data compiled from the OpenDRIVE tree.
+
+    Compiled data (profile tables, lane border engines, ...) is built lazily the
+    first time it is requested for an element and kept for the lifetime of the
+    index. The tree is assumed not to be modified after the index was created.
+
+    Checkers executed in parallel threads share the index. Entries are only
+    stored under the lock of the index. Factories run outside of it and may
+    run twice for the same entry, the first stored result is kept and
+    returned to all callers. Compiled data must not be modified after it was
+    stored.
+    """
+
+    def __init__(self, root: etree._Element):
+        self.root = root
+        self._caches: Dict[str, Dict[etree._Element, Any]] = dict()
+        self._services: Dict[str, Any] = dict()
+        self._lock = threading.Lock()
+
+    def get_or_build(
+        self, name: str, element: etree._Element, factory: Callable[[], Any]
+    ) -> Any:
+        with self._lock:
+            compiled = self._caches.setdefault(name, dict()).get(element)
+        if compiled is None:
+            compiled = factory()
+            with self._lock:
+                compiled = self._caches[name].setdefault(element, compiled)
+        return compiled
+
+    def set(self, name: str, element: etree._Element, compiled: Any) -> None:
+        """
+        Stores already compiled data of an element, e.g. loaded from a snapshot.
+        """
+        with self._lock:
+            self._caches.setdefault(name, dict())[element] = compiled
+
+    def get_or_create(self, name: str, factory: Callable[[], Any]) -> Any:
+        """
+        Returns a document-wide object, e.g. a cache with its own eviction
+        policy, creating it on first use.
+        """
+        with self._lock:
+            service = self._services.get(name)
+        if service is None:
+            service = factory()
+            with self._lock:
+                service = self._services.setdefault(name, service)
+        return service
+
+    def get_service(self, name: str) -> Optional[Any]:
+        with self._lock:
+            return self._services.get(name)
+
+    def set_service(self, name: str, service: Any) -> None:
+        with self._lock:
+            self._services[name] = service
+
+    def clear(self) -> None:
+        with self._lock:
+            self._caches = dict()
+            self._services = dict()
+
+
+_current_index: Optional[NetworkIndex] = None
+_current_index_lock = threading.Lock()
+
+
+def get_network_index(element: etree._Element) -> NetworkIndex:
+    """
+    Returns the network index of the document the element belongs to.
+    Only the index of the most recently used document is kept alive.
+    """
+    global _current_index
+
+    if isinstance(element, etree._ElementTree):
+        root = element.getroot()
+    else:
+        root = element.getroottree().getroot()
+
+    with _current_index_lock:
+        if _current_index is None or _current_index.root is not root:
+            _current_index = NetworkIndex(root)
+
+        return _current_index
+
+
+def reset_network_index() -> None:
+    global _current_index
+    _current_index = None
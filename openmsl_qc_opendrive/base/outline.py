@@ -0,0 +1,365 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+from lxml import etree
+
+from openmsl_qc_opendrive.base import models, reference_line, spatial, utils
+
+# Points closer than this [m] to the outline of a road footprint touch the
+# footprint and are not inside it
+FOOTPRINT_TOLERANCE = 0.01
+
+
+def _compile_road_footprint(
+    road: etree._ElementTree, step: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the left and right outline of the road like compile_road_outline,
+    except that a side without lanes follows the center lane, so that the two
+    polylines enclose the footprint of the road. The masks (N,) flag the rows
+    of each side that lie on the center lane of a side without lanes.
+    """
+    length = utils.get_road_length(road)
+    lane_sections = utils.get_sorted_lane_sections_with_length_from_road(road)
+    if length is None or not length > 0.0 or len(lane_sections) == 0:
+        empty = np.zeros(0, dtype=bool)
+        return np.zeros((0, 3)), np.zeros((0, 3)), empty, empty
+
+    section_starts = np.array(
+        [
+            utils.get_s_from_lane_section(section.lane_section)
+            for section in lane_sections
+        ]
+    )
+    s = reference_line.sample_positions(
+        length, step, np.concatenate([utils.get_road_plan_view(road).s, section_starts])
+    )
+    lane_offset = utils.evaluate_road_lane_offset(road, s)
+
+    t_left = np.full(s.shape, np.nan)
+    t_right = np.full(s.shape, np.nan)
+    left_empty = np.zeros(s.shape, dtype=bool)
+    right_empty = np.zeros(s.shape, dtype=bool)
+    for section, s_start in zip(lane_sections, section_starts):
+        in_section = (s >= s_start) & (s <= s_start + section.length)
+        if not in_section.any():
+            continue
+
+        section_borders = utils.get_lane_section_borders(section.lane_section)
+        ds = s[in_section] - s_start
+        for group, side, empty, outermost in (
+            (section_borders.left, t_left, left_empty, np.fmax),
+            (section_borders.right, t_right, right_empty, np.fmin),
+        ):
+            if len(group) == 0:
+                side[in_section] = lane_offset[in_section]
+                empty[in_section] = True
+                continue
+            borders = group.evaluate_outer_borders(ds, lane_offset[in_section])
+            side[in_section] = outermost.reduce(
+                np.vstack([lane_offset[in_section], borders]), axis=0
+            )
+
+    zeros = np.zeros(s.shape)
+    left = utils.get_points_xyz_from_road(road, s, t_left, zeros)
+    right = utils.get_points_xyz_from_road(road, s, t_right, zeros)
+    return left, right, left_empty, right_empty
+
+
+def compile_road_outline(
+    road: etree._ElementTree, step: float = reference_line.DEFAULT_STEP
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the outer borders of the left and of the right lanes of the road
+    as polylines (N, 3) of inertial points from start to end. Rows are NaN
+    where the border is undefined and where the side has no lanes, e.g. the
+    empty left side of one carriageway of a divided road.
+    """
+    left, right, left_empty, right_empty = _compile_road_footprint(road, step)
+    left[left_empty] = np.nan
+    right[right_empty] = np.nan
+    return left, right
+
+
+def _compile_footprint_quads(
+    footprints: List[Tuple[np.ndarray, np.ndarray]],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Splits the footprints, given by their left and right outlines, into the
+    quads between consecutive samples. Returns the corners (Q, 4, 3) of each
+    quad in the order left start, left end, right end, right start, a mask
+    (Q, 4) of the quad edges from corner k to corner k + 1 that are on the
+    outline of the footprint and the index of the footprint of each quad.
+    Quads with an undefined corner are left out.
+    """
+    corners = []
+    outline = []
+    owners = []
+    for i, (left, right) in enumerate(footprints):
+        count = len(left) - 1
+        if count < 1:
+            continue
+
+        # Only the first and the last cross section close the footprint
+        border = np.ones(count, dtype=bool)
+        corners.append(np.stack([left[:-1], left[1:], right[1:], right[:-1]], axis=1))
+        outline.append(
+            np.stack(
+                [border, np.arange(count) == count - 1, border, np.arange(count) == 0],
+                axis=1,
+            )
+        )
+        owners.append(np.full(count, i, dtype=np.int64))
+
+    if len(corners) == 0:
+        return (
+            np.zeros((0, 4, 3)),
+            np.zeros((0, 4), dtype=bool),
+            np.zeros(0, dtype=np.int64),
+        )
+
+    corners = np.concatenate(corners)
+    outline = np.concatenate(outline)
+    owners = np.concatenate(owners)
+    valid = ~np.isnan(corners).any(axis=(1, 2))
+    return corners[valid], outline[valid], owners[valid]
+
+
+def compile_footprint_overlaps(
+    footprints: List[Tuple[np.ndarray, np.ndarray]],
+    vertical_clearance: float = 1.0,
+    tolerance: float = FOOTPRINT_TOLERANCE,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the points of footprints that are inside other footprints, as
+    arrays of the index of the footprint containing the point, the index of
+    the footprint of the point and the points (N, 3). The footprints are
+    given by their left and right outlines. The points are the samples of
+    both outlines and the middles between them, so a footprint is also found
+    inside an equal one. Points less than tolerance from the outline of the
+    other footprint touch it, points at least vertical_clearance apart in z
+    from it pass above or below.
+
+    The quads between the samples of all footprints are inserted into a
+    BoxGrid, only the quads whose boxes contain a point are tested exactly.
+    """
+    corners, outline, quad_owners = _compile_footprint_quads(footprints)
+
+    points = []
+    point_owners = []
+    for i, (left, right) in enumerate(footprints):
+        points.extend([left, right, 0.5 * (left + right)])
+        point_owners.append(np.full(3 * len(left), i, dtype=np.int64))
+    points = np.concatenate(points + [np.zeros((0, 3))])
+    point_owners = np.concatenate(point_owners + [np.zeros(0, dtype=np.int64)])
+    valid = ~np.isnan(points).any(axis=1)
+    points = points[valid]
+    point_owners = point_owners[valid]
+
+    grid = spatial.BoxGrid(
+        corners[:, :, 0].min(axis=1),
+        corners[:, :, 1].min(axis=1),
+        corners[:, :, 0].max(axis=1),
+        corners[:, :, 1].max(axis=1),
+    )
+    quad, point = grid.boxes_containing_points(points[:, 0], points[:, 1])
+    other = quad_owners[quad] != point_owners[point]
+    quad = quad[other]
+    point = point[other]
+
+    a = corners[quad]
+    p = points[point]
+
+    def cross(i: int, j: int) -> np.ndarray:
+        # Twice the signed area of the triangle of corners i, j and the point
+        return (a[:, j, 0] - a[:, i, 0]) * (p[:, 1] - a[:, i, 1]) - (
+            a[:, j, 1] - a[:, i, 1]
+        ) * (p[:, 0] - a[:, i, 0])
+
+    # The quad is split along its diagonal from corner 0 to corner 2. Points
+    # inside a triangle have the sign of its area towards all of its edges,
+    # the height is interpolated with the barycentric weights.
+    inside = np.zeros(len(quad), dtype=bool)
+    z = np.full(len(quad), np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for i, j, k in ((0, 1, 2), (0, 2, 3)):
+            weights = np.stack([cross(j, k), cross(k, i), cross(i, j)], axis=1)
+            area = weights.sum(axis=1)
+            in_triangle = (area != 0.0) & (
+                (weights * np.sign(area)[:, np.newaxis] >= 0.0).all(axis=1)
+            )
+            z = np.where(
+                in_triangle & ~inside,
+                (weights * a[:, [i, j, k], 2]).sum(axis=1) / area,
+                z,
+            )
+            inside |= in_triangle
+
+    # Distances of the points to the edges of the quads on the outline
+    for i in range(4):
+        j = (i + 1) % 4
+        edge = a[:, j, :2] - a[:, i, :2]
+        offset = p[:, :2] - a[:, i, :2]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            u = np.clip((offset * edge).sum(axis=1) / (edge * edge).sum(axis=1), 0, 1)
+        distance = np.hypot(*(offset - np.nan_to_num(u)[:, np.newaxis] * edge).T)
+        inside &= ~outline[quad, i] | (distance > tolerance)
+
+    inside &= np.abs(z - p[:, 2]) < vertical_clearance
+
+    return quad_owners[quad[inside]], point_owners[point[inside]], p[inside]
+
+
+def compile_road_overlaps(
+    roads: List[etree._ElementTree],
+    step: float = reference_line.DEFAULT_STEP,
+    vertical_clearance: float = 1.0,
+    junctions: Optional[List[etree._ElementTree]] = None,
+) -> List[models.RoadOverlap]:
+    """
+    Returns the overlaps of roads that are not linked to each other and do
+    not share a junction, and the crossings of the borders of a single road
+    with each other. Two roads overlap where their outer lane borders cross
+    and where a point of one footprint is inside the other, e.g. of a
+    duplicated road or of a road inside the footprint of another one.
+    Overlaps where the roads are at least vertical_clearance apart in z
+    (bridges) are skipped. Roads that only touch, e.g. that meet end to end,
+    do not overlap. The main road of a virtual junction in junctions, e.g. of
+    a pedestrian crossing, is part of that junction.
+
+    The border segments of all roads are inserted into a SegmentGrid, only
+    the candidate pairs of the grid are tested exactly. The footprints are
+    compared with compile_footprint_overlaps.
+    """
+    footprints = []
+    polylines = []
+    polyline_owners = []
+    for i, road in enumerate(roads):
+        left, right, left_empty, right_empty = _compile_road_footprint(road, step)
+        footprints.append((left, right))
+        # The center lane of a side without lanes is not a border, e.g. where
+        # the two carriageways of a divided road meet
+        for border, empty in ((left, left_empty), (right, right_empty)):
+            border = np.where(empty[:, np.newaxis], np.nan, border)
+            if len(border) > 1:
+                polylines.append(border)
+                polyline_owners.append(i)
+
+    owners = np.concatenate(
+        [
+            np.full(len(p) - 1, i, dtype=np.int64)
+            for p, i in zip(polylines, polyline_owners)
+        ]
+        + [np.zeros(0, dtype=np.int64)]
+    )
+    starts = np.concatenate([p[:-1] for p in polylines] + [np.zeros((0, 3))])
+    ends = np.concatenate([p[1:] for p in polylines] + [np.zeros((0, 3))])
+
+    valid = ~(np.isnan(starts).any(axis=1) | np.isnan(ends).any(axis=1))
+    segments = np.flatnonzero(valid)
+    owners = owners[segments]
+    starts = starts[segments]
+    ends = ends[segments]
+
+    grid = spatial.SegmentGrid(starts[:, 0], starts[:, 1], ends[:, 0], ends[:, 1])
+    first, second = grid.candidate_pairs()
+    crossing, t, u = spatial.intersect_segments(
+        starts[first, 0],
+        starts[first, 1],
+        ends[first, 0],
+        ends[first, 1],
+        starts[second, 0],
+        starts[second, 1],
+        ends[second, 0],
+        ends[second, 1],
+    )
+    first = first[crossing]
+    second = second[crossing]
+    t = t[crossing]
+    u = u[crossing]
+
+    z_first = starts[first, 2] + t * (ends[first, 2] - starts[first, 2])
+    z_second = starts[second, 2] + u * (ends[second, 2] - starts[second, 2])
+    below_clearance = np.abs(z_first - z_second) < vertical_clearance
+    first = first[below_clearance]
+    second = second[below_clearance]
+    t = t[below_clearance]
+    z = z_first[below_clearance]
+
+    # Virtual junctions lie on their main road instead of between roads
+    main_road_junction_ids = dict()
+    for junction in junctions or []:
+        main_road_id = utils.to_int(junction.get("mainRoad"))
+        junction_id = utils.get_junction_id(junction)
+        if main_road_id is not None and junction_id is not None:
+            main_road_junction_ids.setdefault(main_road_id, set()).add(junction_id)
+
+    # Roads that meet at links or in a junction touch or overlap legitimately
+    def get_neighbours(road):
+        road_ids = set()
+        junction_ids = set(
+            main_road_junction_ids.get(utils.to_int(road.get("id")), set())
+        )
+        junction_id = utils.get_road_junction_id(road)
+        if junction_id is not None and junction_id != -1:
+            junction_ids.add(junction_id)
+        for linkage_tag in (models.LinkageTag.PREDECESSOR, models.LinkageTag.SUCCESSOR):
+            linkage = utils.get_road_linkage(road, linkage_tag)
+            if linkage is not None:
+                road_ids.add(linkage.id)
+            linked_junction_id = utils.get_linked_junction_id(road, linkage_tag)
+            if linked_junction_id is not None:
+                junction_ids.add(linked_junction_id)
+        return road_ids, junction_ids
+
+    overlaps = []
+    reported = set()
+    neighbours = dict()
+
+    def add_overlap(a: int, b: int, x: float, y: float, z: float) -> None:
+        key = (min(a, b), max(a, b))
+        if key in reported:
+            return
+
+        if a != b:
+            for i in key:
+                if i not in neighbours:
+                    neighbours[i] = get_neighbours(roads[i])
+            road_ids_a, junction_ids_a = neighbours[key[0]]
+            road_ids_b, junction_ids_b = neighbours[key[1]]
+            if (
+                utils.to_int(roads[key[1]].get("id")) in road_ids_a
+                or utils.to_int(roads[key[0]].get("id")) in road_ids_b
+                or len(junction_ids_a & junction_ids_b) > 0
+            ):
+                return
+
+        reported.add(key)
+        overlaps.append(
+            models.RoadOverlap(
+                road=roads[key[0]],
+                other_road=roads[key[1]],
+                point=models.Point3D(x=float(x), y=float(y), z=float(z)),
+            )
+        )
+
+    for k in range(len(first)):
+        add_overlap(
+            int(owners[first[k]]),
+            int(owners[second[k]]),
+            starts[first[k], 0] + t[k] * (ends[first[k], 0] - starts[first[k], 0]),
+            starts[first[k], 1] + t[k] * (ends[first[k], 1] - starts[first[k], 1]),
+            z[k],
+        )
+
+    # Footprints without crossing borders
+    for a, b, point in zip(*compile_footprint_overlaps(footprints, vertical_clearance)):
+        add_overlap(int(a), int(b), *point)
+
+    return overlaps
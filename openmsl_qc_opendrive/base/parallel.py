@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import sys
+import sysconfig
+import threading
+from typing import Any, Optional, Set
+
+from qc_baselib import Result
+
+
+def is_free_threaded() -> bool:
+    """
+    Returns True if the interpreter is a free-threaded build running without
+    the GIL. Importing an extension module that does not support free
+    threading enables the GIL again at runtime.
+    """
+    if not sysconfig.get_config_var("Py_GIL_DISABLED"):
+        return False
+
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+class ResultBuffer:
+    """
+    Stands in for the Result while a checker is executed in a worker thread.
+
+    The checker writes to a Result of its own, all calls are delegated to it.
+    merge() moves the checker results into the shared Result, under the lock
+    that guards it. Issue ids are assigned by the shared Result while merging,
+    so merging the buffers in checker order gives the issue ids of a serial
+    run. Preconditions are answered from the shared Result.
+    """
+
+    def __init__(self, result: Result, lock: threading.Lock):
+        self._result = result
+        self._lock = lock
+        self._buffer = Result()
+        with self._lock:
+            bundles = result.get_checker_bundle_results()
+            for bundle in bundles:
+                self._buffer.register_checker_bundle(
+                    description=bundle.description,
+                    name=bundle.name,
+                    version=bundle.version,
+                    build_date=bundle.build_date,
+                    summary=bundle.summary,
+                )
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._buffer, name)
+
+    def all_checkers_completed_without_issue(
+        self, check_id_set: Optional[Set[str]] = None
+    ) -> bool:
+        with self._lock:
+            return self._result.all_checkers_completed_without_issue(check_id_set)
+
+    def merge(self) -> None:
+        with self._lock:
+            for buffered_bundle in self._buffer.get_checker_bundle_results():
+                bundle = self._result.get_checker_bundle_result(buffered_bundle.name)
+                for checker in buffered_bundle.checkers:
+                    issues = checker.issues
+                    checker.issues = []
+                    bundle.checkers.append(checker)
+
+                    # Draw the issue id from the shared Result, then replace
+                    # the issue it registered by the buffered one
+                    for issue in issues:
+                        issue.issue_id = self._result.register_issue(
+                            checker_bundle_name=bundle.name,
+                            checker_id=checker.checker_id,
+                            description=issue.description,
+                            level=issue.level,
+                            rule_uid=issue.rule_uid,
+                        )
+                        checker.issues[-1] = issue
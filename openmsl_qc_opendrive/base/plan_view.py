@@ -0,0 +1,379 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pyclothoids as pc
+
+from openmsl_qc_opendrive.base import arc_length, clothoid, models
+
+
+@dataclass
+class GeometryRecord:
+    s: Optional[float]
+    x: Optional[float]
+    y: Optional[float]
+    heading: Optional[float]
+    length: Optional[float]
+    geometry_type: models.GeometryType
+    curv_start: Optional[float] = None
+    curv_end: Optional[float] = None
+    param_poly3: Optional[models.ParamPoly3] = None
+
+
+@dataclass
+class GeometryTransitions:
+    """
+    Differences between the end of each geometry and the recorded start of
+    its successor, one entry per pair of consecutive geometries. x and y are
+    the end points of the predecessors.
+    """
+
+    x: np.ndarray
+    y: np.ndarray
+    position_gap: np.ndarray
+    heading_gap: np.ndarray
+    curvature_gap: np.ndarray
+
+
+def _to_nan(value: Optional[float]) -> float:
+    return np.nan if value is None else value
+
+
+def _poly3_coefficients(poly3: models.Poly3) -> List[float]:
+    return [poly3.a, poly3.b, poly3.c, poly3.d]
+
+
+def _evaluate_poly3(coefficients: np.ndarray, p: np.ndarray) -> np.ndarray:
+    a, b, c, d = coefficients.T
+    return a + p * (b + p * (c + p * d))
+
+
+def _evaluate_poly3_derivative(coefficients: np.ndarray, p: np.ndarray) -> np.ndarray:
+    _, b, c, d = coefficients.T
+    return b + p * (2.0 * c + p * (3.0 * d))
+
+
+class PlanView:
+    """
+    Compiled planView of a road. The geometry records are stored as arrays so
+    that points and headings of many s values are evaluated per geometry type
+    instead of per sample.
+
+    Geometries with missing attributes have the type INVALID and evaluate to NaN.
+    For arcs and spirals curvature_start/curvature_end hold the curvature, for
+    paramPoly3 geometries u and v hold the polynomial coefficients. Normalized
+    paramPoly3 geometries are evaluated at the parameter with the arc length
+    s - s0, found in cumulative arc length tables.
+    """
+
+    def __init__(self, records: List[GeometryRecord]):
+        self.records = records
+        count = len(records)
+
+        self.s = np.array([_to_nan(r.s) for r in records], dtype=np.float64)
+        self.x = np.array([_to_nan(r.x) for r in records], dtype=np.float64)
+        self.y = np.array([_to_nan(r.y) for r in records], dtype=np.float64)
+        self.heading = np.array([_to_nan(r.heading) for r in records], dtype=np.float64)
+        self.length = np.array([_to_nan(r.length) for r in records], dtype=np.float64)
+        self.geometry_type = np.array([r.geometry_type for r in records], dtype=np.int8)
+        self.curvature_start = np.array(
+            [_to_nan(r.curv_start) for r in records], dtype=np.float64
+        )
+        self.curvature_end = np.array(
+            [_to_nan(r.curv_end) for r in records], dtype=np.float64
+        )
+        self.u = np.full((count, 4), np.nan)
+        self.v = np.full((count, 4), np.nan)
+        for i, record in enumerate(records):
+            if record.param_poly3 is not None:
+                self.u[i] = _poly3_coefficients(record.param_poly3.u)
+                self.v[i] = _poly3_coefficients(record.param_poly3.v)
+
+        self._reparametrization = None
+
+    # Names of the arrays that make up a compiled planView
+    ARRAY_NAMES = (
+        "s",
+        "x",
+        "y",
+        "heading",
+        "length",
+        "geometry_type",
+        "curvature_start",
+        "curvature_end",
+        "u",
+        "v",
+    )
+
+    @classmethod
+    def from_arrays(cls, **arrays: np.ndarray) -> "PlanView":
+        """
+        Creates a planView from compiled arrays, e.g. views of a network
+        snapshot. The geometry records are not available in this case.
+        """
+        compiled = cls.__new__(cls)
+        compiled.records = None
+        for name in cls.ARRAY_NAMES:
+            setattr(compiled, name, arrays[name])
+        compiled._reparametrization = None
+        return compiled
+
+    @classmethod
+    def concatenate(cls, plan_views: List["PlanView"]) -> "PlanView":
+        """
+        Joins the geometries of several planViews, e.g. of all roads of a
+        network, so that they are evaluated in one batch with
+        evaluate_geometries. The result is not sorted by s, so evaluate must
+        not be used on it.
+        """
+        return cls.from_arrays(
+            **{
+                name: np.concatenate([getattr(p, name) for p in plan_views])
+                for name in cls.ARRAY_NAMES
+            }
+        )
+
+    def __len__(self) -> int:
+        return len(self.s)
+
+    def _normalized_parameters(self, index: np.ndarray, ds: np.ndarray) -> np.ndarray:
+        """
+        Returns the parameter p in [0, 1] of normalized paramPoly3 geometries
+        at which the curve has the arc length ds. The reparametrization tables
+        of all normalized geometries are built together on first use.
+        """
+        if self._reparametrization is None:
+            normalized = np.flatnonzero(
+                self.geometry_type == models.GeometryType.PARAM_POLY3_NORMALIZED
+            )
+            rows = np.full(len(self), -1, dtype=np.int64)
+            rows[normalized] = np.arange(len(normalized))
+            table = arc_length.ReparametrizationTable(
+                self.u[normalized], self.v[normalized], 1.0
+            )
+            self._reparametrization = (rows, table)
+
+        rows, table = self._reparametrization
+        return table.invert(rows[index], ds)
+
+    def find_indices(self, s: np.ndarray) -> np.ndarray:
+        indices = np.searchsorted(self.s, s, side="right") - 1
+        return np.maximum(indices, 0)
+
+    def evaluate(self, s: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns x, y and heading of the reference line for each s. Samples on
+        invalid geometries are NaN. The caller is responsible for checking that
+        s is within the road.
+        """
+        s = np.asarray(s, dtype=np.float64)
+        if len(self) == 0:
+            return (
+                np.full(s.shape, np.nan),
+                np.full(s.shape, np.nan),
+                np.full(s.shape, np.nan),
+            )
+
+        indices = self.find_indices(s)
+        return self.evaluate_geometries(indices, s - self.s[indices])
+
+    def evaluate_geometries(
+        self, indices: np.ndarray, ds: np.ndarray, backend: Optional[str] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns x, y and heading of geometry indices[i] at distance ds[i] from
+        its start. Unlike evaluate, the end of a geometry is evaluated on the
+        geometry itself and not on its successor. Spirals are evaluated with
+        the given clothoid backend, by default with the selected one.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        all_ds = np.asarray(ds, dtype=np.float64)
+        x = np.full(all_ds.shape, np.nan)
+        y = np.full(all_ds.shape, np.nan)
+        heading = np.full(all_ds.shape, np.nan)
+
+        geometry_types = self.geometry_type[indices]
+
+        for geometry_type in np.unique(geometry_types):
+            mask = geometry_types == geometry_type
+            index = indices[mask]
+            ds = all_ds[mask]
+            x0 = self.x[index]
+            y0 = self.y[index]
+            hdg = self.heading[index]
+
+            if geometry_type == models.GeometryType.LINE:
+                x[mask] = x0 + ds * np.cos(hdg)
+                y[mask] = y0 + ds * np.sin(hdg)
+                heading[mask] = hdg
+            elif geometry_type == models.GeometryType.ARC:
+                x[mask], y[mask], heading[mask] = self._evaluate_arcs(
+                    index, ds, x0, y0, hdg
+                )
+            elif geometry_type == models.GeometryType.SPIRAL:
+                x[mask], y[mask], heading[mask] = self._evaluate_spirals(
+                    index, ds, x0, y0, hdg, backend
+                )
+            elif geometry_type in (
+                models.GeometryType.PARAM_POLY3_ARC_LENGTH,
+                models.GeometryType.PARAM_POLY3_NORMALIZED,
+            ):
+                p = ds
+                if geometry_type == models.GeometryType.PARAM_POLY3_NORMALIZED:
+                    p = self._normalized_parameters(index, ds)
+
+                u = _evaluate_poly3(self.u[index], p)
+                v = _evaluate_poly3(self.v[index], p)
+                du = _evaluate_poly3_derivative(self.u[index], p)
+                dv = _evaluate_poly3_derivative(self.v[index], p)
+
+                x[mask] = np.cos(hdg) * u - np.sin(hdg) * v + x0
+                y[mask] = np.sin(hdg) * u + np.cos(hdg) * v + y0
+                heading[mask] = hdg + np.arctan2(dv, du)
+
+        return x, y, heading
+
+    def evaluate_curvature(self, s: np.ndarray) -> np.ndarray:
+        """
+        Returns the curvature of the reference line for each s, NaN on invalid
+        geometries.
+        """
+        s = np.asarray(s, dtype=np.float64)
+        if len(self) == 0:
+            return np.full(s.shape, np.nan)
+
+        indices = self.find_indices(s)
+        return self.evaluate_geometry_curvatures(indices, s - self.s[indices])
+
+    def evaluate_geometry_curvatures(
+        self, indices: np.ndarray, ds: np.ndarray
+    ) -> np.ndarray:
+        """
+        Returns the curvature of geometry indices[i] at distance ds[i] from its
+        start.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        all_ds = np.asarray(ds, dtype=np.float64)
+        curvature = np.full(all_ds.shape, np.nan)
+
+        geometry_types = self.geometry_type[indices]
+
+        for geometry_type in np.unique(geometry_types):
+            mask = geometry_types == geometry_type
+            index = indices[mask]
+            ds = all_ds[mask]
+
+            if geometry_type == models.GeometryType.LINE:
+                curvature[mask] = 0.0
+            elif geometry_type == models.GeometryType.ARC:
+                curvature[mask] = self.curvature_start[index]
+            elif geometry_type == models.GeometryType.SPIRAL:
+                curv_start = self.curvature_start[index]
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    kd = (self.curvature_end[index] - curv_start) / self.length[index]
+                curvature[mask] = curv_start + kd * ds
+            elif geometry_type in (
+                models.GeometryType.PARAM_POLY3_ARC_LENGTH,
+                models.GeometryType.PARAM_POLY3_NORMALIZED,
+            ):
+                p = ds
+                if geometry_type == models.GeometryType.PARAM_POLY3_NORMALIZED:
+                    p = self._normalized_parameters(index, ds)
+
+                # The curvature of a parametric curve does not depend on its
+                # parametrization, so u(p), v(p) can be used directly.
+                du = _evaluate_poly3_derivative(self.u[index], p)
+                dv = _evaluate_poly3_derivative(self.v[index], p)
+                _, _, c_u, d_u = self.u[index].T
+                _, _, c_v, d_v = self.v[index].T
+                ddu = 2.0 * c_u + 6.0 * d_u * p
+                ddv = 2.0 * c_v + 6.0 * d_v * p
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    curvature[mask] = (du * ddv - dv * ddu) / (du**2 + dv**2) ** 1.5
+
+        return curvature
+
+    def _evaluate_arcs(
+        self,
+        index: np.ndarray,
+        ds: np.ndarray,
+        x0: np.ndarray,
+        y0: np.ndarray,
+        hdg: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        curvature = self.curvature_start[index]
+        heading = hdg + curvature * ds
+
+        # A zero curvature arc is a line. Its radius is undefined, so it is
+        # evaluated with the line equation instead.
+        straight = curvature == 0.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            radius = 1.0 / curvature
+            theta_f = ds * curvature - np.pi / 2
+            x = x0 + radius * (np.cos(theta_f + hdg) - np.sin(hdg))
+            y = y0 + radius * (np.sin(theta_f + hdg) + np.cos(hdg))
+
+        x = np.where(straight, x0 + ds * np.cos(hdg), x)
+        y = np.where(straight, y0 + ds * np.sin(hdg), y)
+
+        return x, y, heading
+
+    def _evaluate_spirals(
+        self,
+        index: np.ndarray,
+        ds: np.ndarray,
+        x0: np.ndarray,
+        y0: np.ndarray,
+        hdg: np.ndarray,
+        backend: Optional[str] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if backend is None:
+            backend = clothoid.get_backend()
+        if backend == clothoid.FRESNEL:
+            length = self.length[index]
+            curv_start = self.curvature_start[index]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                kd = np.where(
+                    length > 0.0,
+                    (self.curvature_end[index] - curv_start) / length,
+                    np.nan,
+                )
+            return clothoid.evaluate_clothoids(x0, y0, hdg, curv_start, kd, ds)
+
+        x = np.full(ds.shape, np.nan)
+        y = np.full(ds.shape, np.nan)
+        heading = np.full(ds.shape, np.nan)
+
+        # pyclothoids evaluates one point per call, so the clothoid of each
+        # geometry is created once and reused for all its samples.
+        order = np.argsort(index, kind="stable")
+        sorted_index = index[order]
+        group_starts = np.flatnonzero(np.diff(sorted_index, prepend=-1) != 0)
+        for start, end in zip(group_starts, np.r_[group_starts[1:], len(order)]):
+            geometry_index = sorted_index[start]
+            length = self.length[geometry_index]
+            if not length > 0.0:
+                continue
+
+            curv_start = self.curvature_start[geometry_index]
+            kd = (self.curvature_end[geometry_index] - curv_start) / length
+            spiral = pc.Clothoid.StandardParams(
+                self.x[geometry_index],
+                self.y[geometry_index],
+                self.heading[geometry_index],
+                curv_start,
+                kd,
+                length,
+            )
+            for i in order[start:end]:
+                x[i] = spiral.X(ds[i])
+                y[i] = spiral.Y(ds[i])
+                heading[i] = spiral.Theta(ds[i])
+
+        return x, y, heading
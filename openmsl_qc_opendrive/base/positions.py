@@ -0,0 +1,266 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+from lxml import etree
+
+from openmsl_qc_opendrive.base import (
+    models,
+    network,
+    plan_view,
+    projection,
+    reference_line,
+    spatial,
+    utils,
+)
+
+
+def compile_road_element_placements(
+    roads: List[etree._ElementTree], tag: str
+) -> models.RoadElementPlacements:
+    """
+    Returns the placements of all <object> or <signal> elements (tag) of the
+    roads. The positions of the elements of a road are projected in one batch.
+
+    Objects are rectangles of length and width turned by hdg, objects with a
+    radius are the squares enclosing the circle. Signals are lines of width
+    across the direction they face.
+    """
+    elements = []
+    element_roads = []
+    columns = {
+        name: []
+        for name in (
+            "s",
+            "t",
+            "x",
+            "y",
+            "z",
+            "heading",
+            "half_length",
+            "half_width",
+            "height",
+        )
+    }
+
+    def get_values(road_elements, attribute, default=np.nan):
+        values = [utils.to_float(element.get(attribute)) for element in road_elements]
+        return np.array([default if v is None else v for v in values], dtype=np.float64)
+
+    for road in roads:
+        road_elements = road.findall(f"./{tag}s/{tag}")
+        if len(road_elements) == 0:
+            continue
+
+        s = get_values(road_elements, "s")
+        t = get_values(road_elements, "t", 0.0)
+        points = utils.get_points_xyz_from_road(road, s, t, 0.0)
+        _, _, road_heading = utils.evaluate_road_reference_line(road, s)
+
+        facing = np.array(
+            [element.get("orientation") == "-" for element in road_elements]
+        )
+        if tag == "signal":
+            heading = road_heading + get_values(road_elements, "hOffset", 0.0)
+            half_length = np.zeros(len(road_elements))
+            half_width = 0.5 * np.nan_to_num(get_values(road_elements, "width"))
+        else:
+            heading = road_heading + get_values(road_elements, "hdg", 0.0)
+            radius = get_values(road_elements, "radius")
+            half_length = np.where(
+                np.isnan(radius), 0.5 * get_values(road_elements, "length"), radius
+            )
+            half_width = np.where(
+                np.isnan(radius), 0.5 * get_values(road_elements, "width"), radius
+            )
+
+        elements += road_elements
+        element_roads += [road] * len(road_elements)
+        columns["s"].append(s)
+        columns["t"].append(t)
+        columns["x"].append(points[:, 0])
+        columns["y"].append(points[:, 1])
+        columns["z"].append(points[:, 2] + get_values(road_elements, "zOffset", 0.0))
+        columns["heading"].append(np.where(facing, heading + np.pi, heading))
+        columns["half_length"].append(np.nan_to_num(half_length))
+        columns["half_width"].append(np.nan_to_num(half_width))
+        columns["height"].append(get_values(road_elements, "height"))
+
+    return models.RoadElementPlacements(
+        elements=elements,
+        roads=element_roads,
+        **{
+            name: np.concatenate(values + [np.zeros(0)])
+            for name, values in columns.items()
+        },
+    )
+
+
+def get_road_element_placements(
+    root: etree._ElementTree, tag: str
+) -> models.RoadElementPlacements:
+    """
+    Returns the placements of all <object> or <signal> elements (tag) of the
+    document, cached on the network index.
+    """
+    return network.get_network_index(root).get_or_create(
+        f"{tag}_placements",
+        lambda: compile_road_element_placements(utils.get_roads(root), tag),
+    )
+
+
+def compile_overlapping_placements(
+    placements: models.RoadElementPlacements, selection: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the index pairs (i, j), i < j, of the selected placements whose
+    footprints overlap in the plane and whose height ranges overlap. Elements
+    without height extend upwards without limit.
+
+    The footprints are inserted into a RectangleGrid, only the candidate
+    pairs of the grid are tested exactly.
+    """
+    indices = np.flatnonzero(
+        selection
+        & np.isfinite(placements.x)
+        & np.isfinite(placements.y)
+        & np.isfinite(placements.heading)
+        & (placements.half_length > 0.0)
+        & (placements.half_width > 0.0)
+    )
+    x = placements.x[indices]
+    y = placements.y[indices]
+    heading = placements.heading[indices]
+    half_length = placements.half_length[indices]
+    half_width = placements.half_width[indices]
+
+    grid = spatial.RectangleGrid(x, y, heading, half_length, half_width)
+    first, second = grid.candidate_pairs()
+    overlap = spatial.intersect_rectangles(
+        x, y, heading, half_length, half_width, first, second
+    )
+    first, second = indices[first[overlap]], indices[second[overlap]]
+
+    bottom = placements.z
+    top = bottom + np.nan_to_num(placements.height, nan=np.inf)
+    stacked = (bottom[first] < top[second]) & (bottom[second] < top[first])
+
+    return first[stacked], second[stacked]
+
+
+def compile_nearby_placements(
+    placements: models.RoadElementPlacements, distance: float, selection: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the index pairs (i, j), i < j, of the selected placements whose
+    positions are at most distance apart in 3d.
+    """
+    indices = np.flatnonzero(
+        selection
+        & np.isfinite(placements.x)
+        & np.isfinite(placements.y)
+        & np.isfinite(placements.z)
+    )
+    x = placements.x[indices]
+    y = placements.y[indices]
+    z = placements.z[indices]
+
+    radius = 0.5 * distance
+    grid = spatial.BoxGrid(x - radius, y - radius, x + radius, y + radius)
+    first, second = grid.candidate_pairs()
+    near = (
+        np.sqrt(
+            (x[second] - x[first]) ** 2
+            + (y[second] - y[first]) ** 2
+            + (z[second] - z[first]) ** 2
+        )
+        <= distance
+    )
+
+    return indices[first[near]], indices[second[near]]
+
+
+def compile_reference_line_projector(
+    roads: List[etree._ElementTree], step: float = reference_line.DEFAULT_STEP
+) -> projection.ReferenceLineProjector:
+    """
+    Returns the inverse projection of the reference lines of the roads. As in
+    evaluate_road_reference_line each geometry is used from its start to the
+    start of the next geometry, the last one up to the end of the road.
+    """
+    plan_views = [utils.get_road_plan_view(road) for road in roads]
+    if sum(len(p) for p in plan_views) == 0:
+        plan_views.append(plan_view.PlanView([]))
+    geometries = plan_view.PlanView.concatenate(plan_views)
+
+    geometry_roads = np.repeat(np.arange(len(plan_views)), [len(p) for p in plan_views])
+    extents = []
+    for road, road_plan_view in zip(roads, plan_views):
+        road_length = utils.get_road_length(road)
+        if road_length is None:
+            road_length = np.nan
+        ends = np.minimum(np.r_[road_plan_view.s[1:], road_length], road_length)
+        extents.append(ends - road_plan_view.s)
+
+    return projection.ReferenceLineProjector(
+        geometries,
+        geometry_roads,
+        np.concatenate(extents + [np.zeros(0)]),
+        step,
+    )
+
+
+def get_reference_line_projector(
+    root: etree._ElementTree,
+) -> Tuple[List[etree._ElementTree], projection.ReferenceLineProjector]:
+    """
+    Returns the roads of the document and the inverse projection of their
+    reference lines, cached on the network index.
+    """
+
+    def compile_all():
+        roads = utils.get_roads(root)
+        return roads, compile_reference_line_projector(roads)
+
+    return network.get_network_index(root).get_or_create(
+        "reference_line_projector", compile_all
+    )
+
+
+def project_points_to_roads(
+    root: etree._ElementTree,
+    x: np.ndarray,
+    y: np.ndarray,
+    max_distance: float = np.inf,
+) -> models.RoadCoordinates:
+    """
+    Maps inertial points (x, y) to the closest road reference line of the
+    document. Returns road, lane, s, t and the distance to the reference
+    line of each point. The lanes are looked up in one batch per road.
+    """
+    roads, projector = get_reference_line_projector(root)
+    road_index, s, t, distance = projector.project(x, y, max_distance)
+
+    point_roads: List[Optional[etree._ElementTree]] = [None] * len(road_index)
+    point_lanes: List[Optional[etree._ElementTree]] = [None] * len(road_index)
+    order = np.argsort(road_index, kind="stable")
+    sorted_index = road_index[order]
+    group_starts = np.flatnonzero(np.diff(sorted_index, prepend=-2) != 0)
+    for start, end in zip(group_starts, np.r_[group_starts[1:], len(order)]):
+        if sorted_index[start] < 0:
+            continue
+        road = roads[sorted_index[start]]
+        points = order[start:end]
+        lanes = utils.evaluate_lanes_from_road(road, s[points], t[points])
+        for point, lane in zip(points, lanes):
+            point_roads[point] = road
+            point_lanes[point] = lane
+
+    return models.RoadCoordinates(
+        roads=point_roads, lanes=point_lanes, s=s, t=t, distance=distance
+    )
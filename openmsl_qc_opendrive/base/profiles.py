@@ -0,0 +1,243 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+from dataclasses import dataclass
+from typing import List, Optional, Union
+
+import numpy as np
+
+from openmsl_qc_opendrive.base import models
+
+ZERO_OFFSET_POLY3 = models.OffsetPoly3(
+    poly3=models.Poly3(a=0.0, b=0.0, c=0.0, d=0.0), s_offset=0.0
+)
+
+
+class Poly3Table:
+    """
+    Compiled piecewise cubic polynomial profile along s, e.g. elevation,
+    superelevation or lane offset of a road.
+
+    Records are stored as contiguous arrays so that a lookup is a single
+    np.searchsorted and the evaluation is vectorized over arrays of s.
+
+    If zero_before_start is True, the profile is zero for s smaller than the
+    first s_offset (lane offset), otherwise the first record is extrapolated
+    (elevation, superelevation).
+    """
+
+    def __init__(
+        self, records: List[models.OffsetPoly3], zero_before_start: bool = False
+    ):
+        self._records = records
+        self.zero_before_start = zero_before_start
+        self.s_offsets = np.array([r.s_offset for r in records], dtype=np.float64)
+        self.coefficients = np.array(
+            [[r.poly3.a, r.poly3.b, r.poly3.c, r.poly3.d] for r in records],
+            dtype=np.float64,
+        ).reshape(-1, 4)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        s_offsets: np.ndarray,
+        coefficients: np.ndarray,
+        zero_before_start: bool = False,
+    ) -> "Poly3Table":
+        """
+        Creates a table from compiled arrays, e.g. views of a network snapshot.
+        The records are only created if they are requested.
+        """
+        table = cls.__new__(cls)
+        table._records = None
+        table.zero_before_start = zero_before_start
+        table.s_offsets = s_offsets
+        table.coefficients = coefficients.reshape(-1, 4)
+        return table
+
+    @property
+    def records(self) -> List[models.OffsetPoly3]:
+        if self._records is None:
+            self._records = [
+                models.OffsetPoly3(
+                    poly3=models.Poly3(a=float(a), b=float(b), c=float(c), d=float(d)),
+                    s_offset=float(s_offset),
+                )
+                for s_offset, (a, b, c, d) in zip(self.s_offsets, self.coefficients)
+            ]
+        return self._records
+
+    def __len__(self) -> int:
+        return len(self.s_offsets)
+
+    def find_indices(self, s: Union[float, np.ndarray]) -> np.ndarray:
+        """
+        Returns the record index for each s. -1 means that no record applies and
+        the profile is zero.
+        """
+        indices = np.searchsorted(self.s_offsets, s, side="right") - 1
+        if not self.zero_before_start and len(self) > 0:
+            indices = np.maximum(indices, 0)
+        return indices
+
+    def get_record(self, s: float) -> models.OffsetPoly3:
+        if len(self) == 0:
+            return ZERO_OFFSET_POLY3
+
+        index = int(self.find_indices(s))
+        if index < 0:
+            return ZERO_OFFSET_POLY3
+        else:
+            return self.records[index]
+
+    def _local_coordinates(self, s: Union[float, np.ndarray]):
+        s = np.asarray(s, dtype=np.float64)
+        if len(self) == 0:
+            return s, None, np.zeros(s.shape, dtype=bool)
+
+        indices = self.find_indices(s)
+        undefined = indices < 0
+        indices = np.where(undefined, 0, indices)
+        ds = s - self.s_offsets[indices]
+        return ds, self.coefficients[indices], undefined
+
+    def evaluate(self, s: Union[float, np.ndarray]) -> np.ndarray:
+        ds, coefficients, undefined = self._local_coordinates(s)
+        if coefficients is None:
+            return np.zeros(ds.shape)
+
+        a, b, c, d = np.moveaxis(coefficients, -1, 0)
+        value = a + ds * (b + ds * (c + ds * d))
+        return np.where(undefined, 0.0, value)
+
+    def evaluate_derivative(self, s: Union[float, np.ndarray]) -> np.ndarray:
+        ds, coefficients, undefined = self._local_coordinates(s)
+        if coefficients is None:
+            return np.zeros(ds.shape)
+
+        _, b, c, d = np.moveaxis(coefficients, -1, 0)
+        value = b + ds * (2.0 * c + ds * (3.0 * d))
+        return np.where(undefined, 0.0, value)
+
+    def evaluate_second_derivative(self, s: Union[float, np.ndarray]) -> np.ndarray:
+        ds, coefficients, undefined = self._local_coordinates(s)
+        if coefficients is None:
+            return np.zeros(ds.shape)
+
+        _, _, c, d = np.moveaxis(coefficients, -1, 0)
+        value = 2.0 * c + ds * (6.0 * d)
+        return np.where(undefined, 0.0, value)
+
+
+class ShapeTable:
+    """
+    Compiled lateral <shape> profile of a road: a piecewise cubic height
+    over t for each cross section s, interpolated linearly in s between
+    consecutive cross sections.
+
+    The records of each cross section are stored in one row of padded
+    (cross sections, records) arrays, so that the record lookup over t and
+    the interpolation over s are vectorized over arrays of (s, t). Before
+    the first cross section and after the last one the nearest cross section
+    applies, before the first t of a cross section its first record is
+    extrapolated.
+    """
+
+    def __init__(self, records: List[models.ShapePoly3]):
+        records = sorted(records, key=lambda r: (r.s_offset, r.t_offset))
+        self._set_records(
+            np.array([r.s_offset for r in records], dtype=np.float64),
+            np.array([r.t_offset for r in records], dtype=np.float64),
+            np.array(
+                [[r.poly3.a, r.poly3.b, r.poly3.c, r.poly3.d] for r in records],
+                dtype=np.float64,
+            ).reshape(-1, 4),
+        )
+
+    @classmethod
+    def from_arrays(
+        cls, s_offsets: np.ndarray, t_offsets: np.ndarray, coefficients: np.ndarray
+    ) -> "ShapeTable":
+        """
+        Creates a table from compiled arrays sorted by (s, t), e.g. views of a
+        network snapshot.
+        """
+        table = cls.__new__(cls)
+        table._set_records(s_offsets, t_offsets, coefficients.reshape(-1, 4))
+        return table
+
+    def _set_records(
+        self, s_offsets: np.ndarray, t_offsets: np.ndarray, coefficients: np.ndarray
+    ) -> None:
+        self.s_offsets = s_offsets
+        self.t_offsets = t_offsets
+        self.coefficients = coefficients
+
+        self.sections, first, counts = np.unique(
+            s_offsets, return_index=True, return_counts=True
+        )
+        width = int(counts.max()) if len(counts) else 0
+        rows = np.repeat(np.arange(len(counts)), counts)
+        columns = np.arange(len(s_offsets)) - first[rows]
+
+        # Unused cells have t = inf, so they are never selected
+        self.section_t = np.full((len(counts), width), np.inf)
+        self.section_t[rows, columns] = t_offsets
+        self.section_coefficients = np.zeros((len(counts), width, 4))
+        self.section_coefficients[rows, columns] = coefficients
+
+    def __len__(self) -> int:
+        return len(self.s_offsets)
+
+    def _evaluate_sections(self, sections: np.ndarray, t: np.ndarray) -> np.ndarray:
+        section_t = self.section_t[sections]
+        columns = np.maximum((section_t <= t[..., np.newaxis]).sum(axis=-1) - 1, 0)
+        dt = (
+            t - np.take_along_axis(section_t, columns[..., np.newaxis], axis=-1)[..., 0]
+        )
+        a, b, c, d = np.moveaxis(self.section_coefficients[sections, columns], -1, 0)
+        return a + dt * (b + dt * (c + dt * d))
+
+    def evaluate(
+        self, s: Union[float, np.ndarray], t: Union[float, np.ndarray]
+    ) -> np.ndarray:
+        """
+        Returns the shape height at each (s, t), zero if the road has no shape.
+        """
+        s, t = np.broadcast_arrays(
+            np.asarray(s, dtype=np.float64), np.asarray(t, dtype=np.float64)
+        )
+        if len(self) == 0:
+            return np.zeros(s.shape)
+
+        last = len(self.sections) - 1
+        before = np.clip(np.searchsorted(self.sections, s, side="right") - 1, 0, last)
+        after = np.minimum(before + 1, last)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weight = (s - self.sections[before]) / (
+                self.sections[after] - self.sections[before]
+            )
+        weight = np.where(after > before, np.clip(weight, 0.0, 1.0), 0.0)
+
+        height_before = self._evaluate_sections(before, t)
+        height_after = self._evaluate_sections(after, t)
+        return height_before + weight * (height_after - height_before)
+
+
+@dataclass
+class RoadProfiles:
+    length: Optional[float]
+    elevation: Poly3Table
+    superelevation: Poly3Table
+    lane_offset: Poly3Table
+    shape: ShapeTable
+
+    def is_on_road(self, s: Union[float, np.ndarray]) -> np.ndarray:
+        s = np.asarray(s, dtype=np.float64)
+        if self.length is None:
+            return np.zeros(s.shape, dtype=bool)
+        return (s >= 0.0) & (s <= self.length)
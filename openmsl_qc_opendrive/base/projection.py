@@ -0,0 +1,173 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+from typing import Tuple
+
+import numpy as np
+from scipy import spatial as scipy_spatial
+
+from openmsl_qc_opendrive.base import clothoid, plan_view
+
+# Nearest samples refined per query point
+NEIGHBOURS = 8
+NEWTON_ITERATIONS = 8
+# The iteration stops once no candidate moves more than this [m]
+NEWTON_TOLERANCE = 1.0e-9
+# Below this value of 1 - curvature * t the Newton step is replaced by the
+# tangent projection (points near the center of curvature)
+MIN_NEWTON_DENOMINATOR = 0.1
+
+
+class ReferenceLineProjector:
+    """
+    Inverse of the reference line evaluation for a set of roads: maps
+    inertial points (x, y) to the road coordinates (s, t) of the closest
+    reference line.
+
+    The geometries of all roads are sampled every step and the samples are
+    stored in a KD-tree. The nearest samples of a query point are the
+    candidates, each is refined with Newton iterations on the exact geometry
+    to the foot point of the perpendicular, clamped to the geometry. The
+    closest foot point wins. Spirals are evaluated with the vectorized
+    Fresnel backend.
+    """
+
+    def __init__(
+        self,
+        geometries: plan_view.PlanView,
+        geometry_roads: np.ndarray,
+        geometry_lengths: np.ndarray,
+        step: float,
+    ):
+        """
+        geometries holds the geometries of all roads, geometry_roads the
+        index of the road of each geometry and geometry_lengths the length of
+        each geometry that is on its road.
+        """
+        self.geometries = geometries
+        self.geometry_roads = np.asarray(geometry_roads, dtype=np.int64)
+        self.geometry_lengths = np.nan_to_num(
+            np.asarray(geometry_lengths, dtype=np.float64), nan=0.0
+        )
+
+        counts = np.ceil(self.geometry_lengths / step).astype(np.int64) + 1
+        counts[self.geometry_lengths <= 0.0] = 0
+        geometry = np.repeat(np.arange(len(geometries)), counts)
+        local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        ds = np.minimum(local * step, self.geometry_lengths[geometry])
+
+        x, y, _ = geometries.evaluate_geometries(geometry, ds, clothoid.FRESNEL)
+        valid = np.isfinite(x) & np.isfinite(y)
+        self.sample_geometry = geometry[valid]
+        self.sample_ds = ds[valid]
+        self.tree = scipy_spatial.cKDTree(np.column_stack([x[valid], y[valid]]))
+
+    def _refine(
+        self, geometry: np.ndarray, ds: np.ndarray, x: np.ndarray, y: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns ds, t and the distance of the foot points of (x, y) on the
+        given geometries, starting the iteration at ds.
+        """
+        ds = ds.copy()
+        length = self.geometry_lengths[geometry]
+        active = np.arange(len(ds))
+        for _ in range(NEWTON_ITERATIONS):
+            g = geometry[active]
+            px, py, heading = self.geometries.evaluate_geometries(
+                g, ds[active], clothoid.FRESNEL
+            )
+            curvature = np.nan_to_num(
+                self.geometries.evaluate_geometry_curvatures(g, ds[active])
+            )
+            dx = x[active] - px
+            dy = y[active] - py
+            along = dx * np.cos(heading) + dy * np.sin(heading)
+            t = -dx * np.sin(heading) + dy * np.cos(heading)
+
+            denominator = 1.0 - curvature * t
+            denominator = np.where(
+                denominator < MIN_NEWTON_DENOMINATOR, 1.0, denominator
+            )
+            updated = np.nan_to_num(
+                np.clip(ds[active] + along / denominator, 0.0, length[active]), nan=0.0
+            )
+            moved = np.abs(updated - ds[active]) > NEWTON_TOLERANCE
+            ds[active] = updated
+            active = active[moved]
+            if len(active) == 0:
+                break
+
+        px, py, heading = self.geometries.evaluate_geometries(
+            geometry, ds, clothoid.FRESNEL
+        )
+        dx = x - px
+        dy = y - py
+        t = -dx * np.sin(heading) + dy * np.cos(heading)
+        return ds, t, np.hypot(dx, dy)
+
+    def project(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        max_distance: float = np.inf,
+        neighbours: int = NEIGHBOURS,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns road index, s, t and distance of the closest reference line
+        point of each (x, y). Road index is -1 and the other values are NaN
+        where no reference line is within max_distance.
+        """
+        x = np.atleast_1d(np.asarray(x, dtype=np.float64))
+        y = np.atleast_1d(np.asarray(y, dtype=np.float64))
+        count = len(x)
+
+        road = np.full(count, -1, dtype=np.int64)
+        s = np.full(count, np.nan)
+        t = np.full(count, np.nan)
+        distance = np.full(count, np.nan)
+
+        neighbours = min(neighbours, self.tree.n)
+        if count == 0 or neighbours == 0:
+            return road, s, t, distance
+
+        # Samples too far away are reported with index tree.n
+        _, samples = self.tree.query(
+            np.column_stack([x, y]), k=neighbours, distance_upper_bound=max_distance
+        )
+        samples = samples.reshape(count, neighbours)
+        point = np.repeat(np.arange(count), neighbours)
+        samples = samples.ravel()
+        found = samples < self.tree.n
+        point = point[found]
+        samples = samples[found]
+        if len(point) == 0:
+            return road, s, t, distance
+
+        # One candidate per point and geometry, starting at its closest sample
+        geometry = self.sample_geometry[samples]
+        _, first = np.unique(point * len(self.geometries) + geometry, return_index=True)
+        point = point[first]
+        geometry = geometry[first]
+
+        ds, candidate_t, candidate_distance = self._refine(
+            geometry, self.sample_ds[samples[first]], x[point], y[point]
+        )
+
+        # Closest candidate of each point
+        order = np.lexsort((candidate_distance, point))
+        sorted_point = point[order]
+        best = order[np.r_[True, sorted_point[1:] != sorted_point[:-1]]]
+        best = best[candidate_distance[best] <= max_distance]
+
+        best_point = point[best]
+        best_geometry = geometry[best]
+        road[best_point] = self.geometry_roads[best_geometry]
+        s[best_point] = self.geometries.s[best_geometry] + ds[best]
+        t[best_point] = candidate_t[best]
+        distance[best_point] = candidate_distance[best]
+
+        return road, s, t, distance
@@ -0,0 +1,164 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Hashable, Tuple
+
+import numpy as np
+
+# Default sampling step of reference line polylines in meters
+DEFAULT_STEP = 1.0
+# Default memory limit of all cached polylines of a network in bytes
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def sample_positions(length: float, step: float, breaks: np.ndarray) -> np.ndarray:
+    """
+    Returns the sample positions of a road with the given length: a regular grid
+    with the given step, the road end and the break points (e.g. geometry starts),
+    so that no polyline segment spans two geometries.
+    """
+    count = max(int(np.ceil(length / step)), 1)
+    grid = np.linspace(0.0, length, count + 1)
+    breaks = breaks[(breaks > 0.0) & (breaks < length)]
+    return np.unique(np.concatenate([grid, breaks]))
+
+
+@dataclass
+class ReferenceLinePolyline:
+    """
+    Reference line of a road sampled at (at most) step meters. Heading is
+    unwrapped so that it can be interpolated linearly.
+
+    segment_curvature and segment_elevation_curvature hold for each segment
+    between two samples the largest absolute curvature of the reference line
+    and second derivative of the elevation.
+    """
+
+    step: float
+    s: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    z: np.ndarray
+    heading: np.ndarray
+    segment_curvature: np.ndarray
+    segment_elevation_curvature: np.ndarray
+
+    @property
+    def nbytes(self) -> int:
+        return sum(
+            array.nbytes
+            for array in (
+                self.s,
+                self.x,
+                self.y,
+                self.z,
+                self.heading,
+                self.segment_curvature,
+                self.segment_elevation_curvature,
+            )
+        )
+
+    def segment_indices(self, s: np.ndarray) -> np.ndarray:
+        indices = np.searchsorted(self.s, s, side="right") - 1
+        return np.clip(indices, 0, max(len(self.s) - 2, 0))
+
+    def interpolation_error(self, s: np.ndarray) -> np.ndarray:
+        """
+        Estimated error of linear interpolation at s. For a segment of length h
+        the deviation of the chord from the curve is bounded by k * h^2 / 8,
+        where k is the largest curvature on the segment. The lateral and the
+        vertical deviation are bounded separately by the curvature of the
+        reference line and the second derivative of the elevation.
+        """
+        s = np.asarray(s, dtype=np.float64)
+        if len(self.s) < 2:
+            return np.zeros(s.shape)
+
+        i = self.segment_indices(s)
+        h = self.s[i + 1] - self.s[i]
+        k = np.hypot(self.segment_curvature[i], self.segment_elevation_curvature[i])
+        return k * h**2 / 8.0
+
+    def interpolate(
+        self, s: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns x, y, z and heading at s, linearly interpolated between the
+        samples. s outside the sampled range is NaN.
+        """
+        s = np.asarray(s, dtype=np.float64)
+        if len(self.s) < 2:
+            nan = np.full(s.shape, np.nan)
+            return nan, nan.copy(), nan.copy(), nan.copy()
+
+        i = self.segment_indices(s)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            w = (s - self.s[i]) / (self.s[i + 1] - self.s[i])
+        outside = (s < self.s[0]) | (s > self.s[-1])
+        w = np.where(outside, np.nan, w)
+
+        def lerp(values: np.ndarray) -> np.ndarray:
+            return values[i] + w * (values[i + 1] - values[i])
+
+        return lerp(self.x), lerp(self.y), lerp(self.z), lerp(self.heading)
+
+
+class ReferenceLineCache:
+    """
+    LRU cache of sampled reference line polylines. When the accumulated size of
+    the cached polylines exceeds max_bytes, the least recently used polylines
+    are evicted. The most recently inserted polyline is always kept.
+
+    The cache may be used from several threads. Polylines are built outside
+    of the lock, a polyline built twice is only inserted once.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._polylines: "OrderedDict[Hashable, ReferenceLinePolyline]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._polylines)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._polylines
+
+    def get(
+        self, key: Hashable, build: Callable[[], ReferenceLinePolyline]
+    ) -> ReferenceLinePolyline:
+        with self._lock:
+            polyline = self._polylines.get(key)
+            if polyline is not None:
+                self._polylines.move_to_end(key)
+                return polyline
+
+        polyline = build()
+        with self._lock:
+            existing = self._polylines.get(key)
+            if existing is not None:
+                self._polylines.move_to_end(key)
+                return existing
+
+            self._polylines[key] = polyline
+            self.nbytes += polyline.nbytes
+            self._evict()
+
+        return polyline
+
+    def _evict(self) -> None:
+        while self.nbytes > self.max_bytes and len(self._polylines) > 1:
+            _, polyline = self._polylines.popitem(last=False)
+            self.nbytes -= polyline.nbytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._polylines.clear()
+            self.nbytes = 0
@@ -0,0 +1,301 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+from typing import Dict, List
+
+import numpy as np
+from lxml import etree
+
+from openmsl_qc_opendrive.base import arc_length, models, network, plan_view, utils
+
+
+def compile_geometry_arc_lengths(
+    roads: List[etree._ElementTree],
+) -> List[np.ndarray]:
+    """
+    Returns for each road the true arc length of each of its geometries. The
+    arc lengths of all paramPoly3 geometries are integrated in one batch, for
+    all other valid geometries the arc length is @length. NaN for invalid
+    geometries.
+    """
+    plan_views = [utils.get_road_plan_view(road) for road in roads]
+    if len(plan_views) == 0:
+        return []
+
+    geometry_type = np.concatenate([p.geometry_type for p in plan_views])
+    length = np.concatenate([p.length for p in plan_views])
+    u = np.concatenate([p.u.reshape(-1, 4) for p in plan_views])
+    v = np.concatenate([p.v.reshape(-1, 4) for p in plan_views])
+
+    arc_lengths = np.where(geometry_type == models.GeometryType.INVALID, np.nan, length)
+
+    arc_length_range = geometry_type == models.GeometryType.PARAM_POLY3_ARC_LENGTH
+    normalized = geometry_type == models.GeometryType.PARAM_POLY3_NORMALIZED
+    param_poly3 = np.flatnonzero(arc_length_range | normalized)
+    if len(param_poly3) > 0:
+        p_end = np.where(arc_length_range[param_poly3], length[param_poly3], 1.0)
+        arc_lengths[param_poly3], _ = arc_length.param_poly3_arc_lengths(
+            u[param_poly3], v[param_poly3], p_end
+        )
+
+    offsets = np.cumsum([len(p) for p in plan_views])[:-1]
+    return np.split(arc_lengths, offsets)
+
+
+def get_geometry_arc_lengths(road: etree._ElementTree) -> np.ndarray:
+    """
+    Returns the true arc length of each geometry of the road. On first use the
+    arc lengths of all roads of the document are computed at once.
+    """
+    network_index = network.get_network_index(road)
+
+    def compile_all() -> Dict[etree._ElementTree, np.ndarray]:
+        roads = utils.get_roads(network_index.root)
+        return dict(zip(roads, compile_geometry_arc_lengths(roads)))
+
+    arc_lengths = network_index.get_or_create("geometry_arc_lengths", compile_all)
+
+    road_arc_lengths = arc_lengths.get(road)
+    if road_arc_lengths is None:
+        # Road not part of the document when the table was compiled
+        road_arc_lengths = network_index.get_or_build(
+            "geometry_arc_lengths",
+            road,
+            lambda: compile_geometry_arc_lengths([road])[0],
+        )
+    return road_arc_lengths
+
+
+def compile_geometry_transitions(
+    roads: List[etree._ElementTree],
+) -> List[plan_view.GeometryTransitions]:
+    """
+    Returns for each road the position, heading and curvature differences
+    between the end of each geometry and the start of the next one. The ends
+    and starts of all geometries of all roads are evaluated in one batch.
+    """
+    plan_views = [utils.get_road_plan_view(road) for road in roads]
+    if sum(len(p) for p in plan_views) == 0:
+        empty = np.zeros(0)
+        return [
+            plan_view.GeometryTransitions(empty, empty, empty, empty, empty)
+            for _ in plan_views
+        ]
+
+    geometries = plan_view.PlanView.concatenate(plan_views)
+    count = len(geometries)
+
+    # Transition i goes from geometry i to geometry i + 1 of the same road
+    road_starts = np.cumsum([0] + [len(p) for p in plan_views])
+    is_last = np.zeros(count, dtype=bool)
+    is_last[road_starts[1:][road_starts[1:] > road_starts[:-1]] - 1] = True
+    current = np.flatnonzero(~is_last)
+    following = current + 1
+
+    x, y, heading = geometries.evaluate_geometries(current, geometries.length[current])
+    end_curvature = geometries.evaluate_geometry_curvatures(
+        current, geometries.length[current]
+    )
+    start_curvature = geometries.evaluate_geometry_curvatures(
+        following, np.zeros(len(following))
+    )
+
+    position_gap = np.hypot(geometries.x[following] - x, geometries.y[following] - y)
+    heading_gap = np.angle(np.exp(1j * (geometries.heading[following] - heading)))
+    curvature_gap = start_curvature - end_curvature
+
+    transitions = []
+    for road_start, road_end in zip(road_starts[:-1], road_starts[1:]):
+        # The transitions of a road with n geometries are the n - 1 entries
+        # of current between its first and its last geometry
+        selection = slice(
+            np.searchsorted(current, road_start), np.searchsorted(current, road_end)
+        )
+        transitions.append(
+            plan_view.GeometryTransitions(
+                x=x[selection],
+                y=y[selection],
+                position_gap=position_gap[selection],
+                heading_gap=heading_gap[selection],
+                curvature_gap=curvature_gap[selection],
+            )
+        )
+    return transitions
+
+
+def get_geometry_transitions(
+    road: etree._ElementTree,
+) -> plan_view.GeometryTransitions:
+    """
+    Returns the differences between consecutive geometries of the road. On
+    first use the transitions of all roads of the document are computed at
+    once.
+    """
+    network_index = network.get_network_index(road)
+
+    def compile_all() -> Dict[etree._ElementTree, plan_view.GeometryTransitions]:
+        roads = utils.get_roads(network_index.root)
+        return dict(zip(roads, compile_geometry_transitions(roads)))
+
+    transitions = network_index.get_or_create("geometry_transitions", compile_all)
+
+    road_transitions = transitions.get(road)
+    if road_transitions is None:
+        # Road not part of the document when the table was compiled
+        road_transitions = network_index.get_or_build(
+            "geometry_transitions",
+            road,
+            lambda: compile_geometry_transitions([road])[0],
+        )
+    return road_transitions
+
+
+def _find_in_blocks(
+    starts: np.ndarray, counts: np.ndarray, s: np.ndarray
+) -> np.ndarray:
+    """
+    starts holds consecutive blocks of sorted start values, block i has
+    counts[i] entries. Returns for each block the global index of its last
+    start <= s[i], or of its first start if there is none. -1 for empty
+    blocks.
+    """
+    offsets = np.concatenate([[0], np.cumsum(counts)[:-1]]).astype(np.int64)
+    non_empty = counts > 0
+
+    below = np.zeros(len(counts), dtype=np.int64)
+    if non_empty.any():
+        # Empty blocks share the offset of the next block, so reducing over
+        # the offsets of the non-empty blocks sums each block separately.
+        is_below = (starts <= np.repeat(s, counts)).astype(np.int64)
+        below[non_empty] = np.add.reduceat(is_below, offsets[non_empty])
+
+    return np.where(non_empty, offsets + np.maximum(below - 1, 0), -1)
+
+
+def compile_road_contact_poses(
+    roads: List[etree._ElementTree],
+) -> List[np.ndarray]:
+    """
+    Returns for each road an array [[x, y, heading, z] at s=0, [x, y, heading,
+    z] at s=length]. The reference lines and elevations of all roads are
+    evaluated in one batch. NaN for roads without valid geometries or length.
+    """
+    count = len(roads)
+    if count == 0:
+        return []
+
+    length = np.array([utils.get_road_length(road) for road in roads], dtype=np.float64)
+    s = np.stack([np.zeros(count), length], axis=1)
+    poses = np.full((count, 2, 4), np.nan)
+
+    plan_views = [utils.get_road_plan_view(road) for road in roads]
+    geometry_counts = np.array([len(p) for p in plan_views])
+    if geometry_counts.sum() > 0:
+        geometries = plan_view.PlanView.concatenate(plan_views)
+        for contact in range(2):
+            indices = _find_in_blocks(geometries.s, geometry_counts, s[:, contact])
+            valid = indices >= 0
+            index = indices[valid]
+            ds = s[valid, contact] - geometries.s[index]
+            x, y, heading = geometries.evaluate_geometries(index, ds)
+            poses[valid, contact, :3] = np.column_stack([x, y, heading])
+
+    # Roads without elevation records are flat at z=0
+    elevations = [utils.get_road_profiles(road).elevation for road in roads]
+    elevation_counts = np.array([len(e) for e in elevations])
+    poses[:, :, 3] = 0.0
+    if elevation_counts.sum() > 0:
+        s_offsets = np.concatenate([e.s_offsets for e in elevations])
+        coefficients = np.concatenate([e.coefficients for e in elevations])
+        for contact in range(2):
+            indices = _find_in_blocks(s_offsets, elevation_counts, s[:, contact])
+            valid = indices >= 0
+            index = indices[valid]
+            ds = s[valid, contact] - s_offsets[index]
+            a, b, c, d = coefficients[index].T
+            poses[valid, contact, 3] = a + ds * (b + ds * (c + ds * d))
+
+    return list(poses)
+
+
+def get_road_contact_pose(
+    road: etree._ElementTree, contact_point: models.ContactPoint
+) -> np.ndarray:
+    """
+    Returns [x, y, heading, z] of the road at its start or end. On first use
+    the contact poses of all roads of the document are computed at once.
+    """
+    network_index = network.get_network_index(road)
+
+    def compile_all() -> Dict[etree._ElementTree, np.ndarray]:
+        roads = utils.get_roads(network_index.root)
+        return dict(zip(roads, compile_road_contact_poses(roads)))
+
+    contact_poses = network_index.get_or_create("road_contact_poses", compile_all)
+
+    road_contact_poses = contact_poses.get(road)
+    if road_contact_poses is None:
+        # Road not part of the document when the table was compiled
+        road_contact_poses = network_index.get_or_build(
+            "road_contact_poses", road, lambda: compile_road_contact_poses([road])[0]
+        )
+    return road_contact_poses[0 if contact_point == models.ContactPoint.START else 1]
+
+
+def compile_road_contact_lane_borders(
+    road: etree._ElementTree,
+) -> List[Dict[int, np.ndarray]]:
+    """
+    Returns for the start and for the end of the road the inertial points
+    [x, y, z] of the outer borders of the lanes of the first and of the last
+    lane section, keyed by lane id. Lane 0 is the center lane at the lane
+    offset. Lanes whose border is undefined there are left out.
+    """
+    contact_borders = [dict(), dict()]
+    sections = utils.get_sorted_lane_sections_with_length_from_road(road)
+    if len(sections) == 0:
+        return contact_borders
+
+    for contact, section, ds in (
+        (0, sections[0], 0.0),
+        (1, sections[-1], sections[-1].length),
+    ):
+        s = utils.get_s_from_lane_section(section.lane_section) + ds
+        lane_offset = utils.evaluate_road_lane_offset(road, np.array([s]))
+
+        lane_ids = [0]
+        t = [lane_offset]
+        section_borders = utils.get_lane_section_borders(section.lane_section)
+        for group in (section_borders.left, section_borders.right):
+            if len(group) > 0:
+                lane_ids.extend(int(lane_id) for lane_id in group.lane_ids)
+                t.append(
+                    group.evaluate_outer_borders(np.array([ds]), lane_offset)[:, 0]
+                )
+
+        points = utils.get_points_xyz_from_road(road, s, np.concatenate(t), 0.0)
+        contact_borders[contact] = {
+            lane_id: point
+            for lane_id, point in zip(lane_ids, points)
+            if not np.isnan(point).any()
+        }
+
+    return contact_borders
+
+
+def get_road_contact_lane_borders(
+    road: etree._ElementTree, contact_point: models.ContactPoint
+) -> Dict[int, np.ndarray]:
+    """
+    Returns the inertial points of the outer lane borders at the start or end
+    of the road by lane id, cached on the network index.
+    """
+    contact_borders = network.get_network_index(road).get_or_build(
+        "road_contact_lane_borders",
+        road,
+        lambda: compile_road_contact_lane_borders(road),
+    )
+    return contact_borders[0 if contact_point == models.ContactPoint.START else 1]
@@ -0,0 +1,263 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from openmsl_qc_opendrive.base import lane_borders, plan_view, profiles
+
+# Increase when the layout of the snapshot tables changes
+SNAPSHOT_VERSION = 2
+
+STRINGS_FILE_NAME = "strings.json"
+
+PROFILE_NAMES = ("elevation", "superelevation", "lane_offset")
+
+PolynomialArrays = Tuple[np.ndarray, np.ndarray]
+
+
+def file_digest(path: str) -> str:
+    """
+    Returns the digest that keys the snapshot of a file: the SHA-256 of its
+    content and the snapshot version.
+    """
+    digest = hashlib.sha256(f"snapshot-v{SNAPSHOT_VERSION}".encode())
+    with open(path, "rb") as raw_file:
+        for chunk in iter(lambda: raw_file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _pack_polynomials(
+    arrays: Dict[str, np.ndarray], prefix: str, tables: List[PolynomialArrays]
+) -> None:
+    """
+    Stores a list of polynomial tables as one table with row offsets, so that
+    table i is rows offsets[i]:offsets[i + 1].
+    """
+    counts = [len(s_offsets) for s_offsets, _ in tables]
+    arrays[f"{prefix}_offsets"] = np.concatenate([[0], np.cumsum(counts)]).astype(
+        np.int64
+    )
+    arrays[f"{prefix}_s_offsets"] = np.concatenate(
+        [np.empty(0)] + [s_offsets for s_offsets, _ in tables]
+    )
+    arrays[f"{prefix}_coefficients"] = np.concatenate(
+        [np.empty((0, 4))] + [coefficients.reshape(-1, 4) for _, coefficients in tables]
+    )
+
+
+class NetworkSnapshot:
+    """
+    Compiled planViews, profiles and lane borders of all roads of a document,
+    stored as flat tables with row offsets. Road i and lane section i are the
+    i-th road and lane section in document order.
+
+    A loaded snapshot holds read-only memory maps, so that parallel workers
+    share the tables without copies. The compiled objects returned by the
+    getters are views into these tables.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray], strings: Dict[str, List[str]]):
+        self.arrays = arrays
+        self.strings = strings
+
+    @property
+    def road_count(self) -> int:
+        return len(self.arrays["road_length"])
+
+    @property
+    def lane_section_count(self) -> int:
+        return len(self.arrays["lane_section_s"])
+
+    def matches(self, road_ids: List[str], lane_section_count: int) -> bool:
+        return (
+            self.strings["road_ids"] == road_ids
+            and self.lane_section_count == lane_section_count
+        )
+
+    def _rows(self, prefix: str, i: int) -> slice:
+        offsets = self.arrays[f"{prefix}_offsets"]
+        return slice(int(offsets[i]), int(offsets[i + 1]))
+
+    def _polynomials(self, prefix: str, i: int) -> PolynomialArrays:
+        rows = self._rows(prefix, i)
+        return (
+            self.arrays[f"{prefix}_s_offsets"][rows],
+            self.arrays[f"{prefix}_coefficients"][rows],
+        )
+
+    def get_road_plan_view(self, i: int) -> plan_view.PlanView:
+        rows = self._rows("geometry", i)
+        return plan_view.PlanView.from_arrays(
+            **{
+                name: self.arrays[f"geometry_{name}"][rows]
+                for name in plan_view.PlanView.ARRAY_NAMES
+            }
+        )
+
+    def get_road_profiles(self, i: int) -> profiles.RoadProfiles:
+        length = float(self.arrays["road_length"][i])
+        tables = {
+            name: profiles.Poly3Table.from_arrays(
+                *self._polynomials(name, i),
+                zero_before_start=name == "lane_offset",
+            )
+            for name in PROFILE_NAMES
+        }
+        rows = self._rows("shape", i)
+        shape = profiles.ShapeTable.from_arrays(
+            self.arrays["shape_s_offsets"][rows],
+            self.arrays["shape_t_offsets"][rows],
+            self.arrays["shape_coefficients"][rows],
+        )
+        return profiles.RoadProfiles(
+            length=None if np.isnan(length) else length, shape=shape, **tables
+        )
+
+    def _get_lane_group_borders(self, group: int) -> lane_borders.LaneGroupBorders:
+        rows = self._rows("lane_group", group)
+        return lane_borders.LaneGroupBorders.from_arrays(
+            self.arrays["lane_ids"][rows],
+            [
+                self._polynomials("lane_width", row)
+                for row in range(rows.start, rows.stop)
+            ],
+            [
+                self._polynomials("lane_border", row)
+                for row in range(rows.start, rows.stop)
+            ],
+        )
+
+    def get_lane_section_borders(self, i: int) -> lane_borders.LaneSectionBorders:
+        s = float(self.arrays["lane_section_s"][i])
+        return lane_borders.LaneSectionBorders(
+            s=None if np.isnan(s) else s,
+            left=self._get_lane_group_borders(2 * i),
+            right=self._get_lane_group_borders(2 * i + 1),
+        )
+
+
+def create_snapshot(
+    road_ids: List[str],
+    road_plan_views: List[plan_view.PlanView],
+    road_profiles: List[profiles.RoadProfiles],
+    lane_section_borders: List[lane_borders.LaneSectionBorders],
+) -> NetworkSnapshot:
+    arrays: Dict[str, np.ndarray] = dict()
+
+    arrays["road_length"] = np.array(
+        [np.nan if p.length is None else p.length for p in road_profiles],
+        dtype=np.float64,
+    )
+
+    counts = [len(p) for p in road_plan_views]
+    arrays["geometry_offsets"] = np.concatenate([[0], np.cumsum(counts)]).astype(
+        np.int64
+    )
+    for name in plan_view.PlanView.ARRAY_NAMES:
+        parts = [getattr(p, name) for p in road_plan_views]
+        if len(parts) == 0:
+            empty = getattr(plan_view.PlanView([]), name)
+            arrays[f"geometry_{name}"] = empty
+        else:
+            arrays[f"geometry_{name}"] = np.concatenate(parts)
+
+    for name in PROFILE_NAMES:
+        tables = [getattr(p, name) for p in road_profiles]
+        _pack_polynomials(
+            arrays, name, [(table.s_offsets, table.coefficients) for table in tables]
+        )
+
+    shapes = [p.shape for p in road_profiles]
+    _pack_polynomials(
+        arrays, "shape", [(shape.s_offsets, shape.coefficients) for shape in shapes]
+    )
+    arrays["shape_t_offsets"] = np.concatenate(
+        [np.empty(0)] + [shape.t_offsets for shape in shapes]
+    )
+
+    arrays["lane_section_s"] = np.array(
+        [np.nan if b.s is None else b.s for b in lane_section_borders],
+        dtype=np.float64,
+    )
+    groups = [g for b in lane_section_borders for g in (b.left, b.right)]
+    arrays["lane_group_offsets"] = np.concatenate(
+        [[0], np.cumsum([len(g) for g in groups])]
+    ).astype(np.int64)
+    arrays["lane_ids"] = np.concatenate(
+        [np.empty(0, dtype=np.int64)] + [g.lane_ids for g in groups]
+    ).astype(np.int64)
+    _pack_polynomials(
+        arrays,
+        "lane_width",
+        [(w.s_offsets, w.coefficients) for g in groups for w in g.widths],
+    )
+    _pack_polynomials(
+        arrays,
+        "lane_border",
+        [(b.s_offsets, b.coefficients) for g in groups for b in g.borders],
+    )
+
+    return NetworkSnapshot(arrays, {"road_ids": list(road_ids)})
+
+
+def save_snapshot(snapshot: NetworkSnapshot, directory: str) -> None:
+    """
+    Writes every table as a .npy file into directory. The files are written
+    to a temporary directory first, so that concurrent runs never see a
+    partially written snapshot.
+    """
+    parent = os.path.dirname(os.path.abspath(directory))
+    os.makedirs(parent, exist_ok=True)
+    temporary = tempfile.mkdtemp(dir=parent)
+
+    try:
+        for name, array in snapshot.arrays.items():
+            np.save(os.path.join(temporary, f"{name}.npy"), np.ascontiguousarray(array))
+        with open(os.path.join(temporary, STRINGS_FILE_NAME), "w") as strings_file:
+            json.dump(
+                {
+                    "version": SNAPSHOT_VERSION,
+                    "arrays": sorted(snapshot.arrays),
+                    "strings": snapshot.strings,
+                },
+                strings_file,
+            )
+        os.replace(temporary, directory)
+    except OSError:
+        shutil.rmtree(temporary, ignore_errors=True)
+        if not os.path.isdir(directory):
+            raise
+
+
+def load_snapshot(directory: str) -> Optional[NetworkSnapshot]:
+    """
+    Returns the snapshot stored in directory with memory mapped tables, or
+    None if there is no snapshot of the current version.
+    """
+    strings_path = os.path.join(directory, STRINGS_FILE_NAME)
+    if not os.path.isfile(strings_path):
+        return None
+
+    with open(strings_path) as strings_file:
+        content = json.load(strings_file)
+
+    if content.get("version") != SNAPSHOT_VERSION:
+        return None
+
+    arrays = {
+        name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")
+        for name in content["arrays"]
+    }
+
+    return NetworkSnapshot(arrays, content["strings"])
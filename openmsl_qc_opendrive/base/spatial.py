@@ -0,0 +1,312 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Grid cells are this many times the median segment extent
+CELL_SIZE_FACTOR = 4.0
+# Intersections closer to a segment end than this fraction of the segment
+# are touching points (e.g. shared vertices) and not reported
+ENDPOINT_EPSILON = 1.0e-9
+
+
+def _pairs_within_groups(
+    order: np.ndarray, keys: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns all pairs (order[a], order[b]), a < b, of entries with equal keys.
+    keys must be sorted, order holds the entry of each sorted position.
+    """
+    count = len(keys)
+    if count < 2:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    group_starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    group_ends = np.r_[group_starts[1:], count]
+    group_end = np.repeat(group_ends, group_ends - group_starts)
+
+    # Position a is paired with the following positions of its group
+    partners = group_end - np.arange(count) - 1
+    first = np.repeat(np.arange(count), partners)
+    offsets = np.arange(len(first)) - np.repeat(
+        np.cumsum(partners) - partners, partners
+    )
+    second = first + 1 + offsets
+
+    return order[first], order[second]
+
+
+class BoxGrid:
+    """
+    Uniform grid of axis aligned 2d bounding boxes, used as broad phase for
+    intersection queries.
+
+    Each box is inserted into all cells it covers. Pairs of boxes that share
+    a cell and overlap are the candidates for the exact intersection test.
+    With cells a few times larger than the boxes the number of candidates
+    grows linearly with the number of boxes, unless many boxes are stacked at
+    the same place.
+    """
+
+    def __init__(
+        self,
+        min_x: np.ndarray,
+        min_y: np.ndarray,
+        max_x: np.ndarray,
+        max_y: np.ndarray,
+        cell_size: Optional[float] = None,
+    ):
+        self.min_x = np.asarray(min_x, dtype=np.float64)
+        self.min_y = np.asarray(min_y, dtype=np.float64)
+        self.max_x = np.asarray(max_x, dtype=np.float64)
+        self.max_y = np.asarray(max_y, dtype=np.float64)
+
+        if cell_size is None:
+            extent = np.maximum(self.max_x - self.min_x, self.max_y - self.min_y)
+            cell_size = (
+                CELL_SIZE_FACTOR * float(np.median(extent)) if len(extent) else 1.0
+            )
+        self.cell_size = max(cell_size, 1.0e-6)
+
+    def __len__(self) -> int:
+        return len(self.min_x)
+
+    def _cells(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the grid column and row of the points (x, y). The grid starts
+        at the lower left corner of all boxes.
+        """
+        cell_x = (x - self.min_x.min()) // self.cell_size
+        cell_y = (y - self.min_y.min()) // self.cell_size
+        return cell_x, cell_y
+
+    def _columns(self) -> int:
+        return int(self._cells(self.max_x, self.max_y)[0].max()) + 1
+
+    def _cell_entries(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns one entry (box, cell key) per cell covered by each box, sorted
+        by cell key.
+        """
+        cell_x0, cell_y0 = self._cells(self.min_x, self.min_y)
+        cell_x1, cell_y1 = self._cells(self.max_x, self.max_y)
+        cell_x0, cell_y0, cell_x1, cell_y1 = (
+            c.astype(np.int64) for c in (cell_x0, cell_y0, cell_x1, cell_y1)
+        )
+
+        width = cell_x1 - cell_x0 + 1
+        height = cell_y1 - cell_y0 + 1
+        cells = width * height
+        box = np.repeat(np.arange(len(self)), cells)
+        local = np.arange(cells.sum()) - np.repeat(np.cumsum(cells) - cells, cells)
+        cell_x = cell_x0[box] + local % width[box]
+        cell_y = cell_y0[box] + local // width[box]
+
+        keys = cell_y * self._columns() + cell_x
+        order = np.argsort(keys, kind="stable")
+        return box[order], keys[order]
+
+    def boxes_containing_points(
+        self, x: np.ndarray, y: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the index arrays (box, point) of all pairs of a box and a point
+        (x, y) inside it. Points on the edge of a box are inside.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        if len(self) == 0 or len(x) == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+        # Points outside the columns of the grid would alias other cells
+        columns = self._columns()
+        cell_x, cell_y = self._cells(x, y)
+        points = np.flatnonzero((cell_x >= 0) & (cell_x < columns) & (cell_y >= 0))
+        point_keys = (cell_y[points] * columns + cell_x[points]).astype(np.int64)
+
+        # Each point is paired with the boxes covering its cell
+        box, keys = self._cell_entries()
+        lower = np.searchsorted(keys, point_keys, side="left")
+        counts = np.searchsorted(keys, point_keys, side="right") - lower
+        point = np.repeat(points, counts)
+        offsets = np.arange(counts.sum()) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+        box = box[np.repeat(lower, counts) + offsets]
+
+        inside = (
+            (self.min_x[box] <= x[point])
+            & (x[point] <= self.max_x[box])
+            & (self.min_y[box] <= y[point])
+            & (y[point] <= self.max_y[box])
+        )
+        return box[inside], point[inside]
+
+    def candidate_pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the index arrays (i, j), i < j, of all pairs of overlapping
+        boxes. Boxes that touch overlap.
+        """
+        if len(self) < 2:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+        box, keys = self._cell_entries()
+        first, second = _pairs_within_groups(box, keys)
+
+        overlap = (
+            (self.min_x[first] <= self.max_x[second])
+            & (self.min_x[second] <= self.max_x[first])
+            & (self.min_y[first] <= self.max_y[second])
+            & (self.min_y[second] <= self.max_y[first])
+        )
+        first = first[overlap]
+        second = second[overlap]
+
+        # Boxes covering several cells meet in each of them
+        pairs = np.unique(
+            np.minimum(first, second) * len(self) + np.maximum(first, second)
+        )
+        return pairs // len(self), pairs % len(self)
+
+
+class SegmentGrid(BoxGrid):
+    """
+    BoxGrid of the bounding boxes of 2d line segments.
+    """
+
+    def __init__(
+        self,
+        x0: np.ndarray,
+        y0: np.ndarray,
+        x1: np.ndarray,
+        y1: np.ndarray,
+        cell_size: Optional[float] = None,
+    ):
+        super().__init__(
+            np.minimum(x0, x1),
+            np.minimum(y0, y1),
+            np.maximum(x0, x1),
+            np.maximum(y0, y1),
+            cell_size,
+        )
+
+
+class RectangleGrid(BoxGrid):
+    """
+    BoxGrid of the bounding boxes of oriented rectangles, given by center,
+    heading of the length axis and half extents along and across it.
+    """
+
+    def __init__(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        heading: np.ndarray,
+        half_length: np.ndarray,
+        half_width: np.ndarray,
+        cell_size: Optional[float] = None,
+    ):
+        cos = np.abs(np.cos(heading))
+        sin = np.abs(np.sin(heading))
+        extent_x = half_length * cos + half_width * sin
+        extent_y = half_length * sin + half_width * cos
+        super().__init__(
+            x - extent_x, y - extent_y, x + extent_x, y + extent_y, cell_size
+        )
+
+
+def intersect_segments(
+    ax0: np.ndarray,
+    ay0: np.ndarray,
+    ax1: np.ndarray,
+    ay1: np.ndarray,
+    bx0: np.ndarray,
+    by0: np.ndarray,
+    bx1: np.ndarray,
+    by1: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Exact test of the segment pairs a[i], b[i]. Returns a mask of the pairs
+    that cross and the parameters t, u of the crossing point along a and b.
+    Parallel segments and segments that only touch at an end do not cross.
+    """
+    rx = ax1 - ax0
+    ry = ay1 - ay0
+    sx = bx1 - bx0
+    sy = by1 - by0
+    qx = bx0 - ax0
+    qy = by0 - ay0
+
+    denominator = rx * sy - ry * sx
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (qx * sy - qy * sx) / denominator
+        u = (qx * ry - qy * rx) / denominator
+
+    crossing = (
+        (denominator != 0.0)
+        & (t > ENDPOINT_EPSILON)
+        & (t < 1.0 - ENDPOINT_EPSILON)
+        & (u > ENDPOINT_EPSILON)
+        & (u < 1.0 - ENDPOINT_EPSILON)
+    )
+    return crossing, t, u
+
+
+def intersect_rectangles(
+    x: np.ndarray,
+    y: np.ndarray,
+    heading: np.ndarray,
+    half_length: np.ndarray,
+    half_width: np.ndarray,
+    first: np.ndarray,
+    second: np.ndarray,
+) -> np.ndarray:
+    """
+    Exact test of the rectangle pairs (first[i], second[i]) with the
+    separating axis theorem. Returns a mask of the pairs whose interiors
+    overlap, rectangles that only touch do not.
+    """
+    dx = x[second] - x[first]
+    dy = y[second] - y[first]
+    cos_a, sin_a = np.cos(heading[first]), np.sin(heading[first])
+    cos_b, sin_b = np.cos(heading[second]), np.sin(heading[second])
+
+    # Projections of the rectangle axes on each other
+    cos_ab = np.abs(cos_a * cos_b + sin_a * sin_b)
+    sin_ab = np.abs(sin_a * cos_b - cos_a * sin_b)
+
+    separated = np.zeros(len(first), dtype=bool)
+    for axis_x, axis_y, radius_a, radius_b in (
+        (
+            cos_a,
+            sin_a,
+            half_length[first],
+            half_length[second] * cos_ab + half_width[second] * sin_ab,
+        ),
+        (
+            -sin_a,
+            cos_a,
+            half_width[first],
+            half_length[second] * sin_ab + half_width[second] * cos_ab,
+        ),
+        (
+            cos_b,
+            sin_b,
+            half_length[first] * cos_ab + half_width[first] * sin_ab,
+            half_length[second],
+        ),
+        (
+            -sin_b,
+            cos_b,
+            half_length[first] * sin_ab + half_width[first] * cos_ab,
+            half_width[second],
+        ),
+    ):
+        separated |= np.abs(dx * axis_x + dy * axis_y) >= radius_a + radius_b
+
+    return ~separated
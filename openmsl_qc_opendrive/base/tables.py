@@ -0,0 +1,492 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+from typing import List, Tuple
+
+import numpy as np
+from lxml import etree
+
+from openmsl_qc_opendrive.base import models, network, utils
+
+
+# Columns of one row of the geometry table, in compile order
+_GEOMETRY_TABLE_COLUMNS = (
+    "s",
+    "x",
+    "y",
+    "heading",
+    "length",
+    "geometry_type",
+    "curvature_start",
+    "curvature_end",
+    "p_range",
+)
+
+
+_PARAM_POLY3_ATTRIBUTES = ("aU", "bU", "cU", "dU", "aV", "bV", "cV", "dV")
+
+
+_PARAM_POLY3_RANGES = {
+    models.ParamPoly3Range.ARC_LENGTH.value: models.GeometryType.PARAM_POLY3_ARC_LENGTH,
+    models.ParamPoly3Range.NORMALIZED.value: models.GeometryType.PARAM_POLY3_NORMALIZED,
+}
+
+
+def compile_geometry_table(roads: List[etree._ElementTree]) -> models.GeometryTable:
+    """
+    Returns the attributes of all planView geometries of the roads as
+    columns, read in one pass over the geometry elements. The geometry types
+    follow get_geometry_record.
+    """
+
+    def get_value(element: etree._Element, attribute: str) -> float:
+        value = utils.to_float(element.get(attribute))
+        return np.nan if value is None else value
+
+    elements = []
+    geometry_roads = []
+    rows = []
+    coefficients = []
+    for road_index, road in enumerate(roads):
+        for geometry in utils.get_road_plan_view_geometry_list(road):
+            # s, x, y, heading and length lead the row
+            row = [
+                get_value(geometry, name) for name in ("s", "x", "y", "hdg", "length")
+            ]
+            curvature_start = curvature_end = np.nan
+
+            p_range = models.GeometryType.INVALID
+            param_poly3_coefficients = [np.nan] * 8
+            param_poly3 = None
+            for element in geometry.iter("paramPoly3"):
+                param_poly3 = element
+            if param_poly3 is not None:
+                values = [
+                    get_value(param_poly3, name) for name in _PARAM_POLY3_ATTRIBUTES
+                ]
+                p_range_type = _PARAM_POLY3_RANGES.get(param_poly3.get("pRange"))
+                if p_range_type is not None and not np.isnan(values).any():
+                    p_range = p_range_type
+                    param_poly3_coefficients = values
+
+            geometry_type = models.GeometryType.INVALID
+            if not np.isnan(row).any():
+                line = utils.get_geometry_line(geometry)
+                arc = utils.get_geometry_arc(geometry)
+                spiral = utils.get_geometry_spiral(geometry)
+                if line is not None:
+                    geometry_type = models.GeometryType.LINE
+                elif arc is not None:
+                    curvature_start = curvature_end = get_value(arc, "curvature")
+                    if not np.isnan(curvature_start):
+                        geometry_type = models.GeometryType.ARC
+                elif spiral is not None:
+                    curvature_start = get_value(spiral, "curvStart")
+                    curvature_end = get_value(spiral, "curvEnd")
+                    if not np.isnan([curvature_start, curvature_end]).any():
+                        geometry_type = models.GeometryType.SPIRAL
+                else:
+                    geometry_type = p_range
+
+            elements.append(geometry)
+            geometry_roads.append(road_index)
+            rows.append(row + [geometry_type, curvature_start, curvature_end, p_range])
+            coefficients.append(param_poly3_coefficients)
+
+    road_length = [utils.get_road_length(road) for road in roads]
+    columns = np.array(rows, dtype=np.float64).reshape(-1, len(_GEOMETRY_TABLE_COLUMNS))
+    table = dict(zip(_GEOMETRY_TABLE_COLUMNS, columns.T))
+    coefficients = np.array(coefficients, dtype=np.float64).reshape(-1, 8)
+
+    return models.GeometryTable(
+        elements=elements,
+        roads=roads,
+        road_length=np.array(
+            [np.nan if length is None else length for length in road_length],
+            dtype=np.float64,
+        ),
+        road=np.array(geometry_roads, dtype=np.int64),
+        s=table["s"],
+        x=table["x"],
+        y=table["y"],
+        heading=table["heading"],
+        length=table["length"],
+        geometry_type=table["geometry_type"].astype(np.int8),
+        curvature_start=table["curvature_start"],
+        curvature_end=table["curvature_end"],
+        p_range=table["p_range"].astype(np.int8),
+        u=coefficients[:, :4],
+        v=coefficients[:, 4:],
+    )
+
+
+def get_geometry_table(root: etree._ElementTree) -> models.GeometryTable:
+    """
+    Returns the geometry table of all roads of the document, cached on the
+    network index.
+    """
+    return network.get_network_index(root).get_or_create(
+        "geometry_table", lambda: compile_geometry_table(utils.get_roads(root))
+    )
+
+
+def compile_lane_tables(
+    roads: List[etree._ElementTree],
+) -> Tuple[models.LaneSectionTable, models.LaneTable]:
+    """
+    Returns the laneSection table and the lane table of the roads, read in
+    one pass over the laneSections and their left and right lanes.
+    """
+    section_elements = []
+    section_roads = []
+    section_s = []
+
+    lane_elements = []
+    lane_columns = []
+    lane_types = {}
+    for road_index, road in enumerate(roads):
+        for lane_section in utils.get_lane_sections(road):
+            section_index = len(section_elements)
+            s = utils.get_s_from_lane_section(lane_section)
+            section_elements.append(lane_section)
+            section_roads.append(road_index)
+            section_s.append(np.nan if s is None else s)
+
+            for side, lanes in (
+                (1, utils.get_left_lanes_from_lane_section(lane_section)),
+                (-1, utils.get_right_lanes_from_lane_section(lane_section)),
+            ):
+                for lane in lanes:
+                    lane_id = utils.get_lane_id(lane)
+                    lane_type = lane_types.setdefault(
+                        utils.get_type_from_lane(lane), len(lane_types)
+                    )
+                    lane_elements.append(lane)
+                    lane_columns.append(
+                        (
+                            road_index,
+                            section_index,
+                            side,
+                            np.nan if lane_id is None else lane_id,
+                            lane_type,
+                            utils.get_lane_level_from_lane(lane),
+                        )
+                    )
+
+    road_length = np.array(
+        [
+            np.nan if length is None else length
+            for length in map(utils.get_road_length, roads)
+        ],
+        dtype=np.float64,
+    )
+    section_roads = np.array(section_roads, dtype=np.int64)
+    section_s = np.array(section_s, dtype=np.float64)
+
+    # Each laneSection ends at the next start of its road in s order
+    order = np.lexsort((section_s, section_roads))
+    sorted_roads = section_roads[order]
+    sorted_s = section_s[order]
+    is_last = np.r_[sorted_roads[1:] != sorted_roads[:-1], True][: len(order)]
+    end = np.where(
+        is_last, road_length[sorted_roads], np.r_[sorted_s[1:], np.nan][: len(order)]
+    )
+    section_length = np.empty(len(order))
+    section_length[order] = end - sorted_s
+
+    incomplete = np.isnan(road_length)
+    incomplete[section_roads[np.isnan(section_s)]] = True
+    section_length[incomplete[section_roads]] = np.nan
+
+    lane_values = np.array(lane_columns, dtype=np.float64).reshape(-1, 6)
+    road, lane_section, side, lane_id, lane_type, level = lane_values.T
+
+    return (
+        models.LaneSectionTable(
+            elements=section_elements,
+            roads=roads,
+            road_length=road_length,
+            road=section_roads,
+            s=section_s,
+            length=section_length,
+        ),
+        models.LaneTable(
+            elements=lane_elements,
+            road=road.astype(np.int64),
+            lane_section=lane_section.astype(np.int64),
+            side=side.astype(np.int8),
+            id=lane_id,
+            lane_type=lane_type.astype(np.int32),
+            lane_types=list(lane_types),
+            level=level.astype(bool),
+        ),
+    )
+
+
+def get_lane_tables(
+    root: etree._ElementTree,
+) -> Tuple[models.LaneSectionTable, models.LaneTable]:
+    """
+    Returns the laneSection table and the lane table of all roads of the
+    document, cached on the network index.
+    """
+    return network.get_network_index(root).get_or_create(
+        "lane_tables", lambda: compile_lane_tables(utils.get_roads(root))
+    )
+
+
+def compile_junction_tables(
+    root: etree._ElementTree,
+) -> Tuple[models.JunctionConnectionTable, models.LaneLinkTable]:
+    """
+    Returns the connection table and the laneLink table of all junctions of
+    the document, read in one pass over the connections and their laneLinks.
+    Road ids are resolved like get_road_id_map.
+    """
+    roads = utils.get_roads(root)
+    road_indices = {}
+    for index, road in enumerate(roads):
+        road_id = utils.to_int(road.get("id"))
+        if road_id is not None:
+            road_indices[road_id] = index
+    contact_points = {
+        contact_point.value: code
+        for code, contact_point in enumerate(
+            models.JunctionConnectionTable.CONTACT_POINTS
+        )
+        if contact_point is not None
+    }
+
+    junctions = utils.get_junctions(root)
+    connection_elements = []
+    connection_rows = []
+    lane_link_elements = []
+    lane_link_rows = []
+    for junction_index, junction in enumerate(junctions):
+        for connection in utils.get_connections_from_junction(junction):
+            connection_index = len(connection_elements)
+            connection_elements.append(connection)
+            connection_rows.append(
+                (
+                    junction_index,
+                    road_indices.get(
+                        utils.get_incoming_road_id_from_connection(connection), -1
+                    ),
+                    road_indices.get(
+                        utils.get_connecting_road_id_from_connection(connection), -1
+                    ),
+                    contact_points.get(connection.get("contactPoint"), 0),
+                )
+            )
+
+            for lane_link in utils.get_lane_links_from_connection(connection):
+                from_lane = utils.get_from_attribute_from_lane_link(lane_link)
+                to_lane = utils.get_to_attribute_from_lane_link(lane_link)
+                lane_link_elements.append(lane_link)
+                lane_link_rows.append(
+                    (
+                        connection_index,
+                        np.nan if from_lane is None else from_lane,
+                        np.nan if to_lane is None else to_lane,
+                    )
+                )
+
+    connection_columns = np.array(connection_rows, dtype=np.int64).reshape(-1, 4).T
+    junction, incoming_road, connecting_road, contact_point = connection_columns
+    lane_link_columns = np.array(lane_link_rows, dtype=np.float64).reshape(-1, 3).T
+    connection = lane_link_columns[0].astype(np.int64)
+
+    return (
+        models.JunctionConnectionTable(
+            elements=connection_elements,
+            junctions=junctions,
+            roads=roads,
+            junction=junction,
+            incoming_road=incoming_road,
+            connecting_road=connecting_road,
+            contact_point=contact_point.astype(np.int8),
+        ),
+        models.LaneLinkTable(
+            elements=lane_link_elements,
+            connection=connection,
+            junction=junction[connection],
+            incoming_road=incoming_road[connection],
+            connecting_road=connecting_road[connection],
+            contact_point=contact_point[connection].astype(np.int8),
+            from_lane=lane_link_columns[1],
+            to_lane=lane_link_columns[2],
+        ),
+    )
+
+
+def get_junction_tables(
+    root: etree._ElementTree,
+) -> Tuple[models.JunctionConnectionTable, models.LaneLinkTable]:
+    """
+    Returns the connection table and the laneLink table of all junctions of
+    the document, cached on the network index.
+    """
+    return network.get_network_index(root).get_or_create(
+        "junction_tables", lambda: compile_junction_tables(root)
+    )
+
+
+def isin_pairs(
+    keys: np.ndarray, values: np.ndarray, test_keys: np.ndarray, test_values: np.ndarray
+) -> np.ndarray:
+    """
+    Returns a mask of the pairs (keys[i], values[i]) that occur in the pairs
+    (test_keys, test_values). Keys are non-negative integers, values integral
+    floats. Pairs with a negative key or a NaN value never match.
+    """
+    keys = np.asarray(keys, dtype=np.int64)
+    values = np.asarray(values, dtype=np.float64)
+    test_keys = np.asarray(test_keys, dtype=np.int64)
+    test_values = np.asarray(test_values, dtype=np.float64)
+    valid = (keys >= 0) & np.isfinite(values)
+    test_valid = (test_keys >= 0) & np.isfinite(test_values)
+
+    # Each pair is combined to one integer key * value_range + value
+    value_offset = int(
+        np.abs(np.concatenate([values[valid], test_values[test_valid]])).max(
+            initial=0.0
+        )
+    )
+    value_range = 2 * value_offset + 1
+
+    found = np.zeros(len(keys), dtype=bool)
+    found[valid] = np.isin(
+        keys[valid] * value_range + values[valid].astype(np.int64) + value_offset,
+        test_keys[test_valid] * value_range
+        + test_values[test_valid].astype(np.int64)
+        + value_offset,
+    )
+    return found
+
+
+def find_lanes_in_lane_sections(
+    lanes: models.LaneTable, lane_section: np.ndarray, lane_id: np.ndarray
+) -> np.ndarray:
+    """
+    Returns a mask of the pairs (lane_section[i], lane_id[i]) for which the
+    lane table has a left or right lane with that id in that laneSection row.
+    Pairs with a negative laneSection row or a NaN id are not found.
+    """
+    return isin_pairs(lane_section, lane_id, lanes.lane_section, lanes.id)
+
+
+# Element tags of the <objects> and <signals> containers of a road, in the
+# order of the element tables
+ROAD_ELEMENT_TAGS = {
+    "objects": ["object", "objectReference", "tunnel", "bridge"],
+    "signals": ["signal", "signalReference"],
+}
+
+
+# Columns of the element tables and their attributes
+_ROAD_ELEMENT_COLUMNS = {
+    "s": "s",
+    "t": "t",
+    "z_offset": "zOffset",
+    "length": "length",
+    "width": "width",
+    "height": "height",
+    "radius": "radius",
+}
+
+
+def compile_road_element_table(
+    roads: List[etree._ElementTree], container: str
+) -> models.RoadElementTable:
+    """
+    Returns the attributes of all elements of the <objects> or <signals>
+    container of the roads as columns, read in one pass over the elements.
+    """
+    tags = ROAD_ELEMENT_TAGS[container]
+    elements = []
+    rows = []
+    for road_index, road in enumerate(roads):
+        for tag_index, tag in enumerate(tags):
+            for element in road.findall(f"./{container}/{tag}"):
+                attributes = element.attrib
+                values = [
+                    utils.to_float(attributes.get(name))
+                    for name in _ROAD_ELEMENT_COLUMNS.values()
+                ]
+                elements.append(element)
+                rows.append(
+                    [
+                        road_index,
+                        tag_index,
+                        element.find("outlines/outline") is not None,
+                    ]
+                    + [np.nan if value is None else value for value in values]
+                )
+
+    columns = (
+        np.array(rows, dtype=np.float64).reshape(-1, 3 + len(_ROAD_ELEMENT_COLUMNS)).T
+    )
+    road, tag, has_outline = columns[:3]
+
+    return models.RoadElementTable(
+        elements=elements,
+        roads=roads,
+        road_length=np.array(
+            [
+                np.nan if length is None else length
+                for length in map(utils.get_road_length, roads)
+            ],
+            dtype=np.float64,
+        ),
+        road=road.astype(np.int64),
+        tags=list(tags),
+        tag=tag.astype(np.int8),
+        has_outline=has_outline.astype(bool),
+        **dict(zip(_ROAD_ELEMENT_COLUMNS, columns[3:])),
+    )
+
+
+def get_road_element_table(
+    root: etree._ElementTree, container: str
+) -> models.RoadElementTable:
+    """
+    Returns the element table of the <objects> or <signals> (container) of
+    all roads of the document, cached on the network index.
+    """
+    return network.get_network_index(root).get_or_create(
+        f"{container}_table",
+        lambda: compile_road_element_table(utils.get_roads(root), container),
+    )
+
+
+def get_points_xyz_from_roads(
+    roads: List[etree._ElementTree],
+    road: np.ndarray,
+    s: np.ndarray,
+    t: np.ndarray,
+    h: np.ndarray,
+) -> np.ndarray:
+    """
+    Batch version of get_points_xyz_from_road for points on several roads,
+    road holds the index in roads of each point. The points of each road are
+    evaluated in one call.
+    """
+    road = np.asarray(road, dtype=np.int64)
+    s, t, h = np.broadcast_arrays(
+        np.asarray(s, dtype=np.float64),
+        np.asarray(t, dtype=np.float64),
+        np.asarray(h, dtype=np.float64),
+    )
+    points = np.full((len(road), 3), np.nan)
+    order = np.argsort(road, kind="stable")
+    sorted_road = road[order]
+    group_starts = np.flatnonzero(np.diff(sorted_road, prepend=-1) != 0)
+    for start, end in zip(group_starts, np.r_[group_starts[1:], len(order)]):
+        rows = order[start:end]
+        points[rows] = utils.get_points_xyz_from_road(
+            roads[sorted_road[start]], s[rows], t[rows], h[rows]
+        )
+    return points
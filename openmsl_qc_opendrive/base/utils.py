@@ -4,20 +4,33 @@
 # Public License, v. 2.0. If a copy of the MPL was not distributed
 # with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
-import re
+import os
 import numpy as np
 from io import BytesIO
-from typing import List, Dict, Union, Optional
+from typing import BinaryIO, List, Dict, Union, Optional, Set, Tuple
 from lxml import etree
 import pyclothoids as pc
-import transforms3d
 
-from openmsl_qc_opendrive.base import models
+from openmsl_qc_opendrive import constants
+from openmsl_qc_opendrive.base import (
+    arc_length,
+    byte_index,
+    clothoid,
+    input_stream,
+    lane_borders,
+    models,
+    network,
+    plan_view,
+    profiles,
+    reference_line,
+    snapshot,
+)
 
 EPSILON = 1.0e-6
-ZERO_OFFSET_POLY3 = models.OffsetPoly3(
-    poly3=models.Poly3(a=0.0, b=0.0, c=0.0, d=0.0), s_offset=0.0
-)
+# Subtrees that are only parsed if an enabled checker lists them in its
+# REQUIRED_SUBTREES
+OPTIONAL_SUBTREES = {"objects", "signals", "userData", "roadMark", "surface"}
+ZERO_OFFSET_POLY3 = profiles.ZERO_OFFSET_POLY3
 
 
 def to_int(s):
@@ -34,14 +47,89 @@ def to_float(s):
         return None
 
 
-def get_root_without_default_namespace(path: str) -> etree._ElementTree:
-    with open(path, "rb") as raw_file:
-        xml_string = raw_file.read().decode()
+def get_checker_float_param(
+    checker_data: models.CheckerData,
+    checker_id: str,
+    param_name: str,
+    default: Optional[float],
+) -> Optional[float]:
+    """
+    Returns the numeric checker param of the configuration, or default if it
+    is not set.
+    """
+    value = checker_data.config.get_checker_param(
+        checker_bundle_name=constants.BUNDLE_NAME,
+        checker_id=checker_id,
+        param_name=param_name,
+    )
+    value = to_float(value)
+    return default if value is None else value
+
+
+def get_root_without_default_namespace(
+    path: str,
+    skipped_subtrees: Optional[Set[str]] = None,
+    zstd_chunk_size: int = input_stream.DEFAULT_ZSTD_CHUNK_SIZE,
+) -> etree._ElementTree:
+    """
+    Parses the OpenDRIVE file without its default namespace. Elements whose tag
+    is in skipped_subtrees (see OPTIONAL_SUBTREES) are dropped with their
+    subtree while parsing.
+
+    gzip, xz and zstd compressed files are detected by their magic bytes and
+    decompressed while they are parsed.
+    """
+    with input_stream.open_input_stream(path, zstd_chunk_size) as stream:
+        source = input_stream.DefaultNamespaceFilter(stream)
+
+        if skipped_subtrees:
+            return parse_without_subtrees(source, skipped_subtrees)
+        else:
+            return etree.parse(source)
+
+
+def get_partial_root_without_default_namespace(
+    path: str,
+    region: byte_index.RegionOfInterest,
+    skipped_subtrees: Optional[Set[str]] = None,
+) -> Tuple[etree._ElementTree, byte_index.PartialDocument]:
+    """
+    Parses only the roads and junctions of the region of interest of an
+    uncompressed OpenDRIVE file and the elements linked to them, using the
+    byte index stored next to the file (built on first use). The returned
+    partial document maps xpaths of the parsed tree back to the original file.
+    """
+    index = byte_index.get_byte_index(path)
+    selected, context = index.select(region)
+    partial_document = byte_index.PartialDocument(index, selected, context)
+
+    source = input_stream.DefaultNamespaceFilter(BytesIO(partial_document.read(path)))
+    if skipped_subtrees:
+        root = parse_without_subtrees(source, skipped_subtrees)
+    else:
+        root = etree.parse(source)
+
+    return root, partial_document
 
-        if "xmlns" in xml_string:
-            xml_string = re.sub(' xmlns="[^"]+"', "", xml_string)
 
-        return etree.parse(BytesIO(xml_string.encode()))
+def parse_without_subtrees(
+    source: BinaryIO, skipped_subtrees: Set[str]
+) -> etree._ElementTree:
+    """
+    Parses the document and removes every element with a tag in
+    skipped_subtrees as soon as it is complete, so that at most one of these
+    subtrees is in memory at a time.
+
+    Since all elements with a given tag are removed, the positional xpaths of
+    the remaining elements are the same as in the original document.
+    """
+    context = etree.iterparse(source, events=("end",), tag=sorted(skipped_subtrees))
+    for _, element in context:
+        parent = element.getparent()
+        if parent is not None:
+            parent.remove(element)
+
+    return context.root.getroottree()
 
 
 def get_lanes(root: etree._ElementTree) -> List[etree._ElementTree]:
@@ -910,6 +998,32 @@ def get_road_superelevations(road: etree._ElementTree) -> List[models.OffsetPoly
     return superelevation_list
 
 
+def get_road_shapes(road: etree._ElementTree) -> List[models.ShapePoly3]:
+    lateral_profile = road.find("lateralProfile")
+
+    if lateral_profile is None:
+        return []
+
+    shape_list = []
+    for shape in lateral_profile.iter("shape"):
+        shape_poly3 = models.ShapePoly3(
+            models.Poly3(
+                a=to_float(shape.get("a")),
+                b=to_float(shape.get("b")),
+                c=to_float(shape.get("c")),
+                d=to_float(shape.get("d")),
+            ),
+            s_offset=to_float(shape.get("s")),
+            t_offset=to_float(shape.get("t")),
+            xml_element=shape,
+        )
+
+        if shape_poly3.t_offset is not None and is_valid_offset_poly3(shape_poly3):
+            shape_list.append(shape_poly3)
+
+    return shape_list
+
+
 def get_lane_offsets_from_road(road: etree._ElementTree) -> List[models.OffsetPoly3]:
     lanes = road.find("lanes")
 
@@ -935,6 +1049,76 @@ def get_lane_offsets_from_road(road: etree._ElementTree) -> List[models.OffsetPo
     return lane_offset_list
 
 
+def compile_road_profiles(road: etree._ElementTree) -> profiles.RoadProfiles:
+    return profiles.RoadProfiles(
+        length=get_road_length(road),
+        elevation=profiles.Poly3Table(get_road_elevations(road)),
+        superelevation=profiles.Poly3Table(get_road_superelevations(road)),
+        lane_offset=profiles.Poly3Table(
+            get_lane_offsets_from_road(road), zero_before_start=True
+        ),
+        shape=profiles.ShapeTable(get_road_shapes(road)),
+    )
+
+
+def get_road_profiles(road: etree._ElementTree) -> profiles.RoadProfiles:
+    """
+    Returns the compiled elevation, superelevation, lane offset and shape tables
+    of the road. The tables are parsed once and cached on the network index.
+    """
+    return network.get_network_index(road).get_or_build(
+        "road_profiles", road, lambda: compile_road_profiles(road)
+    )
+
+
+def evaluate_road_elevation(road: etree._ElementTree, s: np.ndarray) -> np.ndarray:
+    """
+    Batch version of the elevation lookup. Returns the elevation for each s,
+    NaN where s is not on the road.
+    """
+    road_profiles = get_road_profiles(road)
+    return np.where(
+        road_profiles.is_on_road(s), road_profiles.elevation.evaluate(s), np.nan
+    )
+
+
+def evaluate_road_superelevation(road: etree._ElementTree, s: np.ndarray) -> np.ndarray:
+    """
+    Batch version of the superelevation (roll) lookup. Returns the superelevation
+    for each s, NaN where s is not on the road.
+    """
+    road_profiles = get_road_profiles(road)
+    return np.where(
+        road_profiles.is_on_road(s),
+        road_profiles.superelevation.evaluate(s),
+        np.nan,
+    )
+
+
+def evaluate_road_shape(
+    road: etree._ElementTree, s: np.ndarray, t: np.ndarray
+) -> np.ndarray:
+    """
+    Batch version of the lateral shape lookup. Returns the shape height for
+    each (s, t), NaN where s is not on the road.
+    """
+    road_profiles = get_road_profiles(road)
+    return np.where(
+        road_profiles.is_on_road(s), road_profiles.shape.evaluate(s, t), np.nan
+    )
+
+
+def evaluate_road_lane_offset(road: etree._ElementTree, s: np.ndarray) -> np.ndarray:
+    """
+    Batch version of the lane offset lookup. Returns the lane offset for each s,
+    NaN where s is not on the road.
+    """
+    road_profiles = get_road_profiles(road)
+    return np.where(
+        road_profiles.is_on_road(s), road_profiles.lane_offset.evaluate(s), np.nan
+    )
+
+
 def are_same_equations(first: models.OffsetPoly3, second: models.OffsetPoly3) -> bool:
     """
     This function checks if two equations are the same.
@@ -1112,15 +1296,20 @@ def calculate_spiral_point(
     curv_start: float,
     curv_end: float,
     length: float,
+    backend: Optional[str] = None,
 ) -> models.Point2D:
     # curvature rate given by
     # A = (K1 - K0) / L
     kd = (curv_end - curv_start) / length
 
+    if (backend or clothoid.get_backend()) == clothoid.FRESNEL:
+        x, y, _ = clothoid.evaluate_clothoids(x0, y0, heading, curv_start, kd, s - s0)
+        return models.Point2D(x=float(x), y=float(y))
+
     # Standard clothoid for the given parameters
-    clothoid = pc.Clothoid.StandardParams(x0, y0, heading, curv_start, kd, length)
+    spiral = pc.Clothoid.StandardParams(x0, y0, heading, curv_start, kd, length)
 
-    return models.Point2D(x=clothoid.X(s - s0), y=clothoid.Y(s - s0))
+    return models.Point2D(x=spiral.X(s - s0), y=spiral.Y(s - s0))
 
 
 def calculate_poly3_arclen_point(
@@ -1143,6 +1332,21 @@ def calculate_poly3_arclen_point(
     return models.Point2D(x=xt, y=yt)
 
 
+def get_normalized_param_poly3_parameter(
+    poly3_norm: models.ParamPoly3, ds: float
+) -> float:
+    """
+    Returns the parameter p of a normalized paramPoly3 at which the curve has
+    the arc length ds from its start.
+    """
+    table = arc_length.get_reparametrization_table(
+        (poly3_norm.u.a, poly3_norm.u.b, poly3_norm.u.c, poly3_norm.u.d),
+        (poly3_norm.v.a, poly3_norm.v.b, poly3_norm.v.c, poly3_norm.v.d),
+        1.0,
+    )
+    return float(table.invert(np.zeros(1, dtype=np.int64), np.array([ds]))[0])
+
+
 def calculate_poly3_norm_point(
     s: float,
     poly3_norm: models.ParamPoly3,
@@ -1155,8 +1359,9 @@ def calculate_poly3_norm_point(
     x_poly3 = poly3_to_polynomial(poly3_norm.u)
     y_poly3 = poly3_to_polynomial(poly3_norm.v)
 
-    x = x_poly3((s - s0) / length)
-    y = y_poly3((s - s0) / length)
+    p = get_normalized_param_poly3_parameter(poly3_norm, s - s0)
+    x = x_poly3(p)
+    y = y_poly3(p)
 
     xt = (np.cos(heading) * x) - (np.sin(heading) * y) + x0
     yt = (np.sin(heading) * x) + (np.cos(heading) * y) + y0
@@ -1246,17 +1451,9 @@ def get_elevation_from_road_by_s(
     if s < 0.0 or s > length:
         return None
 
-    elevation_list = get_road_elevations(road)
-
-    # As the default elevation is zero, we return ZERO_OFFSET_POLY3.
-    if len(elevation_list) == 0:
-        return ZERO_OFFSET_POLY3
-
-    elevation_indexes = [e.s_offset for e in elevation_list]
-    elevation_index = np.searchsorted(elevation_indexes, s, side="right") - 1
-    elevation_index = max(elevation_index, 0)
-
-    return elevation_list[elevation_index]
+    # As the default elevation is zero, ZERO_OFFSET_POLY3 is returned if the
+    # road has no elevation records.
+    return get_road_profiles(road).elevation.get_record(s)
 
 
 def calculate_elevation_value(elevation: models.OffsetPoly3, s: float) -> float:
@@ -1264,18 +1461,259 @@ def calculate_elevation_value(elevation: models.OffsetPoly3, s: float) -> float:
     return f_elevation(s - elevation.s_offset)
 
 
+def get_geometry_record(geometry: etree._ElementTree) -> plan_view.GeometryRecord:
+    record = plan_view.GeometryRecord(
+        s=get_s_from_geometry(geometry),
+        x=get_x_from_geometry(geometry),
+        y=get_y_from_geometry(geometry),
+        heading=get_heading_from_geometry(geometry),
+        length=get_length_from_geometry(geometry),
+        geometry_type=models.GeometryType.INVALID,
+    )
+
+    if any(
+        var is None
+        for var in [record.x, record.y, record.s, record.heading, record.length]
+    ):
+        return record
+
+    line = get_geometry_line(geometry)
+    arc = get_geometry_arc(geometry)
+    spiral = get_geometry_spiral(geometry)
+
+    if line is not None:
+        record.geometry_type = models.GeometryType.LINE
+    elif arc is not None:
+        record.curv_start = get_curvature_from_arc(arc)
+        record.curv_end = record.curv_start
+        if record.curv_start is not None:
+            record.geometry_type = models.GeometryType.ARC
+    elif spiral is not None:
+        record.curv_start = get_curv_start_from_spiral(spiral)
+        record.curv_end = get_curv_end_from_spiral(spiral)
+        if record.curv_start is not None and record.curv_end is not None:
+            record.geometry_type = models.GeometryType.SPIRAL
+    else:
+        poly3_arclen = get_arclen_param_poly3_from_geometry(geometry)
+        poly3_norm = get_normalized_param_poly3_from_geometry(geometry)
+        if poly3_arclen is not None:
+            record.param_poly3 = poly3_arclen
+            record.geometry_type = models.GeometryType.PARAM_POLY3_ARC_LENGTH
+        elif poly3_norm is not None:
+            record.param_poly3 = poly3_norm
+            record.geometry_type = models.GeometryType.PARAM_POLY3_NORMALIZED
+
+    return record
+
+
+def compile_road_plan_view(road: etree._ElementTree) -> plan_view.PlanView:
+    return plan_view.PlanView(
+        [get_geometry_record(g) for g in get_road_plan_view_geometry_list(road)]
+    )
+
+
+def get_road_plan_view(road: etree._ElementTree) -> plan_view.PlanView:
+    """
+    Returns the compiled planView of the road, cached on the network index.
+    """
+    return network.get_network_index(road).get_or_build(
+        "road_plan_view", road, lambda: compile_road_plan_view(road)
+    )
+
+
+def evaluate_road_reference_line(road: etree._ElementTree, s: np.ndarray):
+    """
+    Batch evaluation of the road reference line. Returns the arrays x, y and
+    heading for each s, NaN where s is not on the road or the geometry is invalid.
+    """
+    s = np.asarray(s, dtype=np.float64)
+    x, y, heading = get_road_plan_view(road).evaluate(s)
+
+    off_road = ~get_road_profiles(road).is_on_road(s)
+    x[off_road] = np.nan
+    y[off_road] = np.nan
+    heading[off_road] = np.nan
+
+    return x, y, heading
+
+
+def compile_road_reference_line_polyline(
+    road: etree._ElementTree, step: float
+) -> reference_line.ReferenceLinePolyline:
+    road_plan_view = get_road_plan_view(road)
+    road_profiles = get_road_profiles(road)
+
+    length = road_profiles.length
+    if length is None or not length > 0.0:
+        empty = np.empty(0)
+        return reference_line.ReferenceLinePolyline(
+            step, empty, empty, empty, empty, empty, empty, empty
+        )
+
+    # Segments do not span two geometries or two elevation records
+    elevation = road_profiles.elevation
+    s = reference_line.sample_positions(
+        length, step, np.concatenate([road_plan_view.s, elevation.s_offsets])
+    )
+    x, y, heading = road_plan_view.evaluate(s)
+    z = elevation.evaluate(s)
+
+    # The curvature of a geometry may peak inside a segment (poly3,
+    # paramPoly3), the largest of the ends and the middle is taken. Both ends
+    # are evaluated on the geometry of the segment.
+    s_start, s_end = s[:-1], s[1:]
+    s_middle = 0.5 * (s_start + s_end)
+    segment_curvature = np.full(s_middle.shape, np.nan)
+    if len(road_plan_view) > 0:
+        indices = road_plan_view.find_indices(s_middle)
+        geometry_s = road_plan_view.s[indices]
+        segment_curvature = np.max(
+            np.abs(
+                [
+                    road_plan_view.evaluate_geometry_curvatures(indices, t - geometry_s)
+                    for t in (s_start, s_middle, s_end)
+                ]
+            ),
+            axis=0,
+        )
+
+    # The second derivative of the elevation is linear on a segment, it is
+    # extrapolated from the start and the middle to the end of the segment.
+    start_elevation_curvature = elevation.evaluate_second_derivative(s_start)
+    middle_elevation_curvature = elevation.evaluate_second_derivative(s_middle)
+    segment_elevation_curvature = np.maximum(
+        np.abs(start_elevation_curvature),
+        np.abs(2.0 * middle_elevation_curvature - start_elevation_curvature),
+    )
+
+    # np.unwrap propagates NaN to all following samples, so only the valid
+    # headings are unwrapped.
+    valid = ~np.isnan(heading)
+    heading[valid] = np.unwrap(heading[valid])
+
+    return reference_line.ReferenceLinePolyline(
+        step, s, x, y, z, heading, segment_curvature, segment_elevation_curvature
+    )
+
+
+def get_road_reference_line_polyline(
+    road: etree._ElementTree, step: float = reference_line.DEFAULT_STEP
+) -> reference_line.ReferenceLinePolyline:
+    """
+    Returns the reference line of the road sampled at the given step. Polylines
+    are built lazily and kept in a document-wide LRU cache with a memory limit.
+    """
+    cache = network.get_network_index(road).get_or_create(
+        "reference_line_cache", reference_line.ReferenceLineCache
+    )
+    return cache.get(
+        (road, step), lambda: compile_road_reference_line_polyline(road, step)
+    )
+
+
+def interpolate_road_reference_line(
+    road: etree._ElementTree,
+    s: np.ndarray,
+    tolerance: float = 0.01,
+    step: float = reference_line.DEFAULT_STEP,
+):
+    """
+    Returns the arrays x, y, z and heading of the reference line for each s,
+    interpolated from the cached polyline of the road. Samples whose estimated
+    interpolation error exceeds the tolerance (in meters) are evaluated exactly.
+    NaN where s is not on the road or the geometry is invalid.
+    """
+    s = np.asarray(s, dtype=np.float64)
+    polyline = get_road_reference_line_polyline(road, step)
+
+    x, y, z, heading = polyline.interpolate(s)
+    error = polyline.interpolation_error(s)
+
+    exact = ~(error <= tolerance) | np.isnan(x) | np.isnan(heading)
+    if np.any(exact):
+        x[exact], y[exact], heading[exact] = evaluate_road_reference_line(
+            road, s[exact]
+        )
+        z[exact] = evaluate_road_elevation(road, s[exact])
+
+    return x, y, z, heading
+
+
+def compile_network_snapshot(root: etree._ElementTree) -> snapshot.NetworkSnapshot:
+    roads = get_roads(root)
+    return snapshot.create_snapshot(
+        road_ids=[road.get("id", "") for road in roads],
+        road_plan_views=[get_road_plan_view(road) for road in roads],
+        road_profiles=[get_road_profiles(road) for road in roads],
+        lane_section_borders=[
+            get_lane_section_borders(lane_section)
+            for lane_section in root.iter("laneSection")
+        ],
+    )
+
+
+def apply_network_snapshot(
+    root: etree._ElementTree, network_snapshot: snapshot.NetworkSnapshot
+) -> bool:
+    """
+    Fills the network index of the document with the compiled data of the
+    snapshot. Returns False if the snapshot does not belong to the document.
+    """
+    roads = get_roads(root)
+    lane_sections = list(root.iter("laneSection"))
+    if not network_snapshot.matches(
+        [road.get("id", "") for road in roads], len(lane_sections)
+    ):
+        return False
+
+    network_index = network.get_network_index(root)
+    for i, road in enumerate(roads):
+        network_index.set(
+            "road_plan_view", road, network_snapshot.get_road_plan_view(i)
+        )
+        network_index.set("road_profiles", road, network_snapshot.get_road_profiles(i))
+    for i, lane_section in enumerate(lane_sections):
+        network_index.set(
+            "lane_section_borders",
+            lane_section,
+            network_snapshot.get_lane_section_borders(i),
+        )
+
+    return True
+
+
+def load_network_snapshot(
+    root: etree._ElementTree, xml_file_path: str, directory: str
+) -> snapshot.NetworkSnapshot:
+    """
+    Loads the compiled network of the file from the snapshot directory, keyed
+    by the file digest. If there is no valid snapshot yet, the network is
+    compiled and the snapshot is written for later runs.
+    """
+    snapshot_path = os.path.join(directory, snapshot.file_digest(xml_file_path))
+
+    network_snapshot = snapshot.load_snapshot(snapshot_path)
+    if network_snapshot is not None and apply_network_snapshot(root, network_snapshot):
+        return network_snapshot
+
+    network_snapshot = compile_network_snapshot(root)
+    snapshot.save_snapshot(network_snapshot, snapshot_path)
+
+    return network_snapshot
+
+
 def get_point_xy_from_road_reference_line(
     road: etree._ElementTree, s: float
 ) -> Optional[models.Point2D]:
-    geometry = get_geometry_from_road_by_s(road, s)
-    if geometry is None:
+    length = get_road_length(road)
+    if s < 0.0 or s > length:
         return None
 
-    point_2d = get_point_xy_from_geometry(geometry, s)
-    if point_2d is None:
+    x, y, _ = get_road_plan_view(road).evaluate(s)
+    if np.isnan(x) or np.isnan(y):
         return None
 
-    return models.Point2D(x=point_2d.x, y=point_2d.y)
+    return models.Point2D(x=float(x), y=float(y))
 
 
 def get_point_xyz_from_road_reference_line(
@@ -1286,12 +1724,11 @@ def get_point_xyz_from_road_reference_line(
     if point_2d is None:
         return None
 
-    elevation = get_elevation_from_road_by_s(road, s)
-
-    if elevation is None:
+    length = get_road_length(road)
+    if s < 0.0 or s > length:
         return None
 
-    elevation_value = calculate_elevation_value(elevation, s)
+    elevation_value = float(get_road_profiles(road).elevation.evaluate(s))
 
     return models.Point3D(x=point_2d.x, y=point_2d.y, z=elevation_value)
 
@@ -1344,11 +1781,19 @@ def calculate_spiral_point_heading(
     curv_start: float,
     curv_end: float,
     length: float,
+    backend: Optional[str] = None,
 ) -> float:
     kd = (curv_end - curv_start) / length
-    clothoid = pc.Clothoid.StandardParams(x0, y0, heading, curv_start, kd, length)
 
-    return clothoid.Theta(s - s0)
+    if (backend or clothoid.get_backend()) == clothoid.FRESNEL:
+        _, _, theta = clothoid.evaluate_clothoids(
+            x0, y0, heading, curv_start, kd, s - s0
+        )
+        return float(theta)
+
+    spiral = pc.Clothoid.StandardParams(x0, y0, heading, curv_start, kd, length)
+
+    return spiral.Theta(s - s0)
 
 
 def calculate_poly3_arclen_heading(
@@ -1377,8 +1822,9 @@ def calculate_poly3_norm_heading(
     x_poly3_deriv = poly3_to_polynomial(poly3_norm.u).deriv()
     y_poly3_deriv = poly3_to_polynomial(poly3_norm.v).deriv()
 
-    x = x_poly3_deriv((s - s0) / length)
-    y = y_poly3_deriv((s - s0) / length)
+    p = get_normalized_param_poly3_parameter(poly3_norm, s - s0)
+    x = x_poly3_deriv(p)
+    y = y_poly3_deriv(p)
 
     heading = heading + np.arctan2(y, x)
     return heading
@@ -1455,12 +1901,15 @@ def get_heading_from_geometry_by_s(
 def get_heading_from_road_reference_line(
     road: etree._ElementTree, s: float
 ) -> Optional[float]:
-    geometry = get_geometry_from_road_by_s(road, s)
+    length = get_road_length(road)
+    if s < 0.0 or s > length:
+        return None
 
-    if geometry is None:
+    _, _, heading = get_road_plan_view(road).evaluate(s)
+    if np.isnan(heading):
         return None
 
-    return get_heading_from_geometry_by_s(geometry, s)
+    return float(heading)
 
 
 def calculate_elevation_angle(
@@ -1476,13 +1925,14 @@ def calculate_elevation_angle(
 def get_pitch_from_road_reference_line(
     road: etree._ElementTree, s: float
 ) -> Optional[float]:
-    elevation = get_elevation_from_road_by_s(road, s)
-
-    if elevation is None:
+    length = get_road_length(road)
+    if s < 0.0 or s > length:
         return None
 
+    slope = get_road_profiles(road).elevation.evaluate_derivative(s)
+
     # The negation is because head down is positive pitch
-    return -calculate_elevation_angle(elevation, s)
+    return -float(np.arctan(slope))
 
 
 def get_superelevation_from_road_by_s(
@@ -1492,55 +1942,76 @@ def get_superelevation_from_road_by_s(
     if s < 0.0 or s > length:
         return None
 
-    superelevations = get_road_superelevations(road)
-
-    # As the default superelevation is zero, we return ZERO_OFFSET_POLY3 as default.
-    if len(superelevations) == 0:
-        return ZERO_OFFSET_POLY3
-
-    superelevation_indexes = [e.s_offset for e in superelevations]
-    superelevation_index = np.searchsorted(superelevation_indexes, s, side="right") - 1
-    superelevation_index = max(superelevation_index, 0)
-
-    return superelevations[superelevation_index]
+    # As the default superelevation is zero, ZERO_OFFSET_POLY3 is returned if
+    # the road has no superelevation records.
+    return get_road_profiles(road).superelevation.get_record(s)
 
 
 def get_roll_from_road_reference_line(
     road: etree._ElementTree, s: float
 ) -> Optional[float]:
-    superelevation = get_superelevation_from_road_by_s(road, s)
-
-    if superelevation is None:
+    length = get_road_length(road)
+    if s < 0.0 or s > length:
         return None
 
-    poly3 = poly3_to_polynomial(superelevation.poly3)
+    return float(get_road_profiles(road).superelevation.evaluate(s))
 
-    return poly3(s - superelevation.s_offset)
+
+def get_points_xyz_from_road(
+    road: etree._ElementTree,
+    s: np.ndarray,
+    t: np.ndarray,
+    h: np.ndarray,
+) -> np.ndarray:
+    """
+    Batch version of get_point_xyz_from_road. s, t and h are broadcast against
+    each other. Returns an (N, 3) array of inertial points, rows are NaN where
+    the point cannot be computed (e.g. s not on the road).
+
+    The rotation of the (0, t, h) offset by heading (yaw) and superelevation
+    (roll) is applied in closed form. As in the scalar version the pitch of the
+    reference line is not part of the rotation. h is relative to the lateral
+    shape of the road, if it has one.
+    """
+    s, t, h = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(s, dtype=np.float64)),
+        np.asarray(t, dtype=np.float64),
+        np.asarray(h, dtype=np.float64),
+    )
+
+    x, y, yaw = evaluate_road_reference_line(road, s)
+    road_profiles = get_road_profiles(road)
+    z = road_profiles.elevation.evaluate(s)
+    roll = road_profiles.superelevation.evaluate(s)
+    h = h + road_profiles.shape.evaluate(s, t)
+
+    # Rz(yaw) * Rx(roll) applied to (0, t, h)
+    lateral = t * np.cos(roll) - h * np.sin(roll)
+    points = np.stack(
+        [
+            x - lateral * np.sin(yaw),
+            y + lateral * np.cos(yaw),
+            z + t * np.sin(roll) + h * np.cos(roll),
+        ],
+        axis=-1,
+    )
+    points[np.isnan(points).any(axis=-1)] = np.nan
+
+    return points
 
 
 def get_point_xyz_from_road(
     road: etree._ElementTree, s: float, t: float, h: float
 ) -> Optional[models.Point3D]:
-    yaw = get_heading_from_road_reference_line(road, s)
-    roll = get_roll_from_road_reference_line(road, s)
-
-    if yaw is None or roll is None:
+    length = get_road_length(road)
+    if s < 0.0 or s > length:
         return None
 
-    rotation = transforms3d.euler.euler2mat(yaw, 0.0, roll, "rzyx")
-    d_point = rotation.dot(np.array([0.0, t, h]))
-
-    ref_line_point = get_point_xyz_from_road_reference_line(road, s)
-    if ref_line_point is None:
+    point = get_points_xyz_from_road(road, s, t, h)[0]
+    if np.isnan(point).any():
         return None
 
-    point_xyz = models.Point3D(
-        x=ref_line_point.x + d_point[0],
-        y=ref_line_point.y + d_point[1],
-        z=ref_line_point.z + d_point[2],
-    )
-
-    return point_xyz
+    return models.Point3D(x=float(point[0]), y=float(point[1]), z=float(point[2]))
 
 
 def get_lane_section_from_road_by_s(
@@ -1571,34 +2042,20 @@ def get_lane_offset_from_road_by_s(
     if s < 0.0 or s > length:
         return None
 
-    lane_offset_list = get_lane_offsets_from_road(road)
-
-    # Default lane offset is zero.
-    if len(lane_offset_list) == 0:
-        return ZERO_OFFSET_POLY3
-
-    lane_offset_indexes = [l.s_offset for l in lane_offset_list]
-    lane_offset_index = np.searchsorted(lane_offset_indexes, s, side="right") - 1
-
-    if lane_offset_index < 0:
-        # It's possible that s_offset does not start from zero.
-        # In this case, lane offset is zero for s < first s_offset.
-        return ZERO_OFFSET_POLY3
-    else:
-        return lane_offset_list[lane_offset_index]
+    # Default lane offset is zero. It's possible that s_offset does not start
+    # from zero. In this case, lane offset is zero for s < first s_offset.
+    return get_road_profiles(road).lane_offset.get_record(s)
 
 
 def get_lane_offset_value_from_road_by_s(
     road: etree._ElementTree, s: float
 ) -> Optional[float]:
-    lane_offset = get_lane_offset_from_road_by_s(road, s)
+    length = get_road_length(road)
 
-    if lane_offset is None:
+    if s < 0.0 or s > length:
         return None
 
-    poly3 = poly3_to_polynomial(lane_offset.poly3)
-
-    return poly3(s - lane_offset.s_offset)
+    return float(get_road_profiles(road).lane_offset.evaluate(s))
 
 
 def evaluate_lane_border(
@@ -1638,45 +2095,147 @@ def evaluate_lane_border(
     return poly3(s_start_from_lane_section - lane_border.s_offset)
 
 
+def compile_lane_group_borders(
+    lane_group: List[etree._ElementTree],
+) -> lane_borders.LaneGroupBorders:
+    lane_ids = []
+    widths = []
+    borders = []
+    for lane in lane_group:
+        lane_id = get_lane_id(lane)
+        if lane_id is None:
+            continue
+        lane_ids.append(lane_id)
+        widths.append([w for w in get_lane_width_poly3_list(lane) if w is not None])
+        borders.append(get_borders_from_lane(lane))
+
+    return lane_borders.LaneGroupBorders(lane_ids, widths, borders)
+
+
+def compile_lane_section_borders(
+    lane_section: etree._ElementTree,
+) -> lane_borders.LaneSectionBorders:
+    return lane_borders.LaneSectionBorders(
+        s=get_s_from_lane_section(lane_section),
+        left=compile_lane_group_borders(get_left_lanes_from_lane_section(lane_section)),
+        right=compile_lane_group_borders(
+            get_right_lanes_from_lane_section(lane_section)
+        ),
+    )
+
+
+def get_lane_section_borders(
+    lane_section: etree._ElementTree,
+) -> lane_borders.LaneSectionBorders:
+    """
+    Returns the compiled widths and borders of all lanes of the lane section,
+    cached on the network index.
+    """
+    return network.get_network_index(lane_section).get_or_build(
+        "lane_section_borders",
+        lane_section,
+        lambda: compile_lane_section_borders(lane_section),
+    )
+
+
+def evaluate_lanes_from_road(
+    road: etree._ElementTree, s: np.ndarray, t: np.ndarray
+) -> List[Optional[etree._ElementTree]]:
+    """
+    Returns the lane that contains the road coordinates (s, t) for each pair,
+    None where s is not on the road or t is outside of all lanes. The borders
+    are evaluated in one batch per lane section.
+    """
+    s = np.atleast_1d(np.asarray(s, dtype=np.float64))
+    t = np.broadcast_to(np.asarray(t, dtype=np.float64), s.shape)
+    lanes: List[Optional[etree._ElementTree]] = [None] * len(s)
+
+    lane_sections = get_sorted_lane_sections_with_length_from_road(road)
+    if len(lane_sections) == 0:
+        return lanes
+
+    section_starts = np.array(
+        [get_s_from_lane_section(section.lane_section) for section in lane_sections]
+    )
+    section_index = np.searchsorted(section_starts, s, side="right") - 1
+    lane_offset = evaluate_road_lane_offset(road, s)
+
+    for k, section in enumerate(lane_sections):
+        points = np.flatnonzero((section_index == k) & ~np.isnan(lane_offset))
+        if len(points) == 0:
+            continue
+
+        lane_map = {
+            get_lane_id(lane): lane
+            for lane in get_left_and_right_lanes_from_lane_section(section.lane_section)
+        }
+        section_borders = get_lane_section_borders(section.lane_section)
+        ds = s[points] - section_starts[k]
+        for group in (section_borders.left, section_borders.right):
+            if len(group) == 0:
+                continue
+            borders = group.evaluate_outer_borders(ds, lane_offset[points])
+            for row, lane_id in enumerate(group.lane_ids):
+                lane = lane_map.get(int(lane_id))
+                if lane_id == 0 or lane is None:
+                    continue
+                if abs(lane_id) == 1:
+                    inner = lane_offset[points]
+                else:
+                    inner_row = group.rows.get(int(lane_id - np.sign(lane_id)))
+                    if inner_row is None:
+                        continue
+                    inner = borders[inner_row]
+                outer = borders[row]
+                inside = (np.fmin(inner, outer) <= t[points]) & (
+                    t[points] < np.fmax(inner, outer)
+                )
+                for point in points[inside]:
+                    if lanes[point] is None:
+                        lanes[point] = lane
+
+    return lanes
+
+
 def get_outer_border_points_from_lane_group_by_s(
     lane_group: List[etree._ElementTree], lane_offset: float, s_section: float, s: float
 ) -> Dict[int, float]:
     """
     Returns a dictionary where key is the lane id and value is the border point t value
     """
-    id_to_width = dict()
+    group_borders = compile_lane_group_borders(lane_group)
+    borders = group_borders.evaluate_outer_borders(s - s_section, lane_offset)
+
     id_to_border_point_t = dict()
+    for row, lane_id in enumerate(group_borders.lane_ids):
+        border_t = borders[row, 0]
+        if not np.isnan(border_t):
+            id_to_border_point_t[int(lane_id)] = float(border_t)
 
-    for lane in lane_group:
-        lane_id = get_lane_id(lane)
-        width = evaluate_lane_width(lane, s - s_section)
-        if width is None:
-            border_point_t = evaluate_lane_border(lane, s - s_section)
-            id_to_border_point_t[lane_id] = border_point_t
-        else:
-            id_to_width[lane_id] = width
+    return id_to_border_point_t
 
-    # If both width and border are defined, use width
-    if len(id_to_width) > 0:
-        id_to_border_point_t = dict()
 
-        for lane_id, width in id_to_width.items():
-            border_t = lane_offset
+def evaluate_t_middle_points_from_lane(
+    road: etree._ElementTree,
+    lane_section: etree._ElementTree,
+    lane: etree._ElementTree,
+    s: np.ndarray,
+) -> np.ndarray:
+    """
+    Batch version of get_t_middle_point_from_lane_by_s. Returns the t coordinate
+    of the lane middle for each s, NaN where it is undefined.
+    """
+    s = np.atleast_1d(np.asarray(s, dtype=np.float64))
 
-            if lane_id > 0:
-                for i in range(1, lane_id + 1):
-                    width = id_to_width.get(i)
-                    if width is not None:
-                        border_t += id_to_width[i]
-            else:
-                for i in range(-1, lane_id - 1, -1):
-                    width = id_to_width.get(i)
-                    if width is not None:
-                        border_t -= id_to_width[i]
+    lane_id = get_lane_id(lane)
+    if lane_id is None:
+        return np.full(s.shape, np.nan)
 
-            id_to_border_point_t[lane_id] = border_t
+    lane_offset = evaluate_road_lane_offset(road, s)
+    t = get_lane_section_borders(lane_section).evaluate_middle(lane_id, s, lane_offset)
+    t[np.isnan(lane_offset)] = np.nan
 
-    return id_to_border_point_t
+    return t
 
 
 def get_t_middle_point_from_lane_by_s(
@@ -1685,64 +2244,28 @@ def get_t_middle_point_from_lane_by_s(
     lane: etree._ElementTree,
     s: float,
 ) -> Optional[float]:
-    lane_id = get_lane_id(lane)
+    t = evaluate_t_middle_points_from_lane(road, lane_section, lane, s)[0]
 
-    if lane_id is None:
+    if np.isnan(t):
         return None
 
-    lane_offset = get_lane_offset_value_from_road_by_s(road, s)
+    return float(t)
 
-    if lane_offset is None:
-        return None
-
-    s_section = get_s_from_lane_section(lane_section)
-
-    if s_section is None:
-        return None
 
-    if lane_id == 0:
-        return 0.0
-
-    if lane_id > 0:
-        left_lanes = get_left_lanes_from_lane_section(lane_section)
-        border_points = get_outer_border_points_from_lane_group_by_s(
-            left_lanes, lane_offset, s_section, s
-        )
-
-        t_outer = border_points.get(lane_id)
-        if t_outer is None:
-            return None
-
-        t_inner = None
-        if lane_id > 1:
-            t_inner = border_points.get(lane_id - 1)
-        else:
-            t_inner = lane_offset
-
-        if t_inner is None:
-            return None
-
-        return (t_outer + t_inner) / 2.0
-    else:
-        right_lanes = get_right_lanes_from_lane_section(lane_section)
-        border_points = get_outer_border_points_from_lane_group_by_s(
-            right_lanes, lane_offset, s_section, s
-        )
-
-        t_outer = border_points.get(lane_id)
-        if t_outer is None:
-            return None
-
-        t_inner = None
-        if lane_id < -1:
-            t_inner = border_points.get(lane_id + 1)
-        else:
-            t_inner = lane_offset
-
-        if t_inner is None:
-            return None
+def evaluate_middle_points_xyz_at_height_zero_from_lane(
+    road: etree._ElementTree,
+    lane_section: etree._ElementTree,
+    lane: etree._ElementTree,
+    s: np.ndarray,
+) -> np.ndarray:
+    """
+    Batch version of get_middle_point_xyz_at_height_zero_from_lane_by_s. Returns
+    an array (N, 3) of inertial points, rows are NaN where the point is undefined.
+    """
+    s = np.atleast_1d(np.asarray(s, dtype=np.float64))
+    t = evaluate_t_middle_points_from_lane(road, lane_section, lane, s)
 
-        return (t_outer + t_inner) / 2.0
+    return get_points_xyz_from_road(road, s, t, np.zeros(s.shape))
 
 
 def get_middle_point_xyz_at_height_zero_from_lane_by_s(
@@ -0,0 +1,238 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import dataclasses
+import types
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from lxml import etree
+
+from openmsl_qc_opendrive.base import models, network
+
+# Element kinds checkers can register callbacks for. The kind is the tag name
+# of the OpenDRIVE element.
+ROAD = "road"
+GEOMETRY = "geometry"
+LANE_SECTION = "laneSection"
+LANE = "lane"
+WIDTH = "width"
+OBJECT = "object"
+SIGNAL = "signal"
+JUNCTION = "junction"
+CONNECTION = "connection"
+
+ELEMENT_KINDS = (
+    ROAD,
+    GEOMETRY,
+    LANE_SECTION,
+    LANE,
+    WIDTH,
+    OBJECT,
+    SIGNAL,
+    JUNCTION,
+    CONNECTION,
+)
+
+Callback = Callable[[etree._Element, models.CheckerData], None]
+
+
+class IssueRecorder:
+    """
+    Stands in for the Result while a checker runs inside a shared traversal.
+
+    Issue registrations are recorded with local issue ids and replayed into
+    the Result when the checker is executed, so that issue ids and the order
+    of issues are the same as if the checker had walked the tree on its own.
+    """
+
+    def __init__(self):
+        self._calls: List[Tuple[str, Dict[str, Any]]] = []
+        self._issue_count = 0
+
+    def register_issue(
+        self,
+        checker_bundle_name: str,
+        checker_id: str,
+        description: str,
+        level: Any,
+        rule_uid: str,
+    ) -> int:
+        issue_id = self._issue_count
+        self._issue_count += 1
+        self._calls.append(
+            (
+                "register_issue",
+                dict(
+                    checker_bundle_name=checker_bundle_name,
+                    checker_id=checker_id,
+                    description=description,
+                    level=level,
+                    rule_uid=rule_uid,
+                ),
+            )
+        )
+        return issue_id
+
+    def add_xml_location(
+        self,
+        checker_bundle_name: str,
+        checker_id: str,
+        issue_id: int,
+        xpath: str,
+        description: str,
+    ) -> None:
+        self._calls.append(
+            (
+                "add_xml_location",
+                dict(
+                    checker_bundle_name=checker_bundle_name,
+                    checker_id=checker_id,
+                    issue_id=issue_id,
+                    xpath=xpath,
+                    description=description,
+                ),
+            )
+        )
+
+    def add_inertial_location(
+        self,
+        checker_bundle_name: str,
+        checker_id: str,
+        issue_id: int,
+        x: float,
+        y: float,
+        z: float,
+        description: str,
+    ) -> None:
+        self._calls.append(
+            (
+                "add_inertial_location",
+                dict(
+                    checker_bundle_name=checker_bundle_name,
+                    checker_id=checker_id,
+                    issue_id=issue_id,
+                    x=x,
+                    y=y,
+                    z=z,
+                    description=description,
+                ),
+            )
+        )
+
+    def replay(self, result: Any) -> None:
+        issue_ids = []
+        for method, kwargs in self._calls:
+            if method == "register_issue":
+                issue_ids.append(result.register_issue(**kwargs))
+            else:
+                if "issue_id" in kwargs:
+                    kwargs = dict(kwargs, issue_id=issue_ids[kwargs["issue_id"]])
+                getattr(result, method)(**kwargs)
+
+
+class NetworkVisitor:
+    """
+    Walks the OpenDRIVE tree once and dispatches each element to the callbacks
+    the checkers registered for its kind. Elements are visited in document
+    order, which is the order of the get_roads()/get_junctions() loops.
+
+    Issues are recorded per checker and replayed by flush(). If a callback
+    raises, the checker gets no further callbacks and flush() re-raises the
+    exception after replaying the issues recorded before it.
+    """
+
+    def __init__(self, checker_data: models.CheckerData):
+        self.checker_data = checker_data
+        self._callbacks: Dict[str, List[Tuple[str, Callback]]] = dict()
+        self._recorders: Dict[str, IssueRecorder] = dict()
+        self._errors: Dict[str, Exception] = dict()
+        self._walked = False
+
+    def register(self, checker_id: str, kind: str, callback: Callback) -> None:
+        if kind not in ELEMENT_KINDS:
+            raise ValueError(f"Unknown element kind {kind}.")
+        if self._walked:
+            raise RuntimeError("Callbacks must be registered before the walk.")
+
+        self._recorders.setdefault(checker_id, IssueRecorder())
+        self._callbacks.setdefault(kind, []).append((checker_id, callback))
+
+    def has_checker(self, checker_id: str) -> bool:
+        return checker_id in self._recorders
+
+    def walk(self) -> None:
+        checker_data = {
+            checker_id: dataclasses.replace(self.checker_data, result=recorder)
+            for checker_id, recorder in self._recorders.items()
+        }
+
+        root = self.checker_data.input_file_xml_root
+        if len(self._callbacks) > 0:
+            for element in root.iter(*self._callbacks.keys()):
+                for checker_id, callback in self._callbacks[element.tag]:
+                    if checker_id in self._errors:
+                        continue
+                    try:
+                        callback(element, checker_data[checker_id])
+                    except Exception as e:
+                        self._errors[checker_id] = e
+
+        self._walked = True
+
+    def flush(self, checker_id: str, result: Any) -> None:
+        self._recorders[checker_id].replay(result)
+
+        error = self._errors.get(checker_id)
+        if error is not None:
+            raise error
+
+
+RegisterVisits = Callable[[NetworkVisitor], None]
+
+
+def walk_network(
+    checker_data: models.CheckerData, checkers: Iterable[types.ModuleType]
+) -> NetworkVisitor:
+    """
+    Registers the callbacks of all checkers providing register_visits() and
+    walks the tree once. The visitor is kept on the network index, so that the
+    checkers executed afterwards only replay their recorded issues.
+    """
+    network_visitor = NetworkVisitor(checker_data)
+    for checker in checkers:
+        register_visits = getattr(checker, "register_visits", None)
+        if register_visits is not None:
+            register_visits(network_visitor)
+
+    network_visitor.walk()
+
+    network.get_network_index(checker_data.input_file_xml_root).set_service(
+        "network_visitor", network_visitor
+    )
+
+    return network_visitor
+
+
+def visit(
+    checker_data: models.CheckerData,
+    checker_id: str,
+    register_visits: RegisterVisits,
+) -> None:
+    """
+    Runs a checker built on visitor callbacks. Uses the shared traversal of
+    walk_network() if the checker took part in it, otherwise walks the tree for
+    this checker alone.
+    """
+    network_visitor: Optional[NetworkVisitor] = network.get_network_index(
+        checker_data.input_file_xml_root
+    ).get_service("network_visitor")
+
+    if network_visitor is None or not network_visitor.has_checker(checker_id):
+        network_visitor = NetworkVisitor(checker_data)
+        register_visits(network_visitor)
+        network_visitor.walk()
+
+    network_visitor.flush(checker_id, checker_data.result)
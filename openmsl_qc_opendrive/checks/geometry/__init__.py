@@ -5,7 +5,11 @@
 # with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 from . import (
+    road_geometry_continuity as road_geometry_continuity,
     road_geometry_length as road_geometry_length,
     road_geometry_parampoly3_attributes as road_geometry_parampoly3_attributes,
-    road_min_length as road_min_length
+    road_geometry_parampoly3_length_match as road_geometry_parampoly3_length_match,
+    road_link_continuity as road_link_continuity,
+    road_min_length as road_min_length,
+    road_overlap as road_overlap,
 )
\ No newline at end of file
@@ -0,0 +1,120 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import logging
+
+from qc_baselib import IssueSeverity
+
+from openmsl_qc_opendrive import constants
+from openmsl_qc_opendrive.base import road_geometry, visitor
+from openmsl_qc_opendrive.base.utils import *
+
+CHECKER_ID = "check_openmsl_xodr_road_geometry_continuity"
+CHECKER_DESCRIPTION = "End position and heading of a geometry element shall match the start of the next element"
+CHECKER_PRECONDITIONS = set()
+RULE_UID = "openmsl.net:xodr:1.4.0:road.geometry.continuity"
+REQUIRED_SUBTREES = set()
+
+# Default tolerances, overridden by the checker params positionTolerance,
+# headingTolerance and curvatureTolerance. The curvature may change between
+# geometries (e.g. from a line to an arc), so it is only checked if a
+# curvatureTolerance is configured.
+POSITION_TOLERANCE = 0.01
+HEADING_TOLERANCE = 0.001
+CURVATURE_TOLERANCE = None
+
+
+def _check_road(road: etree._Element, checker_data: models.CheckerData) -> None:
+    roadID = road.attrib["id"]
+
+    position_tolerance = get_checker_float_param(
+        checker_data, CHECKER_ID, "positionTolerance", POSITION_TOLERANCE
+    )
+    heading_tolerance = get_checker_float_param(
+        checker_data, CHECKER_ID, "headingTolerance", HEADING_TOLERANCE
+    )
+    curvature_tolerance = get_checker_float_param(
+        checker_data, CHECKER_ID, "curvatureTolerance", CURVATURE_TOLERANCE
+    )
+
+    transitions = road_geometry.get_geometry_transitions(road)
+    geometry_list = get_road_plan_view_geometry_list(road)
+
+    for i in range(len(transitions.position_gap)):
+        next_geometry = geometry_list[i + 1]
+        sGeom = get_s_from_geometry(next_geometry)
+
+        issue_descriptions = []
+        position_gap = transitions.position_gap[i]
+        if position_gap > position_tolerance:
+            issue_descriptions.append(
+                f"road {roadID} Geometry {sGeom} starts {position_gap:.6f} m away from the end of the previous geometry"
+            )
+        heading_gap = transitions.heading_gap[i]
+        if abs(heading_gap) > heading_tolerance:
+            issue_descriptions.append(
+                f"road {roadID} Geometry {sGeom} has heading difference {heading_gap:.6f} rad to the end of the previous geometry"
+            )
+        curvature_gap = transitions.curvature_gap[i]
+        if curvature_tolerance is not None and abs(curvature_gap) > curvature_tolerance:
+            issue_descriptions.append(
+                f"road {roadID} Geometry {sGeom} has curvature difference {curvature_gap:.6f} 1/m to the end of the previous geometry"
+            )
+
+        for description in issue_descriptions:
+            # register issue
+            issue_id = checker_data.result.register_issue(
+                checker_bundle_name=constants.BUNDLE_NAME,
+                checker_id=CHECKER_ID,
+                description=description,
+                level=IssueSeverity.WARNING,
+                rule_uid=RULE_UID,
+            )
+            # add xml location
+            checker_data.result.add_xml_location(
+                checker_bundle_name=constants.BUNDLE_NAME,
+                checker_id=CHECKER_ID,
+                issue_id=issue_id,
+                xpath=checker_data.input_file_xml_root.getpath(next_geometry),
+                description=description,
+            )
+
+            # add 3d point at the end of the previous geometry
+            inertial_point = get_point_xyz_from_road_reference_line(road, sGeom)
+            if inertial_point is not None:
+                checker_data.result.add_inertial_location(
+                    checker_bundle_name=constants.BUNDLE_NAME,
+                    checker_id=CHECKER_ID,
+                    issue_id=issue_id,
+                    x=float(transitions.x[i]),
+                    y=float(transitions.y[i]),
+                    z=inertial_point.z,
+                    description=description,
+                )
+
+
+def register_visits(network_visitor: visitor.NetworkVisitor) -> None:
+    network_visitor.register(CHECKER_ID, visitor.ROAD, _check_road)
+
+
+def check_rule(checker_data: models.CheckerData) -> None:
+    """
+    Rule ID: openmsl.net:xodr:1.4.0:road.geometry.continuity
+
+    Description: End position and heading of a geometry element shall match the start of the next element.
+
+    Severity: WARNING
+
+    Version range: [1.4.0, )
+
+    Remark:
+        The ends of all geometries of the network are evaluated in one batch.
+        The tolerances are set with the checker params positionTolerance [m],
+        headingTolerance [rad] and curvatureTolerance [1/m].
+    """
+    logging.info("Executing road.geometry.continuity check.")
+
+    visitor.visit(checker_data, CHECKER_ID, register_visits)
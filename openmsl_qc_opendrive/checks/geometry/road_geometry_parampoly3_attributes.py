@@ -9,84 +9,97 @@ import logging
 from qc_baselib import IssueSeverity
 
 from openmsl_qc_opendrive import constants
-from qc_opendrive.base.utils import *
+from openmsl_qc_opendrive.base import tables
+from openmsl_qc_opendrive.base.utils import *
 
 CHECKER_ID = "check_openmsl_xodr_road_geometry_parampoly3_attributes"
 CHECKER_DESCRIPTION = "ParamPoly3 parameters @aU, @aV and @bV shall be zero, @bU shall be > 0"
 CHECKER_PRECONDITIONS = set()
 RULE_UID = "openmsl.net:xodr:1.4.0:road.geometry.parampoly3.attributes"
+REQUIRED_SUBTREES = set()
 
 TOLERANCE_THRESHOLD_BV = 0.001
 
-def _check_all_roads(checker_data: models.CheckerData) -> None:
-    roads = get_roads(checker_data.input_file_xml_root)
 
-    for road in roads:
+def _check_all_roads(checker_data: models.CheckerData) -> None:
+    table = tables.get_geometry_table(checker_data.input_file_xml_root)
+
+    param_poly3 = (table.p_range != models.GeometryType.INVALID) & ~np.isnan(
+        table.length
+    )
+    invalid_aU = param_poly3 & (table.u[:, 0] != 0.0)
+    invalid_aV = param_poly3 & (table.v[:, 0] != 0.0)
+    invalid_bV = param_poly3 & (np.abs(table.v[:, 1]) > TOLERANCE_THRESHOLD_BV)
+    invalid_bU = param_poly3 & (table.u[:, 1] <= 0.0)
+
+    for i in np.flatnonzero(invalid_aU | invalid_aV | invalid_bV | invalid_bU):
+        geometry = table.elements[i]
+        road = table.roads[table.road[i]]
         roadID = road.attrib["id"]
-
-        geometry_list = get_road_plan_view_geometry_list(road)
-        for geometry in geometry_list:
-            length = get_length_from_geometry(geometry)
-            if length is None:
+        s_coordinate = None if np.isnan(table.s[i]) else float(table.s[i])
+        length = float(table.length[i])
+        aU, bU = float(table.u[i, 0]), float(table.u[i, 1])
+        aV, bV = float(table.v[i, 0]), float(table.v[i, 1])
+
+        issue_descriptions = []
+        if invalid_aU[i]:
+            issue_descriptions.append(
+                f"road {roadID} has invalid paramPoly3 : aU != 0.0 ({aU}) at s={s_coordinate}"
+            )
+
+        if invalid_aV[i]:
+            issue_descriptions.append(
+                f"road {roadID} has invalid paramPoly3 : aV != 0.0 ({aV}) at s={s_coordinate}"
+            )
+
+        if invalid_bV[i]:
+            issue_descriptions.append(
+                f"road {roadID} has invalid paramPoly3 : abs(bV) > {TOLERANCE_THRESHOLD_BV} ({bV}) at s={s_coordinate}"
+            )
+
+        if invalid_bU[i]:
+            issue_descriptions.append(
+                f"road {roadID} has invalid paramPoly3 : bU <= 0.0 ({bU}) at s={s_coordinate}"
+            )
+
+        for description in issue_descriptions:
+            # register issues
+            issue_id = checker_data.result.register_issue(
+                checker_bundle_name=constants.BUNDLE_NAME,
+                checker_id=CHECKER_ID,
+                description=description,
+                level=IssueSeverity.WARNING,
+                rule_uid=RULE_UID,
+            )
+            # add xml location
+            checker_data.result.add_xml_location(
+                checker_bundle_name=constants.BUNDLE_NAME,
+                checker_id=CHECKER_ID,
+                issue_id=issue_id,
+                xpath=checker_data.input_file_xml_root.getpath(geometry),
+                description=description,
+            )
+
+            if s_coordinate is None:
                 continue
 
-            param_poly3 = get_arclen_param_poly3_from_geometry(geometry)
-            if param_poly3 is None:
-                param_poly3 = get_normalized_param_poly3_from_geometry(geometry)
-                if param_poly3 is None:
-                    continue
-
-            s_coordinate = get_s_from_geometry(geometry)
-
-            issue_descriptions = []
-            if param_poly3.u.a != 0.0:                
-                issue_descriptions.append(f"road {roadID} has invalid paramPoly3 : aU != 0.0 ({param_poly3.u.a}) at s={s_coordinate}")
-
-            if param_poly3.v.a != 0.0:
-                issue_descriptions.append(f"road {roadID} has invalid paramPoly3 : aV != 0.0 ({param_poly3.v.a}) at s={s_coordinate}")
-
-            if abs(param_poly3.v.b) > TOLERANCE_THRESHOLD_BV:
-                issue_descriptions.append(f"road {roadID} has invalid paramPoly3 : abs(bV) > {TOLERANCE_THRESHOLD_BV} ({param_poly3.v.b}) at s={s_coordinate}")              
-
-            if param_poly3.u.b <= 0.0:
-                issue_descriptions.append(f"road {roadID} has invalid paramPoly3 : bU <= 0.0 ({param_poly3.u.b}) at s={s_coordinate}")
+            # each further issue of the geometry is placed another half
+            # length along the road
+            s_coordinate += length / 2.0
 
-            for description in issue_descriptions:
-                # register issues
-                issue_id = checker_data.result.register_issue(
-                    checker_bundle_name=constants.BUNDLE_NAME,
-                    checker_id=CHECKER_ID,
-                    description=description,
-                    level=IssueSeverity.WARNING,
-                    rule_uid=RULE_UID,
-                )
-                # add xml location
-                checker_data.result.add_xml_location(
+            # add 3d point
+            inertial_point = get_point_xyz_from_road_reference_line(road, s_coordinate)
+            if inertial_point is not None:
+                checker_data.result.add_inertial_location(
                     checker_bundle_name=constants.BUNDLE_NAME,
                     checker_id=CHECKER_ID,
                     issue_id=issue_id,
-                    xpath=checker_data.input_file_xml_root.getpath(geometry),
+                    x=inertial_point.x,
+                    y=inertial_point.y,
+                    z=inertial_point.z,
                     description=description,
                 )
 
-                if s_coordinate is None:
-                    continue
-
-                s_coordinate += length / 2.0
-
-                # add 3d point
-                inertial_point = get_point_xyz_from_road_reference_line(road, s_coordinate)
-                if inertial_point is not None:
-                    checker_data.result.add_inertial_location(
-                        checker_bundle_name=constants.BUNDLE_NAME,
-                        checker_id=CHECKER_ID,
-                        issue_id=issue_id,
-                        x=inertial_point.x,
-                        y=inertial_point.y,
-                        z=inertial_point.z,
-                        description=description,
-                    )
-
 
 def check_rule(checker_data: models.CheckerData) -> None:
     """
@@ -99,7 +112,8 @@ def check_rule(checker_data: models.CheckerData) -> None:
     Version range: [1.4.0, )
 
     Remark:
-        TODO
+        The paramPoly3 coefficients of all geometries are read into one table
+        and tested as array operations.
     """
     logging.info("Executing road.geometry.parampoly3.attributes check.")
 
@@ -0,0 +1,99 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import logging
+
+from qc_baselib import IssueSeverity
+
+from openmsl_qc_opendrive import constants
+from openmsl_qc_opendrive.base import road_geometry, visitor
+from openmsl_qc_opendrive.base.utils import *
+
+CHECKER_ID = "check_openmsl_xodr_road_geometry_parampoly3_length_match"
+CHECKER_DESCRIPTION = "Length of the ParamPoly3 curve shall match @length"
+CHECKER_PRECONDITIONS = set()
+RULE_UID = "asam.net:xodr:1.7.0:road.geometry.parampoly3.length_match"
+REQUIRED_SUBTREES = set()
+
+TOLERANCE_THRESHOLD = 0.001
+
+
+def _check_road(road: etree._Element, checker_data: models.CheckerData) -> None:
+    roadID = road.attrib["id"]
+
+    road_plan_view = get_road_plan_view(road)
+    arc_lengths = road_geometry.get_geometry_arc_lengths(road)
+
+    geometry_list = get_road_plan_view_geometry_list(road)
+    for i, geometry in enumerate(geometry_list):
+        if road_plan_view.geometry_type[i] not in (
+            models.GeometryType.PARAM_POLY3_ARC_LENGTH,
+            models.GeometryType.PARAM_POLY3_NORMALIZED,
+        ):
+            continue
+
+        length = float(road_plan_view.length[i])
+        curve_length = float(arc_lengths[i])
+        if abs(curve_length - length) <= TOLERANCE_THRESHOLD:
+            continue
+
+        s_coordinate = float(road_plan_view.s[i])
+        description = f"road {roadID} has paramPoly3 with curve length {curve_length:.6f} != @length {length} at s={s_coordinate}"
+
+        # register issues
+        issue_id = checker_data.result.register_issue(
+            checker_bundle_name=constants.BUNDLE_NAME,
+            checker_id=CHECKER_ID,
+            description=description,
+            level=IssueSeverity.WARNING,
+            rule_uid=RULE_UID,
+        )
+        # add xml location
+        checker_data.result.add_xml_location(
+            checker_bundle_name=constants.BUNDLE_NAME,
+            checker_id=CHECKER_ID,
+            issue_id=issue_id,
+            xpath=checker_data.input_file_xml_root.getpath(geometry),
+            description=description,
+        )
+
+        # add 3d point
+        inertial_point = get_point_xyz_from_road_reference_line(
+            road, s_coordinate + length / 2.0
+        )
+        if inertial_point is not None:
+            checker_data.result.add_inertial_location(
+                checker_bundle_name=constants.BUNDLE_NAME,
+                checker_id=CHECKER_ID,
+                issue_id=issue_id,
+                x=inertial_point.x,
+                y=inertial_point.y,
+                z=inertial_point.z,
+                description=description,
+            )
+
+
+def register_visits(network_visitor: visitor.NetworkVisitor) -> None:
+    network_visitor.register(CHECKER_ID, visitor.ROAD, _check_road)
+
+
+def check_rule(checker_data: models.CheckerData) -> None:
+    """
+    Rule ID: asam.net:xodr:1.7.0:road.geometry.parampoly3.length_match
+
+    Description: Length of the ParamPoly3 curve shall match @length.
+
+    Severity: WARNING
+
+    Version range: [1.7.0, )
+
+    Remark:
+        The curve length is integrated with Gauss-Legendre quadrature for all
+        paramPoly3 geometries of the network at once.
+    """
+    logging.info("Executing road.geometry.parampoly3.length_match check.")
+
+    visitor.visit(checker_data, CHECKER_ID, register_visits)
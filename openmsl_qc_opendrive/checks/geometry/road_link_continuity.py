@@ -0,0 +1,354 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import logging
+
+import numpy as np
+from qc_baselib import IssueSeverity
+
+from openmsl_qc_opendrive import constants
+from openmsl_qc_opendrive.base import road_geometry, visitor
+from openmsl_qc_opendrive.base.utils import *
+
+CHECKER_ID = "check_openmsl_xodr_road_link_continuity"
+CHECKER_DESCRIPTION = "Linked roads shall meet at their contact points with matching position, heading and elevation"
+CHECKER_PRECONDITIONS = set()
+RULE_UID = "openmsl.net:xodr:1.4.0:road.link.continuity"
+REQUIRED_SUBTREES = set()
+
+# Default tolerances, overridden by the checker params positionTolerance [m],
+# headingTolerance [rad] and elevationTolerance [m]. Lane borders of the ASAM
+# examples meet within a few centimeters.
+POSITION_TOLERANCE = 0.05
+HEADING_TOLERANCE = 0.001
+ELEVATION_TOLERANCE = 0.01
+
+
+def _get_lane_pairs(
+    road: etree._Element, contact_point: models.ContactPoint
+) -> List[Tuple[int, int]]:
+    """
+    Returns the pairs (lane id, linked lane id) of the lane links at the start
+    or end of the road.
+    """
+    sections = get_sorted_lane_sections_with_length_from_road(road)
+    if len(sections) == 0:
+        return []
+
+    lane_pairs = []
+    if contact_point == models.ContactPoint.START:
+        section = sections[0]
+    else:
+        section = sections[-1]
+    for lane in get_left_and_right_lanes_from_lane_section(section.lane_section):
+        laneID = get_lane_id(lane)
+        if contact_point == models.ContactPoint.START:
+            linkedLaneIDs = get_predecessor_lane_ids(lane)
+        else:
+            linkedLaneIDs = get_successor_lane_ids(lane)
+        lane_pairs.extend((laneID, linkedLaneID) for linkedLaneID in linkedLaneIDs)
+    return lane_pairs
+
+
+def _get_lane_strip(
+    borders: Dict[int, np.ndarray], laneID: int
+) -> Optional[np.ndarray]:
+    """
+    Returns the inertial points of the outer and the inner border of a lane,
+    None if one of them is undefined.
+    """
+    innerLaneID = laneID - 1 if laneID > 0 else laneID + 1
+    if laneID not in borders or innerLaneID not in borders:
+        return None
+    return np.stack([borders[laneID], borders[innerLaneID]])
+
+
+def _get_contact_gaps(
+    road: etree._Element,
+    contact_point: models.ContactPoint,
+    linked_road: etree._Element,
+    linked_contact_point: models.ContactPoint,
+    lane_pairs: List[Tuple[int, int]],
+) -> Tuple[float, float, float]:
+    """
+    Returns position, heading and elevation difference of two road ends.
+    Position and elevation are compared at the borders of the linked lanes,
+    which include the lane offset: the two borders of a lane meet the two
+    borders of its linked lane, in either order since a lane may continue as
+    a lane on the other side of the linked road. Without lane links the
+    center lanes are compared. Both are NaN if no border pair is defined. At
+    start-to-end contacts the headings of the reference lines are equal, at
+    start-to-start and end-to-end contacts they are opposite.
+    """
+    pose = road_geometry.get_road_contact_pose(road, contact_point)
+    linked_pose = road_geometry.get_road_contact_pose(linked_road, linked_contact_point)
+    expected_heading = 0.0 if contact_point != linked_contact_point else np.pi
+    heading_gap = float(
+        np.angle(np.exp(1j * (linked_pose[2] - pose[2] - expected_heading)))
+    )
+
+    borders = road_geometry.get_road_contact_lane_borders(road, contact_point)
+    linked_borders = road_geometry.get_road_contact_lane_borders(
+        linked_road, linked_contact_point
+    )
+
+    # Links to lanes that do not exist at the contact are checked elsewhere
+    differences = []
+    for laneID, linkedLaneID in sorted(set(lane_pairs), key=str):
+        if laneID in (None, 0) or linkedLaneID in (None, 0):
+            continue
+        strip = _get_lane_strip(borders, laneID)
+        linked_strip = _get_lane_strip(linked_borders, linkedLaneID)
+        if strip is None or linked_strip is None:
+            continue
+
+        difference = min(
+            (linked_strip - strip, linked_strip[::-1] - strip),
+            key=lambda d: np.hypot(d[:, 0], d[:, 1]).max(),
+        )
+        differences.append(difference)
+
+    if len(lane_pairs) == 0 and 0 in borders and 0 in linked_borders:
+        differences.append((linked_borders[0] - borders[0])[np.newaxis])
+
+    if len(differences) == 0:
+        return np.nan, heading_gap, np.nan
+
+    differences = np.concatenate(differences)
+    position_gap = float(np.hypot(differences[:, 0], differences[:, 1]).max())
+    elevation_gap = float(differences[np.argmax(np.abs(differences[:, 2])), 2])
+    return position_gap, heading_gap, elevation_gap
+
+
+def _check_contact(
+    checker_data: models.CheckerData,
+    element: etree._Element,
+    description_prefix: str,
+    pose: np.ndarray,
+    gaps: Tuple[float, float, float],
+) -> None:
+    position_tolerance = get_checker_float_param(
+        checker_data, CHECKER_ID, "positionTolerance", POSITION_TOLERANCE
+    )
+    heading_tolerance = get_checker_float_param(
+        checker_data, CHECKER_ID, "headingTolerance", HEADING_TOLERANCE
+    )
+    elevation_tolerance = get_checker_float_param(
+        checker_data, CHECKER_ID, "elevationTolerance", ELEVATION_TOLERANCE
+    )
+
+    position_gap, heading_gap, elevation_gap = gaps
+    issue_descriptions = []
+    if position_gap > position_tolerance:
+        issue_descriptions.append(
+            f"{description_prefix} has a gap of {position_gap:.6f} m"
+        )
+    if abs(heading_gap) > heading_tolerance:
+        issue_descriptions.append(
+            f"{description_prefix} has heading difference {heading_gap:.6f} rad"
+        )
+    if abs(elevation_gap) > elevation_tolerance:
+        issue_descriptions.append(
+            f"{description_prefix} has elevation difference {elevation_gap:.6f} m"
+        )
+
+    for description in issue_descriptions:
+        # register issue
+        issue_id = checker_data.result.register_issue(
+            checker_bundle_name=constants.BUNDLE_NAME,
+            checker_id=CHECKER_ID,
+            description=description,
+            level=IssueSeverity.WARNING,
+            rule_uid=RULE_UID,
+        )
+        # add xml location
+        checker_data.result.add_xml_location(
+            checker_bundle_name=constants.BUNDLE_NAME,
+            checker_id=CHECKER_ID,
+            issue_id=issue_id,
+            xpath=checker_data.input_file_xml_root.getpath(element),
+            description=description,
+        )
+
+        # add 3d point
+        if not np.isnan(pose).any():
+            checker_data.result.add_inertial_location(
+                checker_bundle_name=constants.BUNDLE_NAME,
+                checker_id=CHECKER_ID,
+                issue_id=issue_id,
+                x=float(pose[0]),
+                y=float(pose[1]),
+                z=float(pose[3]),
+                description=description,
+            )
+
+
+def _links_back(
+    road: etree._Element,
+    contact_point: models.ContactPoint,
+    linked_road: etree._Element,
+    linked_contact_point: models.ContactPoint,
+) -> bool:
+    """
+    Returns True if the linked road links back to the contact point of the
+    road from its linked contact point.
+    """
+    if linked_contact_point == models.ContactPoint.START:
+        linkage = get_road_linkage(linked_road, models.LinkageTag.PREDECESSOR)
+    else:
+        linkage = get_road_linkage(linked_road, models.LinkageTag.SUCCESSOR)
+    return (
+        linkage is not None
+        and linkage.id == to_int(road.get("id"))
+        and linkage.contact_point == contact_point
+    )
+
+
+def _check_road(
+    road: etree._Element,
+    checker_data: models.CheckerData,
+    roads: Dict[int, etree._Element],
+) -> None:
+    roadID = road.attrib["id"]
+
+    for linkage_tag, contact_point in (
+        (models.LinkageTag.PREDECESSOR, models.ContactPoint.START),
+        (models.LinkageTag.SUCCESSOR, models.ContactPoint.END),
+    ):
+        linkage = get_road_linkage(road, linkage_tag)
+        if linkage is None:
+            continue
+        linked_road = roads.get(linkage.id)
+        if linked_road is None:
+            continue
+
+        # Mutual links are checked once, from the road with the lower id or
+        # from the end of a road linked to itself
+        road_end = (to_int(roadID), contact_point.value)
+        linked_end = (linkage.id, linkage.contact_point.value)
+        mutual = _links_back(road, contact_point, linked_road, linkage.contact_point)
+        if mutual and linked_end < road_end:
+            continue
+
+        gaps = _get_contact_gaps(
+            road,
+            contact_point,
+            linked_road,
+            linkage.contact_point,
+            _get_lane_pairs(road, contact_point),
+        )
+        _check_contact(
+            checker_data,
+            get_road_link_element(road, linkage.id, linkage_tag),
+            f"{linkage_tag.value} link of road {roadID} to {linkage.contact_point.value} of road {linkage.id}",
+            road_geometry.get_road_contact_pose(road, contact_point),
+            gaps,
+        )
+
+
+def _check_junction(
+    junction: etree._Element,
+    checker_data: models.CheckerData,
+    roads: Dict[int, etree._Element],
+) -> None:
+    junctionID = get_junction_id(junction)
+
+    for connection in get_connections_from_junction(junction):
+        incomingRoadId = get_incoming_road_id_from_connection(connection)
+        connectingRoadId = get_connecting_road_id_from_connection(connection)
+        if connectingRoadId is None:
+            # Connections of direct junctions link the incoming road directly
+            # to a linked road
+            connectingRoadId = to_int(connection.get("linkedRoad"))
+        contact_point = get_contact_point_from_connection(connection)
+
+        incoming_road = roads.get(incomingRoadId)
+        connecting_road = roads.get(connectingRoadId)
+        if incoming_road is None or connecting_road is None or contact_point is None:
+            continue
+
+        lane_pairs = [
+            (
+                get_from_attribute_from_lane_link(lane_link),
+                get_to_attribute_from_lane_link(lane_link),
+            )
+            for lane_link in get_lane_links_from_connection(connection)
+        ]
+
+        # The incoming road contacts the junction at the end that links to
+        # it. If both ends do, the closer one is used.
+        candidates = []
+        for linkage_tag, incoming_contact_point in (
+            (models.LinkageTag.PREDECESSOR, models.ContactPoint.START),
+            (models.LinkageTag.SUCCESSOR, models.ContactPoint.END),
+        ):
+            if get_linked_junction_id(incoming_road, linkage_tag) != junctionID:
+                continue
+            gaps = _get_contact_gaps(
+                incoming_road,
+                incoming_contact_point,
+                connecting_road,
+                contact_point,
+                lane_pairs,
+            )
+            pose = road_geometry.get_road_contact_pose(
+                incoming_road, incoming_contact_point
+            )
+            candidates.append((gaps, pose, incoming_contact_point))
+
+        if len(candidates) == 0:
+            continue
+
+        gaps, pose, incoming_contact_point = min(
+            candidates, key=lambda c: np.nan_to_num(c[0][0], nan=np.inf)
+        )
+        _check_contact(
+            checker_data,
+            connection,
+            f"connection of junction {junctionID} from {incoming_contact_point.value} of road {incomingRoadId} to {contact_point.value} of road {connectingRoadId}",
+            pose,
+            gaps,
+        )
+
+
+def register_visits(network_visitor: visitor.NetworkVisitor) -> None:
+    roads = get_road_id_map(network_visitor.checker_data.input_file_xml_root)
+    network_visitor.register(
+        CHECKER_ID,
+        visitor.ROAD,
+        lambda road, checker_data: _check_road(road, checker_data, roads),
+    )
+    network_visitor.register(
+        CHECKER_ID,
+        visitor.JUNCTION,
+        lambda junction, checker_data: _check_junction(junction, checker_data, roads),
+    )
+
+
+def check_rule(checker_data: models.CheckerData) -> None:
+    """
+    Rule ID: openmsl.net:xodr:1.4.0:road.link.continuity
+
+    Description: Linked roads shall meet at their contact points with matching position, heading and elevation.
+
+    Severity: WARNING
+
+    Version range: [1.4.0, )
+
+    Remark:
+        Road links and junction connections are checked. Positions and
+        elevations are compared at the borders of the linked lanes, so roads
+        that are laterally offset, e.g. in direct junctions or by a lane
+        offset, are not reported. Headings are compared at the reference
+        lines. A road link that is mirrored by a link of the linked road is
+        checked once. The start and end poses of all roads are evaluated in
+        one batch. The tolerances are set with the checker params
+        positionTolerance [m], headingTolerance [rad] and elevationTolerance
+        [m].
+    """
+    logging.info("Executing road.link.continuity check.")
+
+    visitor.visit(checker_data, CHECKER_ID, register_visits)
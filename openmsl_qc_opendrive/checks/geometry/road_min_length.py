@@ -9,41 +9,43 @@ import logging
 from qc_baselib import IssueSeverity
 
 from openmsl_qc_opendrive import constants
-from qc_opendrive.base.utils import *
+from openmsl_qc_opendrive.base import tables
+from openmsl_qc_opendrive.base.utils import *
 
 CHECKER_ID = "check_openmsl_xodr_road_min_length"
 CHECKER_DESCRIPTION = "Road Length shall be greater than epsilon"
 CHECKER_PRECONDITIONS = set()
 RULE_UID = "openmsl.net:xodr:1.4.0:road.min_length"
+REQUIRED_SUBTREES = set()
 
 ROAD_MIN_LENGTH = 0.1
 
 def _check_all_roads(checker_data: models.CheckerData) -> None:
-    roads = get_roads(checker_data.input_file_xml_root)
+    table = tables.get_geometry_table(checker_data.input_file_xml_root)
 
-    for road in roads:
+    for i in np.flatnonzero(table.road_length < ROAD_MIN_LENGTH):
+        road = table.roads[i]
         roadID = road.attrib["id"]
-        roadLength = get_road_length(road)
-
-        if roadLength < ROAD_MIN_LENGTH:
-            description = f"road {roadID} is to short: {roadLength}m"
-            
-            # register issue
-            issue_id = checker_data.result.register_issue(
-                checker_bundle_name=constants.BUNDLE_NAME,
-                checker_id=CHECKER_ID,
-                description=description,
-                level=IssueSeverity.WARNING,
-                rule_uid=RULE_UID,
-            )
-            # add xml location
-            checker_data.result.add_xml_location(
-                checker_bundle_name=constants.BUNDLE_NAME,
-                checker_id=CHECKER_ID,
-                issue_id=issue_id,
-                xpath=checker_data.input_file_xml_root.getpath(road),
-                description=description,
-            )
+        roadLength = float(table.road_length[i])
+
+        description = f"road {roadID} is to short: {roadLength}m"
+
+        # register issue
+        issue_id = checker_data.result.register_issue(
+            checker_bundle_name=constants.BUNDLE_NAME,
+            checker_id=CHECKER_ID,
+            description=description,
+            level=IssueSeverity.WARNING,
+            rule_uid=RULE_UID,
+        )
+        # add xml location
+        checker_data.result.add_xml_location(
+            checker_bundle_name=constants.BUNDLE_NAME,
+            checker_id=CHECKER_ID,
+            issue_id=issue_id,
+            xpath=checker_data.input_file_xml_root.getpath(road),
+            description=description,
+        )
 
 
 def check_rule(checker_data: models.CheckerData) -> None:
@@ -57,7 +59,7 @@ def check_rule(checker_data: models.CheckerData) -> None:
     Version range: [1.4.0, )
 
     Remark:
-        TODO
+        The road lengths are taken from the geometry table of the network.
     """
     logging.info("Executing road.min_length check.")
 
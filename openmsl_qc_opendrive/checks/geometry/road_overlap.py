@@ -0,0 +1,105 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import logging
+
+from qc_baselib import IssueSeverity
+
+from openmsl_qc_opendrive import constants
+from openmsl_qc_opendrive.base import outline
+from openmsl_qc_opendrive.base.utils import *
+
+CHECKER_ID = "check_openmsl_xodr_road_overlap"
+CHECKER_DESCRIPTION = "Roads shall not overlap each other outside of junctions and shall not intersect themselves"
+CHECKER_PRECONDITIONS = set()
+RULE_UID = "openmsl.net:xodr:1.4.0:road.geometry.overlap"
+REQUIRED_SUBTREES = set()
+
+# Defaults, overridden by the checker params sampleStep [m] and
+# verticalClearance [m]. Roads crossing at least verticalClearance apart in z
+# are bridges.
+SAMPLE_STEP = 1.0
+VERTICAL_CLEARANCE = 1.0
+
+
+def _check_all_roads(checker_data: models.CheckerData) -> None:
+    sample_step = get_checker_float_param(
+        checker_data, CHECKER_ID, "sampleStep", SAMPLE_STEP
+    )
+    vertical_clearance = get_checker_float_param(
+        checker_data, CHECKER_ID, "verticalClearance", VERTICAL_CLEARANCE
+    )
+
+    roads = get_roads(checker_data.input_file_xml_root)
+    junctions = get_junctions(checker_data.input_file_xml_root)
+
+    for overlap in outline.compile_road_overlaps(
+        roads, sample_step, vertical_clearance, junctions
+    ):
+        roadID = overlap.road.get("id")
+        otherRoadID = overlap.other_road.get("id")
+        if overlap.road is overlap.other_road:
+            description = f"lane borders of road {roadID} intersect themselves"
+            elements = [overlap.road]
+        else:
+            description = f"road {roadID} overlaps road {otherRoadID}, but they are neither linked nor part of a common junction"
+            elements = [overlap.road, overlap.other_road]
+
+        # register issue
+        issue_id = checker_data.result.register_issue(
+            checker_bundle_name=constants.BUNDLE_NAME,
+            checker_id=CHECKER_ID,
+            description=description,
+            level=IssueSeverity.WARNING,
+            rule_uid=RULE_UID,
+        )
+        # add xml location
+        for element in elements:
+            checker_data.result.add_xml_location(
+                checker_bundle_name=constants.BUNDLE_NAME,
+                checker_id=CHECKER_ID,
+                issue_id=issue_id,
+                xpath=checker_data.input_file_xml_root.getpath(element),
+                description=description,
+            )
+
+        # add 3d point
+        checker_data.result.add_inertial_location(
+            checker_bundle_name=constants.BUNDLE_NAME,
+            checker_id=CHECKER_ID,
+            issue_id=issue_id,
+            x=overlap.point.x,
+            y=overlap.point.y,
+            z=overlap.point.z,
+            description=description,
+        )
+
+
+def check_rule(checker_data: models.CheckerData) -> None:
+    """
+    Rule ID: openmsl.net:xodr:1.4.0:road.geometry.overlap
+
+    Description: Roads shall not overlap each other outside of junctions and shall not intersect themselves.
+
+    Severity: WARNING
+
+    Version range: [1.4.0, )
+
+    Remark:
+        The outer lane borders of all roads are sampled and their segments are
+        inserted into a uniform grid, only segments sharing a grid cell are
+        tested for crossings. Roads whose borders do not cross, e.g. a
+        duplicated road or a road inside the footprint of another one, are
+        found by testing the border samples of each road for containment in
+        the footprints of the other roads. Roads that are linked or meet in a
+        junction, including the main road of a virtual junction, are not
+        compared. One issue is reported per pair of roads. The sampling is set
+        with the checker param sampleStep [m], overlaps at least
+        verticalClearance [m] apart in z are ignored.
+    """
+    logging.info("Executing road.geometry.overlap check.")
+
+    _check_all_roads(checker_data)
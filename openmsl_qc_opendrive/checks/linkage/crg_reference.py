@@ -11,12 +11,13 @@ from qc_baselib import IssueSeverity
 from pathlib import Path
 
 from openmsl_qc_opendrive import constants
-from qc_opendrive.base.utils import *
+from openmsl_qc_opendrive.base.utils import *
 
 CHECKER_ID = "check_openmsl_xodr_crg_reference"
 CHECKER_DESCRIPTION = "check reference to OpenCRG files"
 CHECKER_PRECONDITIONS = set()
 RULE_UID = "openmsl.net:xodr:1.4.0:road.linkage.crg_reference"
+REQUIRED_SUBTREES = {"surface"}
 
 def _check_references(checker_data: models.CheckerData) -> None:
 
@@ -16,10 +16,14 @@ from . import (
     road_lane_property_sOffset as road_lane_property_sOffset,
     road_lane_type_none as road_lane_type_none,
     road_lane_width as road_lane_width,
+    road_lane_width_continuity as road_lane_width_continuity,
     road_link_backward as road_link_backward,
     road_link_id as road_link_id,
+    road_object_on_driving_lane as road_object_on_driving_lane,
+    road_object_overlap as road_object_overlap,
     road_object_position as road_object_position,
     road_object_size as road_object_size,
+    road_signal_duplicate as road_signal_duplicate,
     road_signal_object_lane_linkage as road_signal_object_lane_linkage,
     road_signal_position as road_signal_position,
     road_signal_size as road_signal_size,
@@ -9,62 +9,98 @@ import logging
 from qc_baselib import IssueSeverity
 
 from openmsl_qc_opendrive import constants
-from qc_opendrive.base.utils import *
+from openmsl_qc_opendrive.base import tables
+from openmsl_qc_opendrive.base.utils import *
 
 CHECKER_ID = "check_openmsl_xodr_junction_connection_lane_link_id"
 CHECKER_DESCRIPTION = "linked Lane shall exist in connected LaneSection"
 CHECKER_PRECONDITIONS = set()
 RULE_UID = "openmsl.net:xodr:1.4.0:road.semantic.junction_connection_lane_link_id"
+REQUIRED_SUBTREES = set()
+
 
 def _check_all_junctions(checker_data: models.CheckerData) -> None:
-    roads = get_road_id_map(checker_data.input_file_xml_root)
-    junctions = get_junctions(checker_data.input_file_xml_root)
-
-    for junction in junctions:
-        junctionID = junction.attrib["id"]
-        connections = get_connections_from_junction(junction)
-
-        for connection in connections:
-            connectionID = connection.attrib["id"]
-            connectedLaneSections = get_incoming_and_connection_contacting_lane_sections(connection, roads)
-            if connectedLaneSections is None:
-                continue                            # checked in junction_connection_road_linkage
-
-            laneLinks = get_lane_links_from_connection(connection)
-            for laneLink in laneLinks:
-                issue_descriptions = []
-                laneFrom = get_from_attribute_from_lane_link(laneLink)
-                laneTo = get_to_attribute_from_lane_link(laneLink)
-
-                connectedLane = get_lane_from_lane_section(connectedLaneSections.incoming, laneFrom)
-                if laneFrom == 0:
-                    issue_descriptions.append(f"junction {junctionID} Connection {connectionID} has invalid lane linkage : 0")
-                elif connectedLane is None:
-                    issue_descriptions.append(f"junction {junctionID} Connection {connectionID} has invalid lane linkage : laneFrom not found")
-
-                connectedLane = get_lane_from_lane_section(connectedLaneSections.connection, laneTo)
-                if laneTo == 0: 
-                    issue_descriptions.append(f"junction {junctionID} Connection {connectionID} has invalid lane linkage : 0")
-                elif connectedLane is None:
-                    issue_descriptions.append(f"junction {junctionID} Connection {connectionID} has invalid lane linkage : laneTo not found")
-
-                for description in issue_descriptions:
-                    # register issues
-                    issue_id = checker_data.result.register_issue(
-                        checker_bundle_name=constants.BUNDLE_NAME,
-                        checker_id=CHECKER_ID,
-                        description=description,
-                        level=IssueSeverity.WARNING,
-                        rule_uid=RULE_UID,
-                    )
-                    # add xml location
-                    checker_data.result.add_xml_location(
-                        checker_bundle_name=constants.BUNDLE_NAME,
-                        checker_id=CHECKER_ID,
-                        issue_id=issue_id,
-                        xpath=checker_data.input_file_xml_root.getpath(laneLink),
-                        description=description,
-                    )
+    root = checker_data.input_file_xml_root
+    connections, lane_links = tables.get_junction_tables(root)
+    if len(lane_links) == 0:
+        return
+
+    lane_sections, lanes = tables.get_lane_tables(root)
+    lane_section_rows = {
+        lane_section: row for row, lane_section in enumerate(lane_sections.elements)
+    }
+    roads = get_road_id_map(root)
+
+    # laneSections at both ends of each connection with laneLinks
+    resolved = np.zeros(len(connections), dtype=bool)
+    incoming_lane_section = np.full(len(connections), -1, dtype=np.int64)
+    connection_lane_section = np.full(len(connections), -1, dtype=np.int64)
+    for row in np.unique(lane_links.connection):
+        connectedLaneSections = get_incoming_and_connection_contacting_lane_sections(
+            connections.elements[row], roads
+        )
+        if connectedLaneSections is None:
+            continue  # checked in junction_connection_road_linkage
+        resolved[row] = True
+        incoming_lane_section[row] = lane_section_rows.get(
+            connectedLaneSections.incoming, -1
+        )
+        connection_lane_section[row] = lane_section_rows.get(
+            connectedLaneSections.connection, -1
+        )
+
+    from_zero = lane_links.from_lane == 0
+    from_not_found = ~from_zero & ~tables.find_lanes_in_lane_sections(
+        lanes, incoming_lane_section[lane_links.connection], lane_links.from_lane
+    )
+    to_zero = lane_links.to_lane == 0
+    to_not_found = ~to_zero & ~tables.find_lanes_in_lane_sections(
+        lanes, connection_lane_section[lane_links.connection], lane_links.to_lane
+    )
+
+    flagged = resolved[lane_links.connection] & (
+        from_zero | from_not_found | to_zero | to_not_found
+    )
+    for i in np.flatnonzero(flagged):
+        laneLink = lane_links.elements[i]
+        junctionID = connections.junctions[lane_links.junction[i]].attrib["id"]
+        connectionID = connections.elements[lane_links.connection[i]].attrib["id"]
+
+        issue_descriptions = []
+        if from_zero[i]:
+            issue_descriptions.append(
+                f"junction {junctionID} Connection {connectionID} has invalid lane linkage : 0"
+            )
+        elif from_not_found[i]:
+            issue_descriptions.append(
+                f"junction {junctionID} Connection {connectionID} has invalid lane linkage : laneFrom not found"
+            )
+        if to_zero[i]:
+            issue_descriptions.append(
+                f"junction {junctionID} Connection {connectionID} has invalid lane linkage : 0"
+            )
+        elif to_not_found[i]:
+            issue_descriptions.append(
+                f"junction {junctionID} Connection {connectionID} has invalid lane linkage : laneTo not found"
+            )
+
+        for description in issue_descriptions:
+            # register issues
+            issue_id = checker_data.result.register_issue(
+                checker_bundle_name=constants.BUNDLE_NAME,
+                checker_id=CHECKER_ID,
+                description=description,
+                level=IssueSeverity.WARNING,
+                rule_uid=RULE_UID,
+            )
+            # add xml location
+            checker_data.result.add_xml_location(
+                checker_bundle_name=constants.BUNDLE_NAME,
+                checker_id=CHECKER_ID,
+                issue_id=issue_id,
+                xpath=checker_data.input_file_xml_root.getpath(laneLink),
+                description=description,
+            )
 
 
 def check_rule(checker_data: models.CheckerData) -> None:
@@ -78,7 +114,9 @@ def check_rule(checker_data: models.CheckerData) -> None:
     Version range: [1.4.0, )
 
     Remark:
-        TODO
+        The laneLinks of all junctions are read into one table. The linked
+        lanes are looked up in the lane table of the network in one batch,
+        the laneSections at the ends of each connection are resolved once.
     """
     logging.info("Executing road.semantic.junction_connection_lane_link_id check.")
 
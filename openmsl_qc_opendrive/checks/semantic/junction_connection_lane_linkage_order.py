@@ -10,48 +10,61 @@ from enum import Enum
 from qc_baselib import IssueSeverity
 
 from openmsl_qc_opendrive import constants
-from qc_opendrive.base.utils import *
+from openmsl_qc_opendrive.base import tables
+from openmsl_qc_opendrive.base.utils import *
 
 CHECKER_ID = "check_openmsl_xodr_junction_connection_lane_linkage_order"
 CHECKER_DESCRIPTION = "Lane Links of Junction Connections should be ordered from left to right"
 CHECKER_PRECONDITIONS = set()
 RULE_UID = "openmsl.net:xodr:1.4.0:road.semantic.junction_connection_lane_linkage_order"
+REQUIRED_SUBTREES = set()
+
+# laneFrom value that does not start an order comparison
+INVALID_LANE_FROM = 999
+
 
 def _check_all_junctions(checker_data: models.CheckerData) -> None:
-    invalid = 999
-    junctions = get_junctions(checker_data.input_file_xml_root)
-    for junction in junctions:
-        junctionID = junction.attrib["id"]
-        connections = get_connections_from_junction(junction)
-        for connection in connections:
-            lastFrom = invalid
-            connectionID = connection.attrib["id"]
-            laneLinks = get_lane_links_from_connection(connection)
-            issue_descriptions = []
-            for laneLink in laneLinks:
-                laneFrom = get_from_attribute_from_lane_link(laneLink)
-                if lastFrom != invalid and laneFrom >= lastFrom:
-                    issue_descriptions.append(f"junction {junctionID} Connection {connectionID} has invalid lane order for laneFrom: {laneFrom}")
-                    break
-                lastFrom = laneFrom
-
-            for description in issue_descriptions:
-                # register issues
-                issue_id = checker_data.result.register_issue(
-                    checker_bundle_name=constants.BUNDLE_NAME,
-                    checker_id=CHECKER_ID,
-                    description=description,
-                    level=IssueSeverity.WARNING,
-                    rule_uid=RULE_UID,
-                )
-                # add xml location
-                checker_data.result.add_xml_location(
-                    checker_bundle_name=constants.BUNDLE_NAME,
-                    checker_id=CHECKER_ID,
-                    issue_id=issue_id,
-                    xpath=checker_data.input_file_xml_root.getpath(laneLink),
-                    description=description,
-                )
+    connections, lane_links = tables.get_junction_tables(
+        checker_data.input_file_xml_root
+    )
+    if len(lane_links) == 0:
+        return
+
+    # laneFrom shall decrease within each connection
+    laneFrom = lane_links.from_lane
+    same_connection = np.r_[
+        False, lane_links.connection[1:] == lane_links.connection[:-1]
+    ]
+    lastFrom = np.r_[np.nan, laneFrom[:-1]]
+    out_of_order = np.flatnonzero(
+        same_connection & (lastFrom != INVALID_LANE_FROM) & (laneFrom >= lastFrom)
+    )
+
+    # only the first laneLink out of order is reported per connection
+    _, first = np.unique(lane_links.connection[out_of_order], return_index=True)
+
+    for i in out_of_order[first]:
+        laneLink = lane_links.elements[i]
+        junctionID = connections.junctions[lane_links.junction[i]].attrib["id"]
+        connectionID = connections.elements[lane_links.connection[i]].attrib["id"]
+        description = f"junction {junctionID} Connection {connectionID} has invalid lane order for laneFrom: {int(laneFrom[i])}"
+
+        # register issues
+        issue_id = checker_data.result.register_issue(
+            checker_bundle_name=constants.BUNDLE_NAME,
+            checker_id=CHECKER_ID,
+            description=description,
+            level=IssueSeverity.WARNING,
+            rule_uid=RULE_UID,
+        )
+        # add xml location
+        checker_data.result.add_xml_location(
+            checker_bundle_name=constants.BUNDLE_NAME,
+            checker_id=CHECKER_ID,
+            issue_id=issue_id,
+            xpath=checker_data.input_file_xml_root.getpath(laneLink),
+            description=description,
+        )
 
 
 def check_rule(checker_data: models.CheckerData) -> None:
@@ -65,7 +78,8 @@ def check_rule(checker_data: models.CheckerData) -> None:
     Version range: [1.4.0, )
 
     Remark:
-        TODO
+        The laneLinks of all junctions are read into one table and each
+        laneFrom is compared with its predecessor in the same connection.
     """
     logging.info("Executing road.semantic.junction_connection_lane_linkage_order check.")
 
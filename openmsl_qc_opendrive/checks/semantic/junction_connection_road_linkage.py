@@ -10,12 +10,14 @@ from lxml import etree
 from qc_baselib import IssueSeverity
 
 from openmsl_qc_opendrive import constants
-from qc_opendrive.base.utils import *
+from openmsl_qc_opendrive.base import visitor
+from openmsl_qc_opendrive.base.utils import *
 
 CHECKER_ID = "check_openmsl_xodr_junction_connection_road_linkage"
 CHECKER_DESCRIPTION = "Connection Roads need Predecessor and Successor. Connection Roads should be registered in Connection"
 CHECKER_PRECONDITIONS = set()
 RULE_UID = "openmsl.net:xodr:1.4.0:road.semantic.junction_connection_road_linkage"
+REQUIRED_SUBTREES = set()
 
 def registerIssue(checker_data: models.CheckerData, description : str, treeElement: etree._ElementTree) -> None:
     issue_id = checker_data.result.register_issue(
@@ -35,50 +37,68 @@ def registerIssue(checker_data: models.CheckerData, description : str, treeEleme
         description=description,
     )
 
-def _check_all_junctions(checker_data: models.CheckerData) -> None:
-    roads = get_road_id_map(checker_data.input_file_xml_root)
-    junctions = get_junctions(checker_data.input_file_xml_root)
-
-    for junction in junctions:
-        junctionID = junction.attrib["id"]
-        connections = get_connections_from_junction(junction)
-
-        connectionRoads = []
-        for connection in connections:
-            connectingRoadId = get_connecting_road_id_from_connection(connection)
-            if connectingRoadId is None:                    # direct junctions have no connection roads
-                continue                                        
-
-            if connectingRoadId not in connectionRoads:
-                connectionRoads.append(connectingRoadId)
-
-            connectingRoad = roads.get(connectingRoadId)
-            if connectingRoad is None:
-                continue                            # checked by schema
-
-            predecessorId = get_predecessor_road_id(connectingRoad)
-            predecessor = roads.get(predecessorId)
-            successorId = get_successor_road_id(connectingRoad)
-            successor = roads.get(successorId)
-            if predecessor is None or successor is None:
-                registerIssue(checker_data, f"connectingRoad {connectingRoadId} of junction {junctionID} has no predecessor or successor!", connection)
-
-        searchString = "./road[@junction='" + junctionID + "']"
-        for road in checker_data.input_file_xml_root.findall(searchString):
-            roadID = to_int(road.attrib['id'])
-            if roadID not in connectionRoads:
-                # check if road has driving lanes - if not it does not need a connection entry
-                foundDrivingLane = False
-                laneSection_list = get_lane_sections(road)
-                for laneSection in laneSection_list:
-                    lane_list = get_left_and_right_lanes_from_lane_section(laneSection)
-                    for lane in lane_list:
-                        laneType = get_type_from_lane(lane)
-                        if laneType == "driving":
-                            foundDrivingLane = True
-
-                if foundDrivingLane:
-                    registerIssue(checker_data, f"road {roadID} belongs to junction {junctionID}, but no connection for this road exists!", road)
+
+def _check_junction(
+    junction: etree._Element,
+    checker_data: models.CheckerData,
+    roads: Dict[int, etree._Element],
+) -> None:
+    junctionID = junction.attrib["id"]
+    connections = get_connections_from_junction(junction)
+
+    connectionRoads = []
+    for connection in connections:
+        connectingRoadId = get_connecting_road_id_from_connection(connection)
+        if connectingRoadId is None:  # direct junctions have no connection roads
+            continue
+
+        if connectingRoadId not in connectionRoads:
+            connectionRoads.append(connectingRoadId)
+
+        connectingRoad = roads.get(connectingRoadId)
+        if connectingRoad is None:
+            continue  # checked by schema
+
+        predecessorId = get_predecessor_road_id(connectingRoad)
+        predecessor = roads.get(predecessorId)
+        successorId = get_successor_road_id(connectingRoad)
+        successor = roads.get(successorId)
+        if predecessor is None or successor is None:
+            registerIssue(
+                checker_data,
+                f"connectingRoad {connectingRoadId} of junction {junctionID} has no predecessor or successor!",
+                connection,
+            )
+
+    searchString = "./road[@junction='" + junctionID + "']"
+    for road in checker_data.input_file_xml_root.findall(searchString):
+        roadID = to_int(road.attrib["id"])
+        if roadID not in connectionRoads:
+            # check if road has driving lanes - if not it does not need a connection entry
+            foundDrivingLane = False
+            laneSection_list = get_lane_sections(road)
+            for laneSection in laneSection_list:
+                lane_list = get_left_and_right_lanes_from_lane_section(laneSection)
+                for lane in lane_list:
+                    laneType = get_type_from_lane(lane)
+                    if laneType == "driving":
+                        foundDrivingLane = True
+
+            if foundDrivingLane:
+                registerIssue(
+                    checker_data,
+                    f"road {roadID} belongs to junction {junctionID}, but no connection for this road exists!",
+                    road,
+                )
+
+
+def register_visits(network_visitor: visitor.NetworkVisitor) -> None:
+    roads = get_road_id_map(network_visitor.checker_data.input_file_xml_root)
+    network_visitor.register(
+        CHECKER_ID,
+        visitor.JUNCTION,
+        lambda junction, checker_data: _check_junction(junction, checker_data, roads),
+    )
 
 
 def check_rule(checker_data: models.CheckerData) -> None:
@@ -96,4 +116,4 @@ def check_rule(checker_data: models.CheckerData) -> None:
     """
     logging.info("Executing road.semantic.junction_connection_road_linkage check.")
 
-    _check_all_junctions(checker_data)
+    visitor.visit(checker_data, CHECKER_ID, register_visits)
@@ -10,12 +10,14 @@ from lxml import etree
 from qc_baselib import IssueSeverity
 
 from openmsl_qc_opendrive import constants
-from qc_opendrive.base.utils import *
+from openmsl_qc_opendrive.base import tables
+from openmsl_qc_opendrive.base.utils import *
 
 CHECKER_ID = "check_openmsl_xodr_junction_driving_lanes_continue"
 CHECKER_DESCRIPTION = "check road lane links of juction connection - each driving lane of the incoming roads must have a connection in the junction"
 CHECKER_PRECONDITIONS = set()
 RULE_UID = "openmsl.net:xodr:1.4.0:road.semantic.junction_driving_lanes_continue"
+REQUIRED_SUBTREES = set()
 
 def registerIssue(checker_data: models.CheckerData, description : str, treeElement: etree._ElementTree) -> None:
     issue_id = checker_data.result.register_issue(
@@ -35,7 +37,24 @@ def registerIssue(checker_data: models.CheckerData, description : str, treeEleme
         description=description,
     )
 
-def getDrivingLanesTowardsJunction(road: etree._Element, junctionID: int):
+
+# TODO more lanetypes? .... use config file
+DRIVING_LANE_TYPES = ["driving", "entry", "exit", "onRamp", "offRamp", "connectionRamp"]
+
+
+def getDrivingLanesTowardsJunction(
+    road: etree._Element,
+    junctionID: int,
+    first_lanes: np.ndarray,
+    last_lanes: np.ndarray,
+    lanes: models.LaneTable,
+    is_driving: np.ndarray,
+):
+    """
+    Returns the lane table rows of the driving lanes of road that lead into
+    the junction. first_lanes and last_lanes are the rows of the lanes of
+    the first and last laneSection of the road.
+    """
     drivingLanes = list()
     rule = get_traffic_hand_rule_from_road(road)
 
@@ -45,71 +64,114 @@ def getDrivingLanesTowardsJunction(road: etree._Element, junctionID: int):
     foundLinkedRoad = False
     if predecessor is not None and predecessor == junctionID:
         foundLinkedRoad = True
-        laneSection = get_first_lane_section(road)
-        if rule == models.TrafficHandRule.LHT:
-            lanes = get_right_lanes_from_lane_section(laneSection)
-        else:
-            lanes = get_left_lanes_from_lane_section(laneSection)
-        for lane in lanes:
-            laneType = lane.attrib['type']
-            if (laneType == "driving" or laneType == "entry" or laneType == "exit" or laneType == "onRamp" or laneType == "offRamp" or 
-                laneType == "connectionRamp"):            # TODO more lanetypes? .... use config file
-                drivingLanes.append(lane.attrib['id'])
+        side = -1 if rule == models.TrafficHandRule.LHT else 1
+        drivingLanes.append(
+            first_lanes[is_driving[first_lanes] & (lanes.side[first_lanes] == side)]
+        )
     if successor is not None and successor == junctionID:
         foundLinkedRoad = True
-        laneSection = get_last_lane_section(road)
-        if rule == models.TrafficHandRule.LHT:
-            lanes = get_left_lanes_from_lane_section(laneSection)
-        else:
-            lanes = get_right_lanes_from_lane_section(laneSection)
-        for lane in lanes:
-            laneType = lane.attrib['type']
-            if (laneType == "driving" or laneType == "entry" or laneType == "exit" or laneType == "onRamp" or laneType == "offRamp" or 
-                laneType == "connectionRamp"):            # TODO more lanetypes? .... use config file
-                drivingLanes.append(lane.attrib['id'])
-
-    return drivingLanes, foundLinkedRoad  
+        side = 1 if rule == models.TrafficHandRule.LHT else -1
+        drivingLanes.append(
+            last_lanes[is_driving[last_lanes] & (lanes.side[last_lanes] == side)]
+        )
+
+    return np.concatenate(drivingLanes + [np.zeros(0, dtype=np.int64)]), foundLinkedRoad
+
 
 def _check_all_junctions(checker_data: models.CheckerData) -> None:
-    roads = get_road_id_map(checker_data.input_file_xml_root)
-    junctions = get_junctions(checker_data.input_file_xml_root)
+    root = checker_data.input_file_xml_root
+    connections, lane_links = tables.get_junction_tables(root)
+    lane_sections, lanes = tables.get_lane_tables(root)
+    is_driving = np.isin(
+        lanes.lane_type,
+        [
+            code
+            for code, laneType in enumerate(lanes.lane_types)
+            if laneType in DRIVING_LANE_TYPES
+        ],
+    )
+
+    # rows of the lanes of each laneSection, lanes are ordered by laneSection
+    lane_starts = np.searchsorted(
+        lanes.lane_section, np.arange(len(lane_sections)), side="left"
+    )
+    lane_ends = np.searchsorted(
+        lanes.lane_section, np.arange(len(lane_sections)), side="right"
+    )
+    first_lane_section = {}
+    last_lane_section = {}
+    for row, road in enumerate(lane_sections.road):
+        first_lane_section.setdefault(road, row)
+        last_lane_section[road] = row
+
+    def get_lane_rows(lane_section: Optional[int]) -> np.ndarray:
+        if lane_section is None:
+            return np.zeros(0, dtype=np.int64)
+        return np.arange(lane_starts[lane_section], lane_ends[lane_section])
+
+    # all roads that lead into each junction in order of their first connection
+    road_count = len(connections.roads) + 1
+    connection_keys = connections.junction * road_count + connections.incoming_road + 1
+    valid = connections.incoming_road >= 0  # others are checked by schema
+    _, first = np.unique(connection_keys[valid], return_index=True)
+    incoming = np.flatnonzero(valid)[first[np.argsort(first)]]
+
+    # driving lanes of the incoming roads towards the junction
+    pair_lanes = []
+    for row in incoming:
+        junction = connections.junctions[connections.junction[row]]
+        road_index = connections.incoming_road[row]
+        drivingLanes, foundLinkedRoad = getDrivingLanesTowardsJunction(
+            connections.roads[road_index],
+            to_int(junction.attrib["id"]),
+            get_lane_rows(first_lane_section.get(road_index)),
+            get_lane_rows(last_lane_section.get(road_index)),
+            lanes,
+            is_driving,
+        )
+        pair_lanes.append((row, drivingLanes, foundLinkedRoad))
+
+    # set difference of the driving lanes and the linked lanes per junction and
+    # incoming road
+    driving_rows = np.concatenate(
+        [rows for _, rows, _ in pair_lanes] + [np.zeros(0, dtype=np.int64)]
+    )
+    driving_keys = np.repeat(
+        np.array([connection_keys[row] for row, _, _ in pair_lanes], dtype=np.int64),
+        [len(rows) for _, rows, _ in pair_lanes],
+    )
+    linked = tables.isin_pairs(
+        driving_keys,
+        lanes.id[driving_rows],
+        connection_keys[lane_links.connection],
+        lane_links.from_lane,
+    )
+
+    position = 0
+    for row, drivingLanes, foundLinkedRoad in pair_lanes:
+        pair_linked = linked[position : position + len(drivingLanes)]
+        position += len(drivingLanes)
+        if not foundLinkedRoad:
+            continue  # checked by schema
 
-    for junction in junctions:
+        junction = connections.junctions[connections.junction[row]]
         junctionID = to_int(junction.attrib["id"])
+        incomingRoadID = get_incoming_road_id_from_connection(connections.elements[row])
+        if len(drivingLanes) == 0:
+            registerIssue(
+                checker_data,
+                f"junction {junctionID} has linked road {incomingRoadID} without driving lanes towards junction",
+                junction,
+            )
+            continue
+
+        for drivingLane in drivingLanes[~pair_linked]:
+            registerIssue(
+                checker_data,
+                f"junction {junctionID} has no connection to driving lane {lanes.elements[drivingLane].attrib['id']} of road {incomingRoadID}",
+                junction,
+            )
 
-        # get all roads that lead into the junction and their linked lanes
-        incomingRoadDict = {}
-        connections = get_connections_from_junction(junction)
-        for connection in connections:
-            incomingRoadID = get_incoming_road_id_from_connection(connection)
-            laneLinks = get_lane_links_from_connection(connection)
-            if incomingRoadID in incomingRoadDict:
-                for lanelink in laneLinks:
-                    incomingRoadDict[incomingRoadID].add(lanelink.attrib['from'])
-            else:
-                newLinkedLanes = set()
-                for lanelink in laneLinks:
-                    newLinkedLanes.add(lanelink.attrib['from'])
-                incomingRoadDict[incomingRoadID] = newLinkedLanes
-
-        for incomingRoadID, linkedLanes in incomingRoadDict.items():
-            # find incoming road
-            road = roads.get(incomingRoadID)
-            if road is None:
-                continue                            # checked by schema
-
-            # get driving lanes of incoming road and check if all are linked
-            drivingLanes, foundLinkedRoad = getDrivingLanesTowardsJunction(road, junctionID)
-            if not foundLinkedRoad:
-                continue                            # checked by schema
-
-            if len(drivingLanes) == 0:
-                registerIssue(checker_data, f"junction {junctionID} has linked road {incomingRoadID} without driving lanes towards junction", junction)
-                continue
-
-            for drivingLane in drivingLanes:
-                if drivingLane not in linkedLanes:
-                    registerIssue(checker_data, f"junction {junctionID} has no connection to driving lane {drivingLane} of road {incomingRoadID}", junction)
 
 def check_rule(checker_data: models.CheckerData) -> None:
     """
@@ -122,7 +184,9 @@ def check_rule(checker_data: models.CheckerData) -> None:
     Version range: [1.4.0, )
 
     Remark:
-        TODO
+        The connections and laneLinks of all junctions are read into tables.
+        The driving lanes of each incoming road are compared with the linked
+        lanes of all its connections in one set difference.
     """
     logging.info("Executing road.semantic.junction_driving_lanes_continue check.")
 
@@ -10,34 +10,40 @@ from qc_baselib import IssueSeverity
 from lxml import etree
 
 from openmsl_qc_opendrive import constants
-from qc_opendrive.base.utils import *
+from openmsl_qc_opendrive.base import tables
+from openmsl_qc_opendrive.base.utils import *
 
 CHECKER_ID = "check_openmsl_xodr_road_lane_id_order"
 CHECKER_DESCRIPTION = "lane order should be continuous and without gaps"
 CHECKER_PRECONDITIONS = set()
 RULE_UID = "openmsl.net:xodr:1.4.0:road.semantic.road_lane_id_order"
+REQUIRED_SUBTREES = set()
+
+
+def _check_all_roads(checker_data: models.CheckerData) -> None:
+    lane_sections, lanes = tables.get_lane_tables(checker_data.input_file_xml_root)
+    if len(lanes) == 0:
+        return
+
+    # lanes of one laneSection side are consecutive rows, left lanes are
+    # numbered from their count down to 1, right lanes from -1 downwards
+    side_group = lanes.lane_section * 2 + (lanes.side < 0)
+    group_starts = np.flatnonzero(np.r_[True, side_group[1:] != side_group[:-1]])
+    group_counts = np.diff(np.r_[group_starts, len(lanes)])
+    position = np.arange(len(lanes)) - np.repeat(group_starts, group_counts)
+    count = np.repeat(group_counts, group_counts)
+    expected_id = np.where(lanes.side > 0, count - position, -1 - position)
+    # all issues of a side are reported at its last lane
+    last_lane = np.repeat(group_starts + group_counts - 1, group_counts)
+
+    for i in np.flatnonzero(np.isfinite(lanes.id) & (lanes.id != expected_id)):
+        road = lane_sections.roads[lanes.road[i]]
+        roadID = road.attrib["id"]
+        s_coordinate = lane_sections.s[lanes.lane_section[i]]
+        s_coordinate = None if np.isnan(s_coordinate) else float(s_coordinate)
+        laneID = int(lanes.id[i])
+        description = f"road {roadID} laneSection s={s_coordinate} lane {laneID} has invalid order - should be {int(expected_id[i])}"
 
-# check lane order of one lane section side
-def check_LaneID_Order(road: etree._ElementTree, laneSection: etree._ElementTree, side: str, checker_data: models.CheckerData) -> None:
-    # get lanes and starting lane id
-    if side == "left": 
-        lanes = get_left_lanes_from_lane_section(laneSection)
-        startLaneID = len(lanes)
-    elif side == "right":
-        lanes = get_right_lanes_from_lane_section(laneSection)
-        startLaneID = -1
-
-    # check lane ids
-    s_coordinate = get_s_from_lane_section(laneSection)
-    roadID = road.attrib["id"]       
-    issue_descriptions = []
-    for lane in lanes:
-        laneID = int(lane.attrib["id"])
-        if startLaneID != laneID:
-            issue_descriptions.append(f"road {roadID} laneSection s={s_coordinate} lane {laneID} has invalid order - should be {startLaneID}")
-        startLaneID -= 1
-
-    for description in issue_descriptions:
         # register issues
         issue_id = checker_data.result.register_issue(
             checker_bundle_name=constants.BUNDLE_NAME,
@@ -51,7 +57,9 @@ def check_LaneID_Order(road: etree._ElementTree, laneSection: etree._ElementTree
             checker_bundle_name=constants.BUNDLE_NAME,
             checker_id=CHECKER_ID,
             issue_id=issue_id,
-            xpath=checker_data.input_file_xml_root.getpath(lane),
+            xpath=checker_data.input_file_xml_root.getpath(
+                lanes.elements[last_lane[i]]
+            ),
             description=description,
         )
 
@@ -69,16 +77,8 @@ def check_LaneID_Order(road: etree._ElementTree, laneSection: etree._ElementTree
                 y=inertial_point.y,
                 z=inertial_point.z,
                 description=description,
-            )        
-
-def _check_all_roads(checker_data: models.CheckerData) -> None:
-    roads = get_roads(checker_data.input_file_xml_root)
+            )
 
-    for road in roads:
-        laneSections = get_lane_sections(road)
-        for laneSection in laneSections:
-            check_LaneID_Order(road, laneSection, "left", checker_data)
-            check_LaneID_Order(road, laneSection, "right", checker_data)
 
 def check_rule(checker_data: models.CheckerData) -> None:
     """
@@ -91,7 +91,9 @@ def check_rule(checker_data: models.CheckerData) -> None:
     Version range: [1.4.0, )
 
     Remark:
-        TODO
+        The lanes of all laneSections are read into one table, the expected
+        id of each lane follows from its position within its laneSection
+        side.
     """
     logging.info("Executing road.semantic.road_lane_id_order check.")
 
@@ -10,12 +10,14 @@ from qc_baselib import IssueSeverity
 from lxml import etree
 
 from openmsl_qc_opendrive import constants
-from qc_opendrive.base.utils import *
+from openmsl_qc_opendrive.base import visitor
+from openmsl_qc_opendrive.base.utils import *
 
 CHECKER_ID = "check_openmsl_xodr_road_lane_property_sOffset"
 CHECKER_DESCRIPTION = "lane sOffsets must be ascending, should not exceed the length of road and must be zero for first element of width/border"
 CHECKER_PRECONDITIONS = set()
 RULE_UID = "openmsl.net:xodr:1.4.0:road.semantic.road_lane_property_sOffset"
+REQUIRED_SUBTREES = {"roadMark"}
 
 LENGTH_EPSILON = 0.0000001
 
@@ -86,15 +88,17 @@ def checkLaneSOffsets(road: etree._Element, laneSection: models.LaneSectionWithL
          checkLanePropSOffsets(road, lane, laneSection, "roadMark", checker_data)
          checkLanePropSOffsets(road, lane, laneSection, "rule", checker_data)
 
-def _check_all_roads(checker_data: models.CheckerData) -> None:
-    roads = get_roads(checker_data.input_file_xml_root)
+def _check_road(road: etree._Element, checker_data: models.CheckerData) -> None:
+    laneSections = get_sorted_lane_sections_with_length_from_road(road)
+    for laneSection in laneSections:
+        checkLaneSOffsets(road, laneSection, "left", checker_data)
+        checkLaneSOffsets(road, laneSection, "right", checker_data)
+        checkLaneSOffsets(road, laneSection, "center", checker_data)
+
+
+def register_visits(network_visitor: visitor.NetworkVisitor) -> None:
+    network_visitor.register(CHECKER_ID, visitor.ROAD, _check_road)
 
-    for road in roads:
-        laneSections = get_sorted_lane_sections_with_length_from_road(road)
-        for laneSection in laneSections:
-            checkLaneSOffsets(road, laneSection, "left", checker_data)
-            checkLaneSOffsets(road, laneSection, "right", checker_data)
-            checkLaneSOffsets(road, laneSection, "center", checker_data)
 
 def check_rule(checker_data: models.CheckerData) -> None:
     """
@@ -111,4 +115,4 @@ def check_rule(checker_data: models.CheckerData) -> None:
     """
     logging.info("Executing road.semantic.road_lane_property_sOffset check.")
 
-    _check_all_roads(checker_data)
+    visitor.visit(checker_data, CHECKER_ID, register_visits)
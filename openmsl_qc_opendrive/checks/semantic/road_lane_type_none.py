@@ -9,63 +9,65 @@ import logging
 from qc_baselib import IssueSeverity
 
 from openmsl_qc_opendrive import constants
-from qc_opendrive.base.utils import *
+from openmsl_qc_opendrive.base import tables
+from openmsl_qc_opendrive.base.utils import *
 
 CHECKER_ID = "check_openmsl_xodr_road_lane_type_none"
 CHECKER_DESCRIPTION = "Lane Type shall not be None"
 CHECKER_PRECONDITIONS = set()
 RULE_UID = "openmsl.net:xodr:1.4.0:road.semantic.lane_type.none"
+REQUIRED_SUBTREES = set()
 
-def _check_all_roads(checker_data: models.CheckerData) -> None:
-    roads = get_roads(checker_data.input_file_xml_root)
 
-    for road in roads:
+def _check_all_roads(checker_data: models.CheckerData) -> None:
+    lane_sections, lanes = tables.get_lane_tables(checker_data.input_file_xml_root)
+    if "none" not in lanes.lane_types:
+        return
+
+    for i in np.flatnonzero(lanes.lane_type == lanes.lane_types.index("none")):
+        lane = lanes.elements[i]
+        laneSection = lane_sections.elements[lanes.lane_section[i]]
+        road = lane_sections.roads[lanes.road[i]]
         roadID = road.attrib["id"]
-
-        laneSection_list = get_lane_sections(road)
-        for laneSection in laneSection_list:
-            s_coordinate = get_s_from_lane_section(laneSection)
-
-            lane_list = get_left_and_right_lanes_from_lane_section(laneSection)
-            for lane in lane_list:
-                laneType = get_type_from_lane(lane)
-                if laneType != "none":
-                    continue               
-
-                # register issue
-                laneID = lane.attrib["id"]
-                description = f"road {roadID} has invalid lanetype {laneType} in laneSection s={s_coordinate} lane={str(laneID)}"                    
-                issue_id = checker_data.result.register_issue(
-                    checker_bundle_name=constants.BUNDLE_NAME,
-                    checker_id=CHECKER_ID,
-                    description=description,
-                    level=IssueSeverity.WARNING,
-                    rule_uid=RULE_UID,
-                )
-                # add xml location
-                checker_data.result.add_xml_location(
-                    checker_bundle_name=constants.BUNDLE_NAME,
-                    checker_id=CHECKER_ID,
-                    issue_id=issue_id,
-                    xpath=checker_data.input_file_xml_root.getpath(lane),
-                    description=description,
-                )
-
-                if s_coordinate is None:
-                    continue
-
-                # add 3d point
-                inertial_point = get_middle_point_xyz_at_height_zero_from_lane_by_s(road, laneSection, lane, s_coordinate)
-                if inertial_point is not None:
-                    checker_data.result.add_inertial_location(
-                        checker_bundle_name=constants.BUNDLE_NAME,
-                        checker_id=CHECKER_ID,
-                        issue_id=issue_id,
-                        x=inertial_point.x,
-                        y=inertial_point.y,
-                        z=inertial_point.z,
-                        description=description,
-                    )
+        laneType = get_type_from_lane(lane)
+        s_coordinate = get_s_from_lane_section(laneSection)
+
+        # register issue
+        laneID = lane.attrib["id"]
+        description = f"road {roadID} has invalid lanetype {laneType} in laneSection s={s_coordinate} lane={str(laneID)}"
+        issue_id = checker_data.result.register_issue(
+            checker_bundle_name=constants.BUNDLE_NAME,
+            checker_id=CHECKER_ID,
+            description=description,
+            level=IssueSeverity.WARNING,
+            rule_uid=RULE_UID,
+        )
+        # add xml location
+        checker_data.result.add_xml_location(
+            checker_bundle_name=constants.BUNDLE_NAME,
+            checker_id=CHECKER_ID,
+            issue_id=issue_id,
+            xpath=checker_data.input_file_xml_root.getpath(lane),
+            description=description,
+        )
+
+        if s_coordinate is None:
+            continue
+
+        # add 3d point
+        inertial_point = get_middle_point_xyz_at_height_zero_from_lane_by_s(
+            road, laneSection, lane, s_coordinate
+        )
+        if inertial_point is not None:
+            checker_data.result.add_inertial_location(
+                checker_bundle_name=constants.BUNDLE_NAME,
+                checker_id=CHECKER_ID,
+                issue_id=issue_id,
+                x=inertial_point.x,
+                y=inertial_point.y,
+                z=inertial_point.z,
+                description=description,
+            )
 
 
 def check_rule(checker_data: models.CheckerData) -> None:
@@ -79,7 +81,8 @@ def check_rule(checker_data: models.CheckerData) -> None:
     Version range: [1.4.0, )
 
     Remark:
-        TODO
+        The lane types of all lanes are read into one table and compared
+        as codes.
     """
     logging.info("Executing road.semantic.lane_type.none check.")
 
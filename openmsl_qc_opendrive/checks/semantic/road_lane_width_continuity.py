@@ -0,0 +1,100 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import logging
+
+from qc_baselib import IssueSeverity
+
+from openmsl_qc_opendrive import constants
+from openmsl_qc_opendrive.base import lane_widths, visitor
+from openmsl_qc_opendrive.base.utils import *
+
+CHECKER_ID = "check_openmsl_xodr_road_lane_width_continuity"
+CHECKER_DESCRIPTION = (
+    "Width of linked lanes shall be continuous across lane sections and roads"
+)
+CHECKER_PRECONDITIONS = set()
+RULE_UID = "openmsl.net:xodr:1.4.0:road.semantic.road_lane_width_continuity"
+REQUIRED_SUBTREES = set()
+
+# Default maximum width jump, overridden by the checker param widthTolerance
+WIDTH_TOLERANCE = 0.01
+
+
+def _check_road(road: etree._Element, checker_data: models.CheckerData) -> None:
+    roadID = road.attrib["id"]
+
+    width_tolerance = get_checker_float_param(
+        checker_data, CHECKER_ID, "widthTolerance", WIDTH_TOLERANCE
+    )
+
+    for transition in lane_widths.get_lane_width_transitions(road):
+        width_jump = transition.linked_width - transition.width
+        if not abs(width_jump) > width_tolerance:
+            continue
+
+        laneID = get_lane_id(transition.lane)
+        linkedRoadID = transition.linked_road.get("id")
+        linkedLaneIDs = ", ".join(
+            str(get_lane_id(lane)) for lane in transition.linked_lanes
+        )
+        description = f"road {roadID} lane {laneID} has width {transition.width:.6f} at s={transition.s}, but linked lanes {linkedLaneIDs} of road {linkedRoadID} have width {transition.linked_width:.6f} at s={transition.linked_s}"
+
+        # register issue
+        issue_id = checker_data.result.register_issue(
+            checker_bundle_name=constants.BUNDLE_NAME,
+            checker_id=CHECKER_ID,
+            description=description,
+            level=IssueSeverity.WARNING,
+            rule_uid=RULE_UID,
+        )
+        # add xml location
+        for lane in [transition.lane] + transition.linked_lanes:
+            checker_data.result.add_xml_location(
+                checker_bundle_name=constants.BUNDLE_NAME,
+                checker_id=CHECKER_ID,
+                issue_id=issue_id,
+                xpath=checker_data.input_file_xml_root.getpath(lane),
+                description=description,
+            )
+
+        # add 3d point
+        inertial_point = get_point_xyz_from_road_reference_line(road, transition.s)
+        if inertial_point is not None:
+            checker_data.result.add_inertial_location(
+                checker_bundle_name=constants.BUNDLE_NAME,
+                checker_id=CHECKER_ID,
+                issue_id=issue_id,
+                x=inertial_point.x,
+                y=inertial_point.y,
+                z=inertial_point.z,
+                description=description,
+            )
+
+
+def register_visits(network_visitor: visitor.NetworkVisitor) -> None:
+    network_visitor.register(CHECKER_ID, visitor.ROAD, _check_road)
+
+
+def check_rule(checker_data: models.CheckerData) -> None:
+    """
+    Rule ID: openmsl.net:xodr:1.4.0:road.semantic.road_lane_width_continuity
+
+    Description: Width of linked lanes shall be continuous across lane sections and roads.
+
+    Severity: WARNING
+
+    Version range: [1.4.0, )
+
+    Remark:
+        Lanes are paired through their predecessor and successor links, within
+        the road and over road links. The widths of all pairs are evaluated in
+        one batch. The maximum width jump is set with the checker param
+        widthTolerance [m].
+    """
+    logging.info("Executing road.semantic.road_lane_width_continuity check.")
+
+    visitor.visit(checker_data, CHECKER_ID, register_visits)
@@ -9,49 +9,60 @@ import logging
 from qc_baselib import IssueSeverity
 
 from openmsl_qc_opendrive import constants
-from qc_opendrive.base.utils import *
+from openmsl_qc_opendrive.base import tables
+from openmsl_qc_opendrive.base.utils import *
 
 CHECKER_ID = "check_openmsl_xodr_road_lanesection_s"
 CHECKER_DESCRIPTION = "Check starting sOffset of lanesections"
 CHECKER_PRECONDITIONS = set()
 RULE_UID = "openmsl.net:xodr:1.4.0:road.semantic.lanesection_s"
+REQUIRED_SUBTREES = set()
+
 
 def _check_all_roads(checker_data: models.CheckerData) -> None:
-    roads = get_roads(checker_data.input_file_xml_root)
+    lane_sections, _ = tables.get_lane_tables(checker_data.input_file_xml_root)
+    if len(lane_sections) == 0:
+        return
+
+    s = lane_sections.s
+    road_length = lane_sections.road_length[lane_sections.road]
+    is_first = np.r_[True, lane_sections.road[1:] != lane_sections.road[:-1]]
+    previous_s = np.where(is_first, -1.0, np.r_[np.nan, s[:-1]])
 
-    for road in roads:
+    # the conditions are exclusive in this order
+    too_high = s > road_length
+    first_not_zero = ~too_high & is_first & (s != 0.0)
+    not_ascending = ~too_high & ~first_not_zero & (previous_s >= s)
+
+    for i in np.flatnonzero(
+        np.isfinite(s) & (too_high | first_not_zero | not_ascending)
+    ):
+        road = lane_sections.roads[lane_sections.road[i]]
         roadID = road.attrib["id"]
-        roadLength = get_road_length(road)
-        laneSections = get_lane_sections(road)
-        prevLaneSectionStart = -1.0
-        for laneSection in laneSections:
-            s_coordinate = get_s_from_lane_section(laneSection)
-            description = ""
-            if s_coordinate > roadLength:
-                description = f"road {roadID} has laneSection with invalid (too high) s={s_coordinate} (roadLength={roadLength})"
-            elif laneSections.index(laneSection) == 0 and s_coordinate != 0.0:
-                description = f"road {roadID} has laneSection with invalid s={s_coordinate} (first laneSection needs to start at s=0.0)"
-            elif prevLaneSectionStart >= s_coordinate:
-                description = f"road {roadID} has laneSection with invalid (not ascending) s={s_coordinate}"
-            prevLaneSectionStart = s_coordinate
-
-            if description != "":
-                # register issue
-                issue_id = checker_data.result.register_issue(
-                    checker_bundle_name=constants.BUNDLE_NAME,
-                    checker_id=CHECKER_ID,
-                    description=description,
-                    level=IssueSeverity.WARNING,
-                    rule_uid=RULE_UID,
-                )
-                # add xml location
-                checker_data.result.add_xml_location(
-                    checker_bundle_name=constants.BUNDLE_NAME,
-                    checker_id=CHECKER_ID,
-                    issue_id=issue_id,
-                    xpath=checker_data.input_file_xml_root.getpath(laneSection),
-                    description=description,
-                )
+        s_coordinate = float(s[i])
+        if too_high[i]:
+            description = f"road {roadID} has laneSection with invalid (too high) s={s_coordinate} (roadLength={float(road_length[i])})"
+        elif first_not_zero[i]:
+            description = f"road {roadID} has laneSection with invalid s={s_coordinate} (first laneSection needs to start at s=0.0)"
+        else:
+            description = f"road {roadID} has laneSection with invalid (not ascending) s={s_coordinate}"
+
+        # register issue
+        issue_id = checker_data.result.register_issue(
+            checker_bundle_name=constants.BUNDLE_NAME,
+            checker_id=CHECKER_ID,
+            description=description,
+            level=IssueSeverity.WARNING,
+            rule_uid=RULE_UID,
+        )
+        # add xml location
+        checker_data.result.add_xml_location(
+            checker_bundle_name=constants.BUNDLE_NAME,
+            checker_id=CHECKER_ID,
+            issue_id=issue_id,
+            xpath=checker_data.input_file_xml_root.getpath(lane_sections.elements[i]),
+            description=description,
+        )
 
 
 def check_rule(checker_data: models.CheckerData) -> None:
@@ -65,7 +76,8 @@ def check_rule(checker_data: models.CheckerData) -> None:
     Version range: [1.4.0, )
 
     Remark:
-        TODO
+        The starts of all laneSections are read into one table and compared
+        with their predecessors and the road length as array operations.
     """
     logging.info("Executing road.semantic.lanesection_s check.")
 
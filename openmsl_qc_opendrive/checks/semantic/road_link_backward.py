@@ -9,12 +9,13 @@ import logging
 from qc_baselib import IssueSeverity
 
 from openmsl_qc_opendrive import constants
-from qc_opendrive.base.utils import *
+from openmsl_qc_opendrive.base.utils import *
 
 CHECKER_ID = "check_openmsl_xodr_road_link_backward"
 CHECKER_DESCRIPTION = "check if linked elements are also linked to original element"
 CHECKER_PRECONDITIONS = set()
 RULE_UID = "openmsl.net:xodr:1.4.0:road.semantic.road_link_backward"
+REQUIRED_SUBTREES = set()
 
 def _check_all_roads(checker_data: models.CheckerData) -> None:
     roads = get_road_id_map(checker_data.input_file_xml_root)
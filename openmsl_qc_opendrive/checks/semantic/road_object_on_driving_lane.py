@@ -0,0 +1,104 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import logging
+
+from qc_baselib import IssueSeverity
+
+from openmsl_qc_opendrive import constants
+from openmsl_qc_opendrive.base import positions
+from openmsl_qc_opendrive.base.utils import *
+
+CHECKER_ID = "check_openmsl_xodr_road_object_on_driving_lane"
+CHECKER_DESCRIPTION = (
+    "Fixed objects like poles, trees or buildings shall not be placed on driving lanes"
+)
+CHECKER_PRECONDITIONS = set()
+RULE_UID = "openmsl.net:xodr:1.4.0:road.semantic.object_on_driving_lane"
+REQUIRED_SUBTREES = {"objects"}
+
+OBSTRUCTING_OBJECT_TYPES = {
+    "barrier",
+    "building",
+    "pole",
+    "railing",
+    "soundBarrier",
+    "streetLamp",
+    "tree",
+    "vegetation",
+}
+
+
+def _check_all_roads(checker_data: models.CheckerData) -> None:
+    placements = positions.get_road_element_placements(
+        checker_data.input_file_xml_root, "object"
+    )
+
+    road_rows: Dict[etree._ElementTree, List[int]] = dict()
+    for row, (object, road) in enumerate(zip(placements.elements, placements.roads)):
+        if object.get("type") in OBSTRUCTING_OBJECT_TYPES:
+            road_rows.setdefault(road, []).append(row)
+
+    for road, rows in road_rows.items():
+        roadID = road.get("id")
+        lanes = evaluate_lanes_from_road(road, placements.s[rows], placements.t[rows])
+
+        for row, lane in zip(rows, lanes):
+            if lane is None or get_type_from_lane(lane) != "driving":
+                continue
+
+            object = placements.elements[row]
+            objectID = object.get("id")
+            laneID = get_lane_id(lane)
+            description = f"{object.get('type')} object {objectID} of road {roadID} is placed on driving lane {laneID}"
+
+            # register issue
+            issue_id = checker_data.result.register_issue(
+                checker_bundle_name=constants.BUNDLE_NAME,
+                checker_id=CHECKER_ID,
+                description=description,
+                level=IssueSeverity.WARNING,
+                rule_uid=RULE_UID,
+            )
+            # add xml location
+            checker_data.result.add_xml_location(
+                checker_bundle_name=constants.BUNDLE_NAME,
+                checker_id=CHECKER_ID,
+                issue_id=issue_id,
+                xpath=checker_data.input_file_xml_root.getpath(object),
+                description=description,
+            )
+
+            # add 3d point
+            checker_data.result.add_inertial_location(
+                checker_bundle_name=constants.BUNDLE_NAME,
+                checker_id=CHECKER_ID,
+                issue_id=issue_id,
+                x=float(placements.x[row]),
+                y=float(placements.y[row]),
+                z=float(placements.z[row]),
+                description=description,
+            )
+
+
+def check_rule(checker_data: models.CheckerData) -> None:
+    """
+    Rule ID: openmsl.net:xodr:1.4.0:road.semantic.object_on_driving_lane
+
+    Description: Fixed objects like poles, trees or buildings shall not be placed on driving lanes.
+
+    Severity: WARNING
+
+    Version range: [1.4.0, )
+
+    Remark:
+        The lane at the reference point (s, t) of the object is looked up,
+        with the lane borders of all objects of a lane section evaluated in
+        one batch.
+    """
+    logging.info("Executing road.semantic.object_on_driving_lane check.")
+
+    _check_all_roads(checker_data)
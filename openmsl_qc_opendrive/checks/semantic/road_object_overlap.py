@@ -0,0 +1,97 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import logging
+
+from qc_baselib import IssueSeverity
+
+from openmsl_qc_opendrive import constants
+from openmsl_qc_opendrive.base import positions
+from openmsl_qc_opendrive.base.utils import *
+
+CHECKER_ID = "check_openmsl_xodr_road_object_overlap"
+CHECKER_DESCRIPTION = "Objects shall not overlap each other"
+CHECKER_PRECONDITIONS = set()
+RULE_UID = "openmsl.net:xodr:1.4.0:road.semantic.object_overlap"
+REQUIRED_SUBTREES = {"objects"}
+
+# Objects on the road surface may overlap anything
+SURFACE_OBJECT_TYPES = {"crosswalk", "parkingSpace", "patch", "roadMark", "roadSurface"}
+
+
+def _check_all_roads(checker_data: models.CheckerData) -> None:
+    placements = positions.get_road_element_placements(
+        checker_data.input_file_xml_root, "object"
+    )
+    selection = np.array(
+        [
+            element.get("type") not in SURFACE_OBJECT_TYPES
+            for element in placements.elements
+        ],
+        dtype=bool,
+    )
+
+    first, second = positions.compile_overlapping_placements(placements, selection)
+    for i, j in zip(first, second):
+        object = placements.elements[i]
+        other_object = placements.elements[j]
+        objectID = object.get("id")
+        otherObjectID = other_object.get("id")
+        roadID = placements.roads[i].get("id")
+        otherRoadID = placements.roads[j].get("id")
+        description = f"object {objectID} of road {roadID} overlaps object {otherObjectID} of road {otherRoadID}"
+
+        # register issue
+        issue_id = checker_data.result.register_issue(
+            checker_bundle_name=constants.BUNDLE_NAME,
+            checker_id=CHECKER_ID,
+            description=description,
+            level=IssueSeverity.WARNING,
+            rule_uid=RULE_UID,
+        )
+        # add xml location
+        for element in (object, other_object):
+            checker_data.result.add_xml_location(
+                checker_bundle_name=constants.BUNDLE_NAME,
+                checker_id=CHECKER_ID,
+                issue_id=issue_id,
+                xpath=checker_data.input_file_xml_root.getpath(element),
+                description=description,
+            )
+
+        # add 3d point
+        checker_data.result.add_inertial_location(
+            checker_bundle_name=constants.BUNDLE_NAME,
+            checker_id=CHECKER_ID,
+            issue_id=issue_id,
+            x=float(placements.x[i]),
+            y=float(placements.y[i]),
+            z=float(placements.z[i]),
+            description=description,
+        )
+
+
+def check_rule(checker_data: models.CheckerData) -> None:
+    """
+    Rule ID: openmsl.net:xodr:1.4.0:road.semantic.object_overlap
+
+    Description: Objects shall not overlap each other.
+
+    Severity: WARNING
+
+    Version range: [1.4.0, )
+
+    Remark:
+        All objects of the network are placed in one batch per road. Their
+        footprints, rectangles of length and width or squares around the
+        radius, are inserted into a uniform grid and only objects sharing a
+        grid cell are tested exactly. Objects also have to overlap in height.
+        Objects on the road surface (crosswalk, parkingSpace, patch, roadMark,
+        roadSurface) are not checked.
+    """
+    logging.info("Executing road.semantic.object_overlap check.")
+
+    _check_all_roads(checker_data)
@@ -6,53 +6,100 @@
 
 import logging
 
+from typing import List, Tuple
 from lxml import etree
 from qc_baselib import IssueSeverity
 
 from openmsl_qc_opendrive import constants
-from qc_opendrive.base.utils import *
+from openmsl_qc_opendrive.base import tables
+from openmsl_qc_opendrive.base.utils import *
 
 CHECKER_ID = "check_openmsl_xodr_road_object_position"
 CHECKER_DESCRIPTION = "check if object position is valid - s value is in range of road length, t and zOffset in range"
 CHECKER_PRECONDITIONS = set()
 RULE_UID = "openmsl.net:xodr:1.4.0:road.semantic.object_position"
+REQUIRED_SUBTREES = {"objects"}
 
 EPSILON_S_ON_ROAD = 0.000001
 MAX_RANGE_OBJECT_T = 50
 MAX_RANGE_OBJECT_ZOFFSET = 20
 
-def check_object_postion_for_road(road: etree.Element, object: etree.Element, checker_data: models.CheckerData) -> None:
-    roadID = road.attrib["id"]
-    roadLength = get_road_length(road)
-    objectID = object.attrib["id"]
-    issue_descriptions = []
 
-    # check s position
-    objectS = to_float(object.attrib["s"])
-    if objectS - roadLength > EPSILON_S_ON_ROAD:
-        issue_descriptions.append(f"object {objectID} of road {roadID} has too high s value {objectS} (road length = {roadLength})")
-        objectS = roadLength
+def check_object_positions(
+    table: models.RoadElementTable,
+) -> Tuple[List[Tuple[int, str]], np.ndarray, np.ndarray]:
+    """
+    Returns the issues (row, description) of the object table and s, t of
+    the 3d point of each row.
+    """
+    roadLength = table.road_length[table.road]
+    is_object = table.is_tag("object")
+    is_tunnel_or_bridge = table.is_tag("tunnel") | table.is_tag("bridge")
+
+    # check s position, issues are located at the end of the road
+    s_too_high = table.s - roadLength > EPSILON_S_ON_ROAD
+    objectS = np.where(s_too_high, roadLength, table.s)
 
     # check t position
-    objectT = 0.0
-    if object.tag != "tunnel" and object.tag != "bridge":
-        objectT = to_float(object.attrib["t"]) 
-        if objectT < -MAX_RANGE_OBJECT_T or objectT > MAX_RANGE_OBJECT_T:
-            issue_descriptions.append(f"object {objectID} of road {roadID} has t value {objectT} out of range (-{MAX_RANGE_OBJECT_T}, +{MAX_RANGE_OBJECT_T})")
+    objectT = np.where(is_tunnel_or_bridge, 0.0, table.t)
+    t_out_of_range = ~is_tunnel_or_bridge & (
+        (objectT < -MAX_RANGE_OBJECT_T) | (objectT > MAX_RANGE_OBJECT_T)
+    )
 
     # check zOffset
-    if object.tag == "object":
-        objectZOffset = to_float(object.attrib["zOffset"])
-        if objectZOffset < -MAX_RANGE_OBJECT_ZOFFSET or objectZOffset > MAX_RANGE_OBJECT_ZOFFSET:
-            issue_descriptions.append(f"object {objectID} of road {roadID} has zOffset value {objectZOffset} out of range (-{MAX_RANGE_OBJECT_ZOFFSET}, +{MAX_RANGE_OBJECT_ZOFFSET})")
+    z_out_of_range = is_object & (
+        (table.z_offset < -MAX_RANGE_OBJECT_ZOFFSET)
+        | (table.z_offset > MAX_RANGE_OBJECT_ZOFFSET)
+    )
 
     # check length of tunnel, bridge
-    if object.tag == "tunnel" or object.tag == "bridge":
-        objectLength = to_float(object.attrib["length"]) 
-        if objectS  + objectLength - roadLength  > EPSILON_S_ON_ROAD:
-            issue_descriptions.append(f"{object.tag} {objectID} of road {roadID} is too long (EndS = {objectS  + objectLength}, road length = {roadLength})")
-    
-    for description in issue_descriptions:
+    objectEndS = objectS + table.length
+    too_long = is_tunnel_or_bridge & (objectEndS - roadLength > EPSILON_S_ON_ROAD)
+
+    issues = []
+    for i in np.flatnonzero(s_too_high | t_out_of_range | z_out_of_range | too_long):
+        object = table.elements[i]
+        roadID = table.roads[table.road[i]].attrib["id"]
+        objectID = object.attrib["id"]
+        issue_descriptions = []
+        if s_too_high[i]:
+            issue_descriptions.append(
+                f"object {objectID} of road {roadID} has too high s value {float(table.s[i])} (road length = {float(roadLength[i])})"
+            )
+        if t_out_of_range[i]:
+            issue_descriptions.append(
+                f"object {objectID} of road {roadID} has t value {float(objectT[i])} out of range (-{MAX_RANGE_OBJECT_T}, +{MAX_RANGE_OBJECT_T})"
+            )
+        if z_out_of_range[i]:
+            issue_descriptions.append(
+                f"object {objectID} of road {roadID} has zOffset value {float(table.z_offset[i])} out of range (-{MAX_RANGE_OBJECT_ZOFFSET}, +{MAX_RANGE_OBJECT_ZOFFSET})"
+            )
+        if too_long[i]:
+            issue_descriptions.append(
+                f"{object.tag} {objectID} of road {roadID} is too long (EndS = {float(objectEndS[i])}, road length = {float(roadLength[i])})"
+            )
+        issues += [(i, description) for description in issue_descriptions]
+
+    return issues, objectS, objectT
+
+
+def register_issues(
+    table: models.RoadElementTable,
+    issues: List[Tuple[int, str]],
+    s: np.ndarray,
+    t: np.ndarray,
+    checker_data: models.CheckerData,
+) -> None:
+    if len(issues) == 0:
+        return
+
+    # 3d points of all issues in one batch per road
+    rows = np.array([issue[0] for issue in issues])
+    inertial_points = tables.get_points_xyz_from_roads(
+        table.roads, table.road[rows], s[rows], t[rows], 0.0
+    )
+
+    for (row, description), inertial_point in zip(issues, inertial_points):
         # register issues
         issue_id = checker_data.result.register_issue(
             checker_bundle_name=constants.BUNDLE_NAME,
@@ -66,35 +113,28 @@ def check_object_postion_for_road(road: etree.Element, object: etree.Element, ch
             checker_bundle_name=constants.BUNDLE_NAME,
             checker_id=CHECKER_ID,
             issue_id=issue_id,
-            xpath=checker_data.input_file_xml_root.getpath(object),
+            xpath=checker_data.input_file_xml_root.getpath(table.elements[row]),
             description=description,
         )
 
         # add 3d point
-        inertial_point = get_point_xyz_from_road(road, objectS, objectT, 0.0)
-        if inertial_point is not None:
+        if not np.isnan(inertial_point).any():
             checker_data.result.add_inertial_location(
                 checker_bundle_name=constants.BUNDLE_NAME,
                 checker_id=CHECKER_ID,
                 issue_id=issue_id,
-                x=inertial_point.x,
-                y=inertial_point.y,
-                z=inertial_point.z,
+                x=inertial_point[0],
+                y=inertial_point[1],
+                z=inertial_point[2],
                 description=description,
-            )        
+            )
+
 
 def _check_all_roads(checker_data: models.CheckerData) -> None:
-    roads = get_roads(checker_data.input_file_xml_root)
-
-    for road in roads:
-        for object in road.findall("./objects/object"):
-            check_object_postion_for_road(road, object, checker_data)         
-        for object in road.findall("./objects/objectReference"):
-            check_object_postion_for_road(road, object, checker_data)
-        for object in road.findall("./objects/tunnel"):
-            check_object_postion_for_road(road, object, checker_data)            
-        for object in road.findall("./objects/bridge"):
-            check_object_postion_for_road(road, object, checker_data)   
+    table = tables.get_road_element_table(checker_data.input_file_xml_root, "objects")
+    issues, s, t = check_object_positions(table)
+    register_issues(table, issues, s, t, checker_data)
+
 
 def check_rule(checker_data: models.CheckerData) -> None:
     """
@@ -107,7 +147,9 @@ def check_rule(checker_data: models.CheckerData) -> None:
     Version range: [1.4.0, )
 
     Remark:
-        TODO
+        The positions of all objects, object references, tunnels and bridges
+        are read into one table and compared with the limits as array
+        operations. 3d points are only evaluated for elements with issues.
     """
     logging.info("Executing road.semantic.object_position check.")
 
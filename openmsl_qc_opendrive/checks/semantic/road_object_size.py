@@ -6,17 +6,20 @@
 
 import logging
 
+from typing import List, Tuple
 from lxml import etree
 from qc_baselib import IssueSeverity
 from semver.version import Version
 
 from openmsl_qc_opendrive import constants
-from qc_opendrive.base.utils import *
+from openmsl_qc_opendrive.base import tables
+from openmsl_qc_opendrive.base.utils import *
 
 CHECKER_ID = "check_openmsl_xodr_road_object_size"
 CHECKER_DESCRIPTION = "check if object size is valid - width and length, radius and height in range"
 CHECKER_PRECONDITIONS = set()
 RULE_UID = "openmsl.net:xodr:1.4.0:road.semantic.object_size"
+REQUIRED_SUBTREES = {"objects"}
 
 MAX_OBJECT_LENGTH = 50
 MAX_OBJECT_WIDTH = 50
@@ -27,55 +30,105 @@ MAX_OBJECT_HEIGHT = 50
 # In earlier versions (1.4, 1.5) these attributes are mandatory on every object.
 _VERSION_OUTLINE_ATTRS_OPTIONAL = Version.parse("1.6.0")
 
-def check_object_size(road: etree.Element, object: etree.Element, checker_data: models.CheckerData) -> None:
-    roadID = road.attrib["id"]
-    objectID = object.attrib["id"]
-    objectS = to_float(object.attrib["s"])
-    objectT = to_float(object.attrib["t"])
 
-    has_outline = object.find("outlines/outline") is not None
-    schema_version = Version.parse(checker_data.schema_version)
+def check_object_sizes(
+    table: models.RoadElementTable, checker_data: models.CheckerData
+) -> List[Tuple[int, str]]:
+    """
+    Returns the issues (row, description) of the objects of the table.
+    """
+    checked = table.is_tag("object")
 
     # From OpenDRIVE 1.6 onward, objects defined by an <outline> do not need
     # height/length/width on the <object> element — skip the size check.
     # In earlier versions these attributes are mandatory, so we still check.
-    if has_outline and schema_version >= _VERSION_OUTLINE_ATTRS_OPTIONAL:
-        return
+    schema_version = Version.parse(checker_data.schema_version)
+    if schema_version >= _VERSION_OUTLINE_ATTRS_OPTIONAL:
+        checked &= ~table.has_outline
 
     # check if width + length or radius is present
-    issue_descriptions = []
-    objectLengthAttrib = object.attrib.get("length")
-    objectWidthAttrib = object.attrib.get("width")
-    objectRadiusAttrib = object.attrib.get("radius")
-    if not objectLengthAttrib and not objectWidthAttrib and not objectRadiusAttrib:
-        issue_descriptions.append(f"object {objectID} of road {roadID} has no defined size. Length and width or radius must be provided")
-    elif objectRadiusAttrib and (objectLengthAttrib or objectWidthAttrib):
-        return  # checked by schema
-    elif objectRadiusAttrib:
-        objectRadius = to_float(object.attrib["radius"])
-        if objectRadius < 0.0 or objectRadius > MAX_OBJECT_RADIUS:  # TODO 3x < 0.0 check-> should be done by schema checks already, but is not done in 1.5 (and onyl in 2 cases in 1.7)
-            issue_descriptions.append(f"object {objectID} of road {roadID} has invalid radius {objectRadius} out of range (0-{MAX_OBJECT_RADIUS})")
-    else:
-        objectLength = to_float(object.attrib["length"])
-        objectWidth = to_float(object.attrib["width"])
-        if objectLength < 0.0 or objectLength > MAX_OBJECT_LENGTH:
-            issue_descriptions.append(f"object {objectID} of road {roadID} has invalid length {objectLength} out of range (0-{MAX_OBJECT_LENGTH})")
-        if objectWidth < 0.0 or objectWidth > MAX_OBJECT_WIDTH:
-            issue_descriptions.append(f"object {objectID} of road {roadID} has invalid width {objectWidth} out of range (0-{MAX_OBJECT_WIDTH})")
-
-    # check height — use safe access to prevent KeyError on outlined objects.
-    # The else branch reports missing height as an issue.  Outlined objects on
-    # OpenDRIVE >= 1.6 already early-return above, so the else only fires for
-    # objects that are expected to carry a height attribute.
-    objectHeightAttrib = object.attrib.get("height")
-    if objectHeightAttrib is not None:
-        objectHeight = to_float(objectHeightAttrib)
-        if objectHeight > MAX_OBJECT_HEIGHT:
-            issue_descriptions.append(f"object {objectID} of road {roadID} has too high height value {objectHeight} (max = {MAX_OBJECT_HEIGHT})")
-    else:
-        issue_descriptions.append(f"object {objectID} of road {roadID} has no defined height. Height must be provided")
-
-    for description in issue_descriptions:
+    has_length = ~np.isnan(table.length)
+    has_width = ~np.isnan(table.width)
+    has_radius = ~np.isnan(table.radius)
+    no_size = ~has_length & ~has_width & ~has_radius
+    checked &= ~(has_radius & (has_length | has_width))  # checked by schema
+
+    # TODO 3x < 0.0 check-> should be done by schema checks already, but is not done in 1.5 (and onyl in 2 cases in 1.7)
+    invalid_radius = has_radius & (
+        (table.radius < 0.0) | (table.radius > MAX_OBJECT_RADIUS)
+    )
+    invalid_length = ~has_radius & (
+        (table.length < 0.0) | (table.length > MAX_OBJECT_LENGTH)
+    )
+    invalid_width = ~has_radius & (
+        (table.width < 0.0) | (table.width > MAX_OBJECT_WIDTH)
+    )
+
+    # check height, a missing height is reported as an issue
+    no_height = np.isnan(table.height)
+    too_high = table.height > MAX_OBJECT_HEIGHT
+
+    issues = []
+    for i in np.flatnonzero(
+        checked
+        & (
+            no_size
+            | invalid_radius
+            | invalid_length
+            | invalid_width
+            | no_height
+            | too_high
+        )
+    ):
+        roadID = table.roads[table.road[i]].attrib["id"]
+        objectID = table.elements[i].attrib["id"]
+        issue_descriptions = []
+        if no_size[i]:
+            issue_descriptions.append(
+                f"object {objectID} of road {roadID} has no defined size. Length and width or radius must be provided"
+            )
+        if invalid_radius[i]:
+            issue_descriptions.append(
+                f"object {objectID} of road {roadID} has invalid radius {float(table.radius[i])} out of range (0-{MAX_OBJECT_RADIUS})"
+            )
+        if invalid_length[i]:
+            issue_descriptions.append(
+                f"object {objectID} of road {roadID} has invalid length {float(table.length[i])} out of range (0-{MAX_OBJECT_LENGTH})"
+            )
+        if invalid_width[i]:
+            issue_descriptions.append(
+                f"object {objectID} of road {roadID} has invalid width {float(table.width[i])} out of range (0-{MAX_OBJECT_WIDTH})"
+            )
+        if too_high[i]:
+            issue_descriptions.append(
+                f"object {objectID} of road {roadID} has too high height value {float(table.height[i])} (max = {MAX_OBJECT_HEIGHT})"
+            )
+        if no_height[i]:
+            issue_descriptions.append(
+                f"object {objectID} of road {roadID} has no defined height. Height must be provided"
+            )
+        issues += [(i, description) for description in issue_descriptions]
+
+    return issues
+
+
+def register_issues(
+    table: models.RoadElementTable,
+    issues: List[Tuple[int, str]],
+    s: np.ndarray,
+    t: np.ndarray,
+    checker_data: models.CheckerData,
+) -> None:
+    if len(issues) == 0:
+        return
+
+    # 3d points of all issues in one batch per road
+    rows = np.array([issue[0] for issue in issues])
+    inertial_points = tables.get_points_xyz_from_roads(
+        table.roads, table.road[rows], s[rows], t[rows], 0.0
+    )
+
+    for (row, description), inertial_point in zip(issues, inertial_points):
         # register issues
         issue_id = checker_data.result.register_issue(
             checker_bundle_name=constants.BUNDLE_NAME,
@@ -89,29 +142,28 @@ def check_object_size(road: etree.Element, object: etree.Element, checker_data:
             checker_bundle_name=constants.BUNDLE_NAME,
             checker_id=CHECKER_ID,
             issue_id=issue_id,
-            xpath=checker_data.input_file_xml_root.getpath(object),
+            xpath=checker_data.input_file_xml_root.getpath(table.elements[row]),
             description=description,
         )
 
         # add 3d point
-        inertial_point = get_point_xyz_from_road(road, objectS, objectT, 0.0)
-        if inertial_point is not None:
+        if not np.isnan(inertial_point).any():
             checker_data.result.add_inertial_location(
                 checker_bundle_name=constants.BUNDLE_NAME,
                 checker_id=CHECKER_ID,
                 issue_id=issue_id,
-                x=inertial_point.x,
-                y=inertial_point.y,
-                z=inertial_point.z,
+                x=inertial_point[0],
+                y=inertial_point[1],
+                z=inertial_point[2],
                 description=description,
-            )        
+            )
+
 
 def _check_all_roads(checker_data: models.CheckerData) -> None:
-    roads = get_roads(checker_data.input_file_xml_root)
+    table = tables.get_road_element_table(checker_data.input_file_xml_root, "objects")
+    issues = check_object_sizes(table, checker_data)
+    register_issues(table, issues, table.s, table.t, checker_data)
 
-    for road in roads:
-        for object in road.findall("./objects/object"):
-            check_object_size(road, object, checker_data)
 
 def check_rule(checker_data: models.CheckerData) -> None:
     """
@@ -124,7 +176,9 @@ def check_rule(checker_data: models.CheckerData) -> None:
     Version range: [1.4.0, )
 
     Remark:
-        TODO
+        The sizes of all objects are read into one table and compared with
+        the limits as array operations. 3d points are only evaluated for
+        objects with issues.
     """
     logging.info("Executing road.semantic.object_size check.")
 
@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import logging
+
+from qc_baselib import IssueSeverity
+
+from openmsl_qc_opendrive import constants
+from openmsl_qc_opendrive.base import positions
+from openmsl_qc_opendrive.base.utils import *
+
+CHECKER_ID = "check_openmsl_xodr_road_signal_duplicate"
+CHECKER_DESCRIPTION = "Signals of the same kind shall not be placed at the same position facing the same direction"
+CHECKER_PRECONDITIONS = set()
+RULE_UID = "openmsl.net:xodr:1.4.0:road.semantic.signal_duplicate"
+REQUIRED_SUBTREES = {"signals"}
+
+# Default maximum distance of duplicates, overridden by the checker param
+# distanceTolerance
+DISTANCE_TOLERANCE = 0.1
+
+
+def _get_signal_kind(signal: etree._Element) -> Tuple[Optional[str], ...]:
+    return tuple(
+        signal.get(attribute) for attribute in ("country", "type", "subtype", "value")
+    )
+
+
+def _check_all_roads(checker_data: models.CheckerData) -> None:
+    distance_tolerance = get_checker_float_param(
+        checker_data, CHECKER_ID, "distanceTolerance", DISTANCE_TOLERANCE
+    )
+
+    placements = positions.get_road_element_placements(
+        checker_data.input_file_xml_root, "signal"
+    )
+    selection = np.ones(len(placements.elements), dtype=bool)
+
+    first, second = positions.compile_nearby_placements(
+        placements, distance_tolerance, selection
+    )
+    for i, j in zip(first, second):
+        signal = placements.elements[i]
+        other_signal = placements.elements[j]
+        if _get_signal_kind(signal) != _get_signal_kind(other_signal):
+            continue
+        if np.cos(placements.heading[j] - placements.heading[i]) <= 0.0:
+            continue
+
+        signalID = signal.get("id")
+        otherSignalID = other_signal.get("id")
+        roadID = placements.roads[i].get("id")
+        otherRoadID = placements.roads[j].get("id")
+        description = f"signal {signalID} of road {roadID} duplicates signal {otherSignalID} of road {otherRoadID}"
+
+        # register issue
+        issue_id = checker_data.result.register_issue(
+            checker_bundle_name=constants.BUNDLE_NAME,
+            checker_id=CHECKER_ID,
+            description=description,
+            level=IssueSeverity.WARNING,
+            rule_uid=RULE_UID,
+        )
+        # add xml location
+        for element in (signal, other_signal):
+            checker_data.result.add_xml_location(
+                checker_bundle_name=constants.BUNDLE_NAME,
+                checker_id=CHECKER_ID,
+                issue_id=issue_id,
+                xpath=checker_data.input_file_xml_root.getpath(element),
+                description=description,
+            )
+
+        # add 3d point
+        checker_data.result.add_inertial_location(
+            checker_bundle_name=constants.BUNDLE_NAME,
+            checker_id=CHECKER_ID,
+            issue_id=issue_id,
+            x=float(placements.x[i]),
+            y=float(placements.y[i]),
+            z=float(placements.z[i]),
+            description=description,
+        )
+
+
+def check_rule(checker_data: models.CheckerData) -> None:
+    """
+    Rule ID: openmsl.net:xodr:1.4.0:road.semantic.signal_duplicate
+
+    Description: Signals of the same kind shall not be placed at the same position facing the same direction.
+
+    Severity: WARNING
+
+    Version range: [1.4.0, )
+
+    Remark:
+        Signals of all roads are compared, so also copies on overlapping
+        junction roads are found. Signals are of the same kind if country,
+        type, subtype and value match. Only signals sharing a cell of a
+        uniform grid are compared. The maximum distance is set with the
+        checker param distanceTolerance [m].
+    """
+    logging.info("Executing road.semantic.signal_duplicate check.")
+
+    _check_all_roads(checker_data)
@@ -6,21 +6,29 @@
 
 import logging
 
+from typing import List, Tuple
 from lxml import etree
 from qc_baselib import IssueSeverity
 
 from openmsl_qc_opendrive import constants
-from qc_opendrive.base.utils import *
+from openmsl_qc_opendrive.base import visitor
+from openmsl_qc_opendrive.base.utils import *
 
 CHECKER_ID = "check_openmsl_xodr_road_signal_object_lane_linkage"
 CHECKER_DESCRIPTION = "Linked Lanes should exist and orientation should match with driving direction"
 CHECKER_PRECONDITIONS = set()
 RULE_UID = "openmsl.net:xodr:1.4.0:road.semantic.signal_object_lane_linkage"
+REQUIRED_SUBTREES = {"objects", "signals"}
 
-def check_validity(signal_object: etree._Element, traffic_rule: models.TrafficHandRule, road: etree._Element, checker_data: models.CheckerData) -> None:
+
+def check_validity(
+    signal_object: etree._Element,
+    traffic_rule: models.TrafficHandRule,
+    road: etree._Element,
+) -> List[Tuple[etree._Element, str, float, float]]:
     validity = signal_object.find("validity")
     if validity is None:                            # no valitidy, so nothing to check
-        return
+        return []
 
     # check if lanes exist at signal/object position
     id = signal_object.attrib['id']
@@ -62,7 +70,28 @@ def check_validity(signal_object: etree._Element, traffic_rule: models.TrafficHa
     if error != "":
         issue_descriptions.append(f"lane validity of {signal_object.tag} {id} should be {error} for {traffic_rule} with orientation {orientation}")
 
-    for description in issue_descriptions:
+    return [
+        (signal_object, description, sValue, tValue)
+        for description in issue_descriptions
+    ]
+
+
+def register_issues(
+    road: etree._Element,
+    issues: List[Tuple[etree._Element, str, float, float]],
+    checker_data: models.CheckerData,
+) -> None:
+    if len(issues) == 0:
+        return
+
+    # 3d points of all issues of the road in one batch
+    inertial_points = get_points_xyz_from_road(
+        road, [issue[2] for issue in issues], [issue[3] for issue in issues], 0.0
+    )
+
+    for (signal_object, description, _, _), inertial_point in zip(
+        issues, inertial_points
+    ):
         # register issues
         issue_id = checker_data.result.register_issue(
             checker_bundle_name=constants.BUNDLE_NAME,
@@ -81,32 +110,36 @@ def check_validity(signal_object: etree._Element, traffic_rule: models.TrafficHa
         )
 
         # add 3d point
-        inertial_point = get_point_xyz_from_road(road, sValue, tValue, 0.0)
-        if inertial_point is not None:
+        if not np.isnan(inertial_point).any():
             checker_data.result.add_inertial_location(
                 checker_bundle_name=constants.BUNDLE_NAME,
                 checker_id=CHECKER_ID,
                 issue_id=issue_id,
-                x=inertial_point.x,
-                y=inertial_point.y,
-                z=inertial_point.z,
+                x=inertial_point[0],
+                y=inertial_point[1],
+                z=inertial_point[2],
                 description=description,
-            )        
+            )
+
+
+def _check_road(road: etree._Element, checker_data: models.CheckerData) -> None:
+    rule = get_traffic_hand_rule_from_road(road)
+
+    issues = []
+    for signal in road.findall("./signals/signal"):
+        issues += check_validity(signal, rule, road)
+    for signal in road.findall("./signals/signalReference"):
+        issues += check_validity(signal, rule, road)
+    for object in road.findall("./objects/object"):
+        issues += check_validity(object, rule, road)
+    for object in road.findall("./objects/objectReference"):
+        issues += check_validity(object, rule, road)
+    register_issues(road, issues, checker_data)
 
-def _check_all_roads(checker_data: models.CheckerData) -> None:
-    roads = get_roads(checker_data.input_file_xml_root)
 
-    for road in roads:
-        rule = get_traffic_hand_rule_from_road(road)
+def register_visits(network_visitor: visitor.NetworkVisitor) -> None:
+    network_visitor.register(CHECKER_ID, visitor.ROAD, _check_road)
 
-        for signal in road.findall("./signals/signal"):        
-            check_validity(signal, rule, road, checker_data)
-        for signal in road.findall("./signals/signalReference"):
-            check_validity(signal, rule, road, checker_data)
-        for object in road.findall("./objects/object"):
-            check_validity(object, rule, road, checker_data)
-        for object in road.findall("./objects/objectReference"):
-            check_validity(object, rule, road, checker_data)
 
 def check_rule(checker_data: models.CheckerData) -> None:
     """
@@ -123,4 +156,4 @@ def check_rule(checker_data: models.CheckerData) -> None:
     """
     logging.info("Executing road.semantic.signal_object_lane_linkage check.")
 
-    _check_all_roads(checker_data)
+    visitor.visit(checker_data, CHECKER_ID, register_visits)
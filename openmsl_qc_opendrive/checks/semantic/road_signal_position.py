@@ -6,46 +6,86 @@
 
 import logging
 
+from typing import List, Tuple
 from lxml import etree
 from qc_baselib import IssueSeverity
 
 from openmsl_qc_opendrive import constants
-from qc_opendrive.base.utils import *
+from openmsl_qc_opendrive.base import tables
+from openmsl_qc_opendrive.base.utils import *
 
 CHECKER_ID = "check_openmsl_xodr_road_signal_position"
 CHECKER_DESCRIPTION = "check if signal position is valid - s value is in range of road length, t and zOffset in range"
 CHECKER_PRECONDITIONS = set()
 RULE_UID = "openmsl.net:xodr:1.4.0:road.semantic.signal_position"
+REQUIRED_SUBTREES = {"signals"}
 
 EPSILON_S_ON_ROAD = 0.000001
 MAX_RANGE_SIGNAL_T = 50
 MAX_RANGE_SIGNAL_ZOFFSET = 20
 
-# check signal postion 
-def check_signal_postion_for_road(road: etree.Element, signal: etree.Element, checker_data: models.CheckerData):
-    roadID = road.attrib["id"]
-    signalID = signal.attrib["id"]
-    signalS = to_float(signal.attrib["s"])   
-    signalT = to_float(signal.attrib["t"])     
 
-    # check s position
-    issue_descriptions = []
-    roadLength = get_road_length(road)
-    if signalS - roadLength > EPSILON_S_ON_ROAD:
-        issue_descriptions.append(f"signal {signalID} of road {roadID} has too high s value {signalS} (road length = {roadLength})")
-        signalS = roadLength        
+def check_signal_positions(
+    table: models.RoadElementTable,
+) -> Tuple[List[Tuple[int, str]], np.ndarray]:
+    """
+    Returns the issues (row, description) of the signal table and s of the
+    3d point of each row.
+    """
+    roadLength = table.road_length[table.road]
+
+    # check s position, issues are located at the end of the road
+    s_too_high = table.s - roadLength > EPSILON_S_ON_ROAD
+    signalS = np.where(s_too_high, roadLength, table.s)
 
     # check t position
-    if signalT < -MAX_RANGE_SIGNAL_T or signalT > MAX_RANGE_SIGNAL_T:
-        issue_descriptions.append(f"signal {signalID} of road {roadID} has t value {signalT} out of range (-{MAX_RANGE_SIGNAL_T}, +{MAX_RANGE_SIGNAL_T})")
+    t_out_of_range = (table.t < -MAX_RANGE_SIGNAL_T) | (table.t > MAX_RANGE_SIGNAL_T)
 
     # check z position
-    if signal.tag != "signalReference":
-        signalZOffset = to_float(signal.attrib["zOffset"])
-        if signalZOffset < -MAX_RANGE_SIGNAL_ZOFFSET or signalZOffset > MAX_RANGE_SIGNAL_ZOFFSET:
-            issue_descriptions.append(f"signal {signalID} of road {roadID} has zOffset value {signalZOffset} out of range (-{MAX_RANGE_SIGNAL_ZOFFSET}, +{MAX_RANGE_SIGNAL_ZOFFSET})")
-
-    for description in issue_descriptions:
+    z_out_of_range = table.is_tag("signal") & (
+        (table.z_offset < -MAX_RANGE_SIGNAL_ZOFFSET)
+        | (table.z_offset > MAX_RANGE_SIGNAL_ZOFFSET)
+    )
+
+    issues = []
+    for i in np.flatnonzero(s_too_high | t_out_of_range | z_out_of_range):
+        roadID = table.roads[table.road[i]].attrib["id"]
+        signalID = table.elements[i].attrib["id"]
+        issue_descriptions = []
+        if s_too_high[i]:
+            issue_descriptions.append(
+                f"signal {signalID} of road {roadID} has too high s value {float(table.s[i])} (road length = {float(roadLength[i])})"
+            )
+        if t_out_of_range[i]:
+            issue_descriptions.append(
+                f"signal {signalID} of road {roadID} has t value {float(table.t[i])} out of range (-{MAX_RANGE_SIGNAL_T}, +{MAX_RANGE_SIGNAL_T})"
+            )
+        if z_out_of_range[i]:
+            issue_descriptions.append(
+                f"signal {signalID} of road {roadID} has zOffset value {float(table.z_offset[i])} out of range (-{MAX_RANGE_SIGNAL_ZOFFSET}, +{MAX_RANGE_SIGNAL_ZOFFSET})"
+            )
+        issues += [(i, description) for description in issue_descriptions]
+
+    return issues, signalS
+
+
+def register_issues(
+    table: models.RoadElementTable,
+    issues: List[Tuple[int, str]],
+    s: np.ndarray,
+    t: np.ndarray,
+    checker_data: models.CheckerData,
+) -> None:
+    if len(issues) == 0:
+        return
+
+    # 3d points of all issues in one batch per road
+    rows = np.array([issue[0] for issue in issues])
+    inertial_points = tables.get_points_xyz_from_roads(
+        table.roads, table.road[rows], s[rows], t[rows], 0.0
+    )
+
+    for (row, description), inertial_point in zip(issues, inertial_points):
         # register issues
         issue_id = checker_data.result.register_issue(
             checker_bundle_name=constants.BUNDLE_NAME,
@@ -59,31 +99,28 @@ def check_signal_postion_for_road(road: etree.Element, signal: etree.Element, ch
             checker_bundle_name=constants.BUNDLE_NAME,
             checker_id=CHECKER_ID,
             issue_id=issue_id,
-            xpath=checker_data.input_file_xml_root.getpath(signal),
+            xpath=checker_data.input_file_xml_root.getpath(table.elements[row]),
             description=description,
         )
 
         # add 3d point
-        inertial_point = get_point_xyz_from_road(road, signalS, signalT, 0.0)
-        if inertial_point is not None:
+        if not np.isnan(inertial_point).any():
             checker_data.result.add_inertial_location(
                 checker_bundle_name=constants.BUNDLE_NAME,
                 checker_id=CHECKER_ID,
                 issue_id=issue_id,
-                x=inertial_point.x,
-                y=inertial_point.y,
-                z=inertial_point.z,
+                x=inertial_point[0],
+                y=inertial_point[1],
+                z=inertial_point[2],
                 description=description,
-            )        
+            )
+
 
 def _check_all_roads(checker_data: models.CheckerData) -> None:
-    roads = get_roads(checker_data.input_file_xml_root)
+    table = tables.get_road_element_table(checker_data.input_file_xml_root, "signals")
+    issues, s = check_signal_positions(table)
+    register_issues(table, issues, s, table.t, checker_data)
 
-    for road in roads:
-        for signal in road.findall("./signals/signal"):
-            check_signal_postion_for_road(road, signal, checker_data)         
-        for signal in road.findall("./signals/signalReference"):
-            check_signal_postion_for_road(road, signal, checker_data)
 
 def check_rule(checker_data: models.CheckerData) -> None:
     """
@@ -96,7 +133,9 @@ def check_rule(checker_data: models.CheckerData) -> None:
     Version range: [1.4.0, )
 
     Remark:
-        TODO
+        The positions of all signals and signal references are read into one
+        table and compared with the limits as array operations. 3d points are
+        only evaluated for signals with issues.
     """
     logging.info("Executing road.semantic.signal_position check.")
 
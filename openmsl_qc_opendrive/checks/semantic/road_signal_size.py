@@ -6,39 +6,67 @@
 
 import logging
 
+from typing import List, Tuple
 from lxml import etree
 from qc_baselib import IssueSeverity
 
 from openmsl_qc_opendrive import constants
-from qc_opendrive.base.utils import *
+from openmsl_qc_opendrive.base import tables
+from openmsl_qc_opendrive.base.utils import *
 
 CHECKER_ID = "check_openmsl_xodr_road_signal_size"
 CHECKER_DESCRIPTION = "check if signal size is valid - width and height in range"
 CHECKER_PRECONDITIONS = set()
 RULE_UID = "openmsl.net:xodr:1.4.0:road.semantic.signal_size"
+REQUIRED_SUBTREES = {"signals"}
 
 MAX_SIGNAL_WIDTH = 5
 MAX_SIGNAL_HEIGHT = 5
 
-# check signal postion 
-def check_signal_size(road: etree.Element, signal: etree.Element, checker_data: models.CheckerData):
-    roadID = road.attrib["id"]
-    signalID = signal.attrib["id"]
-    signalS = to_float(signal.attrib["s"])   
-    signalT = to_float(signal.attrib["t"])   
-
-    # check width
-    issue_descriptions = []    
-    signalWidth = to_float(signal.attrib["width"])
-    if signalWidth > MAX_SIGNAL_WIDTH:
-        issue_descriptions.append(f"signal {signalID} of road {roadID} has too high width value {signalWidth} (max = {MAX_SIGNAL_WIDTH})")
-
-    # check height
-    signalheight = to_float(signal.attrib["height"])     
-    if signalheight > MAX_SIGNAL_HEIGHT:
-        issue_descriptions.append(f"signal {signalID} of road {roadID} has too high height value {signalheight} (max = {MAX_SIGNAL_HEIGHT})")
-
-    for description in issue_descriptions:
+
+def check_signal_sizes(table: models.RoadElementTable) -> List[Tuple[int, str]]:
+    """
+    Returns the issues (row, description) of the signals of the table.
+    """
+    is_signal = table.is_tag("signal")
+    too_wide = is_signal & (table.width > MAX_SIGNAL_WIDTH)
+    too_high = is_signal & (table.height > MAX_SIGNAL_HEIGHT)
+
+    issues = []
+    for i in np.flatnonzero(too_wide | too_high):
+        roadID = table.roads[table.road[i]].attrib["id"]
+        signalID = table.elements[i].attrib["id"]
+        issue_descriptions = []
+        if too_wide[i]:
+            issue_descriptions.append(
+                f"signal {signalID} of road {roadID} has too high width value {float(table.width[i])} (max = {MAX_SIGNAL_WIDTH})"
+            )
+        if too_high[i]:
+            issue_descriptions.append(
+                f"signal {signalID} of road {roadID} has too high height value {float(table.height[i])} (max = {MAX_SIGNAL_HEIGHT})"
+            )
+        issues += [(i, description) for description in issue_descriptions]
+
+    return issues
+
+
+def register_issues(
+    table: models.RoadElementTable,
+    issues: List[Tuple[int, str]],
+    s: np.ndarray,
+    t: np.ndarray,
+    checker_data: models.CheckerData,
+) -> None:
+    if len(issues) == 0:
+        return
+
+    # 3d points of all issues in one batch per road
+    rows = np.array([issue[0] for issue in issues])
+    inertial_points = tables.get_points_xyz_from_roads(
+        table.roads, table.road[rows], s[rows], t[rows], 0.0
+    )
+
+    for (row, description), inertial_point in zip(issues, inertial_points):
         # register issues
         issue_id = checker_data.result.register_issue(
             checker_bundle_name=constants.BUNDLE_NAME,
@@ -52,29 +80,28 @@ def check_signal_size(road: etree.Element, signal: etree.Element, checker_data:
             checker_bundle_name=constants.BUNDLE_NAME,
             checker_id=CHECKER_ID,
             issue_id=issue_id,
-            xpath=checker_data.input_file_xml_root.getpath(signal),
+            xpath=checker_data.input_file_xml_root.getpath(table.elements[row]),
             description=description,
         )
 
         # add 3d point
-        inertial_point = get_point_xyz_from_road(road, signalS, signalT, 0.0)
-        if inertial_point is not None:
+        if not np.isnan(inertial_point).any():
             checker_data.result.add_inertial_location(
                 checker_bundle_name=constants.BUNDLE_NAME,
                 checker_id=CHECKER_ID,
                 issue_id=issue_id,
-                x=inertial_point.x,
-                y=inertial_point.y,
-                z=inertial_point.z,
+                x=inertial_point[0],
+                y=inertial_point[1],
+                z=inertial_point[2],
                 description=description,
-            )        
+            )
+
 
 def _check_all_roads(checker_data: models.CheckerData) -> None:
-    roads = get_roads(checker_data.input_file_xml_root)
+    table = tables.get_road_element_table(checker_data.input_file_xml_root, "signals")
+    issues = check_signal_sizes(table)
+    register_issues(table, issues, table.s, table.t, checker_data)
 
-    for road in roads:
-        for signal in road.findall("./signals/signal"):
-            check_signal_size(road, signal, checker_data)
 
 def check_rule(checker_data: models.CheckerData) -> None:
     """
@@ -87,7 +114,9 @@ def check_rule(checker_data: models.CheckerData) -> None:
     Version range: [1.4.0, )
 
     Remark:
-        TODO
+        The sizes of all signals are read into one table and compared with
+        the limits as array operations. 3d points are only evaluated for
+        signals with issues.
     """
     logging.info("Executing road.semantic.signal_size check.")
 
@@ -3,12 +3,14 @@ import logging
 from qc_baselib import IssueSeverity
 
 from openmsl_qc_opendrive import constants
-from qc_opendrive.base.utils import *
+from openmsl_qc_opendrive.base.utils import *
 
 CHECKER_ID = "check_openmsl_xodr_statistic"
 CHECKER_DESCRIPTION = "Prints some infos about OpenDRIVE file"
 CHECKER_PRECONDITIONS = set()
 RULE_UID = "openmsl.net:xodr:1.4.0:statistic"
+REQUIRED_SUBTREES = {"objects", "signals"}
+
 
 def calc_frequency(checker_data: models.CheckerData) -> None:
     issue_descriptions = []
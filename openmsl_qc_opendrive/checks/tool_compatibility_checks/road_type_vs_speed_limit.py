@@ -11,12 +11,14 @@ from lxml import etree
 from qc_baselib import IssueSeverity
 
 from openmsl_qc_opendrive import constants
-from qc_opendrive.base.utils import *
+from openmsl_qc_opendrive.base import visitor
+from openmsl_qc_opendrive.base.utils import *
 
 CHECKER_ID = "check_openmsl_xodr_road_type_vs_speed_limit"
 CHECKER_DESCRIPTION = "Speed Limit of Lanes should match with road type"
 CHECKER_PRECONDITIONS = set()
 RULE_UID = "openmsl.net:xodr:1.4.0:road.road_type_vs_speed_limit"
+REQUIRED_SUBTREES = set()
 
 def getSpeedRange(roadType: str) -> None:
     if roadType == "rural":
@@ -90,36 +92,51 @@ def registerIssue(checker_data: models.CheckerData, description : str, treeEleme
         description=description,
     )
 
-def _check_all_roads(checker_data: models.CheckerData) -> None:
-    roads = get_roads(checker_data.input_file_xml_root)
-
-    for road in roads:
-        if road.find("type") is None:
-            continue                        # nothing to check, if no roadtype is given
-
-        roadID = road.attrib["id"]
-        roadType = road.find("type").attrib["type"]
-        speedRange = getSpeedRange(roadType)
-        if speedRange is None:
-            registerIssue(checker_data, f"road {roadID} has invalid road type {roadType} or it is missing in config file", road, None)
-        else:
-            laneSections = get_lane_sections(road)
-            for laneSection in laneSections:
-                s_coordinate = get_s_from_lane_section(laneSection)
-                lanes = get_left_and_right_lanes_from_lane_section(laneSection)
-                for lane in lanes:
-                    laneID = lane.attrib["id"]
-                    laneType = lane.attrib['type']
-                    if laneType != 'driving':                                           # TODO accept more lanetypes
-                        continue                        # only check driving lanes
-
-                    for speed in lane.findall("./speed"):
-                        speedvalue = get_speed_value(speed)            
-                        if speedRange[0] > speedvalue or speedRange[1] < speedvalue:
-                            inertial_point = get_middle_point_xyz_at_height_zero_from_lane_by_s(road, laneSection, lane, s_coordinate)
-                            registerIssue(checker_data, 
-                                        f"road {roadID} laneSection {s_coordinate} lane {laneID} has speed value {speedvalue}km/h that is outside the valid range ({speedRange[0]} - {speedRange[1]})",
-                                        lane, inertial_point)
+
+def _check_road(road: etree._Element, checker_data: models.CheckerData) -> None:
+    if road.find("type") is None:
+        return  # nothing to check, if no roadtype is given
+
+    roadID = road.attrib["id"]
+    roadType = road.find("type").attrib["type"]
+    speedRange = getSpeedRange(roadType)
+    if speedRange is None:
+        registerIssue(
+            checker_data,
+            f"road {roadID} has invalid road type {roadType} or it is missing in config file",
+            road,
+            None,
+        )
+    else:
+        laneSections = get_lane_sections(road)
+        for laneSection in laneSections:
+            s_coordinate = get_s_from_lane_section(laneSection)
+            lanes = get_left_and_right_lanes_from_lane_section(laneSection)
+            for lane in lanes:
+                laneID = lane.attrib["id"]
+                laneType = lane.attrib["type"]
+                if laneType != "driving":  # TODO accept more lanetypes
+                    continue  # only check driving lanes
+
+                for speed in lane.findall("./speed"):
+                    speedvalue = get_speed_value(speed)
+                    if speedRange[0] > speedvalue or speedRange[1] < speedvalue:
+                        inertial_point = (
+                            get_middle_point_xyz_at_height_zero_from_lane_by_s(
+                                road, laneSection, lane, s_coordinate
+                            )
+                        )
+                        registerIssue(
+                            checker_data,
+                            f"road {roadID} laneSection {s_coordinate} lane {laneID} has speed value {speedvalue}km/h that is outside the valid range ({speedRange[0]} - {speedRange[1]})",
+                            lane,
+                            inertial_point,
+                        )
+
+
+def register_visits(network_visitor: visitor.NetworkVisitor) -> None:
+    network_visitor.register(CHECKER_ID, visitor.ROAD, _check_road)
+
 
 def check_rule(checker_data: models.CheckerData) -> None:
     """
@@ -136,4 +153,4 @@ def check_rule(checker_data: models.CheckerData) -> None:
     """
     logging.info("Executing road.road_type_vs_speed_limit check.")
 
-    _check_all_roads(checker_data)
+    visitor.visit(checker_data, CHECKER_ID, register_visits)
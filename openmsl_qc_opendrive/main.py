@@ -5,7 +5,10 @@
 # with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 import argparse
+import concurrent.futures
+import dataclasses
 import logging
+import threading
 import types
 
 import openmsl_qc_opendrive
@@ -13,8 +16,16 @@ print(openmsl_qc_opendrive.__file__)
 
 from qc_baselib import Configuration, Result, StatusType
 from qc_baselib.models.result import RuleType
-#from qc_opendrive.base import models, utils
-from qc_opendrive.base.utils import *
+
+# from qc_opendrive.base import models, utils
+from openmsl_qc_opendrive.base import (
+    byte_index,
+    clothoid,
+    input_stream,
+    parallel,
+    visitor,
+)
+from openmsl_qc_opendrive.base.utils import *
 
 from openmsl_qc_opendrive import constants
 from openmsl_qc_opendrive import version
@@ -40,6 +51,101 @@ def args_entrypoint() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def is_checker_enabled(checker: types.ModuleType, config: Configuration) -> bool:
+    """
+    All checkers are enabled if the checker bundle configuration lists no
+    checkers, otherwise only the listed ones.
+    """
+    for bundle in config.get_all_checker_bundles():
+        if bundle.application == constants.BUNDLE_NAME and len(bundle.checkers) > 0:
+            return any(c.checker_id == checker.CHECKER_ID for c in bundle.checkers)
+
+    return True
+
+
+def get_skipped_subtrees(checkers: List[types.ModuleType]) -> Set[str]:
+    """
+    Returns the optional subtrees no checker requires. A checker without
+    REQUIRED_SUBTREES requires all of them.
+    """
+    required_subtrees = set()
+    for checker in checkers:
+        required_subtrees |= getattr(checker, "REQUIRED_SUBTREES", OPTIONAL_SUBTREES)
+
+    return OPTIONAL_SUBTREES - required_subtrees
+
+
+def get_list_param(config: Configuration, param_name: str) -> List[str]:
+    """
+    Returns the values of a CheckerBundle param listing values separated by
+    commas or spaces.
+    """
+    value = config.get_checker_bundle_param(
+        checker_bundle_name=constants.BUNDLE_NAME, param_name=param_name
+    )
+    if not value:
+        return []
+
+    return [i for i in str(value).replace(",", " ").split() if i]
+
+
+def get_region_of_interest(config: Configuration) -> byte_index.RegionOfInterest:
+    """
+    Returns the region of interest given by the CheckerBundle params roadIds,
+    junctionIds and boundingBox (x_min y_min x_max y_max). The region is empty
+    if none of them is set.
+    """
+    region = byte_index.RegionOfInterest(
+        road_ids=set(get_list_param(config, "roadIds")),
+        junction_ids=set(get_list_param(config, "junctionIds")),
+    )
+
+    bounding_box = get_list_param(config, "boundingBox")
+    if len(bounding_box) > 0:
+        if len(bounding_box) != 4:
+            raise ValueError(
+                f"boundingBox needs 4 values x_min y_min x_max y_max, got {len(bounding_box)}."
+            )
+        region.bounding_box = tuple(float(v) for v in bounding_box)
+
+    margin = config.get_checker_bundle_param(
+        checker_bundle_name=constants.BUNDLE_NAME, param_name="boundingBoxMargin"
+    )
+    if margin:
+        region.margin = float(margin)
+
+    return region
+
+
+def restrict_result_to_selection(
+    result: Result, partial_document: byte_index.PartialDocument
+) -> None:
+    """
+    Maps the xpaths of a partial run back to the original file and drops the
+    issues located only in elements that were parsed as context of the
+    selection.
+    """
+    bundle = result.get_checker_bundle_result(constants.BUNDLE_NAME)
+    for checker in bundle.checkers:
+        kept_issues = []
+        for issue in checker.issues:
+            xml_locations = [
+                xml_location
+                for location in issue.locations
+                for xml_location in location.xml_location
+            ]
+            if len(xml_locations) > 0 and all(
+                partial_document.is_context(l.xpath) for l in xml_locations
+            ):
+                continue
+
+            for xml_location in xml_locations:
+                xml_location.xpath = partial_document.map_xpath(xml_location.xpath)
+            kept_issues.append(issue)
+
+        checker.issues = kept_issues
+
+
 def check_preconditions(
     checker: types.ModuleType, checker_data: models.CheckerData
 ) -> bool:
@@ -166,6 +272,23 @@ def execute_checker(
         rule_uid=checker.RULE_UID,
     )
 
+    # Checkers not listed in the configuration are skipped, the subtrees they
+    # require may not have been parsed
+    if not is_checker_enabled(checker, checker_data.config):
+        checker_data.result.set_checker_status(
+            checker_bundle_name=constants.BUNDLE_NAME,
+            checker_id=checker.CHECKER_ID,
+            status=StatusType.SKIPPED,
+        )
+
+        checker_data.result.add_checker_summary(
+            constants.BUNDLE_NAME,
+            checker.CHECKER_ID,
+            "Checker is not enabled in the configuration. Skip the check.",
+        )
+
+        return
+
     # Check preconditions. If not satisfied then set status as SKIPPED and return
     satisfied_preconditions = check_preconditions(checker, checker_data)
     if not satisfied_preconditions:
@@ -206,6 +329,105 @@ def execute_checker(
         logging.exception(f"An error occur in {checker.CHECKER_ID}.")
 
 
+def get_checker_threads(config: Configuration) -> int:
+    """
+    Returns the number of threads given by the CheckerBundle param
+    checkerThreads. Checkers only run in parallel threads on a free-threaded
+    interpreter, otherwise they are executed serially.
+    """
+    checker_threads = config.get_checker_bundle_param(
+        checker_bundle_name=constants.BUNDLE_NAME, param_name="checkerThreads"
+    )
+    if not checker_threads or int(checker_threads) <= 1:
+        return 1
+
+    if not parallel.is_free_threaded():
+        logging.info(
+            "The interpreter runs with the GIL. Execute the checkers serially."
+        )
+        return 1
+
+    return int(checker_threads)
+
+
+def execute_checkers_in_threads(
+    checkers: List[types.ModuleType],
+    checker_data: models.CheckerData,
+    threads: int,
+) -> None:
+    """
+    Executes the checkers on a pool of threads. Each checker writes to its own
+    result buffer, the buffers are merged into the Result in checker order,
+    so that the result is the same as of a serial run. A checker with
+    preconditions on earlier checkers starts once these are merged.
+    """
+    lock = threading.Lock()
+
+    def execute(checker: types.ModuleType) -> parallel.ResultBuffer:
+        buffer = parallel.ResultBuffer(checker_data.result, lock)
+        execute_checker(checker, dataclasses.replace(checker_data, result=buffer))
+        return buffer
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+        futures = []
+        for index, checker in enumerate(checkers):
+            earlier_checkers = {c.CHECKER_ID for c in checkers[:index]}
+            if checker.CHECKER_PRECONDITIONS & earlier_checkers:
+                for future in futures:
+                    future.result().merge()
+                futures = []
+
+            futures.append(executor.submit(execute, checker))
+
+        for future in futures:
+            future.result().merge()
+
+
+def get_checkers() -> List[types.ModuleType]:
+    """
+    Returns all checkers of the bundle in the order they are executed.
+    """
+    return [
+        # 1. Run semantic checks
+        semantic.junction_connection_lane_link_id,
+        semantic.junction_connection_lane_linkage_order,
+        semantic.junction_connection_road_linkage,
+        semantic.junction_driving_lanes_continue,
+        semantic.road_lanesection_min_length,
+        semantic.road_lanesection_s,
+        semantic.road_lane_id_order,
+        semantic.road_lane_link_id,
+        semantic.road_lane_property_sOffset,
+        semantic.road_lane_type_none,
+        semantic.road_lane_width,
+        semantic.road_lane_width_continuity,
+        semantic.road_link_backward,
+        semantic.road_link_id,
+        semantic.road_object_on_driving_lane,
+        semantic.road_object_overlap,
+        semantic.road_object_position,
+        semantic.road_object_size,
+        semantic.road_signal_duplicate,
+        semantic.road_signal_object_lane_linkage,
+        semantic.road_signal_position,
+        semantic.road_signal_size,
+        # 2. Run geometry checks
+        geometry.road_geometry_continuity,
+        geometry.road_geometry_length,
+        geometry.road_geometry_parampoly3_attributes,
+        geometry.road_geometry_parampoly3_length_match,
+        geometry.road_link_continuity,
+        geometry.road_min_length,
+        geometry.road_overlap,
+        # 3. Run linkage checks
+        linkage.crg_reference,
+        # 4. Run tool compatibility checks
+        tool_compatibility_checks.road_type_vs_speed_limit,
+        # 5. Run tool statistic checks
+        statistic.statistic,
+    ]
+
+
 def run_checks(config: Configuration, result: Result) -> None:
     checker_data = models.CheckerData(
         xml_file_path=config.get_config_param("InputFile"),
@@ -215,44 +437,84 @@ def run_checks(config: Configuration, result: Result) -> None:
         schema_version=None,
     )
 
-    # Get xml root if the input file is a valid xml doc
-    checker_data.input_file_xml_root = get_root_without_default_namespace(checker_data.xml_file_path)
-
-    checker_data.schema_version = get_standard_schema_version(checker_data.input_file_xml_root)
-
-    # 1. Run semantic checks
-    execute_checker(semantic.junction_connection_lane_link_id, checker_data)
-    execute_checker(semantic.junction_connection_lane_linkage_order, checker_data)
-    execute_checker(semantic.junction_connection_road_linkage, checker_data)
-    execute_checker(semantic.junction_driving_lanes_continue, checker_data)    
-    execute_checker(semantic.road_lanesection_min_length, checker_data)
-    execute_checker(semantic.road_lanesection_s, checker_data)
-    execute_checker(semantic.road_lane_id_order, checker_data)
-    execute_checker(semantic.road_lane_link_id, checker_data)
-    execute_checker(semantic.road_lane_property_sOffset, checker_data)
-    execute_checker(semantic.road_lane_type_none, checker_data)
-    execute_checker(semantic.road_lane_width, checker_data)
-    execute_checker(semantic.road_link_backward, checker_data)    
-    execute_checker(semantic.road_link_id, checker_data)
-    execute_checker(semantic.road_object_position, checker_data)
-    execute_checker(semantic.road_object_size, checker_data)
-    execute_checker(semantic.road_signal_object_lane_linkage, checker_data)
-    execute_checker(semantic.road_signal_position, checker_data)
-    execute_checker(semantic.road_signal_size, checker_data)
-
-    # 2. Run geometry checks
-    execute_checker(geometry.road_geometry_length, checker_data)
-    execute_checker(geometry.road_geometry_parampoly3_attributes, checker_data)
-    execute_checker(geometry.road_min_length, checker_data)
-
-    # 3. Run linkage checks
-    execute_checker(linkage.crg_reference, checker_data)
-
-    # 4. Run tool compatibility checks
-    execute_checker(tool_compatibility_checks.road_type_vs_speed_limit, checker_data)
-
-    # 5. Run tool statistic checks
-    execute_checker(statistic.statistic, checker_data)
+    checkers = get_checkers()
+
+    enabled_checkers = [c for c in checkers if is_checker_enabled(c, config)]
+
+    zstd_chunk_size = config.get_checker_bundle_param(
+        checker_bundle_name=constants.BUNDLE_NAME, param_name="zstdChunkSize"
+    )
+    skipped_subtrees = get_skipped_subtrees(enabled_checkers)
+
+    spiral_backend = config.get_checker_bundle_param(
+        checker_bundle_name=constants.BUNDLE_NAME, param_name="spiralBackend"
+    )
+    if spiral_backend:
+        try:
+            clothoid.set_backend(str(spiral_backend))
+        except ValueError as e:
+            logging.warning(f"{e} Use {clothoid.get_backend()}.")
+
+    region = get_region_of_interest(config)
+    partial_document = None
+    if region.is_empty():
+        logging.info("No region of interest. Check the whole file.")
+    elif input_stream.is_compressed(checker_data.xml_file_path):
+        logging.warning(
+            "A region of interest is not supported for compressed input files. Check the whole file."
+        )
+    else:
+        # Parse only the roads and junctions of the region and their linked
+        # neighbours
+        (
+            checker_data.input_file_xml_root,
+            partial_document,
+        ) = get_partial_root_without_default_namespace(
+            checker_data.xml_file_path, region, skipped_subtrees
+        )
+
+    # Get xml root if the input file is a valid xml doc. Subtrees that no
+    # enabled checker requires are dropped while parsing. Compressed input
+    # files are decompressed while parsing.
+    if partial_document is None:
+        checker_data.input_file_xml_root = get_root_without_default_namespace(
+            checker_data.xml_file_path,
+            skipped_subtrees,
+            (
+                int(zstd_chunk_size)
+                if zstd_chunk_size
+                else input_stream.DEFAULT_ZSTD_CHUNK_SIZE
+            ),
+        )
+
+    checker_data.schema_version = get_standard_schema_version(
+        checker_data.input_file_xml_root
+    )
+
+    # Reuse the compiled network of previous runs on the same file. A snapshot
+    # always covers the whole file.
+    snapshot_directory = config.get_checker_bundle_param(
+        checker_bundle_name=constants.BUNDLE_NAME, param_name="snapshotDirectory"
+    )
+    if snapshot_directory and partial_document is None:
+        load_network_snapshot(
+            checker_data.input_file_xml_root,
+            checker_data.xml_file_path,
+            str(snapshot_directory),
+        )
+
+    # Walk the tree once for all checkers built on visitor callbacks
+    visitor.walk_network(checker_data, enabled_checkers)
+
+    checker_threads = get_checker_threads(config)
+    if checker_threads > 1:
+        execute_checkers_in_threads(checkers, checker_data, checker_threads)
+    else:
+        for checker in checkers:
+            execute_checker(checker, checker_data)
+
+    if partial_document is not None:
+        restrict_result_to_selection(result, partial_document)
 
 
 def main():
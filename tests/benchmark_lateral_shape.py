@@ -0,0 +1,99 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""
+Compares the compiled lateral shape evaluation with a lookup over the
+<shape> elements per point on a synthetic road.
+
+    python tests/benchmark_lateral_shape.py [cross sections] [points]
+"""
+
+import sys
+import time
+
+import numpy as np
+from lxml import etree
+
+from openmsl_qc_opendrive.base.utils import *
+
+
+def create_road(cross_sections: int, records: int) -> etree._Element:
+    rng = np.random.default_rng(0)
+    length = float(cross_sections)
+    shapes = "".join(
+        f'<shape s="{s}" t="{t}" a="{a}" b="{b}" c="{c}" d="0.0"/>'
+        for s in range(cross_sections)
+        for t, (a, b, c) in zip(
+            np.linspace(-10.0, 10.0, records), rng.uniform(-0.01, 0.01, (records, 3))
+        )
+    )
+    root = etree.ElementTree(
+        etree.fromstring(
+            f'<OpenDRIVE><road length="{length}" id="1" junction="-1">'
+            f'<planView><geometry s="0" x="0" y="0" hdg="0" length="{length}"><line/></geometry></planView>'
+            f"<lateralProfile>{shapes}</lateralProfile>"
+            "</road></OpenDRIVE>"
+        )
+    )
+    return get_roads(root)[0]
+
+
+def evaluate_per_point(road: etree._Element, s: float, t: float) -> float:
+    """Reference lookup that reads the <shape> elements for every point."""
+    sections = {}
+    for shape in road.find("lateralProfile").iter("shape"):
+        sections.setdefault(float(shape.get("s")), []).append(shape)
+
+    starts = sorted(sections)
+    before = max([start for start in starts if start <= s], default=starts[0])
+    after = min([start for start in starts if start > s], default=before)
+
+    def height(start: float) -> float:
+        records = sorted(sections[start], key=lambda shape: float(shape.get("t")))
+        candidates = [r for r in records if float(r.get("t")) <= t]
+        record = candidates[-1] if candidates else records[0]
+        dt = t - float(record.get("t"))
+        a, b, c, d = (float(record.get(name)) for name in "abcd")
+        return a + dt * (b + dt * (c + dt * d))
+
+    if after == before:
+        return height(before)
+    weight = (s - before) / (after - before)
+    return height(before) + weight * (height(after) - height(before))
+
+
+def main() -> None:
+    cross_sections = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    points = int(sys.argv[2]) if len(sys.argv) > 2 else 1000000
+    reference_points = 200
+
+    road = create_road(cross_sections, 8)
+    rng = np.random.default_rng(1)
+    s = rng.uniform(0.0, cross_sections, points)
+    t = rng.uniform(-12.0, 12.0, points)
+
+    start = time.perf_counter()
+    get_road_profiles(road)
+    compile_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    heights = evaluate_road_shape(road, s, t)
+    batch_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    reference = [evaluate_per_point(road, s[i], t[i]) for i in range(reference_points)]
+    reference_time = (time.perf_counter() - start) / reference_points * points
+
+    error = np.max(np.abs(heights[:reference_points] - reference))
+    print(f"{cross_sections} cross sections, {points} points")
+    print(f"compile:          {compile_time:.3f} s")
+    print(f"batch evaluation: {batch_time:.3f} s")
+    print(f"per point lookup: {reference_time:.1f} s (extrapolated)")
+    print(f"max difference:   {error:.3e} m")
+
+
+if __name__ == "__main__":
+    main()
@@ -204,3 +204,376 @@ def test_road_geometry_param_poly3_normalized_range(
         geometry.road_geometry_parampoly3_normalized_range.CHECKER_ID,
     )
     cleanup_files()
+
+
+@pytest.mark.parametrize(
+    "target_file,issue_count,issue_xpath",
+    [
+        (
+            "simple_valid",
+            0,
+            [],
+        ),
+        (
+            "many_invalid",
+            2,
+            [
+                "/OpenDRIVE/road[15]/planView/geometry[3]",
+            ],
+        ),
+    ],
+)
+def test_road_geometry_continuity(
+    target_file: str,
+    issue_count: int,
+    issue_xpath: List[str],
+    monkeypatch,
+) -> None:
+    base_path = "tests/data/smoothness_example/"
+    target_file_name = f"{target_file}.xodr"
+    rule_uid = "openmsl.net:xodr:1.4.0:road.geometry.continuity"
+    issue_severity = IssueSeverity.WARNING
+
+    target_file_path = os.path.join(base_path, target_file_name)
+    create_test_config(target_file_path)
+    launch_main(monkeypatch)
+    check_issues(
+        rule_uid,
+        issue_count,
+        issue_xpath,
+        issue_severity,
+        geometry.road_geometry_continuity.CHECKER_ID,
+    )
+    cleanup_files()
+
+
+@pytest.mark.parametrize(
+    "tolerances,issue_count",
+    [
+        ({"positionTolerance": 1.0, "headingTolerance": 0.1}, 0),
+        ({"headingTolerance": 0.1}, 1),
+        ({"curvatureTolerance": 0.01}, 9),
+    ],
+)
+def test_road_geometry_continuity_tolerances(
+    tolerances: dict,
+    issue_count: int,
+    monkeypatch,
+) -> None:
+    target_file_path = "tests/data/smoothness_example/many_invalid.xodr"
+    rule_uid = "openmsl.net:xodr:1.4.0:road.geometry.continuity"
+    checker_id = geometry.road_geometry_continuity.CHECKER_ID
+
+    config = Configuration()
+    config.set_config_param(name="InputFile", value=target_file_path)
+    config.register_checker_bundle(checker_bundle_name=constants.BUNDLE_NAME)
+    config.set_checker_bundle_param(
+        checker_bundle_name=constants.BUNDLE_NAME,
+        name="resultFile",
+        value=REPORT_FILE_PATH,
+    )
+    config.register_checker(
+        checker_bundle_name=constants.BUNDLE_NAME,
+        checker_id=checker_id,
+        min_level=IssueSeverity.INFORMATION,
+        max_level=IssueSeverity.ERROR,
+    )
+    for name, value in tolerances.items():
+        config.set_checker_param(
+            checker_bundle_name=constants.BUNDLE_NAME,
+            checker_id=checker_id,
+            name=name,
+            value=value,
+        )
+    config.write_to_file(CONFIG_FILE_PATH)
+
+    launch_main(monkeypatch)
+    check_issues(rule_uid, issue_count, [], IssueSeverity.WARNING, checker_id)
+    cleanup_files()
+
+
+@pytest.mark.parametrize(
+    "target_file,issue_count,issue_xpath",
+    [
+        (
+            "junction_valid_conn_smoothness",
+            0,
+            [],
+        ),
+        (
+            "junction_invalid_conn_smoothness",
+            2,
+            [
+                "/OpenDRIVE/road[2]/link/predecessor",
+                "/OpenDRIVE/junction/connection[1]",
+            ],
+        ),
+        (
+            "many_invalid",
+            5,
+            [
+                "/OpenDRIVE/road[1]/link/successor",
+                "/OpenDRIVE/road[3]/link/successor",
+                "/OpenDRIVE/road[9]/link/successor",
+            ],
+        ),
+    ],
+)
+def test_road_link_continuity(
+    target_file: str,
+    issue_count: int,
+    issue_xpath: List[str],
+    monkeypatch,
+) -> None:
+    base_path = "tests/data/smoothness_example/"
+    target_file_name = f"{target_file}.xodr"
+    rule_uid = "openmsl.net:xodr:1.4.0:road.link.continuity"
+    issue_severity = IssueSeverity.WARNING
+
+    target_file_path = os.path.join(base_path, target_file_name)
+    create_test_config(target_file_path)
+    launch_main(monkeypatch)
+    check_issues(
+        rule_uid,
+        issue_count,
+        issue_xpath,
+        issue_severity,
+        geometry.road_link_continuity.CHECKER_ID,
+    )
+    cleanup_files()
+
+
+@pytest.mark.parametrize(
+    "target_file",
+    [
+        "examples/Ex_Entry_Exit",
+        "utils/Ex_Bidirectional_Junction",
+        "valid_schema/positive18",
+        "smoothness_example/lane_gap_example_issue_119",
+    ],
+)
+def test_road_link_continuity_offset_roads(
+    target_file: str,
+    monkeypatch,
+) -> None:
+    target_file_path = os.path.join("tests/data/", f"{target_file}.xodr")
+    rule_uid = "openmsl.net:xodr:1.4.0:road.link.continuity"
+
+    create_test_config(target_file_path)
+    launch_main(monkeypatch)
+    check_issues(
+        rule_uid,
+        0,
+        [],
+        IssueSeverity.WARNING,
+        geometry.road_link_continuity.CHECKER_ID,
+    )
+    cleanup_files()
+
+
+@pytest.mark.parametrize(
+    "target_file,issue_count,issue_xpath",
+    [
+        (
+            "smoothness_example/simple_valid",
+            0,
+            [],
+        ),
+        (
+            "smoothness_example/many_invalid",
+            1,
+            [
+                "/OpenDRIVE/road[15]",
+            ],
+        ),
+        (
+            "examples/Ex_Entry_Exit",
+            0,
+            [],
+        ),
+        (
+            "utils/Ex_Bidirectional_Junction",
+            0,
+            [],
+        ),
+        (
+            "road_overlap/road_overlap_valid",
+            0,
+            [],
+        ),
+        (
+            "road_overlap/road_overlap_duplicated_road_invalid",
+            1,
+            [
+                "/OpenDRIVE/road[1]",
+                "/OpenDRIVE/road[2]",
+            ],
+        ),
+        (
+            "road_overlap/road_overlap_contained_road_invalid",
+            1,
+            [
+                "/OpenDRIVE/road[1]",
+                "/OpenDRIVE/road[2]",
+            ],
+        ),
+        (
+            "road_overlap/road_overlap_parallel_roads_invalid",
+            1,
+            [
+                "/OpenDRIVE/road[1]",
+                "/OpenDRIVE/road[2]",
+            ],
+        ),
+        (
+            "not_implemented_yet/rule_178_junctions_priority_high_and_low_attrib_valid",
+            0,
+            [],
+        ),
+    ],
+)
+def test_road_overlap(
+    target_file: str,
+    issue_count: int,
+    issue_xpath: List[str],
+    monkeypatch,
+) -> None:
+    base_path = "tests/data/"
+    target_file_name = f"{target_file}.xodr"
+    rule_uid = "openmsl.net:xodr:1.4.0:road.geometry.overlap"
+    issue_severity = IssueSeverity.WARNING
+
+    target_file_path = os.path.join(base_path, target_file_name)
+    create_test_config(target_file_path)
+    launch_main(monkeypatch)
+    check_issues(
+        rule_uid,
+        issue_count,
+        issue_xpath,
+        issue_severity,
+        geometry.road_overlap.CHECKER_ID,
+    )
+    cleanup_files()
+
+
+@pytest.mark.parametrize(
+    "target_file,issue_count,issue_xpath",
+    [
+        (
+            "road_geometry_length_valid",
+            0,
+            [],
+        ),
+        (
+            "road_geometry_length_invalid",
+            2,
+            [
+                "/OpenDRIVE/road",
+            ],
+        ),
+    ],
+)
+def test_road_geometry_length(
+    target_file: str,
+    issue_count: int,
+    issue_xpath: List[str],
+    monkeypatch,
+) -> None:
+    base_path = "tests/data/road_geometry_length/"
+    target_file_name = f"{target_file}.xodr"
+    rule_uid = "openmsl.net:xodr:1.4.0:road.geometry.length"
+    issue_severity = IssueSeverity.WARNING
+
+    target_file_path = os.path.join(base_path, target_file_name)
+    create_test_config(target_file_path)
+    launch_main(monkeypatch)
+    check_issues(
+        rule_uid,
+        issue_count,
+        issue_xpath,
+        issue_severity,
+        geometry.road_geometry_length.CHECKER_ID,
+    )
+    cleanup_files()
+
+
+@pytest.mark.parametrize(
+    "target_file,issue_count,issue_xpath",
+    [
+        (
+            "road_geometry_parampoly3_attributes_valid",
+            0,
+            [],
+        ),
+        (
+            "road_geometry_parampoly3_attributes_invalid",
+            4,
+            [
+                "/OpenDRIVE/road/planView/geometry",
+            ],
+        ),
+    ],
+)
+def test_road_geometry_parampoly3_attributes(
+    target_file: str,
+    issue_count: int,
+    issue_xpath: List[str],
+    monkeypatch,
+) -> None:
+    base_path = "tests/data/road_geometry_parampoly3_attributes/"
+    target_file_name = f"{target_file}.xodr"
+    rule_uid = "openmsl.net:xodr:1.4.0:road.geometry.parampoly3.attributes"
+    issue_severity = IssueSeverity.WARNING
+
+    target_file_path = os.path.join(base_path, target_file_name)
+    create_test_config(target_file_path)
+    launch_main(monkeypatch)
+    check_issues(
+        rule_uid,
+        issue_count,
+        issue_xpath,
+        issue_severity,
+        geometry.road_geometry_parampoly3_attributes.CHECKER_ID,
+    )
+    cleanup_files()
+
+
+@pytest.mark.parametrize(
+    "target_file,issue_count,issue_xpath",
+    [
+        (
+            "road_min_length_valid",
+            0,
+            [],
+        ),
+        (
+            "road_min_length_invalid",
+            1,
+            [
+                "/OpenDRIVE/road",
+            ],
+        ),
+    ],
+)
+def test_road_min_length(
+    target_file: str,
+    issue_count: int,
+    issue_xpath: List[str],
+    monkeypatch,
+) -> None:
+    base_path = "tests/data/road_min_length/"
+    target_file_name = f"{target_file}.xodr"
+    rule_uid = "openmsl.net:xodr:1.4.0:road.min_length"
+    issue_severity = IssueSeverity.WARNING
+
+    target_file_path = os.path.join(base_path, target_file_name)
+    create_test_config(target_file_path)
+    launch_main(monkeypatch)
+    check_issues(
+        rule_uid,
+        issue_count,
+        issue_xpath,
+        issue_severity,
+        geometry.road_min_length.CHECKER_ID,
+    )
+    cleanup_files()
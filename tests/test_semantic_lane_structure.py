@@ -0,0 +1,182 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import os
+import pytest
+
+from typing import List
+
+from qc_baselib import IssueSeverity
+from openmsl_qc_opendrive.checks import semantic
+
+from test_setup import *
+
+
+@pytest.mark.parametrize(
+    "target_file,issue_count,issue_xpath",
+    [
+        (
+            "valid",
+            0,
+            [],
+        ),
+        (
+            "invalid",
+            4,
+            [
+                "/OpenDRIVE/road/lanes/laneSection[1]/left/lane",
+                "/OpenDRIVE/road/lanes/laneSection[2]/right/lane[2]",
+            ],
+        ),
+    ],
+)
+def test_road_lane_id_order(
+    target_file: str,
+    issue_count: int,
+    issue_xpath: List[str],
+    monkeypatch,
+) -> None:
+    base_path = "tests/data/road_lane_id_order/"
+    target_file_name = f"road_lane_id_order_{target_file}.xodr"
+    rule_uid = semantic.road_lane_id_order.RULE_UID
+    issue_severity = IssueSeverity.WARNING
+
+    target_file_path = os.path.join(base_path, target_file_name)
+    create_test_config(target_file_path)
+    launch_main(monkeypatch)
+    check_issues(
+        rule_uid,
+        issue_count,
+        issue_xpath,
+        issue_severity,
+        semantic.road_lane_id_order.CHECKER_ID,
+    )
+    cleanup_files()
+
+
+@pytest.mark.parametrize(
+    "target_file,issue_count,issue_xpath",
+    [
+        (
+            "valid",
+            0,
+            [],
+        ),
+        (
+            "invalid",
+            1,
+            [
+                "/OpenDRIVE/road/lanes/laneSection/right/lane",
+            ],
+        ),
+    ],
+)
+def test_road_lane_type_none(
+    target_file: str,
+    issue_count: int,
+    issue_xpath: List[str],
+    monkeypatch,
+) -> None:
+    base_path = "tests/data/road_lane_type_none/"
+    target_file_name = f"road_lane_type_none_{target_file}.xodr"
+    rule_uid = semantic.road_lane_type_none.RULE_UID
+    issue_severity = IssueSeverity.WARNING
+
+    target_file_path = os.path.join(base_path, target_file_name)
+    create_test_config(target_file_path)
+    launch_main(monkeypatch)
+    check_issues(
+        rule_uid,
+        issue_count,
+        issue_xpath,
+        issue_severity,
+        semantic.road_lane_type_none.CHECKER_ID,
+    )
+    cleanup_files()
+
+
+@pytest.mark.parametrize(
+    "target_file,issue_count,issue_xpath",
+    [
+        (
+            "valid",
+            0,
+            [],
+        ),
+        (
+            "invalid",
+            1,
+            [
+                "/OpenDRIVE/road/lanes/laneSection[2]",
+            ],
+        ),
+    ],
+)
+def test_road_lanesection_min_length(
+    target_file: str,
+    issue_count: int,
+    issue_xpath: List[str],
+    monkeypatch,
+) -> None:
+    base_path = "tests/data/road_lanesection_min_length/"
+    target_file_name = f"road_lanesection_min_length_{target_file}.xodr"
+    rule_uid = semantic.road_lanesection_min_length.RULE_UID
+    issue_severity = IssueSeverity.WARNING
+
+    target_file_path = os.path.join(base_path, target_file_name)
+    create_test_config(target_file_path)
+    launch_main(monkeypatch)
+    check_issues(
+        rule_uid,
+        issue_count,
+        issue_xpath,
+        issue_severity,
+        semantic.road_lanesection_min_length.CHECKER_ID,
+    )
+    cleanup_files()
+
+
+@pytest.mark.parametrize(
+    "target_file,issue_count,issue_xpath",
+    [
+        (
+            "valid",
+            0,
+            [],
+        ),
+        (
+            "invalid",
+            3,
+            [
+                "/OpenDRIVE/road/lanes/laneSection[1]",
+                "/OpenDRIVE/road/lanes/laneSection[3]",
+                "/OpenDRIVE/road/lanes/laneSection[4]",
+            ],
+        ),
+    ],
+)
+def test_road_lanesection_s(
+    target_file: str,
+    issue_count: int,
+    issue_xpath: List[str],
+    monkeypatch,
+) -> None:
+    base_path = "tests/data/road_lanesection_s/"
+    target_file_name = f"road_lanesection_s_{target_file}.xodr"
+    rule_uid = semantic.road_lanesection_s.RULE_UID
+    issue_severity = IssueSeverity.WARNING
+
+    target_file_path = os.path.join(base_path, target_file_name)
+    create_test_config(target_file_path)
+    launch_main(monkeypatch)
+    check_issues(
+        rule_uid,
+        issue_count,
+        issue_xpath,
+        issue_severity,
+        semantic.road_lanesection_s.CHECKER_ID,
+    )
+    cleanup_files()
@@ -0,0 +1,58 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import os
+import pytest
+
+from typing import List
+
+from qc_baselib import IssueSeverity
+from openmsl_qc_opendrive.checks import semantic
+
+from test_setup import *
+
+
+@pytest.mark.parametrize(
+    "target_file,issue_count,issue_xpath",
+    [
+        (
+            "multiple_successor_valid",
+            0,
+            [],
+        ),
+        (
+            "multiple_successor_invalid",
+            1,
+            [
+                "/OpenDRIVE/road/lanes/laneSection[1]/right/lane",
+                "/OpenDRIVE/road/lanes/laneSection[2]/right/lane[1]",
+                "/OpenDRIVE/road/lanes/laneSection[2]/right/lane[2]",
+            ],
+        ),
+    ],
+)
+def test_road_lane_width_continuity(
+    target_file: str,
+    issue_count: int,
+    issue_xpath: List[str],
+    monkeypatch,
+) -> None:
+    base_path = "tests/data/smoothness_example/"
+    target_file_name = f"{target_file}.xodr"
+    rule_uid = "openmsl.net:xodr:1.4.0:road.semantic.road_lane_width_continuity"
+    issue_severity = IssueSeverity.WARNING
+
+    target_file_path = os.path.join(base_path, target_file_name)
+    create_test_config(target_file_path)
+    launch_main(monkeypatch)
+    check_issues(
+        rule_uid,
+        issue_count,
+        issue_xpath,
+        issue_severity,
+        semantic.road_lane_width_continuity.CHECKER_ID,
+    )
+    cleanup_files()
@@ -0,0 +1,143 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2026, Envited OpenMSL
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import os
+import pytest
+
+from typing import List
+
+from qc_baselib import IssueSeverity
+from openmsl_qc_opendrive.checks import semantic
+
+from test_setup import *
+
+
+@pytest.mark.parametrize(
+    "target_file,issue_count,issue_xpath",
+    [
+        (
+            "valid",
+            0,
+            [],
+        ),
+        (
+            "invalid",
+            2,
+            [
+                "/OpenDRIVE/road/objects/object[1]",
+                "/OpenDRIVE/road/objects/object[2]",
+                "/OpenDRIVE/road/objects/object[3]",
+                "/OpenDRIVE/road/objects/object[4]",
+            ],
+        ),
+    ],
+)
+def test_road_object_overlap(
+    target_file: str,
+    issue_count: int,
+    issue_xpath: List[str],
+    monkeypatch,
+) -> None:
+    base_path = "tests/data/road_object_overlap/"
+    target_file_name = f"road_object_overlap_{target_file}.xodr"
+    rule_uid = semantic.road_object_overlap.RULE_UID
+    issue_severity = IssueSeverity.WARNING
+
+    target_file_path = os.path.join(base_path, target_file_name)
+    create_test_config(target_file_path)
+    launch_main(monkeypatch)
+    check_issues(
+        rule_uid,
+        issue_count,
+        issue_xpath,
+        issue_severity,
+        semantic.road_object_overlap.CHECKER_ID,
+    )
+    cleanup_files()
+
+
+@pytest.mark.parametrize(
+    "target_file,issue_count,issue_xpath",
+    [
+        (
+            "valid",
+            0,
+            [],
+        ),
+        (
+            "invalid",
+            2,
+            [
+                "/OpenDRIVE/road/objects/object[1]",
+                "/OpenDRIVE/road/objects/object[2]",
+            ],
+        ),
+    ],
+)
+def test_road_object_on_driving_lane(
+    target_file: str,
+    issue_count: int,
+    issue_xpath: List[str],
+    monkeypatch,
+) -> None:
+    base_path = "tests/data/road_object_on_driving_lane/"
+    target_file_name = f"road_object_on_driving_lane_{target_file}.xodr"
+    rule_uid = semantic.road_object_on_driving_lane.RULE_UID
+    issue_severity = IssueSeverity.WARNING
+
+    target_file_path = os.path.join(base_path, target_file_name)
+    create_test_config(target_file_path)
+    launch_main(monkeypatch)
+    check_issues(
+        rule_uid,
+        issue_count,
+        issue_xpath,
+        issue_severity,
+        semantic.road_object_on_driving_lane.CHECKER_ID,
+    )
+    cleanup_files()
+
+
+@pytest.mark.parametrize(
+    "target_file,issue_count,issue_xpath",
+    [
+        (
+            "valid",
+            0,
+            [],
+        ),
+        (
+            "invalid",
+            1,
+            [
+                "/OpenDRIVE/road/signals/signal[1]",
+                "/OpenDRIVE/road/signals/signal[4]",
+            ],
+        ),
+    ],
+)
+def test_road_signal_duplicate(
+    target_file: str,
+    issue_count: int,
+    issue_xpath: List[str],
+    monkeypatch,
+) -> None:
+    base_path = "tests/data/road_signal_duplicate/"
+    target_file_name = f"road_signal_duplicate_{target_file}.xodr"
+    rule_uid = semantic.road_signal_duplicate.RULE_UID
+    issue_severity = IssueSeverity.WARNING
+
+    target_file_path = os.path.join(base_path, target_file_name)
+    create_test_config(target_file_path)
+    launch_main(monkeypatch)
+    check_issues(
+        rule_uid,
+        issue_count,
+        issue_xpath,
+        issue_severity,
+        semantic.road_signal_duplicate.CHECKER_ID,
+    )
+    cleanup_files()
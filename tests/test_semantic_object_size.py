@@ -129,4 +129,26 @@ def test_road_object_size_no_outline_no_height_v1_7_reports_issue(monkeypatch) -
     assert len(issues) == 1
     assert "height" in issues[0].description.lower()
 
-    cleanup_files()
\ No newline at end of file
+    cleanup_files()
+
+
+def test_road_object_size_width_without_length(monkeypatch) -> None:
+    """An object with a width but no length is still checked, the missing
+    length itself is not reported."""
+    target_file_path = "openmsl_qc_opendrive/examples/Semantic/check_object_size.xodr"
+    rule_uid = semantic.road_object_size.RULE_UID
+    checker_id = semantic.road_object_size.CHECKER_ID
+
+    create_test_config(target_file_path)
+    launch_main(monkeypatch)
+    check_issues(
+        rule_uid,
+        3,
+        [
+            "/OpenDRIVE/road/objects/object[3]",
+            "/OpenDRIVE/road/objects/object[5]",
+        ],
+        IssueSeverity.WARNING,
+        checker_id,
+    )
+    cleanup_files()
@@ -4,9 +4,27 @@
 # Public License, v. 2.0. If a copy of the MPL was not distributed
 # with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
+import glob
+from io import BytesIO
+
+import numpy as np
 import pytest
 from lxml import etree
-from qc_opendrive.base.utils import *
+from typing import List, Tuple
+from openmsl_qc_opendrive.base import (
+    arc_length,
+    byte_index,
+    clothoid,
+    input_stream,
+    lane_borders,
+    outline,
+    positions,
+    road_geometry,
+    spatial,
+    tables,
+    visitor,
+)
+from openmsl_qc_opendrive.base.utils import *
 
 
 def test_get_root_without_default_namespace() -> None:
@@ -140,6 +158,9 @@ def test_get_point_xyz_from_road_invalid_s() -> None:
         ("simple_line_elevation.xodr", 5, 0, 0, 5, 0, 5),
         ("simple_line_elevation.xodr", 5, 10, 0, 5, 10, 5),
         ("simple_line_elevation.xodr", 5, -10, 0, 5, -10, 5),
+        ("simple_line_elevation_shape.xodr", 25, -3.5, 0, 25, -3.5, 25.14),
+        ("simple_line_elevation_shape.xodr", 75, 4, 1, 75, 4, 76.096),
+        ("simple_line_elevation_shape.xodr", 10, -10, 0, 10, -10, 10.34),
         ("simple_line_heading_and_elevation.xodr", 0, 5, 0, -5, 0, 0),
         ("simple_line_heading_and_elevation.xodr", 0, -5, 0, 5, 0, 0),
         ("simple_line_heading_and_elevation.xodr", 20, -5, 0, 5, 20, 20),
@@ -317,3 +338,1183 @@ def test_get_point_xyz_from_road(file_name, s, t, h, x, y, z) -> None:
     assert point.x == pytest.approx(x, abs=1e-6)
     assert point.y == pytest.approx(y, abs=1e-6)
     assert point.z == pytest.approx(z, abs=1e-6)
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    [
+        "tests/data/utils/Ex_Line-Spiral-Arc_elevation_and_superelevation.xodr",
+        "tests/data/utils/simple_line_heading_and_elevation_and_superelevation.xodr",
+        "tests/data/road_lane_level_true_one_side_road/road_lane_level_true_one_side_road_valid.xodr",
+    ],
+)
+def test_evaluate_road_profiles(file_name) -> None:
+    root = get_root_without_default_namespace(file_name)
+
+    for road in get_roads(root):
+        length = get_road_length(road)
+        s_values = np.linspace(0.0, length, 25)
+
+        elevations = evaluate_road_elevation(road, s_values)
+        superelevations = evaluate_road_superelevation(road, s_values)
+        lane_offsets = evaluate_road_lane_offset(road, s_values)
+
+        for i, s in enumerate(s_values):
+            elevation = get_elevation_from_road_by_s(road, s)
+            superelevation = get_superelevation_from_road_by_s(road, s)
+            lane_offset = get_lane_offset_from_road_by_s(road, s)
+
+            assert elevations[i] == pytest.approx(
+                calculate_elevation_value(elevation, s), abs=1e-9
+            )
+            assert superelevations[i] == pytest.approx(
+                poly3_to_polynomial(superelevation.poly3)(s - superelevation.s_offset),
+                abs=1e-9,
+            )
+            assert lane_offsets[i] == pytest.approx(
+                poly3_to_polynomial(lane_offset.poly3)(s - lane_offset.s_offset),
+                abs=1e-9,
+            )
+
+        outside = evaluate_road_elevation(road, np.array([-0.001, length + 0.001]))
+        assert np.all(np.isnan(outside))
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    [
+        "Ex_Line-Spiral-Arc.xodr",
+        "Ex_Line-Spiral-Arc_elevation_and_superelevation.xodr",
+        "simple_line_heading_and_elevation_and_superelevation.xodr",
+    ],
+)
+def test_get_points_xyz_from_road(file_name) -> None:
+    root = get_root_without_default_namespace(f"tests/data/utils/{file_name}")
+
+    road = get_roads(root)[0]
+    length = get_road_length(road)
+    s = np.array([-1.0, 0.0, length / 3.0, length / 2.0, length, length + 1.0])
+    t = np.array([0.0, 5.0, -5.0, 10.0, -2.5, 0.0])
+    h = np.array([0.0, 1.0, 0.0, 10.0, 0.0, 0.0])
+
+    points = get_points_xyz_from_road(road, s, t, h)
+
+    assert points.shape == (len(s), 3)
+    assert np.all(np.isnan(points[0]))
+    assert np.all(np.isnan(points[-1]))
+
+    for i in range(1, len(s) - 1):
+        point = get_point_xyz_from_road(road, s[i], t[i], h[i])
+        assert points[i] == pytest.approx([point.x, point.y, point.z], abs=1e-9)
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    [
+        "Ex_Line-Spiral-Arc.xodr",
+        "Ex_Line-Spiral-Arc_elevation_and_superelevation.xodr",
+        "simple_line_heading_and_elevation_and_superelevation.xodr",
+    ],
+)
+def test_interpolate_road_reference_line(file_name) -> None:
+    root = get_root_without_default_namespace(f"tests/data/utils/{file_name}")
+
+    road = get_roads(root)[0]
+    length = get_road_length(road)
+    s = np.linspace(-1.0, length + 1.0, 101)
+
+    x, y, z, heading = interpolate_road_reference_line(road, s, tolerance=0.01)
+    exact_x, exact_y, exact_heading = evaluate_road_reference_line(road, s)
+    exact_z = evaluate_road_elevation(road, s)
+
+    on_road = (s >= 0.0) & (s <= length)
+    assert np.all(np.isnan(x[~on_road]))
+    assert np.hypot(x - exact_x, y - exact_y)[on_road] == pytest.approx(0.0, abs=0.01)
+    assert z[on_road] == pytest.approx(exact_z[on_road], abs=0.01)
+    heading_error = np.angle(np.exp(1j * (heading - exact_heading)))
+    assert heading_error[on_road] == pytest.approx(0.0, abs=0.01)
+
+
+def test_interpolate_road_reference_line_bounds_elevation_error() -> None:
+    # The reference line is straight, only the elevation is curved
+    root = etree.ElementTree(
+        etree.fromstring(
+            b"""<OpenDRIVE>
+  <header revMajor="1" revMinor="6"/>
+  <road id="1" junction="-1" length="100.0">
+    <planView>
+      <geometry s="0.0" x="0.0" y="0.0" hdg="0.0" length="100.0"><line/></geometry>
+    </planView>
+    <elevationProfile>
+      <elevation s="0.0" a="0.0" b="0.0" c="0.001" d="0.0"/>
+      <elevation s="50.0" a="2.5" b="0.1" c="-0.001" d="0.0"/>
+    </elevationProfile>
+  </road>
+</OpenDRIVE>"""
+        )
+    )
+
+    road = get_roads(root)[0]
+    s = np.linspace(0.0, 100.0, 101)
+
+    x, y, z, heading = interpolate_road_reference_line(
+        road, s, tolerance=0.01, step=40.0
+    )
+
+    assert z == pytest.approx(evaluate_road_elevation(road, s), abs=0.01)
+
+
+def test_reference_line_cache_eviction() -> None:
+    root = get_root_without_default_namespace(
+        "tests/data/utils/Ex_Line-Spiral-Arc.xodr"
+    )
+    road = get_roads(root)[0]
+
+    polyline = compile_road_reference_line_polyline(road, 1.0)
+    cache = reference_line.ReferenceLineCache(max_bytes=2 * polyline.nbytes)
+
+    cache.get("first", lambda: polyline)
+    cache.get("second", lambda: polyline)
+    assert len(cache) == 2
+    assert cache.nbytes == 2 * polyline.nbytes
+
+    # Touch the first polyline so that the second one is the least recently used
+    assert cache.get("first", lambda: None) is polyline
+    cache.get("third", lambda: polyline)
+
+    assert "first" in cache
+    assert "second" not in cache
+    assert "third" in cache
+    assert cache.nbytes == 2 * polyline.nbytes
+
+    # A polyline larger than the limit is kept as the only entry
+    dense = compile_road_reference_line_polyline(road, 0.1)
+    cache.get("dense", lambda: dense)
+    assert len(cache) == 1
+    assert "dense" in cache
+
+
+def test_evaluate_t_middle_points_from_lane() -> None:
+    root = get_root_without_default_namespace(
+        "tests/data/utils/Ex_Bidirectional_Junction.xodr"
+    )
+
+    for road in get_roads(root):
+        length = get_road_length(road)
+        s_values = np.linspace(-1.0, length + 1.0, 17)
+
+        for lane_section in get_lane_sections(road):
+            for lane in get_left_and_right_lanes_from_lane_section(lane_section):
+                t_values = evaluate_t_middle_points_from_lane(
+                    road, lane_section, lane, s_values
+                )
+
+                for s, t in zip(s_values, t_values):
+                    expected = get_t_middle_point_from_lane_by_s(
+                        road, lane_section, lane, s
+                    )
+                    if expected is None:
+                        assert np.isnan(t)
+                    else:
+                        assert t == pytest.approx(expected, abs=1e-9)
+
+
+def test_lane_group_borders_accumulate_widths() -> None:
+    def width(a: float, s_offset: float = 0.0) -> models.OffsetPoly3:
+        return models.OffsetPoly3(
+            poly3=models.Poly3(a=a, b=0.0, c=0.0, d=0.0), s_offset=s_offset
+        )
+
+    # Lane -2 only has a width from ds = 5, lane -3 has no width record
+    group = lane_borders.LaneGroupBorders(
+        lane_ids=[-3, -1, -2],
+        widths=[[], [width(3.0)], [width(2.0, 5.0)]],
+        borders=[[], [], []],
+    )
+    borders = group.evaluate_outer_borders(np.array([0.0, 10.0]), 1.0)
+
+    assert list(group.lane_ids) == [-1, -2, -3]
+    assert borders[0] == pytest.approx([-2.0, -2.0])
+    assert np.isnan(borders[1, 0])
+    assert borders[1, 1] == pytest.approx(-4.0)
+    assert np.all(np.isnan(borders[2]))
+    assert group.evaluate_middle(-2, np.array([10.0]), 1.0) == pytest.approx([-3.0])
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    [
+        "tests/data/junction_connection_road_linkage/junction_connection_road_linkage_invalid.xodr",
+        "tests/data/road_lane_property_sOffset/road_lane_property_sOffset_invalid.xodr",
+        "tests/data/road_lane_width/road_lane_width_invalid.xodr",
+    ],
+)
+def test_network_visitor_matches_standalone_checkers(file_name) -> None:
+    from qc_baselib import Configuration, Result
+
+    from openmsl_qc_opendrive import constants, main
+    from openmsl_qc_opendrive.checks import semantic
+
+    checkers = [
+        semantic.junction_connection_road_linkage,
+        semantic.road_lane_property_sOffset,
+        semantic.road_lane_width,
+    ]
+
+    def run(single_pass: bool) -> List[Tuple[int, str, str]]:
+        root = get_root_without_default_namespace(file_name)
+        result = Result()
+        result.register_checker_bundle(
+            name=constants.BUNDLE_NAME, description="", version="", summary=""
+        )
+        config = Configuration()
+        config.set_config_param(name="InputFile", value=file_name)
+        checker_data = models.CheckerData(
+            xml_file_path=file_name,
+            input_file_xml_root=root,
+            config=config,
+            result=result,
+            schema_version=get_standard_schema_version(root),
+        )
+        if single_pass:
+            visitor.walk_network(checker_data, checkers)
+
+        issues = []
+        for checker in checkers:
+            main.execute_checker(checker, checker_data)
+            for issue in result.get_checker_result(
+                constants.BUNDLE_NAME, checker.CHECKER_ID
+            ).issues:
+                issues.append(
+                    (
+                        issue.issue_id,
+                        issue.description,
+                        issue.locations[0].xml_location[0].xpath,
+                    )
+                )
+        return issues
+
+    standalone = run(single_pass=False)
+    assert len(standalone) > 0
+    assert run(single_pass=True) == standalone
+
+
+def test_network_visitor_reraises_after_recorded_issues() -> None:
+    root = get_root_without_default_namespace("tests/data/utils/simple_line.xodr")
+    checker_data = models.CheckerData(
+        xml_file_path="",
+        input_file_xml_root=root,
+        config=None,
+        result=None,
+        schema_version=None,
+    )
+
+    def check_road(road, checker_data) -> None:
+        issue_id = checker_data.result.register_issue(
+            checker_bundle_name="bundle",
+            checker_id="checker",
+            description="road",
+            level=None,
+            rule_uid="rule",
+        )
+        checker_data.result.add_xml_location(
+            checker_bundle_name="bundle",
+            checker_id="checker",
+            issue_id=issue_id,
+            xpath="/OpenDRIVE/road",
+            description="road",
+        )
+        raise ValueError("broken road")
+
+    network_visitor = visitor.NetworkVisitor(checker_data)
+    network_visitor.register("checker", visitor.ROAD, check_road)
+    network_visitor.walk()
+
+    class FakeResult:
+        def __init__(self):
+            self.calls = []
+
+        def register_issue(self, **kwargs) -> int:
+            self.calls.append(("register_issue", kwargs["description"]))
+            return 42
+
+        def add_xml_location(self, **kwargs) -> None:
+            self.calls.append(("add_xml_location", kwargs["issue_id"]))
+
+    result = FakeResult()
+    with pytest.raises(ValueError, match="broken road"):
+        network_visitor.flush("checker", result)
+
+    assert result.calls == [("register_issue", "road"), ("add_xml_location", 42)]
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    sorted(glob.glob("tests/data/**/*.xodr", recursive=True)),
+)
+def test_threaded_checkers_match_serial_run(file_name) -> None:
+    import sys
+
+    from qc_baselib import Configuration, Result
+
+    from openmsl_qc_opendrive import constants, main
+
+    checkers = main.get_checkers()
+
+    def run(threads: int) -> list:
+        root = get_root_without_default_namespace(file_name)
+        result = Result()
+        result.register_checker_bundle(
+            name=constants.BUNDLE_NAME, description="", version="", summary=""
+        )
+        config = Configuration()
+        config.set_config_param(name="InputFile", value=file_name)
+        checker_data = models.CheckerData(
+            xml_file_path=file_name,
+            input_file_xml_root=root,
+            config=config,
+            result=result,
+            schema_version=get_standard_schema_version(root),
+        )
+        visitor.walk_network(checker_data, checkers)
+        if threads > 1:
+            main.execute_checkers_in_threads(checkers, checker_data, threads)
+        else:
+            for checker in checkers:
+                main.execute_checker(checker, checker_data)
+
+        return [
+            checker.model_dump()
+            for checker in result.get_checker_bundle_result(
+                constants.BUNDLE_NAME
+            ).checkers
+        ]
+
+    # Files the bundle cannot check fail the same way in a threaded run
+    try:
+        serial = run(threads=1)
+    except Exception as e:
+        with pytest.raises(type(e)):
+            run(threads=8)
+        return
+
+    # Switch threads as often as possible to provoke races on the shared caches
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1.0e-6)
+    try:
+        assert run(threads=8) == serial
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+
+def test_threaded_checkers_share_geometry_caches() -> None:
+    import concurrent.futures
+    import sys
+
+    from qc_baselib import Configuration, Result
+
+    from openmsl_qc_opendrive import constants, main
+    from openmsl_qc_opendrive.checks import geometry
+
+    file_name = "tests/data/utils/Ex_Bidirectional_Junction.xodr"
+    checkers = [
+        geometry.road_geometry_continuity,
+        geometry.road_geometry_parampoly3_length_match,
+        geometry.road_link_continuity,
+    ]
+
+    def run(threads: int) -> list:
+        root = get_root_without_default_namespace(file_name)
+        result = Result()
+        result.register_checker_bundle(
+            name=constants.BUNDLE_NAME, description="", version="", summary=""
+        )
+        config = Configuration()
+        config.set_config_param(name="InputFile", value=file_name)
+        checker_data = models.CheckerData(
+            xml_file_path=file_name,
+            input_file_xml_root=root,
+            config=config,
+            result=result,
+            schema_version=get_standard_schema_version(root),
+        )
+        main.execute_checkers_in_threads(checkers, checker_data, threads)
+        return [
+            checker.model_dump()
+            for checker in result.get_checker_bundle_result(
+                constants.BUNDLE_NAME
+            ).checkers
+        ]
+
+    def get_cached_geometry(road: etree._ElementTree) -> tuple:
+        return (
+            road_geometry.get_geometry_arc_lengths(road),
+            road_geometry.get_geometry_transitions(road),
+            road_geometry.get_road_contact_pose(road, models.ContactPoint.START),
+        )
+
+    serial = run(threads=1)
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1.0e-6)
+    try:
+        for _ in range(5):
+            # All checkers of a run share the network index of the document
+            assert run(threads=3) == serial
+
+            root = get_root_without_default_namespace(file_name)
+            roads = get_roads(root) * 8
+            with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+                cached = list(executor.map(get_cached_geometry, roads))
+
+            # Every thread is handed the entry stored first
+            for road, (arc_lengths, transitions, pose) in zip(roads, cached):
+                assert arc_lengths is road_geometry.get_geometry_arc_lengths(road)
+                assert transitions is road_geometry.get_geometry_transitions(road)
+                assert np.shares_memory(
+                    pose,
+                    road_geometry.get_road_contact_pose(
+                        road, models.ContactPoint.START
+                    ),
+                )
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    [
+        "tests/data/utils/Ex_Bidirectional_Junction.xodr",
+        "tests/data/utils/simple_line_elevation_shape.xodr",
+    ],
+)
+def test_network_snapshot_round_trip(file_name, tmp_path) -> None:
+    root = get_root_without_default_namespace(file_name)
+
+    created = load_network_snapshot(root, file_name, str(tmp_path))
+    snapshot_path = tmp_path / snapshot.file_digest(file_name)
+    assert (snapshot_path / snapshot.STRINGS_FILE_NAME).is_file()
+
+    expected = {}
+    for road in get_roads(root):
+        length = get_road_length(road)
+        s = np.linspace(0.0, length, 11)
+        expected[road.get("id")] = (
+            get_points_xyz_from_road(road, s, 1.5, 0.0),
+            [
+                evaluate_t_middle_points_from_lane(road, lane_section, lane, s)
+                for lane_section in get_lane_sections(road)
+                for lane in get_left_and_right_lanes_from_lane_section(lane_section)
+            ],
+        )
+
+    # A second run on a freshly parsed tree uses the memory mapped tables
+    network.reset_network_index()
+    root = get_root_without_default_namespace(file_name)
+    loaded = load_network_snapshot(root, file_name, str(tmp_path))
+    assert loaded is not created
+    assert isinstance(loaded.arrays["geometry_s"], np.memmap)
+
+    for road in get_roads(root):
+        length = get_road_length(road)
+        s = np.linspace(0.0, length, 11)
+        points, t_values = expected[road.get("id")]
+        assert get_road_plan_view(road).records is None
+        assert get_points_xyz_from_road(road, s, 1.5, 0.0) == pytest.approx(
+            points, abs=1e-12
+        )
+        middle = [
+            evaluate_t_middle_points_from_lane(road, lane_section, lane, s)
+            for lane_section in get_lane_sections(road)
+            for lane in get_left_and_right_lanes_from_lane_section(lane_section)
+        ]
+        for actual, expected_t in zip(middle, t_values):
+            np.testing.assert_allclose(actual, expected_t, atol=1e-12)
+
+
+def test_get_root_without_default_namespace_skips_subtrees() -> None:
+    file_name = "tests/data/road_object_position/road_object_position_invalid.xodr"
+
+    full_root = get_root_without_default_namespace(file_name)
+    root = get_root_without_default_namespace(file_name, OPTIONAL_SUBTREES)
+
+    assert len(full_root.findall(".//object")) > 0
+    assert len(root.findall(".//object")) == 0
+    assert len(root.findall(".//signal")) == 0
+
+    # Remaining elements keep their positional xpath
+    full_paths = [full_root.getpath(lane) for lane in full_root.iter("lane")]
+    assert full_paths == [root.getpath(lane) for lane in root.iter("lane")]
+
+
+def test_default_config_runs_every_checker() -> None:
+    from qc_baselib import Configuration, Result, StatusType
+
+    from openmsl_qc_opendrive import constants, main
+
+    config = Configuration()
+    config.load_from_file(xml_file_path="openmsl_qc_config_xodr.xml")
+    config.set_config_param(
+        name="InputFile",
+        value="tests/data/road_object_position/road_object_position_invalid.xodr",
+    )
+    result = Result()
+    result.register_checker_bundle(
+        name=constants.BUNDLE_NAME, description="", version="", summary=""
+    )
+
+    main.run_checks(config, result)
+
+    # A checker left out of the shipped configuration would be skipped
+    skipped = [
+        checker.CHECKER_ID
+        for checker in main.get_checkers()
+        if result.get_checker_status(checker.CHECKER_ID) != StatusType.COMPLETED
+    ]
+    assert skipped == []
+
+
+@pytest.mark.parametrize("compression", ["gzip", "xz", "zstd"])
+def test_get_root_without_default_namespace_compressed(tmp_path, compression) -> None:
+    file_name = "tests/data/utils/namespace.xodr"
+    with open(file_name, "rb") as raw_file:
+        content = raw_file.read()
+
+    if compression == "gzip":
+        import gzip
+
+        compressed = gzip.compress(content)
+    elif compression == "xz":
+        import lzma
+
+        compressed = lzma.compress(content)
+    else:
+        zstandard = pytest.importorskip("zstandard")
+        compressed = zstandard.ZstdCompressor().compress(content)
+
+    compressed_file_name = tmp_path / f"map.xodr.{compression}"
+    compressed_file_name.write_bytes(compressed)
+
+    expected = get_root_without_default_namespace(file_name)
+    root = get_root_without_default_namespace(
+        str(compressed_file_name), zstd_chunk_size=64
+    )
+    assert etree.tostring(root) == etree.tostring(expected)
+
+
+def test_default_namespace_filter_across_chunks() -> None:
+    content = (
+        b'<?xml version="1.0"?>\n<OpenDRIVE xmlns="http://www.asam.net/xml/opendrive">'
+        b'<header revMajor="1"/><road id="1" xmlns="http://example.com"/></OpenDRIVE>'
+    )
+
+    for chunk_size in (1, 7, 1000):
+        source = input_stream.DefaultNamespaceFilter(BytesIO(content), chunk_size)
+        assert source.read() == (
+            b'<?xml version="1.0"?>\n<OpenDRIVE>'
+            b'<header revMajor="1"/><road id="1"/></OpenDRIVE>'
+        )
+
+
+def test_partial_root_maps_xpaths_to_original_file(tmp_path) -> None:
+    file_name = tmp_path / "Ex_Bidirectional_Junction.xodr"
+    file_name.write_bytes(
+        open("tests/data/utils/Ex_Bidirectional_Junction.xodr", "rb").read()
+    )
+    file_name = str(file_name)
+
+    full_root = get_root_without_default_namespace(file_name)
+    root, partial_document = get_partial_root_without_default_namespace(
+        file_name, byte_index.RegionOfInterest(road_ids={"1"})
+    )
+
+    # The index is stored next to the file and reused by later runs
+    index = byte_index.load_byte_index(file_name)
+    assert index is not None
+    assert [e.id for e in index.elements if e.tag == "road"] == [
+        road.get("id") for road in get_roads(full_root)
+    ]
+
+    # Road 1 is selected, its junction and the junction roads are parsed as
+    # context
+    assert [e.id for e in partial_document.selected] == ["1"]
+    context = {(e.tag, e.id) for e in partial_document.context}
+    assert {("junction", "1"), ("road", "2"), ("road", "6")} <= context
+    assert ("road", "1") not in context
+
+    full_roads = get_road_id_map(full_root)
+    for road_id, road in get_road_id_map(root).items():
+        xpath = partial_document.map_xpath(root.getpath(road))
+        assert xpath == full_root.getpath(full_roads[road_id])
+        assert partial_document.is_context(root.getpath(road)) == (road_id != 1)
+
+        for lane in road.iter("lane"):
+            full_lane = full_root.xpath(partial_document.map_xpath(root.getpath(lane)))[
+                0
+            ]
+            assert full_lane.get("id") == lane.get("id")
+            assert next(full_lane.iterancestors("road")) is full_roads[road_id]
+
+
+def test_byte_index_region_of_interest() -> None:
+    index = byte_index.build_byte_index(
+        "tests/data/utils/Ex_Bidirectional_Junction.xodr"
+    )
+    roads = {e.id: e for e in index.elements if e.tag == "road"}
+
+    # Junction 1 selects its connecting roads, the incoming roads are context
+    selected, context = index.select(byte_index.RegionOfInterest(junction_ids={"1"}))
+    assert {(e.tag, e.id) for e in selected} == {("junction", "1")} | {
+        ("road", e.id) for e in roads.values() if e.junction == "1"
+    }
+    assert len(context) > 0
+    assert all(e.junction != "1" for e in context)
+
+    # The extents are conservative, a box at the corner of the extent of road
+    # 1 selects it
+    x_min, y_min, _, _ = roads["1"].extent
+    region = byte_index.RegionOfInterest(
+        bounding_box=(x_min, y_min, x_min + 1.0, y_min + 1.0), margin=0.0
+    )
+    selected, _ = index.select(region)
+    assert ("road", "1") in {(e.tag, e.id) for e in selected}
+
+    region.bounding_box = (1.0e6, 1.0e6, 1.0e6 + 1.0, 1.0e6 + 1.0)
+    assert index.select(region) == (
+        [],
+        [e for e in index.elements if e.tag == "controller"],
+    )
+
+
+def test_byte_index_skips_commented_out_elements(tmp_path) -> None:
+    file_name = tmp_path / "commented_out_road.xodr"
+    file_name.write_bytes(
+        b"""<?xml version="1.0"?>
+<OpenDRIVE>
+  <header revMajor="1" revMinor="6"/>
+  <!-- <road id="0" junction="-1" length="1.0"></road> -->
+  <road id="1" junction="-1" length="10.0">
+    <link><successor elementType="road" elementId="2" contactPoint="start"/></link>
+    <!-- <link><predecessor elementType="junction" elementId="9"/></link> </road> -->
+  </road>
+  <userData><![CDATA[<road id="3"></road>]]></userData>
+  <road id="2" junction="-1" length="10.0"/>
+</OpenDRIVE>"""
+    )
+    file_name = str(file_name)
+
+    index = byte_index.build_byte_index(file_name)
+
+    assert [(e.tag, e.id, e.position) for e in index.elements] == [
+        ("road", "1", 1),
+        ("road", "2", 2),
+    ]
+    assert index.elements[0].links == [("road", "2")]
+
+    full_root = get_root_without_default_namespace(file_name)
+    root, partial_document = get_partial_root_without_default_namespace(
+        file_name, byte_index.RegionOfInterest(road_ids={"2"})
+    )
+    road = get_road_id_map(root)[2]
+    assert (
+        full_root.xpath(partial_document.map_xpath(root.getpath(road)))[0].get("id")
+        == "2"
+    )
+
+
+def test_param_poly3_arc_lengths() -> None:
+    # A straight line u(p) = 2p, v(p) = 0 and a parabola v(p) = p^2 on [0, 1]
+    u = np.array([[0.0, 2.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]])
+    v = np.array([[0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0]])
+    lengths, errors = arc_length.param_poly3_arc_lengths(u, v, [3.0, 1.0])
+
+    parabola_length = (2.0 * np.sqrt(5.0) + np.arcsinh(2.0)) / 4.0
+    assert lengths == pytest.approx([6.0, parabola_length], abs=1e-9)
+    assert np.all(errors < 1e-8)
+
+
+def test_get_geometry_arc_lengths() -> None:
+    root = get_root_without_default_namespace(
+        "tests/data/road_geometry_param_poly3_length_match/road_geometry_param_poly3_length_match_invalid.xodr"
+    )
+    road = get_roads(root)[0]
+    road_plan_view = get_road_plan_view(road)
+    arc_lengths = road_geometry.get_geometry_arc_lengths(road)
+
+    assert len(arc_lengths) == len(road_plan_view)
+    assert arc_lengths[0] == pytest.approx(road_plan_view.length[0], abs=1e-3)
+    assert abs(arc_lengths[1] - road_plan_view.length[1]) > 0.5
+
+
+def test_reparametrization_table_inverts_arc_length() -> None:
+    u = np.array([[0.0, 1.0, 0.2, -0.1], [0.0, 3.0, 0.0, 0.0]])
+    v = np.array([[0.0, 0.0, 2.0, -1.5], [0.0, 0.0, 0.0, 0.0]])
+    table = arc_length.ReparametrizationTable(u, v, 1.0)
+
+    # The straight line has constant speed, so p is proportional to s
+    assert table.invert(np.ones(3), np.array([0.0, 1.5, 3.0])) == pytest.approx(
+        [0.0, 0.5, 1.0]
+    )
+
+    s = np.linspace(0.0, table.s_knots[0, -1], 7)
+    p = table.invert(np.zeros(len(s)), s)
+    lengths, _ = arc_length.param_poly3_arc_lengths(
+        np.repeat(u[:1], len(s), axis=0), np.repeat(v[:1], len(s), axis=0), p
+    )
+    assert lengths == pytest.approx(s, abs=1e-9)
+
+
+def test_normalized_param_poly3_evaluated_at_arc_length() -> None:
+    root = get_root_without_default_namespace(
+        "tests/data/road_geometry_param_poly3_length_match/road_geometry_param_poly3_length_match_invalid.xodr"
+    )
+    road = get_roads(root)[0]
+    geometry = get_road_plan_view_geometry_list(road)[1]
+    road_plan_view = get_road_plan_view(road)
+    s0 = road_plan_view.s[1]
+
+    for ds in [0.0, 10.0, 200.0]:
+        x, y, heading = road_plan_view.evaluate(np.array([s0 + ds]))
+        point = get_point_xy_from_geometry(geometry, s0 + ds)
+        assert (x[0], y[0]) == pytest.approx((point.x, point.y), abs=1e-9)
+        assert heading[0] == pytest.approx(
+            get_heading_from_geometry_by_s(geometry, s0 + ds), abs=1e-12
+        )
+
+    # The point at ds is ds away from the start along the curve
+    x, y, _ = road_plan_view.evaluate(s0 + np.linspace(0.0, 10.0, 1001))
+    assert np.hypot(np.diff(x), np.diff(y)).sum() == pytest.approx(10.0, abs=1e-6)
+
+
+@pytest.mark.parametrize(
+    "curv_start,curv_end,length",
+    [
+        (0.0, 0.01, 100.0),
+        (0.02, -0.03, 150.0),
+        (-0.1, 0.1, 30.0),
+        (0.005, 0.0050001, 500.0),
+        (0.01, 0.01 + 1.0e-12, 200.0),
+        (0.0, 0.0, 50.0),
+    ],
+)
+def test_fresnel_spiral_matches_pyclothoids(curv_start, curv_end, length) -> None:
+    ds = np.linspace(0.0, length, 11)
+    x0, y0, heading = 512.3, -87.1, 2.1
+
+    points = [
+        calculate_spiral_point(
+            d, 0.0, x0, y0, heading, curv_start, curv_end, length, clothoid.PYCLOTHOIDS
+        )
+        for d in ds
+    ]
+    headings = [
+        calculate_spiral_point_heading(
+            d, 0.0, x0, y0, heading, curv_start, curv_end, length, clothoid.PYCLOTHOIDS
+        )
+        for d in ds
+    ]
+
+    x, y, theta = clothoid.evaluate_clothoids(
+        x0, y0, heading, curv_start, (curv_end - curv_start) / length, ds
+    )
+    assert x == pytest.approx([p.x for p in points], abs=1e-9)
+    assert y == pytest.approx([p.y for p in points], abs=1e-9)
+    assert theta == pytest.approx(headings, abs=1e-12)
+
+    point = calculate_spiral_point(
+        ds[3], 0.0, x0, y0, heading, curv_start, curv_end, length, clothoid.FRESNEL
+    )
+    assert (point.x, point.y) == pytest.approx((x[3], y[3]))
+
+
+def test_plan_view_spiral_backends_agree() -> None:
+    root = get_root_without_default_namespace(
+        "tests/data/junctions_connection_one_link_to_incoming/Ex_Bidirectional_Junction_valid.xodr"
+    )
+    for road in get_roads(root):
+        road_plan_view = get_road_plan_view(road)
+        if models.GeometryType.SPIRAL not in road_plan_view.geometry_type:
+            continue
+
+        s = np.linspace(0.0, get_road_length(road), 101)
+        expected = road_plan_view.evaluate(s)
+        clothoid.set_backend(clothoid.FRESNEL)
+        try:
+            result = road_plan_view.evaluate(s)
+        finally:
+            clothoid.set_backend(clothoid.DEFAULT_BACKEND)
+
+        for values, expected_values in zip(result, expected):
+            assert values == pytest.approx(expected_values, abs=1e-9)
+
+
+def test_compile_road_contact_poses() -> None:
+    root = get_root_without_default_namespace(
+        "tests/data/junctions_connection_one_link_to_incoming/Ex_Bidirectional_Junction_valid.xodr"
+    )
+    roads = get_roads(root)
+    poses = road_geometry.compile_road_contact_poses(roads)
+
+    assert len(poses) == len(roads)
+    for road, road_poses in zip(roads, poses):
+        for contact, s in enumerate([0.0, get_road_length(road)]):
+            point = get_point_xyz_from_road_reference_line(road, s)
+            x, y, heading = evaluate_road_reference_line(road, np.array([s]))
+            assert road_poses[contact] == pytest.approx(
+                [point.x, point.y, heading[0], point.z], abs=1e-9
+            )
+
+
+def test_lane_width_table_matches_evaluate_lane_width() -> None:
+    root = get_root_without_default_namespace(
+        "tests/data/smoothness_example/many_invalid.xodr"
+    )
+    lanes = [
+        lane
+        for lane_section in root.iter("laneSection")
+        for lane in get_left_and_right_lanes_from_lane_section(lane_section)
+        if get_lane_id(lane) != 0
+    ]
+    table = lane_borders.LaneWidthTable(
+        [get_lane_width_poly3_list(lane) for lane in lanes]
+    )
+
+    ds = np.array([0.0, 0.5, 3.0, 17.25, 100.0])
+    rows = np.repeat(np.arange(len(lanes)), len(ds))
+    widths = table.evaluate(rows, np.tile(ds, len(lanes)))
+
+    expected = [evaluate_lane_width(lane, d) for lane in lanes for d in ds]
+    expected = [np.nan if w is None else w for w in expected]
+    assert widths == pytest.approx(expected, nan_ok=True)
+
+
+def test_segment_grid_candidates_match_brute_force() -> None:
+    rng = np.random.default_rng(0)
+    x0, y0 = rng.uniform(0.0, 100.0, (2, 500))
+    x1 = x0 + rng.uniform(-5.0, 5.0, 500)
+    y1 = y0 + rng.uniform(-5.0, 5.0, 500)
+
+    grid = spatial.SegmentGrid(x0, y0, x1, y1)
+    first, second = grid.candidate_pairs()
+    crossing, _, _ = spatial.intersect_segments(
+        x0[first],
+        y0[first],
+        x1[first],
+        y1[first],
+        x0[second],
+        y0[second],
+        x1[second],
+        y1[second],
+    )
+
+    i, j = np.triu_indices(500, k=1)
+    expected, _, _ = spatial.intersect_segments(
+        x0[i], y0[i], x1[i], y1[i], x0[j], y0[j], x1[j], y1[j]
+    )
+    assert set(zip(first[crossing], second[crossing])) == set(
+        zip(i[expected], j[expected])
+    )
+
+
+def test_box_grid_points_match_brute_force() -> None:
+    rng = np.random.default_rng(1)
+    min_x, min_y = rng.uniform(0.0, 100.0, (2, 300))
+    max_x = min_x + rng.uniform(0.0, 8.0, 300)
+    max_y = min_y + rng.uniform(0.0, 8.0, 300)
+    x, y = rng.uniform(-10.0, 110.0, (2, 400))
+
+    grid = spatial.BoxGrid(min_x, min_y, max_x, max_y)
+    box, point = grid.boxes_containing_points(x, y)
+
+    inside = (
+        (min_x[:, np.newaxis] <= x)
+        & (x <= max_x[:, np.newaxis])
+        & (min_y[:, np.newaxis] <= y)
+        & (y <= max_y[:, np.newaxis])
+    )
+    assert set(zip(box, point)) == set(zip(*np.nonzero(inside)))
+
+
+def test_intersect_rectangles_separating_axis() -> None:
+    x = np.array([0.0, 2.9, 3.0, 0.0, 2.5])
+    y = np.array([0.0, 0.0, 0.0, 5.0, 2.5])
+    heading = np.array([0.0, 0.0, 0.0, 0.0, np.pi / 4])
+    half_length = np.array([2.0, 1.0, 1.0, 2.0, 2.0])
+    half_width = np.array([1.0, 1.0, 1.0, 1.0, 0.5])
+
+    first = np.array([0, 0, 0, 0])
+    second = np.array([1, 2, 3, 4])
+    overlap = spatial.intersect_rectangles(
+        x, y, heading, half_length, half_width, first, second
+    )
+
+    # Touching at x = 2 is no overlap, the turned rectangle reaches into the
+    # corner of the first one
+    assert overlap.tolist() == [True, False, False, True]
+
+
+def test_project_points_to_roads_inverts_forward_projection() -> None:
+    root = get_root_without_default_namespace(
+        "tests/data/smoothness_example/lane_gap_example_issue_119.xodr"
+    )
+    rng = np.random.default_rng(0)
+
+    for road in get_roads(root):
+        s = rng.uniform(0.0, get_road_length(road), 20)
+        t = rng.uniform(-1.0, 1.0, 20)
+        points = get_points_xyz_from_road(road, s, t, 0.0)
+
+        coordinates = positions.project_points_to_roads(
+            root, points[:, 0], points[:, 1]
+        )
+
+        assert all(projected is road for projected in coordinates.roads)
+        assert coordinates.s == pytest.approx(s, abs=1e-6)
+        assert coordinates.t == pytest.approx(t, abs=1e-6)
+        assert coordinates.lanes == evaluate_lanes_from_road(road, s, t)
+
+    far_away = positions.project_points_to_roads(
+        root, [1.0e7], [1.0e7], max_distance=100.0
+    )
+    assert far_away.roads == [None]
+    assert np.isnan(far_away.s[0])
+
+
+def test_shape_table_interpolates_cross_sections() -> None:
+    root = get_root_without_default_namespace(
+        "tests/data/utils/simple_line_elevation_shape.xodr"
+    )
+    road = get_roads(root)[0]
+    shapes = get_road_shapes(road)
+
+    def expected_height(s, t):
+        heights = []
+        for section in sorted({shape.s_offset for shape in shapes}):
+            records = [shape for shape in shapes if shape.s_offset == section]
+            record = [r for r in records if r.t_offset <= t][-1:] or records[:1]
+            heights.append(
+                (section, poly3_to_polynomial(record[0].poly3)(t - record[0].t_offset))
+            )
+        (s0, h0), (s1, h1) = heights
+        weight = min(max((s - s0) / (s1 - s0), 0.0), 1.0)
+        return h0 + weight * (h1 - h0)
+
+    s, t = np.meshgrid(np.linspace(0.0, 100.0, 21), np.linspace(-12.0, 8.0, 11))
+    heights = evaluate_road_shape(road, s, t)
+
+    assert heights.shape == s.shape
+    for height, s_value, t_value in zip(heights.ravel(), s.ravel(), t.ravel()):
+        assert height == pytest.approx(expected_height(s_value, t_value), abs=1e-12)
+    assert np.all(np.isnan(evaluate_road_shape(road, np.array([-1.0, 101.0]), 0.0)))
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    [
+        "tests/data/examples/Ex_Entry_Exit.xodr",
+        "tests/data/road_geometry_parampoly3_arclength_range/road_geometry_parampoly3_arclength_range_invalid.xodr",
+    ],
+)
+def test_geometry_table_matches_road_plan_views(file_name) -> None:
+    root = get_root_without_default_namespace(file_name)
+    roads = get_roads(root)
+    table = tables.get_geometry_table(root)
+
+    assert len(table) == sum(
+        len(get_road_plan_view_geometry_list(road)) for road in roads
+    )
+    assert table.road_length.tolist() == [get_road_length(road) for road in roads]
+
+    for index, road in enumerate(roads):
+        rows = table.road == index
+        road_plan_view = compile_road_plan_view(road)
+        assert [
+            table.elements[i] for i in np.flatnonzero(rows)
+        ] == get_road_plan_view_geometry_list(road)
+        for name in (
+            "s",
+            "x",
+            "y",
+            "heading",
+            "length",
+            "geometry_type",
+            "curvature_start",
+            "curvature_end",
+        ):
+            np.testing.assert_array_equal(
+                getattr(table, name)[rows], getattr(road_plan_view, name)
+            )
+        param_poly3 = (
+            table.geometry_type[rows] >= models.GeometryType.PARAM_POLY3_ARC_LENGTH
+        )
+        np.testing.assert_array_equal(
+            table.u[rows][param_poly3], road_plan_view.u[param_poly3]
+        )
+        np.testing.assert_array_equal(
+            table.v[rows][param_poly3], road_plan_view.v[param_poly3]
+        )
+
+
+def test_lane_tables_match_lane_sections() -> None:
+    root = get_root_without_default_namespace(
+        "tests/data/road_lane_link_new_lane_appear/road_lane_link_new_lane_appear_junction_valid_1.xodr"
+    )
+    roads = get_roads(root)
+    lane_sections, lanes = tables.get_lane_tables(root)
+
+    assert lane_sections.elements == [
+        ls for road in roads for ls in get_lane_sections(road)
+    ]
+    assert lanes.elements == [
+        lane
+        for lane_section in lane_sections.elements
+        for lane in get_left_and_right_lanes_from_lane_section(lane_section)
+    ]
+
+    for index, road in enumerate(roads):
+        expected = get_sorted_lane_sections_with_length_from_road(road)
+        rows = {
+            lane_sections.elements[i]: i
+            for i in np.flatnonzero(lane_sections.road == index)
+        }
+        for section in expected:
+            assert lane_sections.length[rows[section.lane_section]] == pytest.approx(
+                section.length
+            )
+
+    for i, lane in enumerate(lanes.elements):
+        assert lanes.id[i] == get_lane_id(lane)
+        assert lanes.side[i] == np.sign(get_lane_id(lane))
+        assert lanes.lane_types[lanes.lane_type[i]] == get_type_from_lane(lane)
+        assert lanes.level[i] == get_lane_level_from_lane(lane)
+        assert (
+            lanes.elements[i].getparent().getparent()
+            is lane_sections.elements[lanes.lane_section[i]]
+        )
+
+
+@pytest.mark.parametrize(
+    "file_name,container",
+    [
+        (
+            "tests/data/road_object_position/road_object_position_invalid.xodr",
+            "objects",
+        ),
+        (
+            "tests/data/road_signal_position/road_signal_position_invalid.xodr",
+            "signals",
+        ),
+    ],
+)
+def test_road_element_table_reads_attributes(file_name, container) -> None:
+    root = get_root_without_default_namespace(file_name)
+    roads = get_roads(root)
+    table = tables.get_road_element_table(root, container)
+
+    expected = [
+        (index, element)
+        for index, road in enumerate(roads)
+        for tag in tables.ROAD_ELEMENT_TAGS[container]
+        for element in road.findall(f"./{container}/{tag}")
+    ]
+    assert len(table) == len(expected) > 0
+
+    for row, (index, element) in enumerate(expected):
+        assert table.elements[row] is element
+        assert table.road[row] == index
+        assert table.tags[table.tag[row]] == element.tag
+        for name, attribute in (
+            ("s", "s"),
+            ("t", "t"),
+            ("z_offset", "zOffset"),
+            ("height", "height"),
+        ):
+            value = to_float(element.get(attribute))
+            if value is None:
+                assert np.isnan(getattr(table, name)[row])
+            else:
+                assert getattr(table, name)[row] == value
+
+
+def test_junction_tables_match_connections() -> None:
+    root = get_root_without_default_namespace(
+        "tests/data/junction_connection_lane_link_id/junction_connection_lane_link_id_invalid.xodr"
+    )
+    roads = get_roads(root)
+    connections, lane_links = tables.get_junction_tables(root)
+
+    expected = [
+        (junction_index, connection)
+        for junction_index, junction in enumerate(get_junctions(root))
+        for connection in get_connections_from_junction(junction)
+    ]
+    assert len(connections.elements) == len(expected) > 0
+
+    for row, (junction_index, connection) in enumerate(expected):
+        assert connections.elements[row] is connection
+        assert connections.junction[row] == junction_index
+        assert (
+            roads[connections.incoming_road[row]]
+            is get_road_id_map(root)[get_incoming_road_id_from_connection(connection)]
+        )
+        assert connections.CONTACT_POINTS[connections.contact_point[row]] == (
+            get_contact_point_from_connection(connection)
+        )
+
+    assert lane_links.elements == [
+        lane_link
+        for connection in connections.elements
+        for lane_link in get_lane_links_from_connection(connection)
+    ]
+    for row, lane_link in enumerate(lane_links.elements):
+        assert connections.elements[lane_links.connection[row]] is lane_link.getparent()
+        assert lane_links.from_lane[row] == get_from_attribute_from_lane_link(lane_link)
+        assert lane_links.to_lane[row] == get_to_attribute_from_lane_link(lane_link)
+
+
+def test_isin_pairs() -> None:
+    found = tables.isin_pairs(
+        np.array([0, 0, 1, 1, -1, 2]),
+        np.array([-1.0, 1.0, -1.0, np.nan, -1.0, 3.0]),
+        np.array([0, 1, 1, -1, 2]),
+        np.array([-1.0, 1.0, np.nan, -1.0, -3.0]),
+    )
+    np.testing.assert_array_equal(found, [True, False, False, False, False, False])
+
+
+def test_road_outline_skips_sides_without_lanes() -> None:
+    root = get_root_without_default_namespace("tests/data/examples/Ex_Entry_Exit.xodr")
+    road = get_road_id_map(root)[305]
+
+    left, right = outline.compile_road_outline(road)
+
+    assert len(left) == len(right) > 1
+    assert np.all(np.isnan(left))
+    assert not np.isnan(right).any()
+
+
+def test_footprint_overlaps_ignore_touching_footprints() -> None:
+    x = np.linspace(0.0, 10.0, 11)
+    zeros = np.zeros_like(x)
+
+    def footprint(y_left, y_right):
+        return (
+            np.column_stack([x, zeros + y_left, zeros]),
+            np.column_stack([x, zeros + y_right, zeros]),
+        )
+
+    # The first two footprints share a border, the third overlaps both
+    quad_owner, point_owner, points = outline.compile_footprint_overlaps(
+        [footprint(3.0, -3.0), footprint(9.0, 3.0), footprint(5.0, -1.0)]
+    )
+    pairs = set(zip(quad_owner.tolist(), point_owner.tolist()))
+    assert pairs == {(0, 2), (2, 0), (1, 2), (2, 1)}
+    assert len(points) == len(quad_owner)
+
+    # Above the vertical clearance the third one is a bridge
+    raised = footprint(5.0, -1.0)
+    raised[0][:, 2] = raised[1][:, 2] = 1.5
+    quad_owner, _, _ = outline.compile_footprint_overlaps(
+        [footprint(3.0, -3.0), raised], vertical_clearance=1.0
+    )
+    assert len(quad_owner) == 0